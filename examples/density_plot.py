@@ -0,0 +1,23 @@
+import matplotlib.pyplot as plt
+
+from attractors import SolverRegistry, StaticPlotter, SystemRegistry, ThemeManager, view_matrix
+
+# states are binned into the image while integrating, so memory use is fixed by the image
+# size and runs of hundreds of millions of steps can be drawn
+theme = ThemeManager.get("vdesmond_horizon")
+system = SystemRegistry.get("langford")
+solver = SolverRegistry.get("rk4")
+
+plotter = StaticPlotter(system, theme, fig_kwargs={"figsize": (16, 9)}).visualize_density(
+    solver,
+    steps=200_000_000,
+    dt=0.0005,
+    bins=(1920, 1080),
+    view=view_matrix(azimuth=-60.0, elevation=20.0),
+    transient_steps=10_000,
+    gamma=0.6,
+)
+
+# the rendered RGBA image can also be saved directly
+plt.imsave("langford_density.png", plotter.image)
+plt.show()
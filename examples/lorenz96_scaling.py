@@ -0,0 +1,25 @@
+import time
+from dataclasses import replace
+
+import numpy as np
+
+from attractors import SolverRegistry, SystemRegistry, integrate_system
+
+# Lorenz-96 scales to any number of variables; the dimension is set by the initial state
+system = SystemRegistry.get("lorenz96")
+solver = SolverRegistry.get("rk4")
+dt = 0.01
+
+for dim in (40, 400, 4_000, 10_000):
+    init_coord = np.full(dim, system.params[0])
+    init_coord[0] += 0.01
+    scaled = replace(system, init_coord=init_coord)
+
+    # warm up, so that only the first size includes compilation
+    integrate_system(scaled, solver, 10, dt)
+
+    steps = max(2_000, 20_000_000 // dim)
+    start = time.perf_counter()
+    trajectory, _ = integrate_system(scaled, solver, steps, dt, save_every=steps // 100)
+    elapsed = time.perf_counter() - start
+    print(f"N={dim:>6}: {elapsed:.2f}s, {elapsed / steps / dim * 1e9:.2f} ns per step and variable")
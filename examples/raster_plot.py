@@ -0,0 +1,13 @@
+from attractors import RasterPlotter, SolverRegistry, SystemRegistry, ThemeManager, integrate_system
+
+# the trajectory is drawn by a compiled line rasterizer instead of matplotlib, so millions
+# of points render to a 4K image in seconds
+theme = ThemeManager.get("vdesmond_horizon")
+system = SystemRegistry.get("lorenz")
+solver = SolverRegistry.get("rk4")
+
+trajectory, _ = integrate_system(system, solver, steps=10_000_000, dt=0.0005)
+
+plotter = RasterPlotter(system, theme, color_by="velocity")
+plotter.visualize(trajectory, width=3840, height=2160, elevation=20.0, intensity=0.8)
+plotter.save("lorenz_raster.png")
@@ -1,24 +1,72 @@
 from pathlib import Path
 
-from attractors.solvers.core import integrate_system
+from attractors.analysis.bifurcation import (
+    BifurcationMethod,
+    bifurcation_density,
+    bifurcation_diagram,
+)
+from attractors.analysis.lyapunov import (
+    LyapunovEstimate,
+    lyapunov_iter,
+    lyapunov_max,
+    lyapunov_spectrum,
+    lyapunov_sweep,
+)
+from attractors.analysis.poincare import poincare_histogram, poincare_section
+from attractors.maps.iterate import iterate_map, map_density
+from attractors.maps.registry import Map, MapRegistry
+from attractors.solvers.adaptive import AdaptiveStats, integrate_adaptive
+from attractors.solvers.batch import BatchOutput, integrate_ensemble, integrate_sweep, param_grid
+from attractors.solvers.core import integrate_system, integrate_system_iter
+from attractors.solvers.dense import integrate_dense
+from attractors.solvers.guards import (
+    GuardedBatch,
+    GuardedTrajectory,
+    IntegrationGuard,
+    IntegrationStatus,
+)
+from attractors.solvers.kernels import KernelCache
+from attractors.solvers.network import NetworkResult, integrate_network, ring_coupling
+from attractors.solvers.precompile import precompile
 from attractors.solvers.registry import Solver, SolverRegistry
+from attractors.solvers.tableau import ButcherTableau, register_tableau
+from attractors.solvers.threaded import integrate_many, integrate_system_async
+from attractors.solvers.trajectory_cache import TrajectoryCache, TrajectoryCacheStats
 from attractors.systems.registry import System, SystemRegistry
 from attractors.themes.manager import ThemeManager
 from attractors.themes.theme import Theme
 from attractors.visualizers.animate import AnimatedPlotter, AnimatedVisualizeKwargs
 from attractors.visualizers.base import BasePlotter
+from attractors.visualizers.raster import RasterPlotter
 from attractors.visualizers.static import StaticPlotter
 from attractors.visualizers.utils.color_mapper import ColorMapper
+from attractors.visualizers.utils.density import DensityScaling, render_density
 from attractors.visualizers.utils.downsampler import CompressionMethod
+from attractors.visualizers.utils.projection import flow_density, view_matrix
 
 theme_path = Path(__file__).parent / "themes" / "viz_themes.json"
 ThemeManager.load(theme_path)
 __all__ = [
+    "AdaptiveStats",
     "AnimatedPlotter",
     "AnimatedVisualizeKwargs",
     "BasePlotter",
+    "BatchOutput",
+    "BifurcationMethod",
+    "ButcherTableau",
     "ColorMapper",
     "CompressionMethod",
+    "DensityScaling",
+    "GuardedBatch",
+    "GuardedTrajectory",
+    "IntegrationGuard",
+    "IntegrationStatus",
+    "KernelCache",
+    "LyapunovEstimate",
+    "Map",
+    "MapRegistry",
+    "NetworkResult",
+    "RasterPlotter",
     "Solver",
     "SolverRegistry",
     "StaticPlotter",
@@ -26,5 +74,32 @@ __all__ = [
     "SystemRegistry",
     "Theme",
     "ThemeManager",
+    "TrajectoryCache",
+    "TrajectoryCacheStats",
+    "bifurcation_density",
+    "bifurcation_diagram",
+    "flow_density",
+    "integrate_adaptive",
+    "integrate_dense",
+    "integrate_ensemble",
+    "integrate_many",
+    "integrate_network",
+    "integrate_sweep",
     "integrate_system",
+    "integrate_system_async",
+    "integrate_system_iter",
+    "iterate_map",
+    "lyapunov_iter",
+    "lyapunov_max",
+    "lyapunov_spectrum",
+    "lyapunov_sweep",
+    "map_density",
+    "param_grid",
+    "poincare_histogram",
+    "poincare_section",
+    "precompile",
+    "register_tableau",
+    "render_density",
+    "ring_coupling",
+    "view_matrix",
 ]
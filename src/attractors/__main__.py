@@ -0,0 +1,3 @@
+from attractors.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,26 @@
+from attractors.analysis.bifurcation import (
+    BifurcationMethod,
+    bifurcation_density,
+    bifurcation_diagram,
+)
+from attractors.analysis.lyapunov import (
+    LyapunovEstimate,
+    lyapunov_iter,
+    lyapunov_max,
+    lyapunov_spectrum,
+    lyapunov_sweep,
+)
+from attractors.analysis.poincare import poincare_histogram, poincare_section
+
+__all__ = [
+    "BifurcationMethod",
+    "LyapunovEstimate",
+    "bifurcation_density",
+    "bifurcation_diagram",
+    "lyapunov_iter",
+    "lyapunov_max",
+    "lyapunov_spectrum",
+    "lyapunov_sweep",
+    "poincare_histogram",
+    "poincare_section",
+]
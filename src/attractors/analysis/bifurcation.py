@@ -0,0 +1,548 @@
+from collections.abc import Callable, Sequence
+from enum import Enum
+
+import numpy as np
+from numba import prange, types
+from numba.extending import register_jitable
+from numpy.typing import DTypeLike, NDArray
+
+from attractors.solvers.batch import param_grid
+from attractors.solvers.kernels import KernelCache, KernelTarget, _reference_step
+from attractors.solvers.registry import Solver
+from attractors.systems.registry import System
+from attractors.type_defs import SolverInplaceCallable, SystemInplaceCallable, Vector
+from attractors.utils.logger import setup_logger
+
+logger = setup_logger(name=__name__)
+
+DIVERGENCE_FACTOR = 1e6
+
+
+class BifurcationMethod(Enum):
+    """Observables extracted for every parameter value of a bifurcation diagram.
+    maxima: Local maxima of a state component
+    minima: Local minima of a state component
+    section: State component at upward crossings of a plane
+    """
+
+    MAXIMA = "maxima"
+    MINIMA = "minima"
+    SECTION = "section"
+
+
+_METHOD_CODES = {
+    BifurcationMethod.MAXIMA: 0,
+    BifurcationMethod.MINIMA: 1,
+    BifurcationMethod.SECTION: 2,
+}
+
+
+@register_jitable
+def _observe(state: Vector, method: int, component: int, plane: Vector) -> float:
+    """Evaluate the tracked state component, or the plane function for sections."""
+    if method != 2:
+        return float(state[component])
+    value = -plane[-1]
+    for i in range(len(state)):
+        value += plane[i] * state[i]
+    return float(value)
+
+
+@register_jitable
+def _extract(
+    method: int,
+    older: float,
+    newer: float,
+    latest: float,
+    current: Vector,
+    following: Vector,
+    component: int,
+) -> tuple[bool, float]:
+    """Detect an extremum at the middle of three observations or a crossing after it.
+
+    Extrema are refined to the vertex of the parabola through the three observations and
+    crossings by linear interpolation between the states around them.
+    """
+    if method == 2:
+        if newer < 0.0 <= latest:
+            theta = newer / (newer - latest)
+            return True, current[component] + theta * (following[component] - current[component])
+        return False, 0.0
+    sign = 1.0 if method == 0 else -1.0
+    a, b, c = sign * older, sign * newer, sign * latest
+    if b > a and b >= c:
+        return True, sign * (b - (c - a) ** 2 / (8.0 * (a - 2.0 * b + c)))
+    return False, 0.0
+
+
+@register_jitable
+def _warm_start(current: Vector, init_coord: Vector) -> None:
+    """Restart from the initial state if the previous parameter value diverged."""
+    norm = 0.0
+    for i in range(len(current)):
+        norm += current[i] * current[i]
+    scale = 0.0
+    for i in range(len(init_coord)):
+        scale += init_coord[i] * init_coord[i]
+    if not np.isfinite(norm) or norm > DIVERGENCE_FACTOR**2 * max(scale, 1.0):
+        current[:] = init_coord
+
+
+@register_jitable
+def _bin_value(hist: NDArray[np.int64], row: int, value: float, bounds: Vector) -> None:
+    """Add a value to a histogram row, including the upper edge."""
+    bins = hist.shape[1]
+    u = (value - bounds[0]) / (bounds[1] - bounds[0])
+    if 0.0 <= u <= 1.0:
+        hist[row, min(int(u * bins), bins - 1)] += 1
+
+
+# non-jitted
+def _bifurcation_impl(
+    system_func: SystemInplaceCallable,
+    solver_step: SolverInplaceCallable,
+    work_size: int,
+    init_coord: Vector,
+    params: Vector,
+    steps: int,
+    dt: float,
+    skip: int,
+    block_size: int,
+    method: int,
+    component: int,
+    plane: Vector,
+    max_points: int,
+    hist: NDArray[np.int64],
+    bounds: Vector,
+) -> tuple[Vector, NDArray[np.int64]]:
+    members, dim = params.shape[0], len(init_coord)
+    storing = hist.shape[0] == 0
+    values = np.full((members, max_points if storing else 0), np.nan, dtype=np.float64)
+    counts = np.zeros(members, dtype=np.int64)
+
+    for block in prange((members + block_size - 1) // block_size):
+        work = np.empty((work_size, dim), dtype=np.float64)
+        buffers = np.empty((2, dim), dtype=np.float64)
+        current, following = buffers[0], buffers[1]
+        current[:] = init_coord
+        for p in range(block * block_size, min(members, (block + 1) * block_size)):
+            _warm_start(current, init_coord)
+            older = newer = _observe(current, method, component, plane)
+            for n in range(steps):
+                solver_step(system_func, current, params[p], dt, work, following)
+                latest = _observe(following, method, component, plane)
+                if n >= skip:
+                    found, value = _extract(
+                        method, older, newer, latest, current, following, component
+                    )
+                    if found and storing:
+                        values[p, counts[p]] = value
+                        counts[p] += 1
+                    elif found:
+                        _bin_value(hist, p, value, bounds)
+                        counts[p] += 1
+                older, newer = newer, latest
+                current, following = following, current
+                if storing and counts[p] == max_points:
+                    break
+
+    return values, counts
+
+
+# jitted
+@KernelCache.register(
+    "bifurcation",
+    signature=(
+        types.float64[::1],
+        types.float64[:, ::1],
+        types.int64,
+        types.float64,
+        types.int64,
+        types.int64,
+        types.int64,
+        types.int64,
+        types.float64[::1],
+        types.int64,
+        types.int64[:, ::1],
+        types.float64[::1],
+    ),
+    parallel=True,
+)
+def _build_bifurcation_kernel(
+    target: KernelTarget,
+) -> Callable[..., tuple[Vector, NDArray[np.int64]]]:
+    system_func = target.system_func
+    solver_step = target.solver_step
+    work_size = target.work_size
+    dtype = target.dtype
+
+    def kernel(
+        init_coord: Vector,
+        params: Vector,
+        steps: int,
+        dt: float,
+        skip: int,
+        block_size: int,
+        method: int,
+        component: int,
+        plane: Vector,
+        max_points: int,
+        hist: NDArray[np.int64],
+        bounds: Vector,
+    ) -> tuple[Vector, NDArray[np.int64]]:
+        members, dim = params.shape[0], len(init_coord)
+        storing = hist.shape[0] == 0
+        values = np.full((members, max_points if storing else 0), np.nan, dtype=dtype)
+        counts = np.zeros(members, dtype=np.int64)
+
+        for block in prange((members + block_size - 1) // block_size):
+            work = np.empty((work_size, dim), dtype=np.float64)
+            buffers = np.empty((2, dim), dtype=np.float64)
+            current, following = buffers[0], buffers[1]
+            current[:] = init_coord
+            for p in range(block * block_size, min(members, (block + 1) * block_size)):
+                _warm_start(current, init_coord)
+                older = newer = _observe(current, method, component, plane)
+                for n in range(steps):
+                    solver_step(system_func, current, params[p], dt, work, following)
+                    latest = _observe(following, method, component, plane)
+                    if n >= skip:
+                        found, value = _extract(
+                            method, older, newer, latest, current, following, component
+                        )
+                        if found and storing:
+                            values[p, counts[p]] = value
+                            counts[p] += 1
+                        elif found:
+                            _bin_value(hist, p, value, bounds)
+                            counts[p] += 1
+                    older, newer = newer, latest
+                    current, following = following, current
+                    if storing and counts[p] == max_points:
+                        break
+
+        return values, counts
+
+    return kernel
+
+
+def _resolve_sweep(
+    system: System,
+    solver: Solver,
+    param: str,
+    param_range: tuple[float, float],
+    resolution: int,
+    steps: int,
+    dt: float,
+    transient_steps: int,
+    component: int,
+    method: BifurcationMethod,
+    normal: Sequence[float] | Vector | None,
+    offset: float,
+    block_size: int,
+) -> tuple[Vector, Vector, Vector]:
+    if steps <= 0:
+        raise ValueError("Number of steps must be positive")
+    if dt <= 0:
+        raise ValueError("Time step must be positive")
+    if solver.adaptive:
+        msg = f"Solver {solver.name} is adaptive, use a fixed-step solver instead"
+        raise ValueError(msg)
+    if solver.multistep:
+        msg = f"Solver {solver.name} is multistep, use a single-step solver instead"
+        raise ValueError(msg)
+    if not 0 <= transient_steps < steps:
+        raise ValueError("Transient steps must be non-negative and less than the number of steps")
+    if resolution <= 0:
+        raise ValueError("Resolution must be positive")
+    if block_size <= 0:
+        raise ValueError("Block size must be positive")
+    dim = len(system.init_coord)
+    if not 0 <= component < dim:
+        msg = f"Component must be between 0 and {dim - 1}"
+        raise ValueError(msg)
+
+    plane = np.zeros(1, dtype=np.float64)
+    if method is BifurcationMethod.SECTION:
+        if normal is None:
+            raise ValueError("Section method requires a plane normal")
+        plane = np.append(np.asarray(normal, dtype=np.float64), offset)
+        if plane.shape != (dim + 1,) or not np.any(plane[:-1]):
+            msg = f"Plane normal must be a non-zero vector with {dim} components"
+            raise ValueError(msg)
+
+    values = np.linspace(param_range[0], param_range[1], resolution)
+    return values, param_grid(system, **{param: values}), plane
+
+
+def _run_bifurcation(
+    system: System,
+    solver: Solver,
+    params: Vector,
+    steps: int,
+    dt: float,
+    transient_steps: int,
+    block_size: int,
+    method: BifurcationMethod,
+    component: int,
+    plane: Vector,
+    max_points: int,
+    hist: NDArray[np.int64],
+    bounds: Vector,
+    use_jit: bool | None,
+    dtype: DTypeLike,
+) -> tuple[Vector, NDArray[np.int64]]:
+    jit_enabled = True if use_jit is None else use_jit
+    logger.debug("JIT enabled: %s", jit_enabled)
+    logger.info(
+        "Bifurcation of %d parameter values: %s with solver: %s", len(params), system, solver
+    )
+    logger.info(
+        "Steps: %d, dt: %.6g, transient: %d, method: %s",
+        steps,
+        dt,
+        transient_steps,
+        method.value,
+    )
+
+    args = (
+        np.ascontiguousarray(system.init_coord, dtype=np.float64),
+        params,
+        steps,
+        float(dt),
+        transient_steps,
+        block_size,
+        _METHOD_CODES[method],
+        component,
+        plane,
+        max_points,
+        hist,
+        bounds,
+    )
+    if jit_enabled:
+        kernel = KernelCache.get("bifurcation", system, solver, dtype)
+        values, counts = kernel(*args)
+        return values, counts
+
+    solver_step, work_size = _reference_step(system, solver)
+    values, counts = _bifurcation_impl(
+        system.get_inplace_func(jitted=False), solver_step, work_size, *args
+    )
+    return values.astype(dtype, copy=False), counts
+
+
+def bifurcation_diagram(
+    system: System,
+    solver: Solver,
+    param: str,
+    param_range: tuple[float, float],
+    resolution: int,
+    steps: int,
+    dt: float,
+    transient_steps: int = 0,
+    component: int = 0,
+    method: BifurcationMethod = BifurcationMethod.MAXIMA,
+    normal: Sequence[float] | Vector | None = None,
+    offset: float = 0.0,
+    max_points: int = 256,
+    block_size: int = 32,
+    use_jit: bool | None = None,
+    dtype: DTypeLike = np.float64,
+) -> tuple[Vector, Vector]:
+    """Computes the points of a bifurcation diagram over a range of one parameter.
+
+    The parameter is swept over `resolution` evenly spaced values with all other
+    parameters held at the system's current values. For every value, the system is
+    integrated and, after the transient, the local maxima or minima of a state component,
+    or its values at upward crossings of the plane `normal . x = offset`, are extracted
+    inside the integration loop. Full trajectories are never stored.
+
+    Parameter values are split into consecutive blocks of `block_size` values, which run
+    in parallel. Within a block, each value starts from the final state of the previous
+    one, so that the transient only needs to cover the drift between neighbouring
+    attractors. Blocks always start from `system.init_coord`, so results do not depend on
+    the number of threads. A value also restarts from `system.init_coord` when the
+    previous one diverged, so that a diverging range does not empty the rest of its
+    block. Use block_size=1 to start every value from the initial state.
+
+    Args:
+        system (System): System to integrate
+        solver (Solver): Single-step fixed-step solver to use for integration
+        param (str): Name of the swept parameter, one of `system.param_names`
+        param_range (tuple[float, float]): First and last parameter value
+        resolution (int): Number of parameter values
+        steps (int): Number of integration steps per parameter value
+        dt (float): Time step size
+        transient_steps (int): Number of initial steps to discard per parameter value.
+            Defaults to 0.
+        component (int): State component to record. Defaults to 0.
+        method (BifurcationMethod): Observable to extract. Defaults to
+            BifurcationMethod.MAXIMA.
+        normal (Sequence[float] | Vector | None): Normal of the section plane, required
+            for BifurcationMethod.SECTION. Defaults to None.
+        offset (float): Offset of the section plane. Defaults to 0.0.
+        max_points (int): Maximum number of points per parameter value, after which
+            integration of that value stops. Defaults to 256.
+        block_size (int): Number of consecutive parameter values warm-started from each
+            other. Defaults to 32.
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+        dtype (DTypeLike): Storage dtype of the recorded values. Defaults to np.float64.
+
+    Raises:
+        ValueError: If steps, dt, resolution, block_size or max_points are not positive,
+            the solver is adaptive or multistep, transient_steps is negative or not less
+            than steps, param is unknown, component is out of range or the section plane
+            is missing or invalid
+
+    Returns:
+        tuple[Vector, Vector]: A tuple containing:
+            - Vector: Parameter value of each point
+            - Vector: Recorded component value of each point
+
+    Examples:
+        >>> rho, z_max = bifurcation_diagram(
+        ...     lorenz,
+        ...     solver,
+        ...     "rho",
+        ...     (20.0, 200.0),
+        ...     2000,
+        ...     200_000,
+        ...     0.001,
+        ...     transient_steps=50_000,
+        ...     component=2,
+        ... )
+    """
+    if max_points <= 0:
+        raise ValueError("Maximum number of points must be positive")
+    values, params, plane = _resolve_sweep(
+        system,
+        solver,
+        param,
+        param_range,
+        resolution,
+        steps,
+        dt,
+        transient_steps,
+        component,
+        method,
+        normal,
+        offset,
+        block_size,
+    )
+    recorded, counts = _run_bifurcation(
+        system,
+        solver,
+        params,
+        steps,
+        dt,
+        transient_steps,
+        block_size,
+        method,
+        component,
+        plane,
+        max_points,
+        np.zeros((0, 0), dtype=np.int64),
+        np.zeros(2, dtype=np.float64),
+        use_jit,
+        dtype,
+    )
+    mask = np.arange(max_points) < counts[:, None]
+    logger.info("Bifurcation points: %d", int(counts.sum()))
+    return np.broadcast_to(values[:, None], mask.shape)[mask], recorded[mask]
+
+
+def bifurcation_density(
+    system: System,
+    solver: Solver,
+    param: str,
+    param_range: tuple[float, float],
+    resolution: int,
+    steps: int,
+    dt: float,
+    value_range: tuple[float, float],
+    bins: int = 512,
+    transient_steps: int = 0,
+    component: int = 0,
+    method: BifurcationMethod = BifurcationMethod.MAXIMA,
+    normal: Sequence[float] | Vector | None = None,
+    offset: float = 0.0,
+    block_size: int = 32,
+    use_jit: bool | None = None,
+) -> tuple[NDArray[np.int64], Vector, Vector]:
+    """Rasterizes a bifurcation diagram into a density image.
+
+    Points are extracted as in `bifurcation_diagram` but binned over `value_range` directly
+    inside the integration loop, so every extremum or crossing of the full run is counted
+    without storing any of them. Values outside the range are ignored.
+
+    Args:
+        system (System): System to integrate
+        solver (Solver): Single-step fixed-step solver to use for integration
+        param (str): Name of the swept parameter, one of `system.param_names`
+        param_range (tuple[float, float]): First and last parameter value
+        resolution (int): Number of parameter values, i.e. image columns
+        steps (int): Number of integration steps per parameter value
+        dt (float): Time step size
+        value_range (tuple[float, float]): Lower and upper bound of the recorded values
+        bins (int): Number of value bins. Defaults to 512.
+        transient_steps (int): Number of initial steps to discard per parameter value.
+            Defaults to 0.
+        component (int): State component to record. Defaults to 0.
+        method (BifurcationMethod): Observable to extract. Defaults to
+            BifurcationMethod.MAXIMA.
+        normal (Sequence[float] | Vector | None): Normal of the section plane, required
+            for BifurcationMethod.SECTION. Defaults to None.
+        offset (float): Offset of the section plane. Defaults to 0.0.
+        block_size (int): Number of consecutive parameter values warm-started from each
+            other. Defaults to 32.
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+
+    Raises:
+        ValueError: If the inputs of `bifurcation_diagram` are invalid, bins is not positive
+            or value_range is empty
+
+    Returns:
+        tuple[NDArray[np.int64], Vector, Vector]: A tuple containing:
+            - NDArray[np.int64]: Counts of shape (resolution, bins)
+            - Vector: Parameter values
+            - Vector: Bin edges of the recorded values
+    """
+    if bins <= 0:
+        raise ValueError("Number of bins must be positive")
+    if not value_range[0] < value_range[1]:
+        raise ValueError("Value range must be increasing")
+    values, params, plane = _resolve_sweep(
+        system,
+        solver,
+        param,
+        param_range,
+        resolution,
+        steps,
+        dt,
+        transient_steps,
+        component,
+        method,
+        normal,
+        offset,
+        block_size,
+    )
+    hist = np.zeros((resolution, bins), dtype=np.int64)
+    _, counts = _run_bifurcation(
+        system,
+        solver,
+        params,
+        steps,
+        dt,
+        transient_steps,
+        block_size,
+        method,
+        component,
+        plane,
+        0,
+        hist,
+        np.array(value_range, dtype=np.float64),
+        use_jit,
+        np.float64,
+    )
+    logger.info("Bifurcation points: %d", int(counts.sum()))
+    return hist, values, np.linspace(value_range[0], value_range[1], bins + 1)
@@ -0,0 +1,686 @@
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from functools import partial
+
+import numpy as np
+from numba import njit, prange, types
+from numba.extending import register_jitable
+
+from attractors.solvers.kernels import KernelCache, KernelTarget, _reference_step
+from attractors.solvers.registry import Solver
+from attractors.systems.registry import System
+from attractors.type_defs import (
+    JacobianCallable,
+    SolverInplaceCallable,
+    SystemInplaceCallable,
+    Vector,
+)
+from attractors.utils.logger import setup_logger
+
+logger = setup_logger(name=__name__)
+
+
+@dataclass(frozen=True)
+class LyapunovEstimate:
+    """
+    Running estimate of Lyapunov exponents.
+
+    Attributes:
+        exponents (Vector): Estimated exponents, largest first
+        steps (int): Number of integration steps averaged over, excluding the transient
+        time (float): Integration time averaged over, excluding the transient
+        converged (bool): Whether the estimate changed by less than the requested tolerance
+            over the last chunk
+    """
+
+    exponents: Vector
+    steps: int
+    time: float
+    converged: bool
+
+
+@register_jitable
+def _orthonormalize(vectors: Vector, logs: Vector) -> None:
+    """Orthonormalize rows in place by modified Gram-Schmidt, accumulating log norms."""
+    k, dim = vectors.shape
+    for j in range(k):
+        for i in range(j):
+            projection = 0.0
+            for d in range(dim):
+                projection += vectors[j, d] * vectors[i, d]
+            for d in range(dim):
+                vectors[j, d] -= projection * vectors[i, d]
+        norm = 0.0
+        for d in range(dim):
+            norm += vectors[j, d] ** 2
+        norm = np.sqrt(norm)
+        logs[j] += np.log(norm)
+        for d in range(dim):
+            vectors[j, d] /= norm
+
+
+def _tangent_system(
+    system_func: SystemInplaceCallable, jacobian_func: JacobianCallable, dim: int
+) -> SystemInplaceCallable:
+    """Build the in-place system of a state followed by its tangent vectors.
+
+    Tangent vectors evolve by the variational equations `v' = J(x) v`, so that integrating
+    the augmented state with a solver step propagates them by the linearization of the step.
+    """
+
+    def tangent_system(augmented: Vector, params: Vector, out: Vector) -> None:
+        state = augmented[:dim]
+        system_func(state, params, out[:dim])
+        jac = jacobian_func(state, params)
+        for start in range(dim, len(augmented), dim):
+            for i in range(dim):
+                derivative = 0.0
+                for j in range(dim):
+                    derivative += jac[i, j] * augmented[start + j]
+                out[start + i] = derivative
+
+    return tangent_system
+
+
+# non-jitted
+def _variational_advance_impl(
+    tangent_system: SystemInplaceCallable,
+    solver_step: SolverInplaceCallable,
+    work_size: int,
+    state: Vector,
+    basis: Vector,
+    params: Vector,
+    steps: int,
+    dt: float,
+    renorm_every: int,
+    eps: float,  # noqa: ARG001
+    logs: Vector,
+) -> None:
+    k, dim = basis.shape
+    augmented = np.empty((k + 1, dim), dtype=np.float64)
+    augmented[0] = state
+    augmented[1:] = basis
+    flat = augmented.reshape(augmented.size)
+    work = np.empty((work_size, augmented.size), dtype=np.float64)
+    following = np.empty(augmented.size, dtype=np.float64)
+
+    for i in range(steps):
+        solver_step(tangent_system, flat, params, dt, work, following)
+        flat[:] = following
+        if (i + 1) % renorm_every == 0 or i == steps - 1:
+            _orthonormalize(augmented[1:], logs)
+    state[:] = augmented[0]
+    basis[:] = augmented[1:]
+
+
+# non-jitted
+def _lyapunov_advance_impl(
+    system_func: SystemInplaceCallable,
+    solver_step: SolverInplaceCallable,
+    work_size: int,
+    state: Vector,
+    basis: Vector,
+    params: Vector,
+    steps: int,
+    dt: float,
+    renorm_every: int,
+    eps: float,
+    logs: Vector,
+) -> None:
+    k, dim = basis.shape
+    work = np.empty((work_size, dim), dtype=np.float64)
+    following = np.empty(dim, dtype=np.float64)
+    perturbed = np.empty((k, dim), dtype=np.float64)
+    for j in range(k):
+        perturbed[j] = state + eps * basis[j]
+
+    for i in range(steps):
+        solver_step(system_func, state, params, dt, work, following)
+        state[:] = following
+        for j in range(k):
+            solver_step(system_func, perturbed[j], params, dt, work, following)
+            perturbed[j] = following
+        if (i + 1) % renorm_every == 0 or i == steps - 1:
+            for j in range(k):
+                basis[j] = (perturbed[j] - state) / eps
+            _orthonormalize(basis, logs)
+            for j in range(k):
+                perturbed[j] = state + eps * basis[j]
+
+
+# jitted
+_variational_advance = njit(inline="always")(_variational_advance_impl)
+_lyapunov_advance = njit(inline="always")(_lyapunov_advance_impl)
+
+
+def _make_advance(target: KernelTarget) -> Callable[..., None]:
+    """Specialize the tangent-space step loop on a kernel target for inlining.
+
+    Tangent vectors follow the variational equations if the solver step can integrate them
+    and are propagated as perturbed trajectories otherwise.
+    """
+    system_func = target.system_func
+    solver_step = target.solver_step
+    work_size = target.work_size
+    if target.jacobian_func is not None:
+        tangent_system = njit(inline="always")(
+            _tangent_system(system_func, target.jacobian_func, target.dim)
+        )
+
+        def variational_advance(
+            state: Vector,
+            basis: Vector,
+            params: Vector,
+            steps: int,
+            dt: float,
+            renorm_every: int,
+            eps: float,
+            logs: Vector,
+        ) -> None:
+            _variational_advance(
+                tangent_system,
+                solver_step,
+                work_size,
+                state,
+                basis,
+                params,
+                steps,
+                dt,
+                renorm_every,
+                eps,
+                logs,
+            )
+
+        return njit(inline="always")(variational_advance)
+
+    def advance(
+        state: Vector,
+        basis: Vector,
+        params: Vector,
+        steps: int,
+        dt: float,
+        renorm_every: int,
+        eps: float,
+        logs: Vector,
+    ) -> None:
+        _lyapunov_advance(
+            system_func,
+            solver_step,
+            work_size,
+            state,
+            basis,
+            params,
+            steps,
+            dt,
+            renorm_every,
+            eps,
+            logs,
+        )
+
+    return njit(inline="always")(advance)
+
+
+# jitted
+@KernelCache.register(
+    "lyapunov",
+    signature=(
+        types.float64[::1],
+        types.float64[:, ::1],
+        types.float64[::1],
+        types.int64,
+        types.float64,
+        types.int64,
+        types.float64,
+    ),
+)
+def _build_lyapunov_kernel(target: KernelTarget) -> Callable[..., tuple[Vector, Vector, Vector]]:
+    advance = _make_advance(target)
+
+    def kernel(
+        state: Vector,
+        basis: Vector,
+        params: Vector,
+        steps: int,
+        dt: float,
+        renorm_every: int,
+        eps: float,
+    ) -> tuple[Vector, Vector, Vector]:
+        state = state.copy()
+        basis = basis.copy()
+        logs = np.zeros(basis.shape[0], dtype=np.float64)
+        advance(state, basis, params, steps, dt, renorm_every, eps, logs)
+        return state, basis, logs
+
+    return kernel
+
+
+# jitted
+@KernelCache.register(
+    "lyapunov_batch",
+    signature=(
+        types.float64[::1],
+        types.float64[:, ::1],
+        types.float64[:, ::1],
+        types.int64,
+        types.int64,
+        types.float64,
+        types.int64,
+        types.float64,
+    ),
+    parallel=True,
+)
+def _build_lyapunov_batch_kernel(target: KernelTarget) -> Callable[..., Vector]:
+    advance = _make_advance(target)
+
+    def kernel(
+        init_coord: Vector,
+        init_basis: Vector,
+        params: Vector,
+        transient_steps: int,
+        steps: int,
+        dt: float,
+        renorm_every: int,
+        eps: float,
+    ) -> Vector:
+        k = init_basis.shape[0]
+        result = np.empty((len(params), k), dtype=np.float64)
+        for p in prange(len(params)):
+            state = init_coord.copy()
+            basis = init_basis.copy()
+            logs = np.zeros(k, dtype=np.float64)
+            advance(state, basis, params[p], transient_steps, dt, renorm_every, eps, logs)
+            logs[:] = 0.0
+            advance(state, basis, params[p], steps, dt, renorm_every, eps, logs)
+            result[p] = logs / (steps * dt)
+        return result
+
+    return kernel
+
+
+# non-jitted
+def _lyapunov_batch_impl(
+    advance: Callable[..., None],
+    init_coord: Vector,
+    init_basis: Vector,
+    params: Vector,
+    transient_steps: int,
+    steps: int,
+    dt: float,
+    renorm_every: int,
+    eps: float,
+) -> Vector:
+    k = init_basis.shape[0]
+    result = np.empty((len(params), k), dtype=np.float64)
+    for p in range(len(params)):
+        state = init_coord.copy()
+        basis = init_basis.copy()
+        logs = np.zeros(k, dtype=np.float64)
+        advance(state, basis, params[p], transient_steps, dt, renorm_every, eps, logs)
+        logs[:] = 0.0
+        advance(state, basis, params[p], steps, dt, renorm_every, eps, logs)
+        result[p] = logs / (steps * dt)
+    return result
+
+
+def _reference_advance(system: System, solver: Solver) -> Callable[..., None]:
+    """Bind the reference step loop to the in-place system and solver functions."""
+    solver_step, work_size = _reference_step(system, solver)
+    if solver.has_inplace:
+        tangent_system = _tangent_system(
+            system.get_inplace_func(jitted=False),
+            system.get_jacobian_func(jitted=False),
+            system.dim,
+        )
+        return partial(_variational_advance_impl, tangent_system, solver_step, work_size)
+    return partial(
+        _lyapunov_advance_impl, system.get_inplace_func(jitted=False), solver_step, work_size
+    )
+
+
+def _validate_lyapunov_inputs(
+    system: System,
+    solver: Solver,
+    dt: float,
+    n_exponents: int | None,
+    transient_steps: int,
+    renorm_every: int,
+    eps: float,
+) -> int:
+    if dt <= 0:
+        raise ValueError("Time step must be positive")
+    if solver.adaptive:
+        msg = f"Solver {solver.name} is adaptive, use a fixed-step solver instead"
+        raise ValueError(msg)
+    if solver.multistep:
+        msg = f"Solver {solver.name} is multistep, use a single-step solver instead"
+        raise ValueError(msg)
+    if transient_steps < 0:
+        raise ValueError("Transient steps must be non-negative")
+    if renorm_every <= 0:
+        raise ValueError("Renormalization interval must be positive")
+    if eps <= 0:
+        raise ValueError("Perturbation size must be positive")
+
+    dim = len(system.init_coord)
+    k = dim if n_exponents is None else n_exponents
+    if not 1 <= k <= dim:
+        msg = f"Number of exponents must be between 1 and {dim}"
+        raise ValueError(msg)
+    return k
+
+
+def lyapunov_iter(
+    system: System,
+    solver: Solver,
+    dt: float,
+    chunk_steps: int = 10_000,
+    steps: int | None = None,
+    n_exponents: int | None = None,
+    transient_steps: int = 0,
+    renorm_every: int = 1,
+    eps: float = 1e-8,
+    tol: float | None = None,
+    use_jit: bool | None = None,
+) -> Iterator[LyapunovEstimate]:
+    """Streams running estimates of the Lyapunov spectrum of a system.
+
+    Uses the method of Benettin et al.: a set of tangent vectors is propagated alongside the
+    trajectory and re-orthonormalized by Gram-Schmidt (QR) every `renorm_every` steps, and
+    the exponents are the time-averaged logarithmic growth rates of the orthonormalized
+    vectors. Tangent vectors follow the variational equations `v' = J(x) v` with the
+    Jacobian of the system, integrated by the same solver step as the state. Solvers without
+    an in-place variant can only integrate the system itself, so tangent vectors are then
+    propagated as perturbed trajectories at distance `eps` instead.
+
+    Args:
+        system (System): System to analyze
+        solver (Solver): Fixed-step solver to use for integration
+        dt (float): Time step size
+        chunk_steps (int): Number of steps between estimates. Defaults to 10_000.
+        steps (int | None): Total number of steps after the transient. Runs until converged
+            or indefinitely if None.
+        n_exponents (int | None): Number of leading exponents to compute. Defaults to the
+            full spectrum.
+        transient_steps (int): Number of initial steps to discard. Tangent vectors are
+            aligned during the transient. Defaults to 0.
+        renorm_every (int): Steps between re-orthonormalizations. Defaults to 1.
+        eps (float): Size of the tangent perturbations, for solvers without an in-place
+            variant. Defaults to 1e-8.
+        tol (float | None): Stop once no exponent changes by more than this over a chunk.
+            Defaults to None, which disables early stopping.
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+
+    Raises:
+        ValueError: If dt, chunk_steps, steps, renorm_every, eps or tol are not positive,
+            transient_steps is negative, the solver is adaptive or multistep or n_exponents is
+            out of range
+
+    Returns:
+        Iterator[LyapunovEstimate]: Iterator over running estimates, one per chunk
+
+    Examples:
+        >>> for estimate in lyapunov_iter(lorenz, rk4, 0.01, tol=1e-4):
+        ...     print(estimate.time, estimate.exponents)
+    """
+    k = _validate_lyapunov_inputs(
+        system, solver, dt, n_exponents, transient_steps, renorm_every, eps
+    )
+    if chunk_steps <= 0:
+        raise ValueError("Chunk size must be positive")
+    if steps is not None and steps <= 0:
+        raise ValueError("Number of steps must be positive")
+    if tol is not None and tol <= 0:
+        raise ValueError("Tolerance must be positive")
+
+    jit_enabled = True if use_jit is None else use_jit
+    logger.debug("JIT enabled: %s", jit_enabled)
+    logger.info("Computing %d Lyapunov exponents: %s with solver: %s", k, system, solver)
+
+    advance_chunk: Callable[..., tuple[Vector, Vector, Vector]]
+    if jit_enabled:
+        kernel = KernelCache.get("lyapunov", system, solver)
+        advance_chunk = kernel
+    else:
+        advance = _reference_advance(system, solver)
+
+        def advance_chunk(
+            state: Vector,
+            basis: Vector,
+            params: Vector,
+            n: int,
+            dt: float,
+            renorm_every: int,
+            eps: float,
+        ) -> tuple[Vector, Vector, Vector]:
+            state, basis = state.copy(), basis.copy()
+            logs = np.zeros(len(basis), dtype=np.float64)
+            advance(state, basis, params, n, dt, renorm_every, eps, logs)
+            return state, basis, logs
+
+    init_coord = np.ascontiguousarray(system.init_coord, dtype=np.float64)
+    params = np.ascontiguousarray(system.params, dtype=np.float64)
+
+    def estimates() -> Iterator[LyapunovEstimate]:
+        state = init_coord.copy()
+        basis = np.eye(k, len(state))
+        if transient_steps > 0:
+            state, basis, _ = advance_chunk(
+                state, basis, params, transient_steps, float(dt), renorm_every, eps
+            )
+
+        total = np.zeros(k, dtype=np.float64)
+        previous = None
+        done = 0
+        while steps is None or done < steps:
+            n = chunk_steps if steps is None else min(chunk_steps, steps - done)
+            state, basis, logs = advance_chunk(
+                state, basis, params, n, float(dt), renorm_every, eps
+            )
+            total += logs
+            done += n
+            exponents = total / (done * dt)
+            converged = (
+                tol is not None
+                and previous is not None
+                and bool(np.max(np.abs(exponents - previous)) < tol)
+            )
+            yield LyapunovEstimate(
+                exponents=exponents, steps=done, time=done * dt, converged=converged
+            )
+            if converged:
+                logger.info("Lyapunov exponents converged after %d steps", done)
+                return
+            previous = exponents
+
+    return estimates()
+
+
+def lyapunov_spectrum(
+    system: System,
+    solver: Solver,
+    steps: int,
+    dt: float,
+    n_exponents: int | None = None,
+    transient_steps: int = 0,
+    renorm_every: int = 1,
+    eps: float = 1e-8,
+    tol: float | None = None,
+    chunk_steps: int = 10_000,
+    use_jit: bool | None = None,
+) -> LyapunovEstimate:
+    """Computes the Lyapunov spectrum of a system.
+
+    See `lyapunov_iter` for the method. With `tol` set, integration stops early once the
+    estimate changes by less than `tol` between chunks of `chunk_steps` steps.
+
+    Args:
+        system (System): System to analyze
+        solver (Solver): Fixed-step solver to use for integration
+        steps (int): Maximum number of steps after the transient
+        dt (float): Time step size
+        n_exponents (int | None): Number of leading exponents to compute. Defaults to the
+            full spectrum.
+        transient_steps (int): Number of initial steps to discard. Defaults to 0.
+        renorm_every (int): Steps between re-orthonormalizations. Defaults to 1.
+        eps (float): Size of the tangent perturbations, for solvers without an in-place
+            variant. Defaults to 1e-8.
+        tol (float | None): Convergence tolerance for early stopping. Defaults to None.
+        chunk_steps (int): Number of steps between convergence checks. Defaults to 10_000.
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+
+    Raises:
+        ValueError: If any argument is out of range (see `lyapunov_iter`)
+
+    Returns:
+        LyapunovEstimate: Final estimate of the exponents, largest first
+
+    Examples:
+        >>> lyapunov_spectrum(lorenz, rk4, 200_000, 0.01, transient_steps=10_000).exponents
+        array([  0.90...,   0.00...,  -14.57...])
+    """
+    *_, estimate = lyapunov_iter(
+        system,
+        solver,
+        dt,
+        chunk_steps,
+        steps,
+        n_exponents,
+        transient_steps,
+        renorm_every,
+        eps,
+        tol,
+        use_jit,
+    )
+    return estimate
+
+
+def lyapunov_max(
+    system: System,
+    solver: Solver,
+    steps: int,
+    dt: float,
+    transient_steps: int = 0,
+    renorm_every: int = 1,
+    eps: float = 1e-8,
+    tol: float | None = None,
+    chunk_steps: int = 10_000,
+    use_jit: bool | None = None,
+) -> float:
+    """Computes the largest Lyapunov exponent of a system from a single tangent vector.
+
+    Args:
+        system (System): System to analyze
+        solver (Solver): Fixed-step solver to use for integration
+        steps (int): Maximum number of steps after the transient
+        dt (float): Time step size
+        transient_steps (int): Number of initial steps to discard. Defaults to 0.
+        renorm_every (int): Steps between renormalizations. Defaults to 1.
+        eps (float): Size of the tangent perturbation, for solvers without an in-place
+            variant. Defaults to 1e-8.
+        tol (float | None): Convergence tolerance for early stopping. Defaults to None.
+        chunk_steps (int): Number of steps between convergence checks. Defaults to 10_000.
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+
+    Raises:
+        ValueError: If any argument is out of range (see `lyapunov_iter`)
+
+    Returns:
+        float: Largest Lyapunov exponent
+    """
+    estimate = lyapunov_spectrum(
+        system,
+        solver,
+        steps,
+        dt,
+        1,
+        transient_steps,
+        renorm_every,
+        eps,
+        tol,
+        chunk_steps,
+        use_jit,
+    )
+    return float(estimate.exponents[0])
+
+
+def lyapunov_sweep(
+    system: System,
+    solver: Solver,
+    params: Vector,
+    steps: int,
+    dt: float,
+    n_exponents: int | None = None,
+    transient_steps: int = 0,
+    init_coord: Vector | None = None,
+    renorm_every: int = 1,
+    eps: float = 1e-8,
+    use_jit: bool | None = None,
+) -> Vector:
+    """Computes Lyapunov exponents for every row of a parameter matrix in parallel.
+
+    Rows are distributed across all available cores when JIT compilation is enabled. The
+    system instance is not modified. Use `param_grid` to build the parameter matrix.
+
+    Args:
+        system (System): System to analyze
+        solver (Solver): Fixed-step solver to use for integration
+        params (Vector): Parameter matrix (P x n_params), one parameter set per row
+        steps (int): Number of steps after the transient
+        dt (float): Time step size
+        n_exponents (int | None): Number of leading exponents to compute. Defaults to the
+            full spectrum.
+        transient_steps (int): Number of initial steps to discard. Defaults to 0.
+        init_coord (Vector | None): Initial state shared by all rows. Defaults to
+            `system.init_coord`.
+        renorm_every (int): Steps between re-orthonormalizations. Defaults to 1.
+        eps (float): Size of the tangent perturbations, for solvers without an in-place
+            variant. Defaults to 1e-8.
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+
+    Raises:
+        ValueError: If any argument is out of range or params does not have one column per
+            parameter
+
+    Returns:
+        Vector: Exponents of every row, largest first (P x n_exponents)
+
+    Examples:
+        >>> grid = param_grid(lorenz, rho=np.linspace(20, 200, 256))
+        >>> exponents = lyapunov_sweep(lorenz, rk4, grid, 50_000, 0.01, n_exponents=1)
+    """
+    k = _validate_lyapunov_inputs(
+        system, solver, dt, n_exponents, transient_steps, renorm_every, eps
+    )
+    if steps <= 0:
+        raise ValueError("Number of steps must be positive")
+    params = np.ascontiguousarray(params, dtype=np.float64)
+    if params.ndim != 2 or params.shape[1] != len(system.param_names):
+        msg = f"Parameter matrix must be Px{len(system.param_names)} array"
+        raise ValueError(msg)
+
+    jit_enabled = True if use_jit is None else use_jit
+    logger.debug("JIT enabled: %s", jit_enabled)
+    logger.info(
+        "Computing Lyapunov exponents for %d parameter sets: %s with solver: %s",
+        len(params),
+        system,
+        solver,
+    )
+
+    sweep_func: Callable[..., Vector]
+    if jit_enabled:
+        sweep_func = KernelCache.get("lyapunov_batch", system, solver)
+    else:
+        sweep_func = partial(_lyapunov_batch_impl, _reference_advance(system, solver))
+
+    coord = system.init_coord if init_coord is None else init_coord
+    return sweep_func(
+        np.ascontiguousarray(coord, dtype=np.float64),
+        np.eye(k, len(coord)),
+        params,
+        transient_steps,
+        steps,
+        float(dt),
+        renorm_every,
+        eps,
+    )
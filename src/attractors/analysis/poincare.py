@@ -0,0 +1,475 @@
+from collections.abc import Callable, Sequence
+
+import numpy as np
+from numba import njit, types
+from numba.extending import register_jitable
+from numpy.typing import DTypeLike, NDArray
+
+from attractors.solvers.dense import _hermite
+from attractors.solvers.kernels import KernelCache, KernelTarget, _reference_step
+from attractors.solvers.registry import Solver
+from attractors.systems.registry import System
+from attractors.type_defs import SolverInplaceCallable, SystemInplaceCallable, Vector
+from attractors.utils.histogram import accumulate
+from attractors.utils.logger import setup_logger
+
+logger = setup_logger(name=__name__)
+
+# Illinois iterations refining a crossing on the interpolant of its step
+REFINE_MAX_ITER = 50
+REFINE_TOL = 1e-12
+INITIAL_CAPACITY = 1024
+
+EventCallable = Callable[[Vector, Vector], float]
+
+
+@register_jitable
+def _plane_event(state: Vector, params: Vector, plane: Vector) -> float:  # noqa: ARG001
+    """Evaluate normal . x - offset for a plane stored as (normal, offset)."""
+    value = -plane[-1]
+    for i in range(len(state)):
+        value += plane[i] * state[i]
+    return float(value)
+
+
+@register_jitable
+def _is_crossing(before: float, after: float, direction: int) -> bool:
+    if direction >= 0 and before < 0.0 <= after:
+        return True
+    return direction <= 0 and before > 0.0 >= after
+
+
+# non-jitted
+def _section_impl(
+    system_func: SystemInplaceCallable,
+    solver_step: SolverInplaceCallable,
+    event_func: Callable[[Vector, Vector, Vector], float],
+    work: Vector,
+    state: Vector,
+    params: Vector,
+    plane: Vector,
+    steps: int,
+    dt: float,
+    skip: int,
+    direction: int,
+    max_hits: int,
+    hist: NDArray[np.int64],
+    axes: NDArray[np.int64],
+    bounds: Vector,
+) -> tuple[Vector, Vector, int]:
+    dim = len(state)
+    storing = hist.shape[0] == 0
+    points = np.empty((INITIAL_CAPACITY if storing else 0, dim), dtype=np.float64)
+    times = np.empty(len(points), dtype=np.float64)
+    current, following = state.copy(), np.empty_like(state)
+    k0, k1 = np.empty_like(state), np.empty_like(state)
+    point = np.empty_like(state)
+    crossings = 0
+
+    before = event_func(current, params, plane)
+    for n in range(steps):
+        solver_step(system_func, current, params, dt, work, following)
+        after = event_func(following, params, plane)
+        if n >= skip and _is_crossing(before, after, direction):
+            system_func(current, params, k0)
+            system_func(following, params, k1)
+            a, fa, b, fb = 0.0, before, 1.0, after
+            tol = REFINE_TOL * (abs(before) + abs(after))
+            for _ in range(REFINE_MAX_ITER):
+                c = (a * fb - b * fa) / (fb - fa)
+                _hermite(current, k0, following, k1, dt, c, point)
+                fc = event_func(point, params, plane)
+                if fc * fb < 0.0:
+                    a, fa = b, fb
+                else:
+                    fa *= 0.5
+                b, fb = c, fc
+                if abs(fc) <= tol:
+                    break
+
+            if storing:
+                if crossings == len(points):
+                    points = np.concatenate((points, np.empty_like(points)))
+                    times = np.concatenate((times, np.empty_like(times)))
+                points[crossings] = point
+                times[crossings] = (n + b) * dt
+            else:
+                accumulate(hist, point, axes, bounds)
+            crossings += 1
+            if crossings == max_hits:
+                break
+        before = after
+        current, following = following, current
+
+    count = crossings if storing else 0
+    return points[:count].copy(), times[:count].copy(), crossings
+
+
+# jitted
+@KernelCache.register(
+    "section",
+    signature=(
+        types.float64[::1],
+        types.float64[::1],
+        types.float64[::1],
+        types.int64,
+        types.float64,
+        types.int64,
+        types.int64,
+        types.int64,
+        types.int64[:, ::1],
+        types.int64[::1],
+        types.float64[::1],
+    ),
+)
+def _build_section_kernel(target: KernelTarget) -> Callable[..., tuple[Vector, Vector, int]]:
+    system_func = target.system_func
+    solver_step = target.solver_step
+    work_size = target.work_size
+    dtype = target.dtype
+    event_func = target.event_func
+
+    def user_event(state: Vector, params: Vector, plane: Vector) -> float:  # noqa: ARG001
+        return event_func(state, params)  # type: ignore[no-any-return]
+
+    event = _plane_event if event_func is None else njit(inline="always")(user_event)
+
+    def kernel(
+        state: Vector,
+        params: Vector,
+        plane: Vector,
+        steps: int,
+        dt: float,
+        skip: int,
+        direction: int,
+        max_hits: int,
+        hist: NDArray[np.int64],
+        axes: NDArray[np.int64],
+        bounds: Vector,
+    ) -> tuple[Vector, Vector, int]:
+        dim = len(state)
+        storing = hist.shape[0] == 0
+        points = np.empty((INITIAL_CAPACITY if storing else 0, dim), dtype=dtype)
+        times = np.empty(len(points), dtype=np.float64)
+        work = np.empty((work_size, dim), dtype=np.float64)
+        buffers = np.empty((5, dim), dtype=np.float64)
+        current, following = buffers[0], buffers[1]
+        k0, k1, point = buffers[2], buffers[3], buffers[4]
+        current[:] = state
+        crossings = 0
+
+        before = event(current, params, plane)
+        for n in range(steps):
+            solver_step(system_func, current, params, dt, work, following)
+            after = event(following, params, plane)
+            if n >= skip and _is_crossing(before, after, direction):
+                system_func(current, params, k0)
+                system_func(following, params, k1)
+                a, fa, b, fb = 0.0, before, 1.0, after
+                tol = REFINE_TOL * (abs(before) + abs(after))
+                for _ in range(REFINE_MAX_ITER):
+                    c = (a * fb - b * fa) / (fb - fa)
+                    _hermite(current, k0, following, k1, dt, c, point)
+                    fc = event(point, params, plane)
+                    if fc * fb < 0.0:
+                        a, fa = b, fb
+                    else:
+                        fa *= 0.5
+                    b, fb = c, fc
+                    if abs(fc) <= tol:
+                        break
+
+                if storing:
+                    if crossings == len(points):
+                        points = np.concatenate((points, np.empty_like(points)))
+                        times = np.concatenate((times, np.empty_like(times)))
+                    points[crossings] = point
+                    times[crossings] = (n + b) * dt
+                else:
+                    accumulate(hist, point, axes, bounds)
+                crossings += 1
+                if crossings == max_hits:
+                    break
+            before = after
+            current, following = following, current
+
+        count = crossings if storing else 0
+        return points[:count].copy(), times[:count].copy(), crossings
+
+    return kernel
+
+
+def _resolve_plane(
+    system: System,
+    normal: Sequence[float] | Vector | None,
+    offset: float,
+    event: EventCallable | None,
+) -> Vector:
+    dim = len(system.init_coord)
+    if (normal is None) == (event is None):
+        raise ValueError("Exactly one of a plane normal and an event function must be given")
+    if normal is None:
+        return np.zeros(1, dtype=np.float64)
+    plane = np.append(np.asarray(normal, dtype=np.float64), offset)
+    if plane.shape != (dim + 1,):
+        msg = f"Plane normal must have {dim} components"
+        raise ValueError(msg)
+    if not np.any(plane[:-1]):
+        raise ValueError("Plane normal must be non-zero")
+    return plane
+
+
+def _validate_section_inputs(
+    solver: Solver, steps: int, dt: float, transient_steps: int, direction: int
+) -> None:
+    if steps <= 0:
+        raise ValueError("Number of steps must be positive")
+    if dt <= 0:
+        raise ValueError("Time step must be positive")
+    if solver.adaptive:
+        msg = f"Solver {solver.name} is adaptive, use a fixed-step solver instead"
+        raise ValueError(msg)
+    if solver.multistep:
+        msg = f"Solver {solver.name} is multistep, use a single-step solver instead"
+        raise ValueError(msg)
+    if not 0 <= transient_steps < steps:
+        raise ValueError("Transient steps must be non-negative and less than the number of steps")
+    if direction not in (-1, 0, 1):
+        raise ValueError("Crossing direction must be -1, 0 or 1")
+
+
+def _run_section(
+    system: System,
+    solver: Solver,
+    steps: int,
+    dt: float,
+    plane: Vector,
+    event: EventCallable | None,
+    transient_steps: int,
+    direction: int,
+    max_hits: int,
+    hist: NDArray[np.int64],
+    axes: NDArray[np.int64],
+    bounds: Vector,
+    use_jit: bool | None,
+    dtype: DTypeLike,
+) -> tuple[Vector, Vector, int]:
+    jit_enabled = True if use_jit is None else use_jit
+    logger.debug("JIT enabled: %s", jit_enabled)
+    logger.info("Sectioning system: %s with solver: %s", system, solver)
+    logger.info(
+        "Steps: %d, dt: %.6g, transient: %d, direction: %d", steps, dt, transient_steps, direction
+    )
+
+    state = np.ascontiguousarray(system.init_coord, dtype=np.float64)
+    params = np.ascontiguousarray(system.params, dtype=np.float64)
+    args = (state, params, plane, steps, float(dt), transient_steps, direction, max_hits)
+    if jit_enabled:
+        kernel = KernelCache.get("section", system, solver, dtype, event=event)
+        points, times, crossings = kernel(*args, hist, axes, bounds)
+    else:
+        solver_step, work_size = _reference_step(system, solver)
+        if event is None:
+            event_func = _plane_event
+        else:
+            user_event = getattr(event, "py_func", event)
+
+            def event_func(state: Vector, params: Vector, plane: Vector) -> float:  # noqa: ARG001
+                return user_event(state, params)
+
+        work = np.empty((work_size, len(state)), dtype=np.float64)
+        points, times, crossings = _section_impl(
+            system.get_inplace_func(jitted=False),
+            solver_step,
+            event_func,
+            work,
+            *args,
+            hist,
+            axes,
+            bounds,
+        )
+        points = points.astype(dtype, copy=False)
+
+    logger.info("Section crossings: %d", crossings)
+    return points, times, int(crossings)
+
+
+def poincare_section(
+    system: System,
+    solver: Solver,
+    steps: int,
+    dt: float,
+    normal: Sequence[float] | Vector | None = None,
+    offset: float = 0.0,
+    event: EventCallable | None = None,
+    direction: int = 1,
+    transient_steps: int = 0,
+    max_hits: int | None = None,
+    use_jit: bool | None = None,
+    dtype: DTypeLike = np.float64,
+) -> tuple[Vector, Vector]:
+    """Integrates a dynamical system and records only its crossings of a Poincare section.
+
+    The section is the zero set of either the plane `normal . x - offset` or a scalar event
+    function `event(state, params)`. A crossing is detected when the event value changes
+    sign over a step and is located within the step by Illinois root finding on the cubic
+    Hermite interpolant of the step, so that recorded points lie on the section to
+    interpolation accuracy. The full trajectory is never stored.
+
+    With JIT enabled, integration runs in a kernel fused with the system, solver and event
+    function. Planes are passed as data, so sections through different planes share one
+    compiled kernel, while each event function compiles its own.
+
+    Args:
+        system (System): System to integrate
+        solver (Solver): Single-step fixed-step solver to use for integration
+        steps (int): Number of integration steps
+        dt (float): Time step size
+        normal (Sequence[float] | Vector | None): Normal of the section plane.
+            Defaults to None.
+        offset (float): Offset of the section plane. Defaults to 0.0.
+        event (EventCallable | None): Event function taking (state, params) and returning
+            a scalar whose zero set is the section, used instead of a plane. Defaults to None.
+        direction (int): Record crossings from negative to non-negative event values (1),
+            the reverse (-1) or both (0). Defaults to 1.
+        transient_steps (int): Number of initial steps in which crossings are ignored.
+            Defaults to 0.
+        max_hits (int | None): Stop integrating after this many crossings. Defaults to None.
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+        dtype (DTypeLike): Storage dtype of the crossing points. Defaults to np.float64.
+
+    Raises:
+        ValueError: If steps <= 0, dt <= 0, the solver is adaptive or multistep,
+            transient_steps is negative or not less than steps, direction is not -1, 0 or 1,
+            max_hits is not positive, or not exactly one of normal and event is given
+
+    Returns:
+        tuple[Vector, Vector]: A tuple containing:
+            - Vector: System state at each crossing
+            - Vector: Time of each crossing
+
+    Examples:
+        >>> points, times = poincare_section(
+        ...     system, solver, 10_000_000, 0.001, normal=[0, 0, 1], offset=27.0
+        ... )
+    """
+    _validate_section_inputs(solver, steps, dt, transient_steps, direction)
+    if max_hits is not None and max_hits <= 0:
+        raise ValueError("Maximum number of hits must be positive")
+    plane = _resolve_plane(system, normal, offset, event)
+
+    points, times, _ = _run_section(
+        system,
+        solver,
+        steps,
+        dt,
+        plane,
+        event,
+        transient_steps,
+        direction,
+        -1 if max_hits is None else max_hits,
+        np.zeros((0, 0), dtype=np.int64),
+        np.zeros(2, dtype=np.int64),
+        np.zeros(4, dtype=np.float64),
+        use_jit,
+        dtype,
+    )
+    return points, times
+
+
+def poincare_histogram(
+    system: System,
+    solver: Solver,
+    steps: int,
+    dt: float,
+    bounds: tuple[tuple[float, float], tuple[float, float]],
+    bins: int | tuple[int, int] = 256,
+    axes: tuple[int, int] = (0, 1),
+    normal: Sequence[float] | Vector | None = None,
+    offset: float = 0.0,
+    event: EventCallable | None = None,
+    direction: int = 1,
+    transient_steps: int = 0,
+    use_jit: bool | None = None,
+) -> tuple[NDArray[np.int64], Vector, Vector]:
+    """Accumulates the crossings of a Poincare section into a 2D histogram.
+
+    Crossings are detected and refined as in `poincare_section`, projected onto two state
+    components and binned directly inside the integration loop, so memory use is
+    independent of the number of crossings. Bins follow `np.histogram2d`, with the last
+    bin along each axis including its upper edge and points outside the bounds ignored.
+
+    Args:
+        system (System): System to integrate
+        solver (Solver): Single-step fixed-step solver to use for integration
+        steps (int): Number of integration steps
+        dt (float): Time step size
+        bounds (tuple[tuple[float, float], tuple[float, float]]): Lower and upper bounds of
+            the histogram along both axes
+        bins (int | tuple[int, int]): Number of bins along both axes or each axis.
+            Defaults to 256.
+        axes (tuple[int, int]): State components to project crossings onto.
+            Defaults to (0, 1).
+        normal (Sequence[float] | Vector | None): Normal of the section plane.
+            Defaults to None.
+        offset (float): Offset of the section plane. Defaults to 0.0.
+        event (EventCallable | None): Event function taking (state, params) used instead
+            of a plane. Defaults to None.
+        direction (int): Record crossings from negative to non-negative event values (1),
+            the reverse (-1) or both (0). Defaults to 1.
+        transient_steps (int): Number of initial steps in which crossings are ignored.
+            Defaults to 0.
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+
+    Raises:
+        ValueError: If the inputs of `poincare_section` are invalid, bins are not positive,
+            bounds are empty or axes are not valid state components
+
+    Returns:
+        tuple[NDArray[np.int64], Vector, Vector]: A tuple containing:
+            - NDArray[np.int64]: Crossing counts of shape (bins_x, bins_y)
+            - Vector: Bin edges along the first axis
+            - Vector: Bin edges along the second axis
+
+    Examples:
+        >>> counts, xedges, yedges = poincare_histogram(
+        ...     system,
+        ...     solver,
+        ...     100_000_000,
+        ...     0.001,
+        ...     ((-20, 20), (-25, 25)),
+        ...     normal=[0, 0, 1],
+        ...     offset=27.0,
+        ... )
+    """
+    _validate_section_inputs(solver, steps, dt, transient_steps, direction)
+    plane = _resolve_plane(system, normal, offset, event)
+    nx, ny = (bins, bins) if isinstance(bins, int) else bins
+    if nx <= 0 or ny <= 0:
+        raise ValueError("Number of bins must be positive")
+    (x0, x1), (y0, y1) = bounds
+    if not (x0 < x1 and y0 < y1):
+        raise ValueError("Histogram bounds must be increasing")
+    dim = len(system.init_coord)
+    if not all(0 <= axis < dim for axis in axes):
+        msg = f"Axes must be state components between 0 and {dim - 1}"
+        raise ValueError(msg)
+
+    hist = np.zeros((nx, ny), dtype=np.int64)
+    _run_section(
+        system,
+        solver,
+        steps,
+        dt,
+        plane,
+        event,
+        transient_steps,
+        direction,
+        -1,
+        hist,
+        np.array(axes, dtype=np.int64),
+        np.array([x0, x1, y0, y1], dtype=np.float64),
+        use_jit,
+        np.float64,
+    )
+    return hist, np.linspace(x0, x1, nx + 1), np.linspace(y0, y1, ny + 1)
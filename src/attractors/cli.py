@@ -0,0 +1,81 @@
+import argparse
+from collections.abc import Sequence
+
+from attractors.solvers.kernels import KernelCache
+from attractors.solvers.precompile import precompile
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="attractors")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = commands.add_parser(
+        "precompile", help="compile integration kernels into the on-disk cache"
+    )
+    compile_parser.add_argument(
+        "-s",
+        "--system",
+        action="append",
+        dest="systems",
+        help="system to compile for (repeatable, default: all)",
+    )
+    compile_parser.add_argument(
+        "-S",
+        "--solver",
+        action="append",
+        dest="solvers",
+        help="solver to compile for (repeatable, default: all fixed-step solvers)",
+    )
+    compile_parser.add_argument(
+        "-k",
+        "--kind",
+        action="append",
+        dest="kinds",
+        choices=KernelCache.list_kernels(),
+        help="kernel kind to compile (repeatable, default: all)",
+    )
+    compile_parser.add_argument(
+        "-m",
+        "--map",
+        action="append",
+        dest="maps",
+        default=[],
+        help="discrete map to compile the density kernel for (repeatable, default: none)",
+    )
+    compile_parser.add_argument("--dtype", default="float64", help="output dtype")
+    compile_parser.add_argument("--cache-dir", help="kernel cache directory")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the attractors command line interface.
+
+    Args:
+        argv (Sequence[str] | None): Command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: Exit status
+
+    Examples:
+        $ attractors precompile --system lorenz --solver rk4 --kind trajectory
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    if args.cache_dir is not None:
+        KernelCache.set_cache_dir(args.cache_dir)
+    try:
+        report = precompile(
+            args.systems, args.solvers, args.kinds, dtype=args.dtype, maps=args.maps
+        )
+    except (KeyError, ValueError, TypeError) as e:
+        parser.error(str(e))
+
+    width = max(map(len, report), default=0)
+    for label, seconds in report.items():
+        print(f"{label:{width}}  {seconds:8.3f}s")
+    print(
+        f"{len(report)} kernels in {sum(report.values()):.3f}s (cache: {KernelCache.cache_dir()})"
+    )
+    return 0
@@ -0,0 +1,2 @@
+# ruff: noqa: F401
+from attractors.maps import clifford, de_jong, henon, ikeda, svensson
@@ -0,0 +1,22 @@
+import numpy as np
+
+from attractors.maps.registry import MapRegistry
+from attractors.type_defs import Vector
+
+
+@MapRegistry.register(
+    name="clifford",
+    default_params=np.array([-1.4, 1.6, 1.0, 0.7]),  # a, b, c, d
+    param_names=["a", "b", "c", "d"],
+    init_coord=np.array([0.1, 0.1]),
+    reference=(
+        'Pickover, Clifford A. "Chaos in Wonderland: Visual Adventures in a Fractal World." '
+        "St. Martin's Press, 1994."
+    ),
+    extent=((-1.5, 2.0), (-1.4, 1.6)),
+)
+def clifford(state: Vector, params: Vector) -> Vector:
+    """Clifford attractor map."""
+    x, y = state
+    a, b, c, d = params
+    return np.array([np.sin(a * y) + c * np.cos(a * x), np.sin(b * x) + d * np.cos(b * y)])
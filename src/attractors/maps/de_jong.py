@@ -0,0 +1,19 @@
+import numpy as np
+
+from attractors.maps.registry import MapRegistry
+from attractors.type_defs import Vector
+
+
+@MapRegistry.register(
+    name="de_jong",
+    default_params=np.array([1.641, 1.902, 0.316, 1.525]),  # a, b, c, d
+    param_names=["a", "b", "c", "d"],
+    init_coord=np.array([0.1, 0.1]),
+    reference='Bourke, Paul. "Peter de Jong Attractors." paulbourke.net/fractals/peterdejong.',
+    extent=((-2.1, 2.0), (-1.7, 1.2)),
+)
+def de_jong(state: Vector, params: Vector) -> Vector:
+    """Peter de Jong attractor map."""
+    x, y = state
+    a, b, c, d = params
+    return np.array([np.sin(a * y) - np.cos(b * x), np.sin(c * x) - np.cos(d * y)])
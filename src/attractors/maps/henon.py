@@ -0,0 +1,22 @@
+import numpy as np
+
+from attractors.maps.registry import MapRegistry
+from attractors.type_defs import Vector
+
+
+@MapRegistry.register(
+    name="henon",
+    default_params=np.array([1.4, 0.3]),  # a, b
+    param_names=["a", "b"],
+    init_coord=np.array([0.0, 0.0]),
+    reference=(
+        'Hénon, Michel. "A two-dimensional mapping with a strange attractor." '
+        "Communications in Mathematical Physics 50 (1976): 69-77."
+    ),
+    extent=((-1.35, 1.35), (-0.4, 0.4)),
+)
+def henon(state: Vector, params: Vector) -> Vector:
+    """Hénon map."""
+    x, y = state
+    a, b = params
+    return np.array([1.0 - a * x**2 + y, b * x])
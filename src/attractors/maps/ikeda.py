@@ -0,0 +1,25 @@
+import numpy as np
+
+from attractors.maps.registry import MapRegistry
+from attractors.type_defs import Vector
+
+
+@MapRegistry.register(
+    name="ikeda",
+    default_params=np.array([0.9]),  # u
+    param_names=["u"],
+    init_coord=np.array([0.1, 0.1]),
+    reference=(
+        'Ikeda, Kensuke. "Multiple-valued stationary state and its instability of the '
+        'transmitted light by a ring cavity system." Optics Communications 30 (1979): 257-261.'
+    ),
+    extent=((-0.45, 1.8), (-2.3, 0.95)),
+)
+def ikeda(state: Vector, params: Vector) -> Vector:
+    """Ikeda map."""
+    x, y = state
+    u = params[0]
+    t = 0.4 - 6.0 / (1.0 + x**2 + y**2)
+    return np.array(
+        [1.0 + u * (x * np.cos(t) - y * np.sin(t)), u * (x * np.sin(t) + y * np.cos(t))]
+    )
@@ -0,0 +1,321 @@
+from collections.abc import Callable
+
+import numba
+import numpy as np
+from numba import njit, prange, types
+from numba.core.dispatcher import Dispatcher
+from numba.extending import register_jitable
+from numpy.typing import NDArray
+
+from attractors.maps.registry import Map, MapExtent
+from attractors.solvers.kernels import KernelCache
+from attractors.type_defs import SystemInplaceCallable, Vector
+from attractors.utils.histogram import accumulate
+from attractors.utils.logger import setup_logger
+
+logger = setup_logger(name=__name__)
+
+
+@register_jitable
+def _is_finite(state: Vector) -> bool:
+    """Check that all components of a state are finite."""
+    finite = True
+    for i in range(len(state)):
+        finite &= np.isfinite(state[i])
+    return finite
+
+
+# non-jitted
+def _iterate_impl(
+    map_func: SystemInplaceCallable,
+    state: Vector,
+    params: Vector,
+    iterations: int,
+    transient: int,
+) -> Vector:
+    orbit = np.empty((iterations, len(state)), dtype=np.float64)
+    current, following = state.copy(), np.empty_like(state)
+    for i in range(transient + iterations):
+        map_func(current, params, following)
+        current, following = following, current
+        if i >= transient:
+            orbit[i - transient] = current
+    return orbit
+
+
+# jitted
+_iterate_jitted = njit(nogil=True)(_iterate_impl)
+
+
+# non-jitted
+def _density_impl(
+    map_func: SystemInplaceCallable,
+    init_coords: Vector,
+    params: Vector,
+    iterations: NDArray[np.int64],
+    transient: int,
+    chunks: int,
+    axes: NDArray[np.int64],
+    bounds: Vector,
+    nx: int,
+    ny: int,
+) -> tuple[NDArray[np.int64], int]:
+    """Iterate independent orbits and bin their points without storing them.
+
+    Orbits are distributed over chunks, each accumulating into a private histogram so
+    that chunks run in parallel without synchronization. Orbits stop at the first
+    non-finite state, which is not counted.
+    """
+    n_orbits, dim = init_coords.shape
+    hists = np.zeros((chunks, nx, ny), dtype=np.int64)
+    escaped = np.zeros(chunks, dtype=np.int64)
+    for c in range(chunks):
+        buffers = np.empty((2, dim), dtype=np.float64)
+        for k in range(c, n_orbits, chunks):
+            current, following = buffers[0], buffers[1]
+            current[:] = init_coords[k]
+            for i in range(transient + iterations[k]):
+                map_func(current, params, following)
+                current, following = following, current
+                if not _is_finite(current):
+                    escaped[c] += 1
+                    break
+                if i >= transient:
+                    accumulate(hists[c], current, axes, bounds)
+    return hists.sum(axis=0), escaped.sum()
+
+
+_DENSITY_SIGNATURE = (
+    types.float64[:, ::1],
+    types.float64[::1],
+    types.int64[::1],
+    types.int64,
+    types.int64,
+    types.int64[::1],
+    types.float64[::1],
+    types.int64,
+    types.int64,
+)
+
+
+# jitted
+def _build_density_kernel(
+    map_func: SystemInplaceCallable,
+) -> Callable[..., tuple[NDArray[np.int64], int]]:
+    """Build the density kernel of a map, with the map function inlined."""
+    step = njit(inline="always")(getattr(map_func, "py_func", map_func))
+
+    def kernel(
+        init_coords: Vector,
+        params: Vector,
+        iterations: NDArray[np.int64],
+        transient: int,
+        chunks: int,
+        axes: NDArray[np.int64],
+        bounds: Vector,
+        nx: int,
+        ny: int,
+    ) -> tuple[NDArray[np.int64], int]:
+        n_orbits, dim = init_coords.shape
+        hists = np.zeros((chunks, nx, ny), dtype=np.int64)
+        escaped = np.zeros(chunks, dtype=np.int64)
+        for c in prange(chunks):
+            hist = hists[c]
+            buffers = np.empty((2, dim), dtype=np.float64)
+            for k in range(c, n_orbits, chunks):
+                current, following = buffers[0], buffers[1]
+                current[:] = init_coords[k]
+                for i in range(transient + iterations[k]):
+                    step(current, params, following)
+                    current, following = following, current
+                    if not _is_finite(current):
+                        escaped[c] += 1
+                        break
+                    if i >= transient:
+                        accumulate(hist, current, axes, bounds)
+        return hists.sum(axis=0), escaped.sum()
+
+    return kernel
+
+
+def density_kernel(map: Map) -> Dispatcher:
+    """
+    Get the compiled density kernel of a map, compiling it on first use.
+
+    The kernel is kept in the `KernelCache`, which persists it on disk and counts it in
+    the cache statistics under the label "map_density:<map name>".
+
+    Args:
+        map (Map): Map to specialize on
+
+    Returns:
+        Dispatcher: Compiled kernel used by `map_density`
+    """
+    map_func = map.get_inplace_func(jitted=False)
+    return KernelCache.get_custom(
+        "map_density",
+        (map_func,),
+        f"map_density:{map.name}",
+        lambda: _build_density_kernel(map_func),
+        signature=_DENSITY_SIGNATURE,
+        parallel=True,
+    )
+
+
+def iterate_map(
+    map: Map,
+    iterations: int,
+    transient: int = 0,
+    use_jit: bool | None = None,
+) -> Vector:
+    """Iterates a discrete-time map from its initial state.
+
+    Args:
+        map (Map): Map to iterate
+        iterations (int): Number of recorded iterations
+        transient (int): Number of initial iterations to discard. Defaults to 0.
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+
+    Raises:
+        ValueError: If iterations is not positive or transient is negative
+
+    Returns:
+        Vector: States after each recorded iteration (iterations x dim)
+
+    Examples:
+        >>> orbit = iterate_map(MapRegistry.get("henon"), 10_000, transient=100)
+    """
+    if iterations <= 0:
+        raise ValueError("Number of iterations must be positive")
+    if transient < 0:
+        raise ValueError("Number of transient iterations must be non-negative")
+
+    jit_enabled = True if use_jit is None else use_jit
+    logger.debug("JIT enabled: %s", jit_enabled)
+    state = np.ascontiguousarray(map.init_coord, dtype=np.float64)
+    params = np.ascontiguousarray(map.params, dtype=np.float64)
+    iterate: Callable[..., Vector] = _iterate_jitted if jit_enabled else _iterate_impl
+    return iterate(map.get_inplace_func(jit_enabled), state, params, iterations, transient)
+
+
+def map_density(
+    map: Map,
+    iterations: int,
+    bins: int | tuple[int, int] = 1024,
+    bounds: MapExtent | None = None,
+    axes: tuple[int, int] = (0, 1),
+    orbits: int = 64,
+    transient: int = 100,
+    init_coords: Vector | None = None,
+    seed: int | None = 0,
+    use_jit: bool | None = None,
+) -> tuple[NDArray[np.int64], Vector, Vector]:
+    """Accumulates the invariant density of a map into a 2D histogram.
+
+    The iterations are split evenly over independent orbits, whose points are projected
+    onto two state components and binned as they are generated, so memory use is
+    independent of the number of iterations and billions of points can be accumulated.
+    With JIT compilation, orbits run in parallel on all available cores, each thread
+    binning into a private histogram, and the histograms are summed at the end. The counts
+    are exact integers and do not depend on the number of threads. Bins follow
+    `np.histogram2d`, with the last bin along each axis including its upper edge and points
+    outside the bounds ignored. Orbits reaching a non-finite state stop early.
+
+    The counts can be turned into an image with
+    `attractors.visualizers.utils.density.render_density`.
+
+    Args:
+        map (Map): Map to iterate
+        iterations (int): Total number of binned iterations over all orbits
+        bins (int | tuple[int, int]): Number of bins along both axes or each axis.
+            Defaults to 1024.
+        bounds (MapExtent | None): Lower and upper bounds of the histogram along both axes.
+            Defaults to the extent of the map.
+        axes (tuple[int, int]): State components to project onto. Defaults to (0, 1).
+        orbits (int): Number of independent orbits. Defaults to 64.
+        transient (int): Number of initial iterations discarded by every orbit.
+            Defaults to 100.
+        init_coords (Vector | None): Initial states of the orbits (orbits x dim).
+            Defaults to the initial state of the map, perturbed by uniform noise of
+            amplitude 1e-3.
+        seed (int | None): Seed of the initial perturbations. Defaults to 0.
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+
+    Raises:
+        ValueError: If iterations or orbits are not positive, transient is negative, bins
+            are not positive, bounds are missing or empty, axes are not a pair of valid
+            state components or init_coords does not match the orbits
+
+    Returns:
+        tuple[NDArray[np.int64], Vector, Vector]: A tuple containing:
+            - NDArray[np.int64]: Point counts of shape (bins_x, bins_y)
+            - Vector: Bin edges along the first axis
+            - Vector: Bin edges along the second axis
+
+    Examples:
+        >>> counts, xedges, yedges = map_density(MapRegistry.get("clifford"), 1_000_000_000)
+        >>> image = render_density(counts, ThemeManager.get("inferno"))
+    """
+    if iterations <= 0:
+        raise ValueError("Number of iterations must be positive")
+    if orbits <= 0:
+        raise ValueError("Number of orbits must be positive")
+    if transient < 0:
+        raise ValueError("Number of transient iterations must be non-negative")
+    nx, ny = (bins, bins) if isinstance(bins, int) else bins
+    if nx <= 0 or ny <= 0:
+        raise ValueError("Number of bins must be positive")
+    bounds = map.extent if bounds is None else bounds
+    if bounds is None:
+        msg = f"Map {map.name} has no extent, histogram bounds are required"
+        raise ValueError(msg)
+    (x0, x1), (y0, y1) = bounds
+    if not (x0 < x1 and y0 < y1):
+        raise ValueError("Histogram bounds must be increasing")
+    if len(axes) != 2:
+        raise ValueError("Axes must be a pair of state components")
+    if not all(0 <= axis < map.dim for axis in axes):
+        msg = f"Axes must be state components between 0 and {map.dim - 1}"
+        raise ValueError(msg)
+
+    if init_coords is None:
+        rng = np.random.default_rng(seed)
+        init_coords = map.init_coord + rng.uniform(-1e-3, 1e-3, size=(orbits, map.dim))
+    init_coords = np.ascontiguousarray(init_coords, dtype=np.float64)
+    if init_coords.shape != (orbits, map.dim):
+        msg = f"Initial coordinates must be {orbits}x{map.dim} array"
+        raise ValueError(msg)
+
+    per_orbit = np.full(orbits, iterations // orbits, dtype=np.int64)
+    per_orbit[: iterations % orbits] += 1
+
+    jit_enabled = True if use_jit is None else use_jit
+    logger.debug("JIT enabled: %s", jit_enabled)
+    chunks = min(numba.get_num_threads(), orbits) if jit_enabled else 1
+    logger.info(
+        "Accumulating %d iterations of %s over %d orbits in %d chunks",
+        iterations,
+        map,
+        orbits,
+        chunks,
+    )
+    args = (
+        init_coords,
+        np.ascontiguousarray(map.params, dtype=np.float64),
+        per_orbit,
+        transient,
+        chunks,
+        np.asarray(axes, dtype=np.int64),
+        np.array([x0, x1, y0, y1], dtype=np.float64),
+        nx,
+        ny,
+    )
+    if jit_enabled:
+        counts, escaped = density_kernel(map)(*args)
+    else:
+        # escaping orbits are detected and stopped, so overflow is expected
+        with np.errstate(over="ignore", invalid="ignore"):
+            counts, escaped = _density_impl(map.get_inplace_func(jitted=False), *args)
+    if escaped:
+        logger.warning("%d of %d orbits of %s reached a non-finite state", escaped, orbits, map)
+    return counts, np.linspace(x0, x1, nx + 1), np.linspace(y0, y1, ny + 1)
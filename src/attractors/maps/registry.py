@@ -0,0 +1,239 @@
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import ClassVar, TypeVar
+
+import numpy as np
+from numba import njit
+
+from attractors.systems.inplace import adapt_inplace
+from attractors.type_defs import SystemCallable, SystemInplaceCallable, Vector
+from attractors.utils.jit import is_cacheable, is_jitted
+from attractors.utils.logger import setup_logger
+
+logger = setup_logger(name=__name__)
+
+MapExtent = tuple[tuple[float, float], tuple[float, float]]
+
+
+@dataclass
+class Map:
+    """
+    Data class representing a discrete-time map with JIT compilation support.
+
+    Attributes:
+        func (SystemCallable): Original map function returning the next state
+        jitted_func (SystemCallable): JIT-compiled map function
+        name (str): Map identifier
+        params (Vector): Map parameters vector
+        param_names (list[str]): List of parameter names
+        reference (str): Academic reference
+        init_coord (Vector): Initial state vector
+        extent (MapExtent | None): Optional lower and upper bounds of the attractor along
+            the first two state components
+        inplace_func (SystemInplaceCallable | None): In-place map function writing the next
+            state into an output buffer. Generated from func if None.
+        jitted_inplace_func (SystemInplaceCallable | None): JIT-compiled in-place map
+            function. Generated from func if None.
+        dim (int): Dimension of the state vector, taken from init_coord
+
+    Raises:
+        ValueError: If init_coord is not a non-empty vector
+    """
+
+    func: SystemCallable
+    jitted_func: SystemCallable
+    name: str
+    params: Vector
+    param_names: list[str]
+    reference: str
+    init_coord: Vector
+    extent: MapExtent | None = None
+    inplace_func: SystemInplaceCallable | None = None
+    jitted_inplace_func: SystemInplaceCallable | None = None
+    dim: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        if np.ndim(self.init_coord) != 1 or len(self.init_coord) == 0:
+            raise ValueError("Initial state must be a non-empty vector")
+        self.dim = len(self.init_coord)
+        if self.inplace_func is None:
+            self.inplace_func, self.jitted_inplace_func = adapt_inplace(self.func, self.jitted_func)
+        elif self.jitted_inplace_func is None:
+            self.jitted_inplace_func = (
+                self.inplace_func if is_jitted(self.inplace_func) else njit()(self.inplace_func)
+            )
+
+    def set_params(self, params: Vector) -> None:
+        """
+        Set map parameters.
+
+        Args:
+            params (Vector): New parameter vector
+
+        Raises:
+            ValueError: If parameter count doesn't match expected number of parameters
+        """
+        if len(params) != len(self.param_names):
+            msg = f"Expected {len(self.param_names)} parameters"
+            raise ValueError(msg)
+        logger.debug("Setting parameters: %s for map: %s", params, self.name)
+        self.params = params
+
+    def get_func(self, jitted: bool = True) -> SystemCallable:
+        """
+        Get map function.
+
+        Args:
+            jitted (bool, optional): Whether to return JIT-compiled version. Defaults to True.
+
+        Returns:
+            SystemCallable: Map function (JIT-compiled or original)
+        """
+        return self.jitted_func if jitted else self.func
+
+    def get_inplace_func(self, jitted: bool = True) -> SystemInplaceCallable:
+        """
+        Get in-place map function.
+
+        The in-place function takes (state, params, out) and writes the next state into out
+        instead of allocating a new vector.
+
+        Args:
+            jitted (bool, optional): Whether to return JIT-compiled version. Defaults to True.
+
+        Returns:
+            SystemInplaceCallable: In-place map function (JIT-compiled or original)
+        """
+        func = self.jitted_inplace_func if jitted else self.inplace_func
+        assert func is not None
+        return func
+
+    def __repr__(self) -> str:
+        return f"Map(name={self.name}, dim={self.dim})"
+
+
+F = TypeVar("F", bound=SystemCallable)
+
+
+class MapRegistry:
+    """
+    Registry for discrete-time maps with JIT compilation support.
+
+    Mirrors `SystemRegistry`, except that a registered function returns the next state of
+    the map instead of a derivative. Each map must be registered with:
+        - Unique name
+        - Default parameters and their names
+        - Initial coordinates, whose length sets the state dimension
+        - Optional attractor extent and academic reference
+
+    Maps are automatically JIT-compiled during registration.
+
+    Attributes:
+        _maps: Internal dict mapping map names to Map instances
+
+    Examples:
+        >>> @MapRegistry.register(
+        ...     "henon",
+        ...     default_params=np.array([1.4, 0.3]),
+        ...     param_names=["a", "b"],
+        ...     init_coord=np.array([0.0, 0.0]),
+        ... )
+        ... def henon(state: Vector, params: Vector) -> Vector:
+        ...     x, y = state
+        ...     a, b = params
+        ...     return np.array([1 - a * x**2 + y, b * x])
+    """
+
+    _maps: ClassVar[dict[str, Map]] = {}
+
+    @classmethod
+    def register(
+        cls,
+        name: str,
+        *,
+        default_params: Vector,
+        param_names: list[str],
+        reference: str = "",
+        init_coord: Vector,
+        extent: MapExtent | None = None,
+    ) -> Callable[[F], F]:
+        """
+        Register a map function in the MapRegistry.
+
+        Decorator that registers a map function and creates a JIT-compiled version.
+        Module-level map functions are compiled with Numba's on-disk cache enabled.
+        The registered map must take (state, params) Vector type arguments and return the
+        next state, preferably as a single `return np.array([...])` statement so that an
+        allocation-free in-place variant can be generated.
+
+        Args:
+            name (str): Unique identifier for the map
+            default_params (Vector): Default parameter values
+            param_names (list[str]): Names of parameters
+            reference (str, optional): Academic reference. Defaults to "".
+            init_coord (Vector): Initial state vector, which sets the state dimension
+            extent (MapExtent | None, optional): Bounds of the attractor along the first
+                two state components. Defaults to None.
+
+        Returns:
+            Callable[[F], F]: Decorator function that registers and JIT-compiles the map
+
+        Raises:
+            TypeError: If name is not a string or decorated object is not callable
+            ValueError: If map name is already registered
+        """
+
+        def decorator(f: F) -> F:
+            if not isinstance(name, str):
+                raise TypeError("Name must be string")
+            if not callable(f):
+                raise TypeError("Must register callable")
+            if name in cls._maps:
+                msg = f"Map {name} already registered"
+                raise ValueError(msg)
+
+            jitted_f = f if is_jitted(f) else njit(cache=is_cacheable(f))(f)
+            cls._maps[name] = Map(
+                func=f,
+                jitted_func=jitted_f,
+                name=name,
+                params=default_params,
+                param_names=param_names,
+                reference=reference,
+                init_coord=init_coord,
+                extent=extent,
+            )
+            return f
+
+        logger.debug("Registered map: %s", name)
+        return decorator
+
+    @classmethod
+    def get(cls, name: str) -> Map:
+        """
+        Get registered map by name.
+
+        Args:
+            name (str): Name of map to retrieve
+
+        Returns:
+            Map: Registered Map instance
+
+        Raises:
+            KeyError: If map name is not found
+        """
+        if name not in cls._maps:
+            msg = f"Map {name} not found"
+            raise KeyError(msg)
+        logger.debug("Getting map: %s", name)
+        return cls._maps[name]
+
+    @classmethod
+    def list_maps(cls) -> list[str]:
+        """
+        Get list of all registered map names.
+
+        Returns:
+            list[str]: List of registered map names
+        """
+        return list(cls._maps.keys())
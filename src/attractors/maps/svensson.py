@@ -0,0 +1,19 @@
+import numpy as np
+
+from attractors.maps.registry import MapRegistry
+from attractors.type_defs import Vector
+
+
+@MapRegistry.register(
+    name="svensson",
+    default_params=np.array([1.4, 1.56, 1.4, -6.56]),  # a, b, c, d
+    param_names=["a", "b", "c", "d"],
+    init_coord=np.array([0.1, 0.1]),
+    reference='Bourke, Paul. "Johnny Svensson Attractors." paulbourke.net/fractals/peterdejong.',
+    extent=((-7.7, 7.7), (-2.5, 2.5)),
+)
+def svensson(state: Vector, params: Vector) -> Vector:
+    """Johnny Svensson attractor map."""
+    x, y = state
+    a, b, c, d = params
+    return np.array([d * np.sin(a * x) - np.sin(b * y), c * np.cos(a * x) + np.cos(b * y)])
@@ -1,11 +1,39 @@
 # ruff: noqa: F401
 
-from attractors.solvers import euler, rk2, rk3, rk4, rk5
+from attractors.solvers import (
+    abm,
+    backward_euler,
+    bs32,
+    bulirsch_stoer,
+    cash_karp,
+    dopri5,
+    euler,
+    implicit_midpoint,
+    rk2,
+    rk3,
+    rk4,
+    rk5,
+    rk6,
+    rkf78,
+    ros2,
+    sdirk2,
+)
 
 __all__ = [
+    "abm",
+    "backward_euler",
+    "bs32",
+    "bulirsch_stoer",
+    "cash_karp",
+    "dopri5",
     "euler",
+    "implicit_midpoint",
     "rk2",
     "rk3",
     "rk4",
     "rk5",
+    "rk6",
+    "rkf78",
+    "ros2",
+    "sdirk2",
 ]
@@ -0,0 +1,120 @@
+from numba.extending import register_jitable
+
+# The start-up solver is registered on import
+import attractors.solvers.rk4  # noqa: F401
+from attractors.solvers.registry import SolverRegistry
+from attractors.type_defs import SystemInplaceCallable, Vector
+
+# Adams-Bashforth weights of f_n, f_n-1, ..., newest first
+AB2 = (3 / 2, -1 / 2)
+AB3 = (23 / 12, -16 / 12, 5 / 12)
+AB4 = (55 / 24, -59 / 24, 37 / 24, -9 / 24)
+AB5 = (1901 / 720, -2774 / 720, 2616 / 720, -1274 / 720, 251 / 720)
+
+# Adams-Moulton weights of f_n+1, f_n, ..., newest first
+AM2 = (1 / 2, 1 / 2)
+AM3 = (5 / 12, 8 / 12, -1 / 12)
+AM4 = (9 / 24, 19 / 24, -5 / 24, 1 / 24)
+AM5 = (251 / 720, 646 / 720, -264 / 720, 106 / 720, -19 / 720)
+
+
+@register_jitable(inline="always")
+def _abm_step(
+    system_func: SystemInplaceCallable,
+    state: Vector,
+    params: Vector,
+    dt: float,
+    history: Vector,
+    work: Vector,
+    out: Vector,
+    predictor: tuple[float, ...],
+    corrector: tuple[float, ...],
+) -> None:
+    """Adams-Bashforth-Moulton step in PECE mode.
+
+    Predicts with Adams-Bashforth, evaluates the derivative at the prediction, corrects
+    with Adams-Moulton of the same order and evaluates the derivative at the corrected
+    state, which becomes the newest history entry. Costs two system evaluations per step.
+    """
+    n = len(state)
+    depth = len(predictor)
+    predicted, derivative = work[0], work[1]
+    for i in range(n):
+        predicted[i] = state[i]
+    for j in range(depth):
+        for i in range(n):
+            predicted[i] += dt * predictor[j] * history[j, i]
+    system_func(predicted, params, derivative)
+    for i in range(n):
+        out[i] = state[i] + dt * corrector[0] * derivative[i]
+    for j in range(depth - 1):
+        for i in range(n):
+            out[i] += dt * corrector[j + 1] * history[j, i]
+    for j in range(depth - 1, 0, -1):
+        for i in range(n):
+            history[j, i] = history[j - 1, i]
+    system_func(out, params, history[0])
+
+
+@SolverRegistry.register_multistep("abm2", order=2, history=2, work_size=2)
+def abm2(
+    system_func: SystemInplaceCallable,
+    state: Vector,
+    params: Vector,
+    dt: float,
+    history: Vector,
+    work: Vector,
+    out: Vector,
+) -> None:
+    """
+    Adams-Bashforth-Moulton 2nd order predictor-corrector scheme.
+    """
+    _abm_step(system_func, state, params, dt, history, work, out, AB2, AM2)
+
+
+@SolverRegistry.register_multistep("abm3", order=3, history=3, work_size=2)
+def abm3(
+    system_func: SystemInplaceCallable,
+    state: Vector,
+    params: Vector,
+    dt: float,
+    history: Vector,
+    work: Vector,
+    out: Vector,
+) -> None:
+    """
+    Adams-Bashforth-Moulton 3rd order predictor-corrector scheme.
+    """
+    _abm_step(system_func, state, params, dt, history, work, out, AB3, AM3)
+
+
+@SolverRegistry.register_multistep("abm4", order=4, history=4, work_size=2)
+def abm4(
+    system_func: SystemInplaceCallable,
+    state: Vector,
+    params: Vector,
+    dt: float,
+    history: Vector,
+    work: Vector,
+    out: Vector,
+) -> None:
+    """
+    Adams-Bashforth-Moulton 4th order predictor-corrector scheme.
+    """
+    _abm_step(system_func, state, params, dt, history, work, out, AB4, AM4)
+
+
+@SolverRegistry.register_multistep("abm5", order=5, history=5, work_size=2)
+def abm5(
+    system_func: SystemInplaceCallable,
+    state: Vector,
+    params: Vector,
+    dt: float,
+    history: Vector,
+    work: Vector,
+    out: Vector,
+) -> None:
+    """
+    Adams-Bashforth-Moulton 5th order predictor-corrector scheme.
+    """
+    _abm_step(system_func, state, params, dt, history, work, out, AB5, AM5)
@@ -0,0 +1,245 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import cast
+
+import numpy as np
+from numba import njit
+from numba.extending import register_jitable
+from numpy.typing import NDArray
+
+from attractors.solvers.dense import _hermite, _validate_output_times
+from attractors.solvers.registry import Solver
+from attractors.systems.registry import System
+from attractors.type_defs import (
+    AdaptiveSolverCallable,
+    SystemCallable,
+    Vector,
+)
+from attractors.utils.logger import setup_logger
+
+logger = setup_logger(name=__name__)
+
+SAFETY = 0.9
+MIN_FACTOR = 0.2
+MAX_FACTOR = 5.0
+
+
+@dataclass(frozen=True)
+class AdaptiveStats:
+    """
+    Step statistics of an adaptive integration run.
+
+    Attributes:
+        accepted (int): Number of accepted steps
+        rejected (int): Number of rejected step attempts
+        nfev (int): Number of system function evaluations
+    """
+
+    accepted: int
+    rejected: int
+    nfev: int
+
+
+@register_jitable
+def _error_norm(error: Vector, state: Vector, new_state: Vector, rtol: float, atol: float) -> float:
+    total = 0.0
+    for i in range(len(error)):
+        scale = atol + rtol * max(abs(state[i]), abs(new_state[i]))
+        total += (error[i] / scale) ** 2
+    return float(np.sqrt(total / len(error)))
+
+
+@register_jitable
+def _initial_step(state: Vector, derivative: Vector, rtol: float, atol: float, order: int) -> float:
+    scale = atol + rtol * np.abs(state)
+    d0 = np.sqrt(np.mean((state / scale) ** 2))
+    d1 = np.sqrt(np.mean((derivative / scale) ** 2))
+    if d0 < 1e-5 or d1 < 1e-5:
+        return 1e-6
+    return float(0.01 * d0 / d1 * (1.0 / order))
+
+
+# non-jitted
+def _integrate_adaptive_impl(
+    system_func: SystemCallable,
+    solver_step: AdaptiveSolverCallable,
+    init_coord: Vector,
+    params: Vector,
+    t_end: float,
+    dt0: float,
+    rtol: float,
+    atol: float,
+    max_steps: int,
+    order: int,
+    stages: int,
+    fsal: bool,
+    times: Vector,
+) -> tuple[Vector, Vector, NDArray[np.int64], float]:
+    dense = len(times) > 0
+    rows = len(times) if dense else max_steps + 1
+    trajectory = np.empty((rows, len(init_coord)), dtype=np.float64)
+    time = times.copy() if dense else np.empty(rows, dtype=np.float64)
+    if dense:
+        # output times beyond the reached time stay NaN
+        trajectory[:] = np.nan
+    stats = np.zeros(3, dtype=np.int64)
+
+    current = init_coord.copy()
+    k1 = system_func(current, params)
+    stats[2] += 1
+    t = 0.0
+    j = 0
+    if dense:
+        while j < len(times) and times[j] <= 0.0:
+            trajectory[j] = current
+            j += 1
+    else:
+        trajectory[0] = current
+        time[0] = 0.0
+
+    dt = dt0 if dt0 > 0 else _initial_step(current, k1, rtol, atol, order)
+    exponent = 1.0 / order
+    n = 0
+
+    while t < t_end and n < max_steps:
+        finishing = dt >= t_end - t
+        if finishing:
+            dt = t_end - t
+        new_state, error, k_last = solver_step(system_func, current, k1, params, dt)
+        stats[2] += stages - 1
+        err = _error_norm(error, current, new_state, rtol, atol)
+
+        if err <= 1.0:
+            t_next = t_end if finishing else t + dt
+            n += 1
+            if fsal:
+                k_next = k_last
+            else:
+                k_next = system_func(new_state, params)
+                stats[2] += 1
+            if dense:
+                while j < len(times) and times[j] <= t_next:
+                    theta = (times[j] - t) / (t_next - t)
+                    _hermite(current, k1, new_state, k_next, t_next - t, theta, trajectory[j])
+                    j += 1
+            else:
+                trajectory[n] = new_state
+                time[n] = t_next
+            t = t_next
+            current = new_state
+            k1 = k_next
+            stats[0] += 1
+            factor = MAX_FACTOR if err == 0.0 else min(MAX_FACTOR, SAFETY * err**-exponent)
+        else:
+            stats[1] += 1
+            factor = max(MIN_FACTOR, SAFETY * err**-exponent)
+
+        dt *= factor
+        if dt <= 1e-14 * max(abs(t), 1.0):
+            break
+
+    if dense:
+        return trajectory, time, stats, t
+    return trajectory[: n + 1].copy(), time[: n + 1].copy(), stats, t
+
+
+# jitted
+_integrate_adaptive_jitted = njit(nogil=True)(_integrate_adaptive_impl)
+
+
+def integrate_adaptive(
+    system: System,
+    solver: Solver,
+    t_end: float,
+    dt0: float | None = None,
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
+    max_steps: int = 1_000_000,
+    use_jit: bool | None = None,
+    t_eval: Vector | None = None,
+) -> tuple[Vector, Vector, AdaptiveStats]:
+    """Integrates a dynamical system with an adaptive step-size embedded Runge-Kutta solver.
+
+    The step size is controlled so that the scaled RMS norm of the embedded local error
+    estimate stays below one, using the error tolerance `atol + rtol * |state|` for each
+    component. States are recorded at every accepted step, so the returned time points are
+    not uniformly spaced, unless output times are given with t_eval. The state at each
+    output time is then interpolated within the accepted step containing it by the cubic
+    Hermite interpolant through the states and derivatives at both ends of the step. Since
+    these derivatives are computed anyway, dense output costs no extra evaluations.
+
+    Args:
+        system (System): System to integrate
+        solver (Solver): Adaptive solver to use for integration (e.g. "dopri5")
+        t_end (float): End time of the integration
+        dt0 (float | None): Initial step size. Estimated from the initial state if None.
+        rtol (float): Relative tolerance. Defaults to 1e-6.
+        atol (float): Absolute tolerance. Defaults to 1e-9.
+        max_steps (int): Maximum number of accepted steps. Defaults to 1_000_000.
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+        t_eval (Vector | None): Sorted output times within [0, t_end] to sample the state
+            at instead of the accepted steps. Output times not reached are NaN.
+            Defaults to None.
+
+    Raises:
+        ValueError: If the solver is not adaptive, t_end, tolerances or max_steps are
+            not positive, or t_eval is empty, unsorted or outside [0, t_end]
+
+    Returns:
+        tuple[Vector, Vector, AdaptiveStats]: A tuple containing:
+            - Vector: System state at the initial time and after every accepted step, or at
+              each output time
+            - Vector: Time points corresponding to trajectory
+            - AdaptiveStats: Accepted/rejected step counts and function evaluations
+    """
+    if not solver.adaptive:
+        msg = f"Solver {solver.name} is not adaptive"
+        raise ValueError(msg)
+    if t_end <= 0:
+        raise ValueError("End time must be positive")
+    if rtol <= 0 or atol <= 0:
+        raise ValueError("Tolerances must be positive")
+    if max_steps <= 0:
+        raise ValueError("Maximum number of steps must be positive")
+    times = np.empty(0, dtype=np.float64)
+    if t_eval is not None:
+        times = _validate_output_times(t_eval)
+        if times[-1] > t_end:
+            raise ValueError("Output times must not exceed the end time")
+
+    jit_enabled = True if use_jit is None else use_jit
+    logger.debug("JIT enabled: %s", jit_enabled)
+    logger.info("Integrating system: %s with adaptive solver: %s", system, solver)
+    logger.info("t_end: %.6g, rtol: %.3g, atol: %.3g", t_end, rtol, atol)
+
+    integrate_func: Callable[..., tuple[Vector, Vector, NDArray[np.int64], float]] = (
+        _integrate_adaptive_jitted if jit_enabled else _integrate_adaptive_impl
+    )
+
+    trajectory, time, stats, reached = integrate_func(
+        system.get_func(jit_enabled),
+        cast(AdaptiveSolverCallable, solver.get_func(jit_enabled)),
+        system.init_coord,
+        system.params,
+        t_end,
+        dt0 or 0.0,
+        rtol,
+        atol,
+        max_steps,
+        solver.order,
+        solver.stages,
+        solver.fsal,
+        times,
+    )
+    result = AdaptiveStats(accepted=int(stats[0]), rejected=int(stats[1]), nfev=int(stats[2]))
+    if reached < t_end:
+        logger.warning(
+            "Integration stopped at t=%.6g before t_end=%.6g after %d steps",
+            reached,
+            t_end,
+            result.accepted,
+        )
+    logger.info(
+        "Accepted: %d, rejected: %d, nfev: %d", result.accepted, result.rejected, result.nfev
+    )
+    return trajectory, time, result
@@ -0,0 +1,16 @@
+from attractors.solvers.implicit import _iteration_matrix, _jacobian_fd, _solve_stage
+from attractors.solvers.registry import SolverRegistry
+from attractors.type_defs import SystemCallable, Vector
+
+
+@SolverRegistry.register("backward_euler", order=1, implicit=True)
+def backward_euler(system_func: SystemCallable, state: Vector, params: Vector, dt: float) -> Vector:
+    """
+    Implicit (backward) Euler integration scheme.
+
+    First order and L-stable. The implicit equation is solved by simplified Newton
+    iteration with a finite-difference Jacobian.
+    """
+    f0 = system_func(state, params)
+    lu, piv = _iteration_matrix(_jacobian_fd(system_func, state, params, f0), dt)
+    return _solve_stage(system_func, state, dt, state + dt * f0, params, lu, piv)
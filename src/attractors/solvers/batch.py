@@ -0,0 +1,523 @@
+from collections.abc import Callable, Sequence
+from enum import Enum
+from functools import partial
+from typing import overload
+
+import numpy as np
+from numba import prange, types
+from numpy.typing import DTypeLike, NDArray
+
+from attractors.solvers.guards import GuardedBatch, IntegrationGuard, _distance, _guard_status
+from attractors.solvers.kernels import KernelCache, KernelTarget, _reference_step
+from attractors.solvers.registry import Solver
+from attractors.systems.registry import System
+from attractors.type_defs import SolverInplaceCallable, SystemInplaceCallable, Vector
+from attractors.utils.logger import setup_logger
+
+logger = setup_logger(name=__name__)
+
+
+class BatchOutput(Enum):
+    """Output modes for batched integration.
+    trajectory: Full trajectory of every member (M x steps x dim)
+    final: Final state of every member (M x dim)
+    mean: Time-averaged state of every member (M x dim)
+    bounds: Per-coordinate minimum and maximum of every member (M x 2 x dim)
+    """
+
+    TRAJECTORY = "trajectory"
+    FINAL = "final"
+    MEAN = "mean"
+    BOUNDS = "bounds"
+
+
+_OUTPUT_CODES = {
+    BatchOutput.TRAJECTORY: 0,
+    BatchOutput.FINAL: 1,
+    BatchOutput.MEAN: 2,
+    BatchOutput.BOUNDS: 3,
+}
+
+
+# non-jitted
+def _integrate_batch_impl(
+    system_func: SystemInplaceCallable,
+    solver_step: SolverInplaceCallable,
+    work_size: int,
+    init_coords: Vector,
+    params: Vector,
+    steps: int,
+    dt: float,
+    output: int,
+    guarded: bool,
+    max_norm: float,
+    fixed_point_tol: float,
+    period_tol: float,
+) -> tuple[Vector, NDArray[np.int64], NDArray[np.int64]]:
+    members, dim = init_coords.shape
+    if output == 0:
+        result = np.empty((members, steps, dim), dtype=np.float64)
+    elif output == 3:
+        result = np.empty((members, 2, dim), dtype=np.float64)
+    else:
+        result = np.empty((members, 1, dim), dtype=np.float64)
+    status = np.zeros(members, dtype=np.int64)
+    valid_steps = np.zeros(members, dtype=np.int64)
+
+    for m in prange(members):
+        work = np.empty((work_size, dim), dtype=np.float64)
+        buffers = np.empty((3, dim), dtype=np.float64)
+        current, following, anchor = buffers[0], buffers[1], buffers[2]
+        current[:] = init_coords[m]
+        anchor[:] = current
+        horizon = 1
+        departed = False
+        acc = np.zeros(dim, dtype=np.float64)
+        lo = np.full(dim, np.inf)
+        hi = np.full(dim, -np.inf)
+        code = 0
+        taken = steps
+
+        for i in range(steps):
+            solver_step(system_func, current, params[m], dt, work, following)
+            if guarded:
+                code = _guard_status(current, following, dt, max_norm, fixed_point_tol)
+                if code == 0 and period_tol > 0.0:
+                    if _distance(following, anchor) > period_tol:
+                        departed = True
+                    elif departed:
+                        code = 4
+                    if code == 0 and i + 1 == horizon:
+                        anchor[:] = following
+                        horizon *= 2
+                        departed = False
+                if code == 1 or code == 2:
+                    taken = i
+                    break
+            current, following = following, current
+            if output == 0:
+                result[m, i] = current
+            elif output == 2:
+                acc += current
+            elif output == 3:
+                for k in range(dim):
+                    lo[k] = min(lo[k], current[k])
+                    hi[k] = max(hi[k], current[k])
+            if code != 0:
+                taken = i + 1
+                break
+
+        status[m] = code
+        valid_steps[m] = taken
+        if output == 0:
+            result[m, taken:] = np.nan
+        elif output == 1:
+            result[m, 0] = current
+        elif taken == 0:
+            result[m] = np.nan
+        elif output == 2:
+            result[m, 0] = acc / taken
+        elif output == 3:
+            result[m, 0] = lo
+            result[m, 1] = hi
+
+    return result, status, valid_steps
+
+
+# jitted
+@KernelCache.register(
+    "batch",
+    signature=(
+        types.float64[:, ::1],
+        types.float64[:, ::1],
+        types.int64,
+        types.float64,
+        types.int64,
+        types.boolean,
+        types.float64,
+        types.float64,
+        types.float64,
+    ),
+    parallel=True,
+)
+def _build_batch_kernel(
+    target: KernelTarget,
+) -> Callable[..., tuple[Vector, NDArray[np.int64], NDArray[np.int64]]]:
+    system_func = target.system_func
+    solver_step = target.solver_step
+    work_size = target.work_size
+    dtype = target.dtype
+
+    def kernel(
+        init_coords: Vector,
+        params: Vector,
+        steps: int,
+        dt: float,
+        output: int,
+        guarded: bool,
+        max_norm: float,
+        fixed_point_tol: float,
+        period_tol: float,
+    ) -> tuple[Vector, NDArray[np.int64], NDArray[np.int64]]:
+        members, dim = init_coords.shape
+        if output == 0:
+            result = np.empty((members, steps, dim), dtype=dtype)
+        elif output == 3:
+            result = np.empty((members, 2, dim), dtype=dtype)
+        else:
+            result = np.empty((members, 1, dim), dtype=dtype)
+        status = np.zeros(members, dtype=np.int64)
+        valid_steps = np.zeros(members, dtype=np.int64)
+
+        for m in prange(members):
+            work = np.empty((work_size, dim), dtype=np.float64)
+            buffers = np.empty((3, dim), dtype=np.float64)
+            current, following, anchor = buffers[0], buffers[1], buffers[2]
+            current[:] = init_coords[m]
+            anchor[:] = current
+            horizon = 1
+            departed = False
+            acc = np.zeros(dim, dtype=np.float64)
+            lo = np.full(dim, np.inf)
+            hi = np.full(dim, -np.inf)
+            code = 0
+            taken = steps
+
+            for i in range(steps):
+                solver_step(system_func, current, params[m], dt, work, following)
+                if guarded:
+                    code = _guard_status(current, following, dt, max_norm, fixed_point_tol)
+                    if code == 0 and period_tol > 0.0:
+                        if _distance(following, anchor) > period_tol:
+                            departed = True
+                        elif departed:
+                            code = 4
+                        if code == 0 and i + 1 == horizon:
+                            anchor[:] = following
+                            horizon *= 2
+                            departed = False
+                    if code == 1 or code == 2:
+                        taken = i
+                        break
+                current, following = following, current
+                if output == 0:
+                    result[m, i] = current
+                elif output == 2:
+                    acc += current
+                elif output == 3:
+                    for k in range(dim):
+                        lo[k] = min(lo[k], current[k])
+                        hi[k] = max(hi[k], current[k])
+                if code != 0:
+                    taken = i + 1
+                    break
+
+            status[m] = code
+            valid_steps[m] = taken
+            if output == 0:
+                result[m, taken:] = np.nan
+            elif output == 1:
+                result[m, 0] = current
+            elif taken == 0:
+                result[m] = np.nan
+            elif output == 2:
+                result[m, 0] = acc / taken
+            elif output == 3:
+                result[m, 0] = lo
+                result[m, 1] = hi
+
+        return result, status, valid_steps
+
+    return kernel
+
+
+def _validate_batch_inputs(solver: Solver, steps: int, dt: float) -> None:
+    if steps <= 0:
+        raise ValueError("Number of steps must be positive")
+    if dt <= 0:
+        raise ValueError("Time step must be positive")
+    if solver.adaptive:
+        msg = f"Solver {solver.name} is adaptive, use integrate_adaptive instead"
+        raise ValueError(msg)
+    if solver.multistep:
+        msg = f"Solver {solver.name} is multistep, use a single-step solver instead"
+        raise ValueError(msg)
+
+
+def _run_batch(
+    system: System,
+    solver: Solver,
+    init_coords: Vector,
+    params: Vector,
+    steps: int,
+    dt: float,
+    output: BatchOutput,
+    use_jit: bool | None,
+    dtype: DTypeLike,
+    guard: IntegrationGuard | None,
+) -> Vector | GuardedBatch:
+    jit_enabled = True if use_jit is None else use_jit
+    logger.debug("JIT enabled: %s", jit_enabled)
+    logger.info("Steps: %d, dt: %.6g, output: %s", steps, dt, output.value)
+
+    integrate_func: Callable[..., tuple[Vector, NDArray[np.int64], NDArray[np.int64]]]
+    if jit_enabled:
+        integrate_func = KernelCache.get("batch", system, solver, dtype)
+    else:
+        solver_step, work_size = _reference_step(system, solver)
+        integrate_func = partial(
+            _integrate_batch_impl, system.get_inplace_func(jitted=False), solver_step, work_size
+        )
+
+    checks = IntegrationGuard() if guard is None else guard
+    result, status, valid_steps = integrate_func(
+        np.ascontiguousarray(init_coords, dtype=np.float64),
+        np.ascontiguousarray(params, dtype=np.float64),
+        steps,
+        float(dt),
+        _OUTPUT_CODES[output],
+        guard is not None,
+        checks.max_norm,
+        checks.fixed_point_tol,
+        checks.period_tol,
+    )
+    result = result.astype(dtype, copy=False)
+    if output in (BatchOutput.FINAL, BatchOutput.MEAN):
+        result = result[:, 0]
+    if guard is None:
+        return result
+
+    stopped = int(np.count_nonzero(status))
+    logger.info(
+        "Stopped early: %d of %d, steps taken: %.1f%%",
+        stopped,
+        len(status),
+        100.0 * valid_steps.sum() / (steps * len(status)),
+    )
+    return GuardedBatch(result=result, status=status, valid_steps=valid_steps)
+
+
+@overload
+def integrate_ensemble(
+    system: System,
+    solver: Solver,
+    init_coords: Vector,
+    steps: int,
+    dt: float,
+    output: BatchOutput = ...,
+    use_jit: bool | None = ...,
+    dtype: DTypeLike = ...,
+    guard: None = ...,
+) -> Vector: ...
+
+
+@overload
+def integrate_ensemble(
+    system: System,
+    solver: Solver,
+    init_coords: Vector,
+    steps: int,
+    dt: float,
+    output: BatchOutput = ...,
+    use_jit: bool | None = ...,
+    dtype: DTypeLike = ...,
+    *,
+    guard: IntegrationGuard,
+) -> GuardedBatch: ...
+
+
+def integrate_ensemble(
+    system: System,
+    solver: Solver,
+    init_coords: Vector,
+    steps: int,
+    dt: float,
+    output: BatchOutput = BatchOutput.TRAJECTORY,
+    use_jit: bool | None = None,
+    dtype: DTypeLike = np.float64,
+    guard: IntegrationGuard | None = None,
+) -> Vector | GuardedBatch:
+    """Integrates an ensemble of initial conditions in a single parallel kernel.
+
+    Every member is integrated with the system's current parameters on the same time grid
+    as `integrate_system`, i.e. `np.arange(steps) * dt`. Members are distributed across
+    all available cores when JIT compilation is enabled.
+
+    With a guard, each member stops as soon as it diverges, becomes non-finite or settles
+    on a fixed point or cycle (see `IntegrationGuard`), and a `GuardedBatch` with the
+    results over the valid steps, a status code and the number of valid steps per member
+    is returned instead.
+
+    Args:
+        system (System): System to integrate
+        solver (Solver): Numerical solver to use for integration
+        init_coords (Vector): Initial states of the ensemble members (M x dim)
+        steps (int): Number of integration steps
+        dt (float): Time step size
+        output (BatchOutput): What to return for each member. Defaults to BatchOutput.TRAJECTORY.
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+        dtype (DTypeLike): Storage dtype of the results. Defaults to np.float64.
+        guard (IntegrationGuard | None): Checks stopping members early. Defaults to None.
+
+    Raises:
+        ValueError: If steps <= 0, dt <= 0, the solver is adaptive or multistep or
+            init_coords is not an M x dim array
+
+    Returns:
+        Vector | GuardedBatch: Per-member results, shaped according to `output`:
+            - TRAJECTORY: (M, steps, dim)
+            - FINAL, MEAN: (M, dim)
+            - BOUNDS: (M, 2, dim) with minima in `[:, 0]` and maxima in `[:, 1]`
+            or a `GuardedBatch` holding them if guard is given
+    """
+    _validate_batch_inputs(solver, steps, dt)
+
+    init_coords = np.ascontiguousarray(init_coords, dtype=np.float64)
+    if init_coords.ndim != 2 or init_coords.shape[1] != system.dim:
+        msg = f"Initial coordinates must be Mx{system.dim} array"
+        raise ValueError(msg)
+
+    logger.info(
+        "Integrating ensemble of %d members: %s with solver: %s", len(init_coords), system, solver
+    )
+    params = np.tile(np.asarray(system.params, dtype=np.float64), (len(init_coords), 1))
+    return _run_batch(system, solver, init_coords, params, steps, dt, output, use_jit, dtype, guard)
+
+
+def param_grid(system: System, **axes: Sequence[float] | Vector) -> Vector:
+    """Build a Cartesian parameter grid for a system.
+
+    Parameters named in `axes` are varied over the given values; all other parameters are
+    held at the system's current values. Rows are ordered with the last named axis varying
+    fastest, as in `itertools.product`.
+
+    Args:
+        system (System): System whose `param_names` define the columns
+        **axes (Sequence[float] | Vector): Values to sweep for each named parameter
+
+    Raises:
+        ValueError: If an axis is not a parameter of the system or has no values
+
+    Returns:
+        Vector: Parameter matrix (P x n_params)
+
+    Examples:
+        >>> lorenz = SystemRegistry.get("lorenz")
+        >>> grid = param_grid(lorenz, rho=np.linspace(20, 30, 50), beta=[2.0, 8 / 3])
+        >>> grid.shape
+        (100, 3)
+    """
+    for name, values in axes.items():
+        if name not in system.param_names:
+            msg = f"Unknown parameter {name} for system {system.name}"
+            raise ValueError(msg)
+        if len(values) == 0:
+            msg = f"No values given for parameter {name}"
+            raise ValueError(msg)
+
+    mesh = np.meshgrid(*(np.asarray(v, dtype=np.float64) for v in axes.values()), indexing="ij")
+    n_rows = mesh[0].size if mesh else 1
+    grid = np.tile(np.asarray(system.params, dtype=np.float64), (n_rows, 1))
+    for name, values in zip(axes, mesh, strict=True):
+        grid[:, system.param_names.index(name)] = values.ravel()
+    return grid
+
+
+@overload
+def integrate_sweep(
+    system: System,
+    solver: Solver,
+    params: Vector,
+    steps: int,
+    dt: float,
+    init_coord: Vector | None = ...,
+    output: BatchOutput = ...,
+    use_jit: bool | None = ...,
+    dtype: DTypeLike = ...,
+    guard: None = ...,
+) -> Vector: ...
+
+
+@overload
+def integrate_sweep(
+    system: System,
+    solver: Solver,
+    params: Vector,
+    steps: int,
+    dt: float,
+    init_coord: Vector | None = ...,
+    output: BatchOutput = ...,
+    use_jit: bool | None = ...,
+    dtype: DTypeLike = ...,
+    *,
+    guard: IntegrationGuard,
+) -> GuardedBatch: ...
+
+
+def integrate_sweep(
+    system: System,
+    solver: Solver,
+    params: Vector,
+    steps: int,
+    dt: float,
+    init_coord: Vector | None = None,
+    output: BatchOutput = BatchOutput.TRAJECTORY,
+    use_jit: bool | None = None,
+    dtype: DTypeLike = np.float64,
+    guard: IntegrationGuard | None = None,
+) -> Vector | GuardedBatch:
+    """Integrates a system for every row of a parameter matrix in a single parallel kernel.
+
+    The system instance is not modified, so sweeps can run on the shared registry
+    instance. Use `param_grid` to build a Cartesian grid from `system.param_names`, and a
+    reduced `output` to keep memory proportional to the number of parameter rows. A guard
+    skips the remaining steps of rows whose outcome is settled, as in `integrate_ensemble`.
+
+    Args:
+        system (System): System to integrate
+        solver (Solver): Numerical solver to use for integration
+        params (Vector): Parameter matrix (P x n_params), one parameter set per row
+        steps (int): Number of integration steps
+        dt (float): Time step size
+        init_coord (Vector | None): Initial state shared by all rows. Defaults to
+            `system.init_coord`.
+        output (BatchOutput): What to return for each row. Defaults to BatchOutput.TRAJECTORY.
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+        dtype (DTypeLike): Storage dtype of the results. Defaults to np.float64.
+        guard (IntegrationGuard | None): Checks stopping rows early. Defaults to None.
+
+    Raises:
+        ValueError: If steps <= 0, dt <= 0, the solver is adaptive or multistep or params
+            does not have one column per parameter
+
+    Returns:
+        Vector | GuardedBatch: Per-row results, shaped as in `integrate_ensemble` with
+            P rows, or a `GuardedBatch` holding them if guard is given
+
+    Examples:
+        >>> grid = param_grid(lorenz, rho=np.linspace(0, 500, 10_000))
+        >>> batch = integrate_sweep(
+        ...     lorenz,
+        ...     solver,
+        ...     grid,
+        ...     100_000,
+        ...     0.01,
+        ...     output=BatchOutput.BOUNDS,
+        ...     guard=IntegrationGuard(max_norm=1e6, fixed_point_tol=1e-8),
+        ... )
+        >>> np.bincount(batch.status, minlength=len(IntegrationStatus))
+    """
+    _validate_batch_inputs(solver, steps, dt)
+
+    params = np.ascontiguousarray(params, dtype=np.float64)
+    if params.ndim != 2 or params.shape[1] != len(system.param_names):
+        msg = f"Parameter matrix must be Px{len(system.param_names)} array"
+        raise ValueError(msg)
+
+    coord = system.init_coord if init_coord is None else init_coord
+    init_coords = np.tile(np.asarray(coord, dtype=np.float64), (len(params), 1))
+
+    logger.info(
+        "Integrating sweep of %d parameter sets: %s with solver: %s", len(params), system, solver
+    )
+    return _run_batch(system, solver, init_coords, params, steps, dt, output, use_jit, dtype, guard)
@@ -0,0 +1,17 @@
+from attractors.solvers.registry import SolverRegistry
+from attractors.type_defs import SystemCallable, Vector
+
+
+@SolverRegistry.register("bs32", adaptive=True, order=3, stages=4, fsal=True)
+def bs32(
+    system_func: SystemCallable, state: Vector, k1: Vector, params: Vector, dt: float
+) -> tuple[Vector, Vector, Vector]:
+    """
+    Bogacki-Shampine 3(2) embedded integration scheme.
+    """
+    k2 = system_func(state + dt * k1 / 2, params)
+    k3 = system_func(state + 3 * dt * k2 / 4, params)
+    result: Vector = state + dt * (2 * k1 + 3 * k2 + 4 * k3) / 9
+    k4 = system_func(result, params)
+    error: Vector = dt * (-5 * k1 / 72 + k2 / 12 + k3 / 9 - k4 / 8)
+    return result, error, k4
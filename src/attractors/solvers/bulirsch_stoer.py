@@ -0,0 +1,121 @@
+import numpy as np
+
+from attractors.solvers.registry import SolverRegistry
+from attractors.type_defs import SolverCallable, SystemCallable, Vector
+
+# Substep counts of the modified midpoint rule per extrapolation row (Deuflhard sequence)
+SEQUENCE = (2, 4, 6, 8, 10, 12, 14, 16, 18)
+SAFETY = 0.94
+MIN_FACTOR = 0.02
+MAX_FACTOR = 4.0
+
+
+def make_bulirsch_stoer(rtol: float, atol: float) -> SolverCallable:
+    """
+    Build a Gragg-Bulirsch-Stoer step for the given tolerances.
+
+    The step integrates over the full interval dt to the requested tolerance, subdividing
+    it into as many internal steps as needed. Each internal step runs the modified
+    midpoint rule with an increasing number of substeps and extrapolates the results to
+    zero substep size (Aitken-Neville in h^2). The number of extrapolation rows (the order)
+    and the internal step size are adapted to minimize the system evaluations per unit
+    time, following Hairer, Norsett and Wanner (ODEX). If the internal step size underflows,
+    e.g. near a singularity, the step returns NaN.
+
+    Args:
+        rtol (float): Relative tolerance of each internal step
+        atol (float): Absolute tolerance of each internal step
+
+    Returns:
+        SolverCallable: Solver taking (system_func, state, params, dt)
+
+    Raises:
+        ValueError: If a tolerance is not positive
+    """
+    if rtol <= 0 or atol <= 0:
+        raise ValueError("Tolerances must be positive")
+
+    def bulirsch_stoer(
+        system_func: SystemCallable, state: Vector, params: Vector, dt: float
+    ) -> Vector:
+        rows = len(SEQUENCE)
+        dim = len(state)
+        table = np.empty((rows, dim), dtype=np.float64)
+        cost = np.empty(rows, dtype=np.float64)
+        step = np.empty(rows, dtype=np.float64)
+        cost[0] = SEQUENCE[0] + 1.0
+        for k in range(1, rows):
+            cost[k] = cost[k - 1] + SEQUENCE[k]
+
+        current = state.copy()
+        t = 0.0
+        h = dt
+        target = 4
+        while t < dt:
+            finishing = h >= dt - t
+            if finishing:
+                h = dt - t
+            f0 = system_func(current, params)
+            accepted = -1
+            last = 0
+            for k in range(min(target + 2, rows)):
+                last = k
+                # modified midpoint rule with Gragg's smoothing step
+                n = SEQUENCE[k]
+                sub = h / n
+                previous = current.copy()
+                midpoint = current + sub * f0
+                for _ in range(n - 1):
+                    following = previous + 2.0 * sub * system_func(midpoint, params)
+                    previous = midpoint
+                    midpoint = following
+                estimate = 0.5 * (previous + midpoint + sub * system_func(midpoint, params))
+
+                # extrapolate the new row, keeping the previous row's entries in table
+                for j in range(1, k + 1):
+                    ratio = SEQUENCE[k] / SEQUENCE[k - j]
+                    extrapolated = estimate + (estimate - table[j - 1]) / (ratio * ratio - 1.0)
+                    table[j - 1] = estimate
+                    estimate = extrapolated
+                if k == 0:
+                    table[0] = estimate
+                    continue
+                scale = atol + rtol * np.maximum(np.abs(current), np.abs(estimate))
+                err = np.sqrt(np.mean(((estimate - table[k - 1]) / scale) ** 2))
+                table[k] = estimate
+
+                factor = MAX_FACTOR
+                if err > 0.0:
+                    factor = min(MAX_FACTOR, SAFETY * (0.65 / err) ** (1.0 / (2 * k + 1)))
+                elif np.isnan(err):
+                    factor = MIN_FACTOR
+                step[k] = h * max(MIN_FACTOR, factor)
+                if err <= 1.0:
+                    accepted = k
+                    break
+
+            if accepted >= 0:
+                current = table[accepted].copy()
+                t = dt if finishing else t + h
+                target = accepted
+                k = accepted
+                if k >= 2 and cost[k - 1] / step[k - 1] < 0.9 * cost[k] / step[k]:
+                    target = k - 1
+                elif k < rows - 2 and cost[k] / step[k] < 0.9 * cost[k - 1] / step[k - 1]:
+                    target = k + 1
+                h = step[target] if target <= k else step[k] * cost[target] / cost[k]
+            else:
+                h = step[last]
+                target = max(2, min(target, last - 1))
+
+            # the solution cannot be resolved, e.g. near a singularity or for non-finite states
+            if t < dt and h <= 1e-12 * dt:
+                current[:] = np.nan
+                break
+
+        return current
+
+    return bulirsch_stoer
+
+
+bulirsch_stoer = SolverRegistry.register("bulirsch_stoer")(make_bulirsch_stoer(1e-12, 1e-12))
@@ -0,0 +1,40 @@
+from attractors.solvers.registry import SolverRegistry
+from attractors.type_defs import SystemCallable, Vector
+
+
+@SolverRegistry.register("cash_karp", adaptive=True, order=5, stages=6)
+def cash_karp(
+    system_func: SystemCallable, state: Vector, k1: Vector, params: Vector, dt: float
+) -> tuple[Vector, Vector, Vector]:
+    """
+    Cash-Karp 5(4) embedded integration scheme.
+    """
+    k2 = system_func(state + dt * (k1 / 5), params)
+    k3 = system_func(state + dt * (3 * k1 / 40 + 9 * k2 / 40), params)
+    k4 = system_func(state + dt * (3 * k1 / 10 - 9 * k2 / 10 + 6 * k3 / 5), params)
+    k5 = system_func(
+        state + dt * (-11 * k1 / 54 + 5 * k2 / 2 - 70 * k3 / 27 + 35 * k4 / 27), params
+    )
+    k6 = system_func(
+        state
+        + dt
+        * (
+            1631 * k1 / 55296
+            + 175 * k2 / 512
+            + 575 * k3 / 13824
+            + 44275 * k4 / 110592
+            + 253 * k5 / 4096
+        ),
+        params,
+    )
+    result: Vector = state + dt * (
+        37 * k1 / 378 + 250 * k3 / 621 + 125 * k4 / 594 + 512 * k6 / 1771
+    )
+    error: Vector = dt * (
+        (37 / 378 - 2825 / 27648) * k1
+        + (250 / 621 - 18575 / 48384) * k3
+        + (125 / 594 - 13525 / 55296) * k4
+        - 277 * k5 / 14336
+        + (512 / 1771 - 1 / 4) * k6
+    )
+    return result, error, k6
@@ -1,11 +1,25 @@
+from collections.abc import Callable, Iterator
+from functools import partial
+from typing import cast, overload
+
 import numpy as np
-from numba import njit
+from numba import njit, types
+from numpy.typing import DTypeLike, NDArray
 
-from attractors.solvers.registry import Solver
+from attractors.solvers.guards import (
+    GuardedTrajectory,
+    IntegrationGuard,
+    IntegrationStatus,
+    _guard_step,
+)
+from attractors.solvers.kernels import KernelCache, KernelTarget, _reference_step
+from attractors.solvers.registry import Solver, SolverRegistry
+from attractors.solvers.trajectory_cache import TrajectoryCache
 from attractors.systems.registry import System
 from attractors.type_defs import (
-    SolverCallable,
-    SystemCallable,
+    MultistepSolverCallable,
+    SolverInplaceCallable,
+    SystemInplaceCallable,
     Vector,
 )
 from attractors.utils.logger import setup_logger
@@ -14,69 +28,693 @@ logger = setup_logger(name=__name__)
 
 
 # non-jitted
-def _integrate_trajectory_impl(
-    system_func: SystemCallable,
-    solver_step: SolverCallable,
-    init_coord: Vector,
+def _integrate_chunk_impl(
+    system_func: SystemInplaceCallable,
+    solver_step: SolverInplaceCallable,
+    work_size: int,
+    dtype: DTypeLike,
+    state: Vector,
     params: Vector,
-    steps: int,
+    start: int,
+    count: int,
     dt: float,
-) -> tuple[Vector, Vector]:
-    trajectory = np.empty((steps, len(init_coord)), dtype=np.float64)
-    time = np.empty(steps, dtype=np.float64)
-    current = init_coord.copy()
+    skip: int,
+    stride: int,
+    guarded: bool,
+    max_norm: float,
+    fixed_point_tol: float,
+    period_tol: float,
+    anchor: Vector,
+    track: NDArray[np.int64],
+) -> tuple[Vector, Vector, Vector, int, int]:
+    dim = len(state)
+    trajectory = np.empty((count, dim), dtype=dtype)
+    time = np.empty(count, dtype=np.float64)
+    work = np.empty((work_size, dim), dtype=np.float64)
+    buffers = np.empty((2, dim), dtype=np.float64)
+    current, following = buffers[0], buffers[1]
+    current[:] = state
+    total = skip + 1 + (count - 1) * stride
+    code, taken, i = 0, total, 0
 
-    for i in range(steps):
-        current = solver_step(system_func, current, params, dt)
-        trajectory[i] = current
-        time[i] = i * dt
+    for n in range(total):
+        solver_step(system_func, current, params, dt, work, following)
+        if guarded:
+            code = _guard_step(
+                current, following, dt, max_norm, fixed_point_tol, period_tol, anchor, track
+            )
+            if code == 1 or code == 2:
+                taken = n
+                break
+        current, following = following, current
+        if n >= skip and (n - skip) % stride == 0:
+            trajectory[i] = current
+            time[i] = (start + n) * dt
+            i += 1
+        if code != 0:
+            taken = n + 1
+            break
 
-    return trajectory, time
+    return trajectory[:i], time[:i], current.copy(), code, taken
+
+
+# jitted
+_integrate_chunk = njit(inline="always")(_integrate_chunk_impl)
+
+
+# jitted
+@KernelCache.register(
+    "trajectory",
+    signature=(
+        types.float64[::1],
+        types.float64[::1],
+        types.int64,
+        types.int64,
+        types.float64,
+        types.int64,
+        types.int64,
+        types.boolean,
+        types.float64,
+        types.float64,
+        types.float64,
+        types.float64[::1],
+        types.int64[::1],
+    ),
+)
+def _build_trajectory_kernel(
+    target: KernelTarget,
+) -> Callable[..., tuple[Vector, Vector, Vector, int, int]]:
+    system_func = target.system_func
+    solver_step = target.solver_step
+    work_size = target.work_size
+    dtype = target.dtype
+
+    def kernel(
+        state: Vector,
+        params: Vector,
+        start: int,
+        count: int,
+        dt: float,
+        skip: int,
+        stride: int,
+        guarded: bool,
+        max_norm: float,
+        fixed_point_tol: float,
+        period_tol: float,
+        anchor: Vector,
+        track: NDArray[np.int64],
+    ) -> tuple[Vector, Vector, Vector, int, int]:
+        return _integrate_chunk(
+            system_func,
+            solver_step,
+            work_size,
+            dtype,
+            state,
+            params,
+            start,
+            count,
+            dt,
+            skip,
+            stride,
+            guarded,
+            max_norm,
+            fixed_point_tol,
+            period_tol,
+            anchor,
+            track,
+        )
+
+    return kernel
+
+
+# non-jitted
+def _integrate_chunk_multistep_impl(
+    system_func: SystemInplaceCallable,
+    solver_step: MultistepSolverCallable,
+    startup_step: SolverInplaceCallable,
+    work_size: int,
+    dtype: DTypeLike,
+    state: Vector,
+    params: Vector,
+    history: Vector,
+    filled: int,
+    start: int,
+    count: int,
+    dt: float,
+    skip: int,
+    stride: int,
+    guarded: bool,
+    max_norm: float,
+    fixed_point_tol: float,
+    period_tol: float,
+    anchor: Vector,
+    track: NDArray[np.int64],
+) -> tuple[Vector, Vector, Vector, int, int, int]:
+    dim = len(state)
+    trajectory = np.empty((count, dim), dtype=dtype)
+    time = np.empty(count, dtype=np.float64)
+    work = np.empty((work_size, dim), dtype=np.float64)
+    buffers = np.empty((2, dim), dtype=np.float64)
+    current, following = buffers[0], buffers[1]
+    current[:] = state
+    depth = history.shape[0]
+    total = skip + 1 + (count - 1) * stride
+    code, taken, i = 0, total, 0
+
+    if filled == 0:
+        system_func(current, params, history[0])
+        filled = 1
+    for n in range(total):
+        if filled < depth:
+            startup_step(system_func, current, params, dt, work, following)
+            for j in range(depth - 1, 0, -1):
+                history[j] = history[j - 1]
+            system_func(following, params, history[0])
+            filled += 1
+        else:
+            solver_step(system_func, current, params, dt, history, work, following)
+        if guarded:
+            code = _guard_step(
+                current, following, dt, max_norm, fixed_point_tol, period_tol, anchor, track
+            )
+            if code == 1 or code == 2:
+                taken = n
+                break
+        current, following = following, current
+        if n >= skip and (n - skip) % stride == 0:
+            trajectory[i] = current
+            time[i] = (start + n) * dt
+            i += 1
+        if code != 0:
+            taken = n + 1
+            break
+
+    return trajectory[:i], time[:i], current.copy(), filled, code, taken
 
 
 # jitted
-_integrate_trajectory_jitted = njit(_integrate_trajectory_impl)
+_integrate_chunk_multistep = njit(inline="always")(_integrate_chunk_multistep_impl)
+
+
+# jitted
+@KernelCache.register(
+    "multistep",
+    signature=(
+        types.float64[::1],
+        types.float64[::1],
+        types.float64[:, ::1],
+        types.int64,
+        types.int64,
+        types.int64,
+        types.float64,
+        types.int64,
+        types.int64,
+        types.boolean,
+        types.float64,
+        types.float64,
+        types.float64,
+        types.float64[::1],
+        types.int64[::1],
+    ),
+    multistep=True,
+)
+def _build_multistep_kernel(
+    target: KernelTarget,
+) -> Callable[..., tuple[Vector, Vector, Vector, int, int, int]]:
+    system_func = target.system_func
+    solver_step = target.solver_step
+    startup_step = target.startup_step
+    assert startup_step is not None
+    work_size = target.work_size
+    dtype = target.dtype
+
+    def kernel(
+        state: Vector,
+        params: Vector,
+        history: Vector,
+        filled: int,
+        start: int,
+        count: int,
+        dt: float,
+        skip: int,
+        stride: int,
+        guarded: bool,
+        max_norm: float,
+        fixed_point_tol: float,
+        period_tol: float,
+        anchor: Vector,
+        track: NDArray[np.int64],
+    ) -> tuple[Vector, Vector, Vector, int, int, int]:
+        return _integrate_chunk_multistep(
+            system_func,
+            solver_step,
+            startup_step,
+            work_size,
+            dtype,
+            state,
+            params,
+            history,
+            filled,
+            start,
+            count,
+            dt,
+            skip,
+            stride,
+            guarded,
+            max_norm,
+            fixed_point_tol,
+            period_tol,
+            anchor,
+            track,
+        )
+
+    return kernel
+
+
+ChunkKernel = Callable[
+    [Vector, Vector, int, int, float, int, int], tuple[Vector, Vector, Vector, int, int]
+]
+
+
+def _bind_chunk_kernel(
+    system: System,
+    solver: Solver,
+    jit_enabled: bool,
+    dtype: DTypeLike = np.float64,
+    guard: IntegrationGuard | None = None,
+) -> ChunkKernel:
+    """Bind system and solver functions to a chunk kernel.
+
+    The returned kernel takes (state, params, start, count, dt, skip, stride). It takes
+    `skip` steps without storing them and then records `count` states `stride` steps apart,
+    starting with the state after the first step, with step index `start` corresponding to
+    time `start * dt`. It returns the recorded trajectory, time points and the last
+    recorded state in full precision, followed by the `IntegrationStatus` code and the
+    number of steps taken. With JIT enabled, the fused kernel for this system, solver and
+    dtype is taken from the `KernelCache`. Otherwise the same step loop runs uncompiled on
+    the in-place reference functions, so that both paths perform the same arithmetic.
+
+    With a guard, every step is checked and the kernel stops at the first step that trips
+    it, returning only the states recorded up to then. The cycle detection state carries
+    over between calls that continue where the previous one ended.
+
+    Multistep solvers are bound with `_bind_multistep_kernel`.
+    """
+    if solver.multistep:
+        return _bind_multistep_kernel(system, solver, jit_enabled, dtype, guard)
+
+    kernel: Callable[..., tuple[Vector, Vector, Vector, int, int]]
+    if jit_enabled:
+        kernel = KernelCache.get("trajectory", system, solver, dtype)
+    else:
+        solver_step, work_size = _reference_step(system, solver)
+        kernel = partial(
+            _integrate_chunk_impl,
+            system.get_inplace_func(jitted=False),
+            solver_step,
+            work_size,
+            np.dtype(dtype).type,
+        )
+
+    checks = IntegrationGuard() if guard is None else guard
+    anchor = np.empty(len(system.init_coord), dtype=np.float64)
+    track = np.zeros(3, dtype=np.int64)
+    resume_at: int | None = None
+
+    def run_chunk(
+        state: Vector, params: Vector, start: int, count: int, dt: float, skip: int, stride: int
+    ) -> tuple[Vector, Vector, Vector, int, int]:
+        nonlocal resume_at
+        if start != resume_at:
+            anchor[:] = state
+            track[:] = (1, 0, 0)
+        trajectory, time, final, code, taken = kernel(
+            np.ascontiguousarray(state, dtype=np.float64),
+            np.ascontiguousarray(params, dtype=np.float64),
+            start,
+            count,
+            float(dt),
+            skip,
+            stride,
+            guard is not None,
+            checks.max_norm,
+            checks.fixed_point_tol,
+            checks.period_tol,
+            anchor,
+            track,
+        )
+        resume_at = start + skip + (count - 1) * stride + 1
+        return trajectory.astype(dtype, copy=False), time, final, code, taken
+
+    return run_chunk
+
+
+def _bind_multistep_kernel(
+    system: System,
+    solver: Solver,
+    jit_enabled: bool,
+    dtype: DTypeLike = np.float64,
+    guard: IntegrationGuard | None = None,
+) -> ChunkKernel:
+    """Bind system and multistep solver functions to a chunk kernel.
+
+    The returned kernel behaves like the one from `_bind_chunk_kernel` and additionally
+    keeps the derivative history between calls. A call continues the history if it starts
+    at the step where the previous call ended, and otherwise fills it anew from the given
+    state with the start-up solver.
+    """
+    assert solver.startup is not None
+    dim = len(system.init_coord)
+    history = np.zeros((solver.history, dim), dtype=np.float64)
+    filled = 0
+    resume_at: int | None = None
+
+    kernel: Callable[..., tuple[Vector, Vector, Vector, int, int, int]]
+    if jit_enabled:
+        kernel = KernelCache.get("multistep", system, solver, dtype)
+    else:
+        startup = SolverRegistry.get(solver.startup)
+        kernel = partial(
+            _integrate_chunk_multistep_impl,
+            system.get_inplace_func(jitted=False),
+            cast(MultistepSolverCallable, solver.get_func(jitted=False)),
+            startup.get_inplace_func(jitted=False),
+            max(solver.work_size, startup.work_size),
+            np.dtype(dtype).type,
+        )
+
+    checks = IntegrationGuard() if guard is None else guard
+    anchor = np.empty(dim, dtype=np.float64)
+    track = np.zeros(3, dtype=np.int64)
+
+    def run_multistep(
+        state: Vector, params: Vector, start: int, count: int, dt: float, skip: int, stride: int
+    ) -> tuple[Vector, Vector, Vector, int, int]:
+        nonlocal filled, resume_at
+        if start != resume_at:
+            filled = 0
+            anchor[:] = state
+            track[:] = (1, 0, 0)
+        trajectory, time, final, filled, code, taken = kernel(
+            np.ascontiguousarray(state, dtype=np.float64),
+            np.ascontiguousarray(params, dtype=np.float64),
+            history,
+            filled,
+            start,
+            count,
+            float(dt),
+            skip,
+            stride,
+            guard is not None,
+            checks.max_norm,
+            checks.fixed_point_tol,
+            checks.period_tol,
+            anchor,
+            track,
+        )
+        resume_at = start + skip + (count - 1) * stride + 1
+        return trajectory.astype(dtype, copy=False), time, final, code, taken
+
+    return run_multistep
+
+
+def _validate_sampling(steps: int | None, transient_steps: int, save_every: int) -> None:
+    if transient_steps < 0:
+        raise ValueError("Transient steps must be non-negative")
+    if steps is not None and transient_steps >= steps:
+        raise ValueError("Transient steps must be less than the number of steps")
+    if save_every <= 0:
+        raise ValueError("Save interval must be positive")
+
+
+@overload
+def integrate_system(
+    system: System,
+    solver: Solver,
+    steps: int,
+    dt: float,
+    use_jit: bool | None = ...,
+    dtype: DTypeLike = ...,
+    transient_steps: int = ...,
+    save_every: int = ...,
+    cache: TrajectoryCache | None = ...,
+    guard: None = ...,
+) -> tuple[Vector, Vector]: ...
 
 
+@overload
 def integrate_system(
-    system: System, solver: Solver, steps: int, dt: float, use_jit: bool | None = None
-) -> tuple[Vector, Vector]:
+    system: System,
+    solver: Solver,
+    steps: int,
+    dt: float,
+    use_jit: bool | None = ...,
+    dtype: DTypeLike = ...,
+    transient_steps: int = ...,
+    save_every: int = ...,
+    cache: None = ...,
+    *,
+    guard: IntegrationGuard,
+) -> GuardedTrajectory: ...
+
+
+def integrate_system(
+    system: System,
+    solver: Solver,
+    steps: int,
+    dt: float,
+    use_jit: bool | None = None,
+    dtype: DTypeLike = np.float64,
+    transient_steps: int = 0,
+    save_every: int = 1,
+    cache: TrajectoryCache | None = None,
+    guard: IntegrationGuard | None = None,
+) -> tuple[Vector, Vector] | GuardedTrajectory:
     """Integrates a dynamical system using the specified numerical solver.
 
+    With JIT enabled, integration runs in a kernel fused and specialized for the system,
+    solver and dtype, which is compiled on first use and cached for the process lifetime
+    (see `KernelCache`).
+
+    The transient and decimation are applied inside the integration loop, so only the kept
+    states are stored. The result equals `trajectory[transient_steps::save_every]` of a full
+    run, with matching time points.
+
+    With a guard, every step is checked as in `integrate_sweep` and the integration stops
+    at the first step that trips it, so a diverging trajectory does not run to the end.
+
     Args:
         system (System): System to integrate
         solver (Solver): Numerical solver to use for integration
         steps (int): Number of integration steps
         dt (float): Time step size
         use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+        dtype (DTypeLike): Storage dtype of the trajectory. Integration itself always runs
+            in double precision. Defaults to np.float64.
+        transient_steps (int): Number of initial steps to discard. Defaults to 0.
+        save_every (int): Record every k-th state after the transient. Defaults to 1.
+        cache (TrajectoryCache | None): Cache to look up and store the result in. Cached
+            results are returned read-only. Defaults to None.
+        guard (IntegrationGuard | None): Checks that stop the integration early. Defaults
+            to None.
 
     Raises:
-        ValueError: If steps <= 0 or dt <= 0
+        ValueError: If steps <= 0, dt <= 0, the solver is adaptive, transient_steps is
+            negative or not less than steps, save_every <= 0, or both a cache and a guard
+            are given
 
     Returns:
-        tuple[Vector, Vector]: A tuple containing:
-            - Vector: System state trajectory at each time step
+        tuple[Vector, Vector] | GuardedTrajectory: A tuple containing:
+            - Vector: System state trajectory at each recorded time step
             - Vector: Time points corresponding to trajectory
+            With a guard, a `GuardedTrajectory` holding the states recorded within the
+            valid steps, the status and the number of valid steps.
 
+    Examples:
+        >>> trajectory, time = integrate_system(
+        ...     system, solver, 10_000_000, 0.001, transient_steps=100_000, save_every=10
+        ... )
+        >>> result = integrate_system(system, solver, 100_000, 0.01, guard=IntegrationGuard())
+        >>> result.status, result.valid_steps
+        (<IntegrationStatus.COMPLETED: 0>, 100000)
     """
     if steps <= 0:
         raise ValueError("Number of steps must be positive")
     if dt <= 0:
         raise ValueError("Time step must be positive")
+    if solver.adaptive:
+        msg = f"Solver {solver.name} is adaptive, use integrate_adaptive instead"
+        raise ValueError(msg)
+    _validate_sampling(steps, transient_steps, save_every)
+    if cache is not None and guard is not None:
+        raise ValueError("Guarded integrations cannot be cached")
 
     jit_enabled = True if use_jit is None else use_jit
     logger.debug("JIT enabled: %s", jit_enabled)
     logger.info("Integrating system: %s with solver: %s", system, solver)
-    logger.info("Steps: %d, dt: %.6g", steps, dt)
-
-    if jit_enabled is True:
-        integrate_func = _integrate_trajectory_jitted
-    else:
-        integrate_func = _integrate_trajectory_impl
+    logger.info(
+        "Steps: %d, dt: %.6g, transient: %d, save every: %d",
+        steps,
+        dt,
+        transient_steps,
+        save_every,
+    )
 
-    system_func = system.get_func(jit_enabled)
-    solver_func = solver.get_func(jit_enabled)
+    key = None
+    if cache is not None:
+        key = cache.key(system, solver, steps, dt, transient_steps, save_every, dtype)
+    if cache is not None and key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info("Loaded trajectory from cache: %s", key[:12])
+            return cached
 
-    return integrate_func(  # type: ignore[no-any-return]
-        system_func, solver_func, system.init_coord, system.params, steps, dt
+    count = (steps - transient_steps + save_every - 1) // save_every
+    kernel = _bind_chunk_kernel(system, solver, jit_enabled, dtype, guard)
+    trajectory, time, _, code, taken = kernel(
+        system.init_coord, system.params, 0, count, dt, transient_steps, save_every
     )
+    if guard is not None:
+        status = IntegrationStatus(code)
+        logger.info("Status: %s, steps taken: %d of %d", status.name, taken, steps)
+        return GuardedTrajectory(trajectory, time, status, taken if code else steps)
+    if cache is not None and key is not None:
+        return cache.put(key, trajectory, time)
+    return trajectory, time
+
+
+@overload
+def integrate_system_iter(
+    system: System,
+    solver: Solver,
+    dt: float,
+    chunk_size: int,
+    steps: int | None = ...,
+    use_jit: bool | None = ...,
+    dtype: DTypeLike = ...,
+    transient_steps: int = ...,
+    save_every: int = ...,
+    guard: None = ...,
+) -> Iterator[tuple[Vector, Vector]]: ...
+
+
+@overload
+def integrate_system_iter(
+    system: System,
+    solver: Solver,
+    dt: float,
+    chunk_size: int,
+    steps: int | None = ...,
+    use_jit: bool | None = ...,
+    dtype: DTypeLike = ...,
+    transient_steps: int = ...,
+    save_every: int = ...,
+    *,
+    guard: IntegrationGuard,
+) -> Iterator[GuardedTrajectory]: ...
+
+
+def integrate_system_iter(
+    system: System,
+    solver: Solver,
+    dt: float,
+    chunk_size: int,
+    steps: int | None = None,
+    use_jit: bool | None = None,
+    dtype: DTypeLike = np.float64,
+    transient_steps: int = 0,
+    save_every: int = 1,
+    guard: IntegrationGuard | None = None,
+) -> Iterator[tuple[Vector, Vector]] | Iterator[GuardedTrajectory]:
+    """Integrates a dynamical system in fixed-size chunks with bounded memory.
+
+    Each chunk continues exactly from the last state of the previous one, so concatenating
+    all chunks reproduces the output of `integrate_system` for the same number of steps,
+    transient and save interval. Only one chunk is held in memory at a time, which allows
+    arbitrarily long runs to be consumed incrementally.
+
+    With a guard, every chunk is a `GuardedTrajectory` whose `valid_steps` counts the steps
+    taken so far. Iteration ends with the chunk in which the guard tripped, which holds the
+    states recorded up to then and the status, so indefinite runs end once settled.
+
+    Args:
+        system (System): System to integrate
+        solver (Solver): Numerical solver to use for integration
+        dt (float): Time step size
+        chunk_size (int): Number of recorded states per chunk
+        steps (int | None): Total number of integration steps. Runs indefinitely if None.
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+        dtype (DTypeLike): Storage dtype of each chunk. State is carried across chunks in
+            double precision. Defaults to np.float64.
+        transient_steps (int): Number of initial steps to discard. Defaults to 0.
+        save_every (int): Record every k-th state after the transient. Defaults to 1.
+        guard (IntegrationGuard | None): Checks that stop the integration early. Defaults
+            to None.
+
+    Raises:
+        ValueError: If dt <= 0, chunk_size <= 0, steps <= 0, the solver is adaptive,
+            transient_steps is negative or not less than steps, or save_every <= 0
+
+    Returns:
+        Iterator[tuple[Vector, Vector]] | Iterator[GuardedTrajectory]: Iterator over chunks,
+            each a tuple containing:
+            - Vector: System state trajectory for the chunk (at most chunk_size x dim)
+            - Vector: Time points corresponding to the chunk
+            With a guard, each chunk is a `GuardedTrajectory` instead.
+
+    Examples:
+        >>> for trajectory, time in integrate_system_iter(system, solver, 0.001, 100_000):
+        ...     writer.write(trajectory)
+    """
+    if dt <= 0:
+        raise ValueError("Time step must be positive")
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    if steps is not None and steps <= 0:
+        raise ValueError("Number of steps must be positive")
+    if solver.adaptive:
+        msg = f"Solver {solver.name} is adaptive, use integrate_adaptive instead"
+        raise ValueError(msg)
+    _validate_sampling(steps, transient_steps, save_every)
+
+    jit_enabled = True if use_jit is None else use_jit
+    logger.debug("JIT enabled: %s", jit_enabled)
+    logger.info("Streaming system: %s with solver: %s", system, solver)
+    logger.info("Steps: %s, dt: %.6g, chunk size: %d", steps, dt, chunk_size)
+
+    kernel = _bind_chunk_kernel(system, solver, jit_enabled, dtype, guard)
+    init_coord = system.init_coord.copy()
+    params = system.params.copy()
+    total = None if steps is None else (steps - transient_steps + save_every - 1) // save_every
+
+    def chunks() -> Iterator[tuple[Vector, Vector]]:
+        state = init_coord
+        start, skip, recorded = 0, transient_steps, 0
+        while total is None or recorded < total:
+            n = chunk_size if total is None else min(chunk_size, total - recorded)
+            trajectory, time, state, _, _ = kernel(state, params, start, n, dt, skip, save_every)
+            start += skip + (n - 1) * save_every + 1
+            skip = save_every - 1
+            recorded += n
+            yield trajectory, time
+
+    def guarded_chunks() -> Iterator[GuardedTrajectory]:
+        state = init_coord
+        start, skip, recorded = 0, transient_steps, 0
+        while total is None or recorded < total:
+            n = chunk_size if total is None else min(chunk_size, total - recorded)
+            trajectory, time, state, code, taken = kernel(
+                state, params, start, n, dt, skip, save_every
+            )
+            if code:
+                status = IntegrationStatus(code)
+                logger.info("Status: %s, steps taken: %d", status.name, start + taken)
+                yield GuardedTrajectory(trajectory, time, status, start + taken)
+                return
+            start += skip + (n - 1) * save_every + 1
+            skip = save_every - 1
+            recorded += n
+            valid = start if total is None or recorded < total else cast(int, steps)
+            yield GuardedTrajectory(trajectory, time, IntegrationStatus.COMPLETED, valid)
+
+    return chunks() if guard is None else guarded_chunks()
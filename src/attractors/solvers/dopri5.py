@@ -0,0 +1,39 @@
+from attractors.solvers.registry import SolverRegistry
+from attractors.type_defs import SystemCallable, Vector
+
+
+@SolverRegistry.register("dopri5", adaptive=True, order=5, stages=7, fsal=True)
+def dopri5(
+    system_func: SystemCallable, state: Vector, k1: Vector, params: Vector, dt: float
+) -> tuple[Vector, Vector, Vector]:
+    """
+    Dormand-Prince 5(4) embedded integration scheme.
+    """
+    k2 = system_func(state + dt * (k1 / 5), params)
+    k3 = system_func(state + dt * (3 * k1 / 40 + 9 * k2 / 40), params)
+    k4 = system_func(state + dt * (44 * k1 / 45 - 56 * k2 / 15 + 32 * k3 / 9), params)
+    k5 = system_func(
+        state + dt * (19372 * k1 / 6561 - 25360 * k2 / 2187 + 64448 * k3 / 6561 - 212 * k4 / 729),
+        params,
+    )
+    k6 = system_func(
+        state
+        + dt
+        * (
+            9017 * k1 / 3168 - 355 * k2 / 33 + 46732 * k3 / 5247 + 49 * k4 / 176 - 5103 * k5 / 18656
+        ),
+        params,
+    )
+    result: Vector = state + dt * (
+        35 * k1 / 384 + 500 * k3 / 1113 + 125 * k4 / 192 - 2187 * k5 / 6784 + 11 * k6 / 84
+    )
+    k7 = system_func(result, params)
+    error: Vector = dt * (
+        71 * k1 / 57600
+        - 71 * k3 / 16695
+        + 71 * k4 / 1920
+        - 17253 * k5 / 339200
+        + 22 * k6 / 525
+        - k7 / 40
+    )
+    return result, error, k7
@@ -1,5 +1,5 @@
 from attractors.solvers.registry import SolverRegistry
-from attractors.type_defs import SystemCallable, Vector
+from attractors.type_defs import SystemCallable, SystemInplaceCallable, Vector
 
 
 @SolverRegistry.register("euler")
@@ -8,3 +8,21 @@ def euler(system_func: SystemCallable, state: Vector, params: Vector, dt: float)
     Euler integration scheme.
     """
     return state + dt * system_func(state, params)
+
+
+@SolverRegistry.register_inplace("euler", work_size=1)
+def euler_inplace(
+    system_func: SystemInplaceCallable,
+    state: Vector,
+    params: Vector,
+    dt: float,
+    work: Vector,
+    out: Vector,
+) -> None:
+    """
+    Allocation-free Euler integration scheme.
+    """
+    k1 = work[0]
+    system_func(state, params, k1)
+    for i in range(len(state)):
+        out[i] = state[i] + dt * k1[i]
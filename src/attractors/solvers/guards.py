@@ -0,0 +1,150 @@
+from dataclasses import dataclass
+from enum import IntEnum
+
+import numpy as np
+from numba.extending import register_jitable
+from numpy.typing import NDArray
+
+from attractors.type_defs import Vector
+
+
+class IntegrationStatus(IntEnum):
+    """Reasons for a guarded integration to stop.
+    completed: All steps were taken
+    non_finite: A state component became infinite or NaN
+    diverged: A state component exceeded the magnitude bound
+    fixed_point: The state converged to a fixed point
+    periodic: The state returned to an earlier state
+    """
+
+    COMPLETED = 0
+    NON_FINITE = 1
+    DIVERGED = 2
+    FIXED_POINT = 3
+    PERIODIC = 4
+
+
+@dataclass(frozen=True)
+class IntegrationGuard:
+    """
+    Checks that stop an integration early once its outcome is settled.
+
+    Every step is checked for non-finite components and components larger than max_norm,
+    in which case the step is discarded. Optionally, the integration also stops when the
+    state moves slower than fixed_point_tol per unit time, or returns to within period_tol
+    (maximum norm) of an earlier state after having left it. Earlier states are anchored at
+    steps 1, 2, 4, ... (Brent's cycle detection), so a cycle is detected within about twice
+    its length once the orbit has settled on it. For flows, period_tol must exceed half the
+    distance travelled in one step, and chaotic orbits may be flagged when they pass close
+    to an anchor by chance.
+
+    Attributes:
+        max_norm (float): Bound on the magnitude of every state component
+        fixed_point_tol (float): Speed below which the state counts as a fixed point,
+            0 to disable
+        period_tol (float): Distance below which a return counts as periodic, 0 to disable
+
+    Raises:
+        ValueError: If max_norm is not positive or a tolerance is negative
+    """
+
+    max_norm: float = 1e12
+    fixed_point_tol: float = 0.0
+    period_tol: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.max_norm > 0:
+            raise ValueError("Maximum norm must be positive")
+        if self.fixed_point_tol < 0 or self.period_tol < 0:
+            raise ValueError("Tolerances must be non-negative")
+
+
+@dataclass(frozen=True)
+class GuardedBatch:
+    """
+    Results of a guarded batch integration.
+
+    Attributes:
+        result (Vector): Per-member results as returned without a guard, computed over the
+            valid steps, with trajectory rows beyond them set to NaN
+        status (NDArray[np.int64]): `IntegrationStatus` code of every member
+        valid_steps (NDArray[np.int64]): Number of steps kept for every member
+    """
+
+    result: Vector
+    status: NDArray[np.int64]
+    valid_steps: NDArray[np.int64]
+
+
+@dataclass(frozen=True)
+class GuardedTrajectory:
+    """
+    Results of a guarded integration of a single trajectory.
+
+    Attributes:
+        trajectory (Vector): States recorded within the valid steps
+        time (Vector): Time points corresponding to trajectory
+        status (IntegrationStatus): Reason the integration stopped
+        valid_steps (int): Number of integration steps kept, including the transient
+    """
+
+    trajectory: Vector
+    time: Vector
+    status: IntegrationStatus
+    valid_steps: int
+
+
+@register_jitable
+def _distance(a: Vector, b: Vector) -> float:
+    """Maximum norm of the difference of two states."""
+    distance = 0.0
+    for i in range(len(a)):
+        distance = max(distance, abs(a[i] - b[i]))
+    return distance
+
+
+@register_jitable
+def _guard_status(
+    state: Vector, new_state: Vector, dt: float, max_norm: float, fixed_point_tol: float
+) -> int:
+    """Check a step for non-finite values, divergence and convergence to a fixed point."""
+    magnitude = 0.0
+    for i in range(len(new_state)):
+        if not np.isfinite(new_state[i]):
+            return 1
+        magnitude = max(magnitude, abs(new_state[i]))
+    if magnitude > max_norm:
+        return 2
+    if fixed_point_tol > 0.0 and _distance(state, new_state) <= fixed_point_tol * dt:
+        return 3
+    return 0
+
+
+@register_jitable
+def _guard_step(
+    state: Vector,
+    new_state: Vector,
+    dt: float,
+    max_norm: float,
+    fixed_point_tol: float,
+    period_tol: float,
+    anchor: Vector,
+    track: NDArray[np.int64],
+) -> int:
+    """Check a step as `_guard_status` does and for a return to the anchored state.
+
+    The cycle detection state is kept in `anchor` and `track` (next anchoring step, whether
+    the orbit has left the anchor, steps checked) so that it carries over between chunks.
+    """
+    code = _guard_status(state, new_state, dt, max_norm, fixed_point_tol)
+    track[2] += 1
+    if code == 0 and period_tol > 0.0:
+        if _distance(new_state, anchor) > period_tol:
+            track[1] = 1
+        elif track[1] == 1:
+            code = 4
+        if code == 0 and track[2] == track[0]:
+            anchor[:] = new_state
+            track[0] *= 2
+            track[1] = 0
+    return code
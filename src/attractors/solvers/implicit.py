@@ -0,0 +1,102 @@
+import numpy as np
+from numba.extending import register_jitable
+from numpy.typing import NDArray
+
+from attractors.type_defs import SystemCallable, Vector
+
+NEWTON_MAX_ITER = 10
+NEWTON_TOL = 1e-10
+
+# Helpers that call the system function are inlined: passing a dispatcher into a separate
+# compiled function embeds its address, which keeps kernels out of the on-disk cache.
+
+
+@register_jitable(inline="always")
+def _jacobian_fd(system_func: SystemCallable, state: Vector, params: Vector, f0: Vector) -> Vector:
+    """Approximate the Jacobian of a system by forward differences around f0 = f(state)."""
+    n = len(state)
+    jac = np.empty((n, n), dtype=np.float64)
+    shifted = state.copy()
+    for j in range(n):
+        h = 1.4901161193847656e-08 * max(1.0, abs(state[j]))
+        shifted[j] = state[j] + h
+        column = system_func(shifted, params)
+        shifted[j] = state[j]
+        for i in range(n):
+            jac[i, j] = (column[i] - f0[i]) / h
+    return jac
+
+
+@register_jitable
+def _lu_factor(a: Vector) -> tuple[Vector, NDArray[np.intp]]:
+    """LU factorization with partial pivoting of a small dense matrix."""
+    n = a.shape[0]
+    lu = a.copy()
+    piv = np.arange(n)
+    for k in range(n):
+        p = k
+        for i in range(k + 1, n):
+            if abs(lu[i, k]) > abs(lu[p, k]):
+                p = i
+        if p != k:
+            for j in range(n):
+                lu[k, j], lu[p, j] = lu[p, j], lu[k, j]
+            piv[k], piv[p] = piv[p], piv[k]
+        for i in range(k + 1, n):
+            lu[i, k] /= lu[k, k]
+            for j in range(k + 1, n):
+                lu[i, j] -= lu[i, k] * lu[k, j]
+    return lu, piv
+
+
+@register_jitable
+def _lu_solve(lu: Vector, piv: NDArray[np.intp], b: Vector) -> Vector:
+    """Solve LU x = P b given the factors from `_lu_factor`."""
+    n = lu.shape[0]
+    x = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        x[i] = b[piv[i]]
+        for j in range(i):
+            x[i] -= lu[i, j] * x[j]
+    for i in range(n - 1, -1, -1):
+        for j in range(i + 1, n):
+            x[i] -= lu[i, j] * x[j]
+        x[i] /= lu[i, i]
+    return x
+
+
+@register_jitable
+def _iteration_matrix(jac: Vector, c: float) -> tuple[Vector, NDArray[np.intp]]:
+    """Factorize I - c * J."""
+    n = jac.shape[0]
+    m = -c * jac
+    for i in range(n):
+        m[i, i] += 1.0
+    return _lu_factor(m)
+
+
+@register_jitable(inline="always")
+def _solve_stage(
+    system_func: SystemCallable,
+    base: Vector,
+    c: float,
+    guess: Vector,
+    params: Vector,
+    lu: Vector,
+    piv: NDArray[np.intp],
+) -> Vector:
+    """Solve z = base + c * f(z) by simplified Newton iteration.
+
+    The iteration matrix I - c * J is factorized once by the caller. Returns NaN if the
+    iteration has not converged after `NEWTON_MAX_ITER` iterations, so that a failed step
+    is reported as non-finite instead of being accepted.
+    """
+    z = guess.copy()
+    for _ in range(NEWTON_MAX_ITER):
+        delta = _lu_solve(lu, piv, z - base - c * system_func(z, params))
+        for i in range(len(z)):
+            z[i] -= delta[i]
+        if np.max(np.abs(delta)) <= NEWTON_TOL * (1.0 + np.max(np.abs(z))):
+            return z
+    z[:] = np.nan
+    return z
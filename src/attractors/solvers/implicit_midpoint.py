@@ -0,0 +1,19 @@
+from attractors.solvers.implicit import _iteration_matrix, _jacobian_fd, _solve_stage
+from attractors.solvers.registry import SolverRegistry
+from attractors.type_defs import SystemCallable, Vector
+
+
+@SolverRegistry.register("implicit_midpoint", order=2, implicit=True)
+def implicit_midpoint(
+    system_func: SystemCallable, state: Vector, params: Vector, dt: float
+) -> Vector:
+    """
+    Implicit midpoint integration scheme.
+
+    Second order, A-stable and symplectic. The midpoint equation is solved by simplified
+    Newton iteration with a finite-difference Jacobian.
+    """
+    f0 = system_func(state, params)
+    lu, piv = _iteration_matrix(_jacobian_fd(system_func, state, params, f0), dt / 2)
+    midpoint = _solve_stage(system_func, state, dt / 2, state + dt / 2 * f0, params, lu, piv)
+    return 2 * midpoint - state
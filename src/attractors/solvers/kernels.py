@@ -0,0 +1,635 @@
+import hashlib
+import importlib.util
+import inspect
+import os
+import sys
+import textwrap
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, ClassVar, TypeVar
+
+import numpy as np
+from numba import njit
+from numba.core.dispatcher import Dispatcher
+from numpy.typing import DTypeLike
+
+from attractors.solvers.registry import Solver, SolverRegistry
+from attractors.systems.registry import System
+from attractors.type_defs import SolverInplaceCallable, Vector
+from attractors.utils.logger import setup_logger
+
+logger = setup_logger(name=__name__)
+
+CACHE_DIR_ENV = "ATTRACTORS_CACHE_DIR"
+
+
+def _default_cache_dir() -> Path | None:
+    """Resolve the kernel cache directory from the environment.
+
+    `ATTRACTORS_CACHE_DIR` takes precedence, with an empty value disabling the on-disk
+    cache. Otherwise kernels are stored under `$XDG_CACHE_HOME/attractors/kernels`.
+    """
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured is not None:
+        return Path(configured).expanduser() if configured else None
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "attractors" / "kernels"
+
+
+def _fingerprint(obj: Any, seen: set[int] | None = None) -> str | None:
+    """Describe an object reachable from a kernel by a string that changes with its code.
+
+    Functions are described by their source and, recursively, by the closure variables and
+    globals they reference, including module constants that Numba inlines into kernels.
+    Arrays are described by a hash of their contents, since their repr elides all but a few
+    elements of large arrays. Returns None if the object has no stable description, in
+    which case a kernel depending on it cannot be cached on disk.
+    """
+    seen = set() if seen is None else seen
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            return None
+        digest = hashlib.sha256(np.ascontiguousarray(obj).tobytes()).hexdigest()
+        return f"ndarray({obj.dtype.str}, {obj.shape}, {digest})"
+    if isinstance(obj, tuple | list):
+        items = [_fingerprint(item, seen) for item in obj]
+        described = [item for item in items if item is not None]
+        if len(described) < len(items):
+            return None
+        return f"{type(obj).__name__}({', '.join(described)})"
+    func = getattr(obj, "py_func", obj)
+    if not inspect.isfunction(func):
+        if inspect.ismodule(obj):
+            return obj.__name__
+        description = repr(obj)
+        return None if " at 0x" in description else description
+    if id(func) in seen:
+        return func.__qualname__
+    seen.add(id(func))
+
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        return None
+    parts = [func.__module__, func.__qualname__, source]
+    namespace = dict(zip(func.__code__.co_freevars, func.__closure__ or (), strict=True))
+    for name, cell in namespace.items():
+        parts.append(f"{name}={_fingerprint(cell.cell_contents, seen)}")
+    for name in func.__code__.co_names:
+        if name not in func.__globals__ or inspect.ismodule(func.__globals__[name]):
+            continue
+        parts.append(f"{name}={_fingerprint(func.__globals__[name], seen)}")
+    if any(part.endswith("=None") for part in parts[3:]):
+        return None
+    return "\n".join(parts)
+
+
+@dataclass(frozen=True)
+class KernelTarget:
+    """
+    System and solver functions a kernel builder specializes on.
+
+    Both functions follow the in-place convention, with solvers lacking an allocation-free
+    variant wrapped accordingly. They are compiled with `inline="always"`, so referencing
+    them from the builder's closure lets Numba inline them into the generated kernel.
+
+    For multistep solvers, solver_step follows the multistep convention and startup_step is
+    the in-place step of the solver that fills the history. Kernels requested with an event
+    function receive it as event_func, taking (state, params) and returning a scalar.
+
+    For single-step solvers with an in-place variant, the step takes the system function as
+    an argument and can therefore also integrate derived systems, such as the variational
+    equations built from jacobian_func. Wrapped allocating solvers always evaluate the
+    system itself, so jacobian_func is None for them.
+
+    Attributes:
+        system_func (Callable[..., Any]): Inlinable in-place system function
+        solver_step (Callable[..., Any]): Inlinable in-place solver step
+        work_size (int): Number of scratch vectors required by the solver step
+        dtype (type[np.floating[Any]]): Scalar type of stored output
+        dim (int): State dimension of the system, for kernels specializing on it
+        history (int): Number of past derivatives kept by a multistep solver
+        startup_step (Callable[..., Any] | None): Inlinable in-place start-up step of a
+            multistep solver
+        event_func (Callable[..., Any] | None): Inlinable event function, or None if the
+            kernel was requested without one
+        jacobian_func (Callable[..., Any] | None): Inlinable Jacobian function of the
+            system, or None if the solver step cannot integrate derived systems
+    """
+
+    system_func: Callable[..., Any]
+    solver_step: Callable[..., Any]
+    work_size: int
+    dtype: type[np.floating[Any]]
+    dim: int
+    history: int = 0
+    startup_step: Callable[..., Any] | None = None
+    event_func: Callable[..., Any] | None = None
+    jacobian_func: Callable[..., Any] | None = None
+
+
+@dataclass(frozen=True)
+class KernelCacheStats:
+    """
+    Statistics of the process-wide kernel cache.
+
+    Attributes:
+        hits (int): Number of lookups served from the cache
+        misses (int): Number of lookups that required compilation
+        compile_time (float): Total compilation time in seconds
+        size (int): Number of cached kernels
+        disk_hits (int): Number of compilations served from the on-disk cache
+    """
+
+    hits: int
+    misses: int
+    compile_time: float
+    size: int
+    disk_hits: int = 0
+
+
+def _reference_step(system: System, solver: Solver) -> tuple[SolverInplaceCallable, int]:
+    """Get the non-jitted in-place step of a solver and its work size.
+
+    Solvers without an allocation-free variant are wrapped into the in-place convention,
+    calling the allocating solver with the allocating system function.
+    """
+    if solver.has_inplace:
+        return solver.get_inplace_func(jitted=False), solver.work_size
+
+    allocating_system = system.get_func(jitted=False)
+    allocating_step = solver.get_func(jitted=False)
+
+    def solver_step(
+        system_func: Any,  # noqa: ARG001
+        state: Vector,
+        params: Vector,
+        dt: float,
+        work: Vector,  # noqa: ARG001
+        out: Vector,
+    ) -> None:
+        out[:] = allocating_step(allocating_system, state, params, dt)
+
+    return solver_step, 0
+
+
+KernelBuilder = Callable[[KernelTarget], Callable[..., Any]]
+B = TypeVar("B", bound=KernelBuilder)
+
+
+class KernelCache:
+    """
+    Process-wide cache of fused integration kernels.
+
+    Kernel builders are registered per kernel kind together with the argument signature of
+    the kernels they produce. For each (kind, system, solver, dtype) combination and state
+    dimension, the builder is specialized on inlinable versions of the system and solver
+    functions and compiled eagerly, so that the generated kernel contains no calls across
+    the system/solver boundary. Compiled kernels are reused for the lifetime of the process.
+    Kernels release the GIL while running, so integrations on separate threads run
+    concurrently.
+
+    Kernels are additionally persisted on disk, so that later processes load them instead of
+    compiling again. The kernel source is written to a module in the cache directory whose
+    name is a hash of the source of the kernel, system and solver functions and of the
+    globals they reference, and the module is compiled with Numba's `cache=True`. Editing
+    any of these functions or constants therefore yields a new module instead of a stale
+    kernel. The directory defaults to
+    `~/.cache/attractors/kernels` and can be changed with the `ATTRACTORS_CACHE_DIR`
+    environment variable (empty to disable) or `set_cache_dir`.
+
+    Attributes:
+        _builders: Internal dict mapping kernel kinds to builders and compile options
+        _kernels: Internal dict mapping cache keys to compiled kernels
+
+    Examples:
+        >>> kernel = KernelCache.get("trajectory", system, solver)
+        >>> KernelCache.stats()
+        KernelCacheStats(hits=0, misses=1, compile_time=0.41, size=1)
+    """
+
+    _builders: ClassVar[dict[str, tuple[KernelBuilder, Any, bool, bool, bool]]] = {}
+    _kernels: ClassVar[dict[tuple[Any, ...], Dispatcher]] = {}
+    _compile_times: ClassVar[dict[tuple[Any, ...], tuple[str, float]]] = {}
+    _inlinable: ClassVar[dict[Callable[..., Any], Dispatcher]] = {}
+    _hits: ClassVar[int] = 0
+    _misses: ClassVar[int] = 0
+    _disk_hits: ClassVar[int] = 0
+    _cache_dir: ClassVar[Path | None] = _default_cache_dir()
+    _lock: ClassVar[threading.RLock] = threading.RLock()
+
+    @classmethod
+    def register(
+        cls,
+        kind: str,
+        *,
+        signature: Any,
+        parallel: bool = False,
+        multistep: bool = False,
+        inplace: bool = False,
+    ) -> Callable[[B], B]:
+        """Register a kernel builder.
+
+        The builder takes a `KernelTarget` and returns a plain Python function that
+        references the target's functions from its closure. It is compiled by the cache
+        with the given signature.
+
+        Args:
+            kind (str): Unique kernel kind identifier
+            signature (Any): Numba argument types of the generated kernel
+            parallel (bool, optional): Whether to compile with `parallel=True`.
+                Defaults to False.
+            multistep (bool, optional): Whether the builder takes multistep solvers instead
+                of single-step ones. Defaults to False.
+            inplace (bool, optional): Whether the builder only takes solvers with an
+                in-place variant, e.g. because the kernel integrates a state the allocating
+                system function cannot evaluate. Defaults to False.
+
+        Returns:
+            Callable[[B], B]: Decorator function that registers the builder
+
+        Raises:
+            ValueError: If kernel kind is already registered
+        """
+
+        def decorator(builder: B) -> B:
+            if kind in cls._builders:
+                msg = f"Kernel {kind} already registered"
+                raise ValueError(msg)
+            cls._builders[kind] = (builder, signature, parallel, multistep, inplace)
+            return builder
+
+        logger.debug("Registered kernel builder: %s", kind)
+        return decorator
+
+    @classmethod
+    def _make_inlinable(cls, func: Callable[..., Any]) -> Dispatcher:
+        py_func = getattr(func, "py_func", func)
+        if py_func not in cls._inlinable:
+            cls._inlinable[py_func] = njit(inline="always")(py_func)
+        return cls._inlinable[py_func]
+
+    @classmethod
+    def _target(cls, system: System, solver: Solver, dtype: np.dtype[Any]) -> KernelTarget:
+        assert system.inplace_func is not None
+        system_func = cls._make_inlinable(system.inplace_func)
+        if solver.multistep:
+            assert solver.startup is not None
+            startup = SolverRegistry.get(solver.startup)
+            return KernelTarget(
+                system_func=system_func,
+                solver_step=cls._make_inlinable(solver.func),
+                work_size=max(solver.work_size, startup.work_size),
+                dtype=dtype.type,
+                dim=system.dim,
+                history=solver.history,
+                startup_step=cls._make_inlinable(startup.get_inplace_func(jitted=False)),
+            )
+        if solver.inplace_func is not None:
+            assert system.jacobian_func is not None
+            return KernelTarget(
+                system_func=system_func,
+                solver_step=cls._make_inlinable(solver.inplace_func),
+                work_size=solver.work_size,
+                dtype=dtype.type,
+                dim=system.dim,
+                jacobian_func=cls._make_inlinable(system.jacobian_func),
+            )
+
+        allocating_system = cls._make_inlinable(system.func)
+        allocating_step = cls._make_inlinable(solver.func)
+
+        def solver_step(
+            system_func: Any,  # noqa: ARG001
+            state: Any,
+            params: Any,
+            dt: float,
+            work: Any,  # noqa: ARG001
+            out: Any,
+        ) -> None:
+            out[:] = allocating_step(allocating_system, state, params, dt)
+
+        return KernelTarget(
+            system_func=system_func,
+            solver_step=njit(inline="always")(solver_step),
+            work_size=0,
+            dtype=dtype.type,
+            dim=system.dim,
+        )
+
+    @classmethod
+    def set_cache_dir(cls, path: str | os.PathLike[str] | None) -> None:
+        """
+        Set the directory of the on-disk kernel cache.
+
+        Only affects kernels compiled afterwards.
+
+        Args:
+            path (str | os.PathLike[str] | None): Cache directory, or None to keep compiled
+                kernels in memory only
+        """
+        with cls._lock:
+            cls._cache_dir = None if path is None else Path(path).expanduser()
+        logger.debug("Kernel cache directory: %s", cls._cache_dir)
+
+    @classmethod
+    def cache_dir(cls) -> Path | None:
+        """
+        Get the directory of the on-disk kernel cache.
+
+        Returns:
+            Path | None: Cache directory, or None if the on-disk cache is disabled
+        """
+        return cls._cache_dir
+
+    @classmethod
+    def _load_persistent(cls, kind: str, func: Callable[..., Any], fingerprint: str) -> Any:
+        """Re-create a kernel function from a module in the cache directory.
+
+        The closure variables and globals of the kernel function become globals of the
+        generated module, so that Numba can cache it like any module-level function.
+        """
+        assert cls._cache_dir is not None
+        digest = hashlib.sha256(fingerprint.encode()).hexdigest()[:24]
+        module_name = f"{kind}_{digest}"
+        path = cls._cache_dir / f"{module_name}.py"
+        if not path.exists():
+            cls._cache_dir.mkdir(parents=True, exist_ok=True)
+            source = textwrap.dedent(inspect.getsource(func))
+            header = f"# Generated by attractors from {func.__module__}.{func.__qualname__}\n"
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(header + source)
+            tmp.replace(path)
+
+        spec = importlib.util.spec_from_file_location(f"_attractors_kernel_{module_name}", path)
+        assert spec is not None
+        assert spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        namespace = {k: v for k, v in func.__globals__.items() if not k.startswith("__")}
+        namespace.update(
+            zip(
+                func.__code__.co_freevars,
+                (cell.cell_contents for cell in func.__closure__ or ()),
+                strict=True,
+            )
+        )
+        module.__dict__.update(namespace)
+        # Numba re-imports the module by name when loading a cached kernel
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        return getattr(module, func.__name__)
+
+    @classmethod
+    def _compile(
+        cls, kind: str, func: Callable[..., Any], signature: Any, parallel: bool
+    ) -> Dispatcher:
+        fingerprint = _fingerprint(func)
+        kernel: Dispatcher
+        if cls._cache_dir is None or fingerprint is None:
+            kernel = njit(signature, parallel=parallel, nogil=True)(func)
+            return kernel
+
+        fingerprint = f"{fingerprint}\n{signature}\n{parallel}\nnogil"
+        try:
+            persistent = cls._load_persistent(kind, func, fingerprint)
+        except OSError as e:
+            logger.warning("Kernel cache unavailable at %s: %s", cls._cache_dir, e)
+            kernel = njit(signature, parallel=parallel, nogil=True)(func)
+        else:
+            kernel = njit(signature, parallel=parallel, nogil=True, cache=True)(persistent)
+        return kernel
+
+    @classmethod
+    def supports(cls, kind: str, solver: Solver) -> bool:
+        """
+        Check whether a kernel kind can be built for a solver.
+
+        Adaptive solvers have no fused kernels, multistep solvers are only supported by
+        kernels registered with `multistep=True`, and kernels registered with
+        `inplace=True` only support solvers with an in-place variant.
+
+        Args:
+            kind (str): Registered kernel kind
+            solver (Solver): Solver to check
+
+        Returns:
+            bool: True if the kernel kind supports the solver
+
+        Raises:
+            KeyError: If kernel kind is not registered
+        """
+        if kind not in cls._builders:
+            msg = f"Kernel {kind} not found"
+            raise KeyError(msg)
+        _, _, _, multistep, inplace = cls._builders[kind]
+        return (
+            not solver.adaptive
+            and multistep == solver.multistep
+            and (solver.has_inplace or not inplace)
+        )
+
+    @classmethod
+    def get(
+        cls,
+        kind: str,
+        system: System,
+        solver: Solver,
+        dtype: DTypeLike = np.float64,
+        event: Callable[..., float] | None = None,
+    ) -> Dispatcher:
+        """Get the compiled kernel for a system, solver and output dtype.
+
+        Args:
+            kind (str): Registered kernel kind
+            system (System): System to specialize on
+            solver (Solver): Solver to specialize on
+            dtype (DTypeLike, optional): Output dtype. Defaults to np.float64.
+            event (Callable[..., float] | None, optional): Event function taking
+                (state, params) to specialize on, for kernel kinds that use one.
+                Defaults to None.
+
+        Returns:
+            Dispatcher: Compiled kernel
+
+        Raises:
+            KeyError: If kernel kind is not registered
+            ValueError: If the kernel kind does not support the solver
+        """
+        if not cls.supports(kind, solver):
+            msg = f"Kernel {kind} does not support solver {solver.name}"
+            raise ValueError(msg)
+
+        resolved = np.dtype(dtype)
+        key = (
+            system.func,
+            system.inplace_func,
+            system.jacobian_func,
+            solver.func,
+            solver.inplace_func,
+            resolved,
+            system.dim,
+            getattr(event, "py_func", event),
+        )
+        builder, signature, parallel, _, _ = cls._builders[kind]
+        label = cls.label(kind, system, solver, resolved)
+        if event is not None:
+            label = f"{label}:{getattr(event, '__name__', 'event')}"
+
+        def build() -> Callable[..., Any]:
+            target = cls._target(system, solver, resolved)
+            if event is not None:
+                target = replace(target, event_func=cls._make_inlinable(event))
+            return builder(target)
+
+        return cls._lookup(kind, key, label, build, signature, parallel)
+
+    @classmethod
+    def get_custom(
+        cls,
+        kind: str,
+        key: tuple[Any, ...],
+        label: str,
+        build: Callable[[], Callable[..., Any]],
+        *,
+        signature: Any,
+        parallel: bool = False,
+    ) -> Dispatcher:
+        """Get a compiled kernel that is not specialized on a system and solver.
+
+        Kernels of other callables, such as discrete maps, are cached, persisted on disk
+        and counted in the statistics like registered kernels. On a miss, build is called
+        to produce the plain Python kernel function, which is compiled with the given
+        signature.
+
+        Args:
+            kind (str): Kernel kind, which must not be a registered kind
+            key (tuple[Any, ...]): Hashable values the kernel is specialized on
+            label (str): Label identifying the kernel in compile time reports
+            build (Callable[[], Callable[..., Any]]): Function returning the kernel function
+            signature (Any): Numba argument types of the kernel
+            parallel (bool, optional): Whether to compile with `parallel=True`.
+                Defaults to False.
+
+        Returns:
+            Dispatcher: Compiled kernel
+
+        Raises:
+            ValueError: If kind is a registered kernel kind
+
+        Examples:
+            >>> kernel = KernelCache.get_custom(
+            ...     "map_density", (map.func,), "map_density:henon", build, signature=signature
+            ... )
+        """
+        if kind in cls._builders:
+            msg = f"Kernel {kind} is registered, use get instead"
+            raise ValueError(msg)
+        return cls._lookup(kind, key, label, build, signature, parallel)
+
+    @classmethod
+    def _lookup(
+        cls,
+        kind: str,
+        key: tuple[Any, ...],
+        label: str,
+        build: Callable[[], Callable[..., Any]],
+        signature: Any,
+        parallel: bool,
+    ) -> Dispatcher:
+        with cls._lock:
+            kernel = cls._kernels.get((kind, *key))
+            if kernel is not None:
+                cls._hits += 1
+                return kernel
+
+            cls._misses += 1
+            logger.debug("Compiling kernel: %s", label)
+            start = time.perf_counter()
+            kernel = cls._compile(kind, build(), signature, parallel)
+            elapsed = time.perf_counter() - start
+            kernel.disable_compile()
+
+            cls._kernels[(kind, *key)] = kernel
+            cls._compile_times[(kind, *key)] = (label, elapsed)
+            if getattr(kernel.stats, "cache_hits", None):
+                cls._disk_hits += 1
+                logger.info("Loaded kernel %s from disk in %.3fs", label, elapsed)
+            else:
+                logger.info("Compiled kernel %s in %.3fs", label, elapsed)
+            return kernel
+
+    @staticmethod
+    def label(kind: str, system: System, solver: Solver, dtype: DTypeLike = np.float64) -> str:
+        """
+        Get the label identifying a kernel in compile time reports.
+
+        Args:
+            kind (str): Kernel kind
+            system (System): System the kernel is specialized on
+            solver (Solver): Solver the kernel is specialized on
+            dtype (DTypeLike, optional): Output dtype. Defaults to np.float64.
+
+        Returns:
+            str: Label of the form "kind:system:solver:dtype"
+        """
+        return f"{kind}:{system.name}:{solver.name}:{np.dtype(dtype).name}"
+
+    @classmethod
+    def stats(cls) -> KernelCacheStats:
+        """
+        Get cache statistics.
+
+        Returns:
+            KernelCacheStats: Hit/miss counts, total compile time and cache size
+        """
+        with cls._lock:
+            return KernelCacheStats(
+                hits=cls._hits,
+                misses=cls._misses,
+                compile_time=sum(elapsed for _, elapsed in cls._compile_times.values()),
+                size=len(cls._kernels),
+                disk_hits=cls._disk_hits,
+            )
+
+    @classmethod
+    def compile_times(cls) -> dict[str, float]:
+        """
+        Get compilation time of each cached kernel.
+
+        Kernels sharing a label, such as those of one system compiled for several state
+        dimensions, are reported together with their compile times summed.
+
+        Returns:
+            dict[str, float]: Compile time in seconds keyed by "kind:system:solver:dtype"
+        """
+        with cls._lock:
+            times: dict[str, float] = {}
+            for label, elapsed in cls._compile_times.values():
+                times[label] = times.get(label, 0.0) + elapsed
+            return times
+
+    @classmethod
+    def list_kernels(cls) -> list[str]:
+        """
+        Get list of all registered kernel kinds.
+
+        Returns:
+            list[str]: List of kernel kinds
+        """
+        return list(cls._builders.keys())
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all kernels cached in memory and reset statistics.
+
+        Kernels persisted on disk are kept, so that recompilation loads them from disk.
+        """
+        with cls._lock:
+            cls._kernels.clear()
+            cls._compile_times.clear()
+            cls._hits = 0
+            cls._misses = 0
+            cls._disk_hits = 0
@@ -0,0 +1,401 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+import numpy as np
+from numba import njit, prange, types
+from numba.extending import register_jitable
+from numpy.typing import DTypeLike, NDArray
+
+from attractors.solvers.kernels import KernelCache, KernelTarget
+from attractors.solvers.registry import Solver
+from attractors.systems.registry import System
+from attractors.type_defs import SystemInplaceCallable, Vector
+from attractors.utils.logger import setup_logger
+
+logger = setup_logger(name=__name__)
+
+CSRMatrix = tuple[NDArray[np.int64], NDArray[np.int64], Vector]
+
+
+@dataclass(frozen=True)
+class NetworkResult:
+    """
+    Reduced results of a network integration.
+
+    Observables are recorded every `record_every` steps and snapshots every
+    `snapshot_every` steps, with the state after n steps at time n * dt.
+
+    Attributes:
+        final (Vector): Final state of every node (N x dim)
+        time (Vector): Time points of the recorded observables
+        order_parameter (Vector): Kuramoto order parameter |<exp(i phase)>| of the node
+            phases, 1 for phase-synchronized nodes
+        sync_error (Vector): Mean Euclidean distance of the nodes from the network mean
+            state, 0 for completely synchronized nodes
+        snapshots (Vector): States of all nodes at the snapshot times (S x N x dim)
+        snapshot_time (Vector): Time points of the snapshots
+    """
+
+    final: Vector
+    time: Vector
+    order_parameter: Vector
+    sync_error: Vector
+    snapshots: Vector
+    snapshot_time: Vector
+
+
+def ring_coupling(n_nodes: int, neighbors: int = 1) -> CSRMatrix:
+    """Build the CSR adjacency matrix of a ring lattice.
+
+    Every node is coupled with unit weight to the `neighbors` nearest nodes on each side.
+
+    Args:
+        n_nodes (int): Number of nodes
+        neighbors (int): Number of neighbors on each side. Defaults to 1.
+
+    Raises:
+        ValueError: If neighbors <= 0 or the ring has fewer than 2 * neighbors + 1 nodes
+
+    Returns:
+        tuple[NDArray[np.int64], NDArray[np.int64], Vector]: Row pointers, column indices
+            and weights of the adjacency matrix
+
+    Examples:
+        >>> indptr, indices, weights = ring_coupling(10_000, neighbors=2)
+    """
+    if neighbors <= 0:
+        raise ValueError("Number of neighbors must be positive")
+    if n_nodes < 2 * neighbors + 1:
+        raise ValueError("Ring must have more than twice as many nodes as neighbors")
+
+    offsets = np.concatenate((np.arange(-neighbors, 0), np.arange(1, neighbors + 1)))
+    indices = (np.arange(n_nodes)[:, None] + offsets) % n_nodes
+    indptr = np.arange(n_nodes + 1, dtype=np.int64) * len(offsets)
+    weights = np.ones(indices.size, dtype=np.float64)
+    return indptr, indices.ravel().astype(np.int64), weights
+
+
+# non-jitted
+def _network_derivative_impl(
+    node_func: SystemInplaceCallable,
+    state: Vector,
+    coupling: tuple[Vector, NDArray[np.int64], NDArray[np.int64], Vector, Vector],
+    out: Vector,
+) -> None:
+    """Evaluate all nodes and add the diffusive coupling.
+
+    State and output hold the node states one after another. The coupling tuple holds the
+    node parameters, the CSR adjacency matrix scaled by the coupling strength and the inner
+    coupling matrix.
+    """
+    params, indptr, indices, weights, inner = coupling
+    dim = inner.shape[0]
+    for i in range(len(indptr) - 1):
+        node = state[i * dim : (i + 1) * dim]
+        derivative = out[i * dim : (i + 1) * dim]
+        node_func(node, params, derivative)
+        for a in range(dim):
+            diffusion = 0.0
+            for k in range(indptr[i], indptr[i + 1]):
+                diffusion += weights[k] * (state[indices[k] * dim + a] - node[a])
+            for b in range(dim):
+                derivative[b] += inner[b, a] * diffusion
+
+
+@register_jitable(inline="always")
+def _observe(state: Vector, dim: int, phase_axes: NDArray[np.int64]) -> tuple[float, float]:
+    """Compute the order parameter and synchronization error of the network state."""
+    n = len(state) // dim
+    mean = np.empty(dim, dtype=np.float64)
+    for a in range(dim):
+        total = 0.0
+        for i in prange(n):
+            total += state[i * dim + a]
+        mean[a] = total / n
+
+    cosines = 0.0
+    sines = 0.0
+    error = 0.0
+    for i in prange(n):
+        phase = np.arctan2(state[i * dim + phase_axes[1]], state[i * dim + phase_axes[0]])
+        cosines += np.cos(phase)
+        sines += np.sin(phase)
+        distance = 0.0
+        for a in range(dim):
+            distance += (state[i * dim + a] - mean[a]) ** 2
+        error += np.sqrt(distance)
+    return np.sqrt(cosines**2 + sines**2) / n, error / n
+
+
+# non-jitted
+def _integrate_network_impl(
+    network_func: Callable[..., None],
+    solver_step: Callable[..., None],
+    work_size: int,
+    init_coords: Vector,
+    coupling: tuple[Vector, NDArray[np.int64], NDArray[np.int64], Vector, Vector],
+    steps: int,
+    dt: float,
+    record_every: int,
+    snapshot_every: int,
+    phase_axes: NDArray[np.int64],
+) -> tuple[Vector, Vector, Vector, Vector]:
+    n, dim = init_coords.shape
+    order = np.empty(steps // record_every, dtype=np.float64)
+    error = np.empty(steps // record_every, dtype=np.float64)
+    snapshots = np.empty((steps // snapshot_every if snapshot_every else 0, n, dim))
+    work = np.empty((work_size, n * dim), dtype=np.float64)
+    current, following = init_coords.flatten(), np.empty(n * dim, dtype=np.float64)
+
+    for i in range(steps):
+        solver_step(network_func, current, coupling, dt, work, following)
+        current, following = following, current
+        if (i + 1) % record_every == 0:
+            order[i // record_every], error[i // record_every] = _observe(current, dim, phase_axes)
+        if snapshot_every and (i + 1) % snapshot_every == 0:
+            snapshots[i // snapshot_every] = current.reshape(n, dim)
+
+    return current.reshape(n, dim).copy(), order, error, snapshots
+
+
+# jitted
+@KernelCache.register(
+    "network",
+    signature=(
+        types.float64[:, ::1],
+        types.Tuple(  # type: ignore[no-untyped-call]
+            (
+                types.float64[::1],
+                types.int64[::1],
+                types.int64[::1],
+                types.float64[::1],
+                types.float64[:, ::1],
+            )
+        ),
+        types.int64,
+        types.float64,
+        types.int64,
+        types.int64,
+        types.int64[::1],
+    ),
+    parallel=True,
+    inplace=True,
+)
+def _build_network_kernel(target: KernelTarget) -> Callable[..., tuple[Vector, ...]]:
+    system_func = target.system_func
+    solver_step = target.solver_step
+    work_size = target.work_size
+    dtype = target.dtype
+    dim = target.dim
+
+    def network_derivative(state: Vector, coupling: Any, out: Vector) -> None:
+        params, indptr, indices, weights, inner = coupling
+        for i in prange(len(indptr) - 1):
+            node = state[i * dim : (i + 1) * dim]
+            derivative = out[i * dim : (i + 1) * dim]
+            system_func(node, params, derivative)
+            for a in range(dim):
+                diffusion = 0.0
+                for k in range(indptr[i], indptr[i + 1]):
+                    diffusion += weights[k] * (state[indices[k] * dim + a] - node[a])
+                for b in range(dim):
+                    derivative[b] += inner[b, a] * diffusion
+
+    network_func = njit(inline="always")(network_derivative)
+
+    def kernel(
+        init_coords: Vector,
+        coupling: Any,
+        steps: int,
+        dt: float,
+        record_every: int,
+        snapshot_every: int,
+        phase_axes: NDArray[np.int64],
+    ) -> tuple[Vector, ...]:
+        n = init_coords.shape[0]
+        order = np.empty(steps // record_every, dtype=np.float64)
+        error = np.empty(steps // record_every, dtype=np.float64)
+        snapshots = np.empty((steps // snapshot_every if snapshot_every else 0, n, dim), dtype)
+        work = np.empty((work_size, n * dim), dtype=np.float64)
+        buffers = np.empty((2, n * dim), dtype=np.float64)
+        current, following = buffers[0], buffers[1]
+        current[:] = init_coords.ravel()
+
+        for i in range(steps):
+            solver_step(network_func, current, coupling, dt, work, following)
+            current, following = following, current
+            if (i + 1) % record_every == 0:
+                order[i // record_every], error[i // record_every] = _observe(
+                    current, dim, phase_axes
+                )
+            if snapshot_every and (i + 1) % snapshot_every == 0:
+                snapshots[i // snapshot_every] = current.reshape((n, dim))
+
+        return current.reshape((n, dim)).copy(), order, error, snapshots
+
+    return kernel
+
+
+def _validate_coupling(
+    coupling: Any, n_nodes: int
+) -> tuple[NDArray[np.int64], NDArray[np.int64], Vector]:
+    """Convert a CSR matrix or (indptr, indices, weights) tuple into contiguous arrays."""
+    if isinstance(coupling, tuple):
+        indptr, indices, weights = coupling
+    else:
+        indptr, indices, weights = coupling.indptr, coupling.indices, coupling.data
+    indptr = np.ascontiguousarray(indptr, dtype=np.int64)
+    indices = np.ascontiguousarray(indices, dtype=np.int64)
+    weights = np.ascontiguousarray(weights, dtype=np.float64)
+
+    if indptr.shape != (n_nodes + 1,) or indices.ndim != 1 or indices.shape != weights.shape:
+        msg = f"Coupling must be a {n_nodes}x{n_nodes} CSR matrix"
+        raise ValueError(msg)
+    if indptr[0] != 0 or indptr[-1] != len(indices) or np.any(np.diff(indptr) < 0):
+        raise ValueError("Coupling row pointers must increase from 0 to the number of entries")
+    if len(indices) and (indices.min() < 0 or indices.max() >= n_nodes):
+        raise ValueError("Coupling column indices must refer to nodes")
+    return indptr, indices, weights
+
+
+def integrate_network(
+    system: System,
+    solver: Solver,
+    init_coords: Vector,
+    coupling: Any,
+    steps: int,
+    dt: float,
+    strength: float = 1.0,
+    inner: Vector | None = None,
+    record_every: int = 1,
+    snapshot_every: int = 0,
+    phase_axes: tuple[int, int] = (0, 1),
+    use_jit: bool | None = None,
+    dtype: DTypeLike = np.float64,
+) -> NetworkResult:
+    """Integrates a network of diffusively coupled copies of a system in a single kernel.
+
+    Every node i evolves as
+
+        dx_i/dt = f(x_i) + strength * sum_j A_ij * H (x_j - x_i)
+
+    with the node system f, the sparse adjacency matrix A given in CSR format and the inner
+    coupling matrix H selecting the coupled components. All nodes share the system's current
+    parameters. The whole network is integrated as one state with the node states stored
+    one after another, so that each node function reads a contiguous vector. Nodes are
+    evaluated in parallel on all available cores when JIT compilation is enabled.
+
+    Instead of the full trajectory, which rarely fits in memory for large networks, the
+    Kuramoto order parameter of the node phases atan2(x[phase_axes[1]], x[phase_axes[0]])
+    and the synchronization error are recorded every record_every steps, and optionally
+    snapshots of all nodes every snapshot_every steps.
+
+    Args:
+        system (System): Node system
+        solver (Solver): Numerical solver with an in-place variant
+        init_coords (Vector): Initial states of the nodes (N x dim)
+        coupling (Any): Adjacency matrix as a CSR matrix with indptr, indices and data
+            attributes (e.g. `scipy.sparse.csr_array`), or an (indptr, indices, weights)
+            tuple as returned by `ring_coupling`
+        steps (int): Number of integration steps
+        dt (float): Time step size
+        strength (float): Coupling strength. Defaults to 1.0.
+        inner (Vector | None): Inner coupling matrix H (dim x dim). Defaults to the
+            identity, coupling all components.
+        record_every (int): Record the observables every k-th step. Defaults to 1.
+        snapshot_every (int): Store all node states every k-th step, 0 for no snapshots.
+            Defaults to 0.
+        phase_axes (tuple[int, int]): State components defining the node phase.
+            Defaults to (0, 1).
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+        dtype (DTypeLike): Storage dtype of the snapshots. Defaults to np.float64.
+
+    Raises:
+        ValueError: If steps, dt or record_every are not positive, snapshot_every is
+            negative, the solver is adaptive, multistep or has no in-place variant, or
+            init_coords, coupling, inner or phase_axes do not match the network
+
+    Returns:
+        NetworkResult: Final state, recorded observables and snapshots
+
+    Examples:
+        >>> rossler = SystemRegistry.get("rossler")
+        >>> init_coords = rossler.init_coord + rng.normal(size=(10_000, 3))
+        >>> result = integrate_network(
+        ...     rossler,
+        ...     solver,
+        ...     init_coords,
+        ...     ring_coupling(10_000),
+        ...     100_000,
+        ...     0.01,
+        ...     strength=0.2,
+        ...     inner=np.diag([1.0, 0.0, 0.0]),
+        ...     record_every=10,
+        ... )
+        >>> result.order_parameter[-1]
+    """
+    if steps <= 0:
+        raise ValueError("Number of steps must be positive")
+    if dt <= 0:
+        raise ValueError("Time step must be positive")
+    if record_every <= 0:
+        raise ValueError("Record interval must be positive")
+    if snapshot_every < 0:
+        raise ValueError("Snapshot interval must be non-negative")
+    if solver.adaptive or solver.multistep or not solver.has_inplace:
+        msg = f"Solver {solver.name} has no in-place single-step variant"
+        raise ValueError(msg)
+
+    dim = system.dim
+    init_coords = np.ascontiguousarray(init_coords, dtype=np.float64)
+    if init_coords.ndim != 2 or init_coords.shape[1] != dim:
+        msg = f"Initial coordinates must be Nx{dim} array"
+        raise ValueError(msg)
+    n_nodes = len(init_coords)
+    indptr, indices, weights = _validate_coupling(coupling, n_nodes)
+    inner = np.eye(dim) if inner is None else np.ascontiguousarray(inner, dtype=np.float64)
+    if inner.shape != (dim, dim):
+        msg = f"Inner coupling matrix must be {dim}x{dim}"
+        raise ValueError(msg)
+    axes = np.asarray(phase_axes, dtype=np.int64)
+    if axes.shape != (2,) or axes.min() < 0 or axes.max() >= dim:
+        raise ValueError("Phase axes must be two state components")
+
+    jit_enabled = True if use_jit is None else use_jit
+    logger.debug("JIT enabled: %s", jit_enabled)
+    logger.info(
+        "Integrating network of %d nodes with %d links: %s with solver: %s",
+        n_nodes,
+        len(indices),
+        system,
+        solver,
+    )
+
+    packed = (
+        np.ascontiguousarray(system.params, dtype=np.float64),
+        indptr,
+        indices,
+        weights * strength,
+        inner,
+    )
+    args = (init_coords, packed, steps, float(dt), record_every, snapshot_every, axes)
+    if jit_enabled:
+        kernel = KernelCache.get("network", system, solver, dtype)
+        final, order, error, snapshots = kernel(*args)
+    else:
+        network_func = partial(_network_derivative_impl, system.get_inplace_func(jitted=False))
+        final, order, error, snapshots = _integrate_network_impl(
+            network_func, solver.get_inplace_func(jitted=False), solver.work_size, *args
+        )
+
+    snapshot_count = len(snapshots)
+    return NetworkResult(
+        final=final,
+        time=np.arange(1, len(order) + 1, dtype=np.float64) * (record_every * dt),
+        order_parameter=order,
+        sync_error=error,
+        snapshots=snapshots.astype(dtype, copy=False),
+        snapshot_time=np.arange(1, snapshot_count + 1, dtype=np.float64) * (snapshot_every * dt),
+    )
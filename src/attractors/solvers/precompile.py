@@ -0,0 +1,162 @@
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Literal, overload
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+# Kernel builders are registered on import
+import attractors.analysis.bifurcation
+import attractors.analysis.lyapunov
+import attractors.analysis.poincare
+import attractors.maps
+import attractors.solvers.batch
+import attractors.solvers.core
+import attractors.solvers.dense
+import attractors.solvers.network
+import attractors.visualizers.utils.projection  # noqa: F401
+from attractors.maps.iterate import density_kernel
+from attractors.maps.registry import Map, MapRegistry
+from attractors.solvers.kernels import KernelCache
+from attractors.solvers.registry import Solver, SolverRegistry
+from attractors.systems.registry import System, SystemRegistry
+from attractors.utils.logger import setup_logger
+
+logger = setup_logger(name=__name__)
+
+
+def _resolve_targets(
+    systems: Iterable[str | System] | None,
+    solvers: Iterable[str | Solver] | None,
+    kinds: Iterable[str] | None,
+) -> tuple[list[System], list[Solver], list[str]]:
+    resolved_systems = [
+        SystemRegistry.get(system) if isinstance(system, str) else system
+        for system in (SystemRegistry.list_systems() if systems is None else systems)
+    ]
+    if solvers is None:
+        resolved_solvers = [
+            solver
+            for solver in map(SolverRegistry.get, SolverRegistry.list_solvers())
+            if not solver.adaptive
+        ]
+    else:
+        resolved_solvers = [
+            SolverRegistry.get(solver) if isinstance(solver, str) else solver for solver in solvers
+        ]
+    for solver in resolved_solvers:
+        if solver.adaptive:
+            msg = f"Solver {solver.name} is adaptive and has no fused kernels"
+            raise ValueError(msg)
+
+    resolved_kinds = KernelCache.list_kernels() if kinds is None else list(kinds)
+    for kind in resolved_kinds:
+        if kind not in KernelCache.list_kernels():
+            msg = f"Kernel {kind} not found"
+            raise KeyError(msg)
+    return resolved_systems, resolved_solvers, resolved_kinds
+
+
+def _compile_all(
+    systems: list[System],
+    solvers: list[Solver],
+    kinds: list[str],
+    maps: list[Map],
+    dtype: DTypeLike,
+) -> dict[str, float]:
+    targets = [
+        (kind, system, solver)
+        for kind in kinds
+        for system in systems
+        for solver in solvers
+        if KernelCache.supports(kind, solver)
+    ]
+    for kind, system, solver in targets:
+        KernelCache.get(kind, system, solver, dtype)
+    for discrete_map in maps:
+        density_kernel(discrete_map)
+
+    compile_times = KernelCache.compile_times()
+    labels = [KernelCache.label(kind, system, solver, dtype) for kind, system, solver in targets]
+    labels += [f"map_density:{discrete_map.name}" for discrete_map in maps]
+    report = {label: compile_times[label] for label in labels}
+    logger.info("Precompiled %d kernels in %.3fs", len(report), sum(report.values()))
+    return report
+
+
+@overload
+def precompile(
+    systems: Iterable[str | System] | None = ...,
+    solvers: Iterable[str | Solver] | None = ...,
+    kinds: Iterable[str] | None = ...,
+    dtype: DTypeLike = ...,
+    background: Literal[False] = ...,
+    maps: Iterable[str | Map] = ...,
+) -> dict[str, float]: ...
+
+
+@overload
+def precompile(
+    systems: Iterable[str | System] | None = ...,
+    solvers: Iterable[str | Solver] | None = ...,
+    kinds: Iterable[str] | None = ...,
+    dtype: DTypeLike = ...,
+    *,
+    background: Literal[True],
+    maps: Iterable[str | Map] = ...,
+) -> Future[dict[str, float]]: ...
+
+
+def precompile(
+    systems: Iterable[str | System] | None = None,
+    solvers: Iterable[str | Solver] | None = None,
+    kinds: Iterable[str] | None = None,
+    dtype: DTypeLike = np.float64,
+    background: bool = False,
+    maps: Iterable[str | Map] = (),
+) -> dict[str, float] | Future[dict[str, float]]:
+    """Eagerly compile the fused integration kernels of systems and solvers.
+
+    Kernels are stored in the `KernelCache`, and persisted on disk if its cache directory is
+    set, so calling this at the start of a process (or once per machine) removes the
+    compilation latency from the first integration. Kernels already on disk are loaded
+    rather than compiled. Each solver is compiled for the kernel kinds that support it,
+    so multistep solvers only get multistep kernels. The density kernels of discrete maps
+    used by `map_density` are compiled for the given maps.
+
+    Args:
+        systems (Iterable[str | System] | None): Systems or system names to compile for.
+            Defaults to all registered systems.
+        solvers (Iterable[str | Solver] | None): Solvers or solver names to compile for.
+            Defaults to all registered fixed-step solvers.
+        kinds (Iterable[str] | None): Kernel kinds to compile (e.g. "trajectory", "batch").
+            Defaults to all registered kinds.
+        dtype (DTypeLike): Output dtype to compile for. Defaults to np.float64.
+        background (bool): Whether to compile in a background thread. Defaults to False.
+        maps (Iterable[str | Map]): Maps or map names to compile density kernels for.
+            Defaults to none.
+
+    Raises:
+        KeyError: If a system, solver, kernel kind or map is not registered
+        ValueError: If a solver is adaptive
+
+    Returns:
+        dict[str, float] | Future[dict[str, float]]: Compile time in seconds of each kernel
+            keyed by "kind:system:solver:dtype" or "map_density:map", or a future
+            resolving to it if background is True
+
+    Examples:
+        >>> precompile(["lorenz"], ["rk4"], kinds=["trajectory"])
+        {'trajectory:lorenz:rk4:float64': 0.53}
+        >>> future = precompile(background=True)
+        >>> future.result()
+    """
+    targets = _resolve_targets(systems, solvers, kinds)
+    resolved_maps = [MapRegistry.get(m) if isinstance(m, str) else m for m in maps]
+    if not background:
+        return _compile_all(*targets, resolved_maps, dtype)
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="attractors-precompile")
+    future = executor.submit(_compile_all, *targets, resolved_maps, dtype)
+    executor.shutdown(wait=False)
+    return future
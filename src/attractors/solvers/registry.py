@@ -1,12 +1,15 @@
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any, ClassVar, TypeVar
+from typing import Any, ClassVar, TypeVar, cast
 
 from numba import njit
 from numba.core.dispatcher import Dispatcher
 
 from attractors.type_defs import (
+    AdaptiveSolverCallable,
+    MultistepSolverCallable,
     SolverCallable,
+    SolverInplaceCallable,
 )
 from attractors.utils.logger import setup_logger
 
@@ -22,11 +25,44 @@ class Solver:
         func (SolverCallable): Original solver function
         jitted_func (SolverCallable): JIT-compiled solver function
         name (str): Solver identifier
+        adaptive (bool): Whether the solver is an embedded adaptive step-size method
+        order (int): Order of the propagated solution (adaptive solvers only)
+        stages (int): Number of system evaluations per step attempt (adaptive solvers only)
+        fsal (bool): Whether the last stage is reused as the next first stage
+            (adaptive solvers only)
+        implicit (bool): Whether the solver is implicit or linearly implicit and suited to
+            stiff systems
+        inplace_func (SolverInplaceCallable | None): Optional allocation-free variant
+        jitted_inplace_func (SolverInplaceCallable | None): JIT-compiled allocation-free variant
+        work_size (int): Number of scratch vectors required by the allocation-free variant
+        history (int): Number of past derivatives kept between steps (multistep solvers only)
+        startup (str | None): Name of the solver that fills the history (multistep solvers
+            only)
     """
 
     func: SolverCallable
     jitted_func: SolverCallable
     name: str
+    adaptive: bool = False
+    order: int = 0
+    stages: int = 0
+    fsal: bool = False
+    implicit: bool = False
+    inplace_func: SolverInplaceCallable | None = None
+    jitted_inplace_func: SolverInplaceCallable | None = None
+    work_size: int = 0
+    history: int = 0
+    startup: str | None = None
+
+    @property
+    def multistep(self) -> bool:
+        """Whether the solver keeps a history of past derivatives between steps."""
+        return self.history > 0
+
+    @property
+    def has_inplace(self) -> bool:
+        """Whether the solver provides an allocation-free variant."""
+        return self.inplace_func is not None
 
     def get_func(self, jitted: bool = True) -> SolverCallable:
         """
@@ -40,11 +76,30 @@ class Solver:
         """
         return self.jitted_func if jitted else self.func
 
+    def get_inplace_func(self, jitted: bool = True) -> SolverInplaceCallable:
+        """
+        Get allocation-free solver function.
+
+        Args:
+            jitted (bool, optional): Whether to return JIT-compiled version. Defaults to True.
+
+        Raises:
+            ValueError: If the solver has no allocation-free variant
+
+        Returns:
+            SolverInplaceCallable: In-place solver function (JIT-compiled or original)
+        """
+        func = self.jitted_inplace_func if jitted else self.inplace_func
+        if func is None:
+            msg = f"Solver {self.name} has no in-place variant"
+            raise ValueError(msg)
+        return func
+
     def __repr__(self) -> str:
         return f"Solver(name={self.name})"
 
 
-F = TypeVar("F", bound=SolverCallable)
+F = TypeVar("F", bound=SolverCallable | AdaptiveSolverCallable)
 
 
 class SolverRegistry:
@@ -55,6 +110,22 @@ class SolverRegistry:
         - Input: (system_func, state, params, dt)
         - Output: next state vector
 
+    Solvers may additionally register an allocation-free variant with `register_inplace`:
+        - Input: (inplace_system_func, state, params, dt, work, out) where work holds
+          preallocated scratch vectors and the system writes into a provided buffer
+        - Output: None, the next state is written into out
+
+    Adaptive solvers are registered with `adaptive=True` and follow the embedded
+    Runge-Kutta interface used by `integrate_adaptive`:
+        - Input: (system_func, state, k1, params, dt) where k1 is the derivative at state
+        - Output: (next state, local error estimate, derivative at next state if FSAL)
+
+    Multistep solvers are registered with `register_multistep` and carry a history of past
+    derivatives between steps:
+        - Input: (inplace_system_func, state, params, dt, history, work, out) where history
+          holds the derivatives at the most recent states, newest first
+        - Output: None, the next state is written into out and the history is advanced
+
     Solvers are automatically JIT-compiled during registration.
 
     Attributes:
@@ -72,7 +143,16 @@ class SolverRegistry:
     _solvers: ClassVar[dict[str, Solver]] = {}
 
     @classmethod
-    def register(cls, name: str) -> Callable[[F], F]:
+    def register(
+        cls,
+        name: str,
+        *,
+        adaptive: bool = False,
+        order: int = 0,
+        stages: int = 0,
+        fsal: bool = False,
+        implicit: bool = False,
+    ) -> Callable[[F], F]:
         """Register a solver function in the SolverRegistry.
 
         Decorator that registers a solver function and creates a JIT-compiled version.
@@ -81,13 +161,24 @@ class SolverRegistry:
 
         Args:
             name (str): Unique identifier for the solver
+            adaptive (bool, optional): Whether the solver follows the adaptive interface.
+                Defaults to False.
+            order (int, optional): Order of the propagated solution. Required for adaptive
+                solvers. Defaults to 0.
+            stages (int, optional): System evaluations per step attempt. Required for
+                adaptive solvers. Defaults to 0.
+            fsal (bool, optional): Whether the solver has the first-same-as-last property.
+                Defaults to False.
+            implicit (bool, optional): Whether the solver is implicit and suited to stiff
+                systems. Defaults to False.
 
         Returns:
             Callable[[F], F]: Decorator function that registers and JIT-compiles the solver
 
         Raises:
             TypeError: If name is not a string or decorated object is not callable
-            ValueError: If solver name is already registered
+            ValueError: If solver name is already registered or an adaptive solver is
+                missing its order or stage count
 
         Examples:
             >>> @SolverRegistry.register("solver_name")
@@ -104,14 +195,149 @@ class SolverRegistry:
             if name in cls._solvers:
                 msg = f"Solver {name} already registered"
                 raise ValueError(msg)
+            if adaptive and (order <= 0 or stages <= 0):
+                msg = f"Adaptive solver {name} must declare a positive order and stage count"
+                raise ValueError(msg)
 
             jitted_f = njit(f)
-            cls._solvers[name] = Solver(f, jitted_f, name)
+            cls._solvers[name] = Solver(
+                cast(SolverCallable, f),
+                jitted_f,
+                name,
+                adaptive=adaptive,
+                order=order,
+                stages=stages,
+                fsal=fsal,
+                implicit=implicit,
+            )
             return f
 
         logger.debug("Registered solver: %s", name)
         return decorator
 
+    @classmethod
+    def register_multistep(
+        cls,
+        name: str,
+        *,
+        order: int,
+        history: int,
+        work_size: int,
+        startup: str = "rk4",
+    ) -> Callable[[MultistepSolverCallable], MultistepSolverCallable]:
+        """Register a multistep solver function in the SolverRegistry.
+
+        The multistep solver takes (system_func, state, params, dt, history, work, out),
+        where system_func is an in-place system function, history is a (history x dim)
+        array of the derivatives at the current and preceding states, newest first, work is
+        a preallocated (work_size x dim) scratch array and out receives the next state. The
+        solver must shift the history and store the derivative at the next state in
+        history[0]. out must not alias state.
+
+        The integrator fills the history by taking the first history - 1 steps with the
+        in-place variant of the start-up solver.
+
+        Args:
+            name (str): Unique identifier for the solver
+            order (int): Order of the solver
+            history (int): Number of past derivatives the solver needs
+            work_size (int): Number of scratch vectors the solver needs
+            startup (str, optional): Name of the registered solver used to fill the
+                history. Defaults to "rk4".
+
+        Returns:
+            Callable[[MultistepSolverCallable], MultistepSolverCallable]: Decorator function
+                that registers and JIT-compiles the solver
+
+        Raises:
+            TypeError: If name is not a string or decorated object is not callable
+            KeyError: If the start-up solver is not registered
+            ValueError: If solver name is already registered, the order or history is not
+                positive or the start-up solver has no in-place variant
+
+        Examples:
+            >>> @SolverRegistry.register_multistep("ab1", order=1, history=1, work_size=0)
+            >>> def ab1(system_func, state, params, dt, history, work, out):
+            ...     for i in range(len(state)):
+            ...         out[i] = state[i] + dt * history[0, i]
+            ...     system_func(out, params, history[0])
+        """
+
+        def decorator(f: MultistepSolverCallable) -> MultistepSolverCallable:
+            if not isinstance(name, str):
+                raise TypeError("Name must be string")
+            if not callable(f):
+                raise TypeError("Must register callable")
+            if name in cls._solvers:
+                msg = f"Solver {name} already registered"
+                raise ValueError(msg)
+            if order <= 0 or history <= 0:
+                msg = f"Multistep solver {name} must declare a positive order and history"
+                raise ValueError(msg)
+            if not cls.get(startup).has_inplace:
+                msg = f"Start-up solver {startup} has no in-place variant"
+                raise ValueError(msg)
+
+            jitted_f = njit()(f)
+            cls._solvers[name] = Solver(
+                cast(SolverCallable, f),
+                cast(SolverCallable, jitted_f),
+                name,
+                order=order,
+                work_size=work_size,
+                history=history,
+                startup=startup,
+            )
+            return f
+
+        logger.debug("Registered multistep solver: %s", name)
+        return decorator
+
+    @classmethod
+    def register_inplace(
+        cls, name: str, *, work_size: int
+    ) -> Callable[[SolverInplaceCallable], SolverInplaceCallable]:
+        """Register an allocation-free variant of an already registered solver.
+
+        The in-place solver takes (system_func, state, params, dt, work, out), where
+        system_func is an in-place system function taking (state, params, out), work is a
+        preallocated (work_size x dim) scratch array and out receives the next state. out
+        must not alias state.
+
+        Args:
+            name (str): Name of the registered solver
+            work_size (int): Number of scratch vectors the solver needs
+
+        Returns:
+            Callable[[SolverInplaceCallable], SolverInplaceCallable]: Decorator function that
+                attaches and JIT-compiles the in-place solver
+
+        Raises:
+            KeyError: If solver name is not registered
+            ValueError: If the solver already has an in-place variant
+
+        Examples:
+            >>> @SolverRegistry.register_inplace("euler", work_size=1)
+            >>> def euler_inplace(system_func, state, params, dt, work, out):
+            ...     system_func(state, params, work[0])
+            ...     for i in range(len(state)):
+            ...         out[i] = state[i] + dt * work[0, i]
+        """
+
+        def decorator(f: SolverInplaceCallable) -> SolverInplaceCallable:
+            solver = cls.get(name)
+            if solver.has_inplace:
+                msg = f"Solver {name} already has an in-place variant"
+                raise ValueError(msg)
+
+            solver.inplace_func = f
+            solver.jitted_inplace_func = njit()(f)
+            solver.work_size = work_size
+            return f
+
+        logger.debug("Registered in-place solver: %s", name)
+        return decorator
+
     @classmethod
     def get(cls, name: str) -> Solver:
         """
@@ -1,5 +1,5 @@
 from attractors.solvers.registry import SolverRegistry
-from attractors.type_defs import SystemCallable, Vector
+from attractors.type_defs import SystemCallable, SystemInplaceCallable, Vector
 
 
 @SolverRegistry.register("rk2")
@@ -10,3 +10,25 @@ def rk2(system_func: SystemCallable, state: Vector, params: Vector, dt: float) -
     k1 = system_func(state, params)
     k2 = system_func(state + dt * k1, params)
     return state + dt * (k1 + k2) / 2
+
+
+@SolverRegistry.register_inplace("rk2", work_size=3)
+def rk2_inplace(
+    system_func: SystemInplaceCallable,
+    state: Vector,
+    params: Vector,
+    dt: float,
+    work: Vector,
+    out: Vector,
+) -> None:
+    """
+    Allocation-free Runge-Kutta 2nd order integration scheme.
+    """
+    k1, k2, tmp = work[0], work[1], work[2]
+    n = len(state)
+    system_func(state, params, k1)
+    for i in range(n):
+        tmp[i] = state[i] + dt * k1[i]
+    system_func(tmp, params, k2)
+    for i in range(n):
+        out[i] = state[i] + dt * (k1[i] + k2[i]) / 2
@@ -1,5 +1,5 @@
 from attractors.solvers.registry import SolverRegistry
-from attractors.type_defs import SystemCallable, Vector
+from attractors.type_defs import SystemCallable, SystemInplaceCallable, Vector
 
 
 @SolverRegistry.register("rk3")
@@ -11,3 +11,28 @@ def rk3(system_func: SystemCallable, state: Vector, params: Vector, dt: float) -
     k2 = system_func(state + dt * k1 / 2, params)
     k3 = system_func(state - dt * k1 + 2 * dt * k2, params)
     return state + dt * (k1 + 4 * k2 + k3) / 6
+
+
+@SolverRegistry.register_inplace("rk3", work_size=4)
+def rk3_inplace(
+    system_func: SystemInplaceCallable,
+    state: Vector,
+    params: Vector,
+    dt: float,
+    work: Vector,
+    out: Vector,
+) -> None:
+    """
+    Allocation-free Runge-Kutta 3rd order integration scheme.
+    """
+    k1, k2, k3, tmp = work[0], work[1], work[2], work[3]
+    n = len(state)
+    system_func(state, params, k1)
+    for i in range(n):
+        tmp[i] = state[i] + dt * k1[i] / 2
+    system_func(tmp, params, k2)
+    for i in range(n):
+        tmp[i] = state[i] - dt * k1[i] + 2 * dt * k2[i]
+    system_func(tmp, params, k3)
+    for i in range(n):
+        out[i] = state[i] + dt * (k1[i] + 4 * k2[i] + k3[i]) / 6
@@ -1,5 +1,5 @@
 from attractors.solvers.registry import SolverRegistry
-from attractors.type_defs import SystemCallable, Vector
+from attractors.type_defs import SystemCallable, SystemInplaceCallable, Vector
 
 
 @SolverRegistry.register("rk4")
@@ -13,3 +13,31 @@ def rk4(system_func: SystemCallable, state: Vector, params: Vector, dt: float) -
     k4 = system_func(state + dt * k3, params)
     result: Vector = state + dt * (k1 + 2 * k2 + 2 * k3 + k4) / 6
     return result
+
+
+@SolverRegistry.register_inplace("rk4", work_size=5)
+def rk4_inplace(
+    system_func: SystemInplaceCallable,
+    state: Vector,
+    params: Vector,
+    dt: float,
+    work: Vector,
+    out: Vector,
+) -> None:
+    """
+    Allocation-free Runge-Kutta 4th order integration scheme.
+    """
+    k1, k2, k3, k4, tmp = work[0], work[1], work[2], work[3], work[4]
+    n = len(state)
+    system_func(state, params, k1)
+    for i in range(n):
+        tmp[i] = state[i] + dt * k1[i] / 2
+    system_func(tmp, params, k2)
+    for i in range(n):
+        tmp[i] = state[i] + dt * k2[i] / 2
+    system_func(tmp, params, k3)
+    for i in range(n):
+        tmp[i] = state[i] + dt * k3[i]
+    system_func(tmp, params, k4)
+    for i in range(n):
+        out[i] = state[i] + dt * (k1[i] + 2 * k2[i] + 2 * k3[i] + k4[i]) / 6
@@ -1,5 +1,5 @@
 from attractors.solvers.registry import SolverRegistry
-from attractors.type_defs import SystemCallable, Vector
+from attractors.type_defs import SystemCallable, SystemInplaceCallable, Vector
 
 
 @SolverRegistry.register("rk5")
@@ -15,3 +15,37 @@ def rk5(system_func: SystemCallable, state: Vector, params: Vector, dt: float) -
     k6 = system_func(state + dt * (k1 - 3 * k3 + 4 * k5) / 2, params)
     result: Vector = state + dt * (k1 + 4 * k5 + k6) / 6
     return result
+
+
+@SolverRegistry.register_inplace("rk5", work_size=7)
+def rk5_inplace(
+    system_func: SystemInplaceCallable,
+    state: Vector,
+    params: Vector,
+    dt: float,
+    work: Vector,
+    out: Vector,
+) -> None:
+    """
+    Allocation-free Runge-Kutta 5th order integration scheme.
+    """
+    k1, k2, k3, k4, k5, k6, tmp = work[0], work[1], work[2], work[3], work[4], work[5], work[6]
+    n = len(state)
+    system_func(state, params, k1)
+    for i in range(n):
+        tmp[i] = state[i] + dt * k1[i] / 4
+    system_func(tmp, params, k2)
+    for i in range(n):
+        tmp[i] = state[i] + dt * (k1[i] + k2[i]) / 8
+    system_func(tmp, params, k3)
+    for i in range(n):
+        tmp[i] = state[i] + dt * k3[i]
+    system_func(tmp, params, k4)
+    for i in range(n):
+        tmp[i] = state[i] + dt * (k1[i] - k2[i] + k4[i]) / 2
+    system_func(tmp, params, k5)
+    for i in range(n):
+        tmp[i] = state[i] + dt * (k1[i] - 3 * k3[i] + 4 * k5[i]) / 2
+    system_func(tmp, params, k6)
+    for i in range(n):
+        out[i] = state[i] + dt * (k1[i] + 4 * k5[i] + k6[i]) / 6
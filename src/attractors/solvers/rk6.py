@@ -0,0 +1,21 @@
+from fractions import Fraction as F
+
+from attractors.solvers.tableau import ButcherTableau, register_tableau
+
+BUTCHER6 = ButcherTableau(
+    a=[
+        [],
+        [F(1, 3)],
+        [F(0), F(2, 3)],
+        [F(1, 12), F(1, 3), F(-1, 12)],
+        [F(-1, 16), F(9, 8), F(-3, 16), F(-3, 8)],
+        [F(0), F(9, 8), F(-3, 8), F(-3, 4), F(1, 2)],
+        [F(9, 44), F(-9, 11), F(63, 44), F(18, 11), F(0), F(-16, 11)],
+    ],
+    b=[F(11, 120), F(0), F(27, 40), F(27, 40), F(-4, 15), F(-4, 15), F(11, 120)],
+    c=[F(0), F(1, 3), F(2, 3), F(1, 3), F(1, 2), F(1, 2), F(1)],
+    order=6,
+)
+"""Butcher's seven-stage sixth order method (Butcher, 1964)."""
+
+register_tableau("rk6", BUTCHER6)
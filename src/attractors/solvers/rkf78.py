@@ -0,0 +1,117 @@
+from fractions import Fraction as F
+
+from attractors.solvers.tableau import ButcherTableau, register_tableau
+
+FEHLBERG78 = ButcherTableau(
+    a=[
+        [],
+        [F(2, 27)],
+        [F(1, 36), F(1, 12)],
+        [F(1, 24), F(0), F(1, 8)],
+        [F(5, 12), F(0), F(-25, 16), F(25, 16)],
+        [F(1, 20), F(0), F(0), F(1, 4), F(1, 5)],
+        [F(-25, 108), F(0), F(0), F(125, 108), F(-65, 27), F(125, 54)],
+        [F(31, 300), F(0), F(0), F(0), F(61, 225), F(-2, 9), F(13, 900)],
+        [F(2), F(0), F(0), F(-53, 6), F(704, 45), F(-107, 9), F(67, 90), F(3)],
+        [
+            F(-91, 108),
+            F(0),
+            F(0),
+            F(23, 108),
+            F(-976, 135),
+            F(311, 54),
+            F(-19, 60),
+            F(17, 6),
+            F(-1, 12),
+        ],
+        [
+            F(2383, 4100),
+            F(0),
+            F(0),
+            F(-341, 164),
+            F(4496, 1025),
+            F(-301, 82),
+            F(2133, 4100),
+            F(45, 82),
+            F(45, 164),
+            F(18, 41),
+        ],
+        [
+            F(3, 205),
+            F(0),
+            F(0),
+            F(0),
+            F(0),
+            F(-6, 41),
+            F(-3, 205),
+            F(-3, 41),
+            F(3, 41),
+            F(6, 41),
+            F(0),
+        ],
+        [
+            F(-1777, 4100),
+            F(0),
+            F(0),
+            F(-341, 164),
+            F(4496, 1025),
+            F(-289, 82),
+            F(2193, 4100),
+            F(51, 82),
+            F(33, 164),
+            F(12, 41),
+            F(0),
+            F(1),
+        ],
+    ],
+    b=[
+        F(0),
+        F(0),
+        F(0),
+        F(0),
+        F(0),
+        F(34, 105),
+        F(9, 35),
+        F(9, 35),
+        F(9, 280),
+        F(9, 280),
+        F(0),
+        F(41, 840),
+        F(41, 840),
+    ],
+    c=[
+        F(0),
+        F(2, 27),
+        F(1, 9),
+        F(1, 6),
+        F(5, 12),
+        F(1, 2),
+        F(5, 6),
+        F(1, 6),
+        F(2, 3),
+        F(1, 3),
+        F(1),
+        F(0),
+        F(1),
+    ],
+    order=8,
+    b_embedded=[
+        F(41, 840),
+        F(0),
+        F(0),
+        F(0),
+        F(0),
+        F(34, 105),
+        F(9, 35),
+        F(9, 35),
+        F(9, 280),
+        F(9, 280),
+        F(41, 840),
+        F(0),
+        F(0),
+    ],
+)
+"""Fehlberg's 13-stage 7(8) pair, propagating the eighth order solution (Fehlberg, 1968)."""
+
+register_tableau("rkf8", FEHLBERG78)
+register_tableau("rkf78", FEHLBERG78, adaptive=True)
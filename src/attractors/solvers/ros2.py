@@ -0,0 +1,21 @@
+from attractors.solvers.implicit import _iteration_matrix, _jacobian_fd, _lu_solve
+from attractors.solvers.registry import SolverRegistry
+from attractors.type_defs import SystemCallable, Vector
+
+GAMMA = 1 + 2**-0.5
+
+
+@SolverRegistry.register("ros2", order=2, implicit=True)
+def ros2(system_func: SystemCallable, state: Vector, params: Vector, dt: float) -> Vector:
+    """
+    Two-stage Rosenbrock-W scheme ROS2 (Verwer et al.).
+
+    Second order and L-stable. Linearly implicit, so each step solves two linear systems
+    with the same matrix instead of iterating. As a W-method it keeps its order with an
+    approximate Jacobian, here a finite-difference one.
+    """
+    f0 = system_func(state, params)
+    lu, piv = _iteration_matrix(_jacobian_fd(system_func, state, params, f0), GAMMA * dt)
+    k1 = _lu_solve(lu, piv, f0)
+    k2 = _lu_solve(lu, piv, system_func(state + dt * k1, params) - 2 * k1)
+    return state + dt * (1.5 * k1 + 0.5 * k2)
@@ -0,0 +1,21 @@
+from attractors.solvers.implicit import _iteration_matrix, _jacobian_fd, _solve_stage
+from attractors.solvers.registry import SolverRegistry
+from attractors.type_defs import SystemCallable, Vector
+
+GAMMA = 1 - 2**-0.5
+
+
+@SolverRegistry.register("sdirk2", order=2, implicit=True)
+def sdirk2(system_func: SystemCallable, state: Vector, params: Vector, dt: float) -> Vector:
+    """
+    Two-stage singly diagonally implicit Runge-Kutta scheme (Alexander).
+
+    Second order, L-stable and stiffly accurate. Both stages share the iteration matrix
+    I - gamma * dt * J, which is factorized once per step.
+    """
+    f0 = system_func(state, params)
+    lu, piv = _iteration_matrix(_jacobian_fd(system_func, state, params, f0), GAMMA * dt)
+    z1 = _solve_stage(system_func, state, GAMMA * dt, state + GAMMA * dt * f0, params, lu, piv)
+    k1 = (z1 - state) / (GAMMA * dt)
+    base = state + (1 - GAMMA) * dt * k1
+    return _solve_stage(system_func, base, GAMMA * dt, base + GAMMA * dt * k1, params, lu, piv)
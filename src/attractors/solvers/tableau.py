@@ -0,0 +1,220 @@
+import linecache
+import math
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import Any
+
+import numpy as np
+
+from attractors.solvers.registry import Solver, SolverRegistry
+from attractors.utils.logger import setup_logger
+
+logger = setup_logger(name=__name__)
+
+Coefficient = float | Fraction
+
+
+@dataclass(frozen=True)
+class ButcherTableau:
+    """
+    Butcher tableau of an explicit Runge-Kutta method.
+
+    Coefficients may be given as fractions, in which case consistency is checked exactly
+    and each coefficient is rounded to double precision only once, when the step function
+    is generated.
+
+    Attributes:
+        a (Sequence[Sequence[Coefficient]]): Stage coefficients, where row i holds the i
+            coefficients of the preceding stages (row 0 is empty)
+        b (Sequence[Coefficient]): Weights of the propagated solution
+        c (Sequence[Coefficient]): Stage nodes
+        order (int): Order of the propagated solution
+        b_embedded (Sequence[Coefficient] | None): Weights of the embedded solution used for
+            error estimation, or None if the method has no embedded pair
+
+    Raises:
+        ValueError: If the tableau is not explicit, its dimensions do not match, the row
+            sums of a differ from c, the weights do not sum to one or the order is not
+            positive
+    """
+
+    a: Sequence[Sequence[Coefficient]]
+    b: Sequence[Coefficient]
+    c: Sequence[Coefficient]
+    order: int
+    b_embedded: Sequence[Coefficient] | None = field(default=None)
+
+    def __post_init__(self) -> None:
+        stages = len(self.b)
+        if stages == 0 or len(self.a) != stages or len(self.c) != stages:
+            raise ValueError("Tableau a, b and c must have one entry per stage")
+        if any(len(row) != i for i, row in enumerate(self.a)):
+            raise ValueError("Tableau must be explicit, row i of a must have i entries")
+        if any(
+            not math.isclose(sum(row, Fraction(0)), c, rel_tol=0, abs_tol=1e-12)
+            for row, c in zip(self.a, self.c, strict=True)
+        ):
+            raise ValueError("Row sums of a must equal c")
+        for weights in (self.b, self.b_embedded):
+            if weights is None:
+                continue
+            if len(weights) != stages:
+                raise ValueError("Tableau a, b and c must have one entry per stage")
+            if not math.isclose(sum(weights, Fraction(0)), 1, rel_tol=0, abs_tol=1e-12):
+                raise ValueError("Weights must sum to one")
+        if self.order <= 0:
+            raise ValueError("Order must be positive")
+
+    @property
+    def stages(self) -> int:
+        """Number of stages."""
+        return len(self.b)
+
+    @property
+    def fsal(self) -> bool:
+        """Whether the last stage is evaluated at the propagated solution."""
+        return self.stages > 1 and list(self.a[-1]) == list(self.b[:-1]) and self.b[-1] == 0
+
+
+def _linear_combination(coefficients: Sequence[Coefficient], terms: Sequence[str]) -> str:
+    """Format sum(coefficient * term) as source, skipping zero coefficients."""
+    parts = []
+    for coefficient, term in zip(coefficients, terms, strict=False):
+        if coefficient == 0:
+            continue
+        value = float(coefficient)
+        sign = "-" if value < 0 else "+"
+        parts.append(f"{sign} {abs(value)!r} * {term}")
+    if not parts:
+        return "0.0"
+    source = " ".join(parts)
+    return source[2:] if source.startswith("+") else f"-{source[2:]}"
+
+
+def _step_source(name: str, tableau: ButcherTableau) -> str:
+    """Generate the source of an allocating solver step."""
+    stages = [f"k{j + 1}" for j in range(tableau.stages)]
+    lines = [
+        f"def {name}(system_func, state, params, dt):",
+        "    k1 = system_func(state, params)",
+    ]
+    for j in range(1, tableau.stages):
+        combination = _linear_combination(tableau.a[j], stages)
+        lines.append(f"    {stages[j]} = system_func(state + dt * ({combination}), params)")
+    lines.append(f"    return state + dt * ({_linear_combination(tableau.b, stages)})")
+    return "\n".join(lines) + "\n"
+
+
+def _inplace_step_source(name: str, tableau: ButcherTableau) -> str:
+    """Generate the source of an allocation-free solver step."""
+    stages = [f"k{j + 1}" for j in range(tableau.stages)]
+    elements = [f"{stage}[i]" for stage in stages]
+    lines = [
+        f"def {name}(system_func, state, params, dt, work, out):",
+        "    n = len(state)",
+        *(f"    {stage} = work[{j}]" for j, stage in enumerate(stages)),
+        f"    tmp = work[{tableau.stages}]",
+        "    system_func(state, params, k1)",
+    ]
+    for j in range(1, tableau.stages):
+        combination = _linear_combination(tableau.a[j], elements)
+        lines += [
+            "    for i in range(n):",
+            f"        tmp[i] = state[i] + dt * ({combination})",
+            f"    system_func(tmp, params, {stages[j]})",
+        ]
+    lines += [
+        "    for i in range(n):",
+        f"        out[i] = state[i] + dt * ({_linear_combination(tableau.b, elements)})",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _adaptive_step_source(name: str, tableau: ButcherTableau) -> str:
+    """Generate the source of an embedded adaptive solver step."""
+    assert tableau.b_embedded is not None
+    stages = [f"k{j + 1}" for j in range(tableau.stages)]
+    last = tableau.stages - 1 if tableau.fsal else tableau.stages
+    lines = [f"def {name}(system_func, state, k1, params, dt):"]
+    for j in range(1, last):
+        combination = _linear_combination(tableau.a[j], stages)
+        lines.append(f"    {stages[j]} = system_func(state + dt * ({combination}), params)")
+    lines.append(f"    result = state + dt * ({_linear_combination(tableau.b, stages)})")
+    if tableau.fsal:
+        lines.append(f"    {stages[-1]} = system_func(result, params)")
+    error = [
+        Fraction(high) - Fraction(low)
+        for high, low in zip(tableau.b, tableau.b_embedded, strict=True)
+    ]
+    lines += [
+        f"    error = dt * ({_linear_combination(error, stages)})",
+        f"    return result, error, {stages[-1]}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _compile_source(name: str, source: str) -> Callable[..., Any]:
+    """Compile generated source into a function whose source stays inspectable."""
+    # register the source so that inspect, the kernel cache and Numba can read it back
+    filename = f"<tableau {name}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(keepends=True), filename)
+    namespace: dict[str, Any] = {"__name__": __name__, "np": np}
+    exec(compile(source, filename, "exec"), namespace)  # noqa: S102
+    func: Callable[..., Any] = namespace[name]
+    return func
+
+
+def register_tableau(name: str, tableau: ButcherTableau, *, adaptive: bool = False) -> Solver:
+    """
+    Generate and register a Runge-Kutta solver from a Butcher tableau.
+
+    The stages are fully unrolled into straight-line source with the coefficients inlined
+    as constants and zero coefficients dropped, which is compiled into an allocating step
+    and an allocation-free step registered with `register_inplace`. With adaptive=True, an
+    embedded step following the adaptive interface is generated instead, using the
+    difference of the propagated and embedded weights as error estimate.
+
+    Args:
+        name (str): Unique identifier for the solver
+        tableau (ButcherTableau): Tableau of the method
+        adaptive (bool, optional): Whether to register an embedded adaptive solver.
+            Defaults to False.
+
+    Returns:
+        Solver: Registered solver
+
+    Raises:
+        ValueError: If solver name is already registered or adaptive is True and the
+            tableau has no embedded weights
+
+    Examples:
+        >>> heun = ButcherTableau(a=[[], [1]], b=[0.5, 0.5], c=[0, 1], order=2)
+        >>> solver = register_tableau("heun", heun)
+        >>> trajectory, time = integrate_system(system, solver, 10_000, 0.01)
+    """
+    if adaptive and tableau.b_embedded is None:
+        msg = f"Tableau of adaptive solver {name} has no embedded weights"
+        raise ValueError(msg)
+
+    identifier = re.sub(r"\W", "_", name)
+    if adaptive:
+        step = _compile_source(identifier, _adaptive_step_source(identifier, tableau))
+        SolverRegistry.register(
+            name,
+            adaptive=True,
+            order=tableau.order,
+            stages=tableau.stages,
+            fsal=tableau.fsal,
+        )(step)
+    else:
+        step = _compile_source(identifier, _step_source(identifier, tableau))
+        SolverRegistry.register(name, order=tableau.order)(step)
+        inplace_name = f"{identifier}_inplace"
+        SolverRegistry.register_inplace(name, work_size=tableau.stages + 1)(
+            _compile_source(inplace_name, _inplace_step_source(inplace_name, tableau))
+        )
+
+    logger.debug("Registered %d-stage tableau solver: %s", tableau.stages, name)
+    return SolverRegistry.get(name)
@@ -0,0 +1,285 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from attractors.solvers.kernels import _fingerprint
+from attractors.solvers.registry import Solver
+from attractors.systems.registry import System
+from attractors.type_defs import Vector
+from attractors.utils.logger import setup_logger
+
+logger = setup_logger(name=__name__)
+
+_uncacheable: set[tuple[str, str]] = set()
+
+
+@dataclass(frozen=True)
+class TrajectoryCacheStats:
+    """
+    Statistics of a trajectory cache.
+
+    Attributes:
+        memory_hits (int): Number of lookups served from the in-process tier
+        disk_hits (int): Number of lookups served from the on-disk tier
+        misses (int): Number of lookups that required integration
+        disk_bytes (int): Total size of the on-disk entries
+    """
+
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    disk_bytes: int
+
+
+class TrajectoryCache:
+    """
+    Content-addressed cache of integrated trajectories.
+
+    Entries are keyed by a hash of everything that determines a trajectory: the system name,
+    parameters and initial state, the solver, the step count and size, the transient and
+    save interval, the output dtype and the source of the system and solver functions.
+    Integrations whose functions have no stable description, such as functions without
+    source, bypass the cache, since their name alone cannot tell redefinitions apart.
+    Results live in two tiers, an in-process LRU of the most recent entries and an optional
+    directory of `.npy` files bounded in total size, where the least recently used entries
+    are evicted first. Entries read from disk are memory-mapped rather than loaded.
+
+    Cached arrays are shared between callers and therefore returned read-only.
+
+    Args:
+        directory (str | os.PathLike[str] | None): Directory of the on-disk tier, or None
+            to keep entries in memory only
+        max_bytes (int): Maximum total size of the on-disk tier. Defaults to 1 GiB.
+        memory_items (int): Maximum number of entries in the in-process tier. Defaults to 16.
+
+    Raises:
+        ValueError: If max_bytes or memory_items is negative
+
+    Examples:
+        >>> cache = TrajectoryCache("~/.cache/attractors/trajectories")
+        >>> trajectory, time = integrate_system(system, solver, 1_000_000, 0.001, cache=cache)
+        >>> trajectory, time = integrate_system(system, solver, 1_000_000, 0.001, cache=cache)
+        >>> cache.stats()
+        TrajectoryCacheStats(memory_hits=1, disk_hits=0, misses=1, disk_bytes=32000000)
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        max_bytes: int = 1 << 30,
+        memory_items: int = 16,
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError("Maximum cache size must be non-negative")
+        if memory_items < 0:
+            raise ValueError("Number of in-memory entries must be non-negative")
+        self.directory = None if directory is None else Path(directory).expanduser()
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self._memory: OrderedDict[str, tuple[Vector, Vector]] = OrderedDict()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def key(
+        system: System,
+        solver: Solver,
+        steps: int,
+        dt: float,
+        transient_steps: int = 0,
+        save_every: int = 1,
+        dtype: DTypeLike = np.float64,
+    ) -> str | None:
+        """
+        Compute the cache key of an integration.
+
+        Args:
+            system (System): Integrated system
+            solver (Solver): Solver used for integration
+            steps (int): Number of integration steps
+            dt (float): Time step size
+            transient_steps (int, optional): Number of discarded steps. Defaults to 0.
+            save_every (int, optional): Save interval. Defaults to 1.
+            dtype (DTypeLike, optional): Storage dtype. Defaults to np.float64.
+
+        Returns:
+            str | None: Hex digest identifying the integration result, or None if the
+                system or solver function cannot be fingerprinted and the integration must
+                not be cached
+        """
+        system_fingerprint = _fingerprint(system.func)
+        solver_fingerprint = _fingerprint(solver.func)
+        if system_fingerprint is None or solver_fingerprint is None:
+            if (system.name, solver.name) not in _uncacheable:
+                _uncacheable.add((system.name, solver.name))
+                logger.warning(
+                    "System %s with solver %s cannot be fingerprinted, bypassing the cache",
+                    system.name,
+                    solver.name,
+                )
+            return None
+
+        digest = hashlib.sha256()
+        for part in (
+            system.name,
+            solver.name,
+            system_fingerprint,
+            solver_fingerprint,
+            f"{steps}:{float(dt).hex()}:{transient_steps}:{save_every}:{np.dtype(dtype).str}",
+        ):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        digest.update(np.ascontiguousarray(system.params, dtype=np.float64).tobytes())
+        digest.update(np.ascontiguousarray(system.init_coord, dtype=np.float64).tobytes())
+        return digest.hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        assert self.directory is not None
+        return (
+            self.directory / f"{key}.trajectory.npy",
+            self.directory / f"{key}.time.npy",
+        )
+
+    def _remember(self, key: str, entry: tuple[Vector, Vector]) -> None:
+        if self.memory_items == 0:
+            return
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> tuple[Vector, Vector] | None:
+        """
+        Look up a cached trajectory.
+
+        Args:
+            key (str): Cache key from `TrajectoryCache.key`
+
+        Returns:
+            tuple[Vector, Vector] | None: Read-only trajectory and time points, memory-mapped
+                if read from disk, or None if the key is not cached
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return entry
+
+            if self.directory is not None:
+                trajectory_path, time_path = self._paths(key)
+                try:
+                    entry = (
+                        np.load(trajectory_path, mmap_mode="r"),
+                        np.load(time_path, mmap_mode="r"),
+                    )
+                    os.utime(trajectory_path)
+                except (OSError, ValueError):
+                    entry = None
+                if entry is not None:
+                    self._disk_hits += 1
+                    self._remember(key, entry)
+                    return entry
+
+            self._misses += 1
+            return None
+
+    def put(self, key: str, trajectory: Vector, time: Vector) -> tuple[Vector, Vector]:
+        """
+        Store a trajectory, evicting least recently used entries if needed.
+
+        The arrays are marked read-only, since the in-process tier shares them with later
+        callers.
+
+        Args:
+            key (str): Cache key from `TrajectoryCache.key`
+            trajectory (Vector): Trajectory to store
+            time (Vector): Time points to store
+
+        Returns:
+            tuple[Vector, Vector]: The stored, now read-only, trajectory and time points
+        """
+        trajectory.setflags(write=False)
+        time.setflags(write=False)
+        with self._lock:
+            self._remember(key, (trajectory, time))
+            if self.directory is None:
+                return trajectory, time
+
+            size = trajectory.nbytes + time.nbytes
+            if size > self.max_bytes:
+                logger.debug("Trajectory %s exceeds cache size limit, not stored", key)
+                return trajectory, time
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                for path, array in zip(self._paths(key), (trajectory, time), strict=True):
+                    tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+                    np.save(tmp, array)
+                    tmp.replace(path)
+                self._evict()
+            except OSError as e:
+                logger.warning("Failed to store trajectory in %s: %s", self.directory, e)
+            return trajectory, time
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """List on-disk entries as (last use, size, key), least recently used first."""
+        assert self.directory is not None
+        entries = []
+        for trajectory_path in self.directory.glob("*.trajectory.npy"):
+            key = trajectory_path.name.removesuffix(".trajectory.npy")
+            try:
+                used = trajectory_path.stat().st_mtime
+                size = sum(path.stat().st_size for path in self._paths(key))
+            except OSError:
+                continue
+            entries.append((used, size, key))
+        return sorted(entries)
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in entries:
+            if total <= self.max_bytes:
+                break
+            for path in self._paths(key):
+                path.unlink(missing_ok=True)
+            total -= size
+            logger.debug("Evicted trajectory %s", key)
+
+    def stats(self) -> TrajectoryCacheStats:
+        """
+        Get cache statistics.
+
+        Returns:
+            TrajectoryCacheStats: Hit/miss counts per tier and on-disk size
+        """
+        with self._lock:
+            disk_bytes = (
+                0 if self.directory is None else sum(size for _, size, _ in self._entries())
+            )
+            return TrajectoryCacheStats(
+                memory_hits=self._memory_hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                disk_bytes=disk_bytes,
+            )
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers and reset statistics."""
+        with self._lock:
+            self._memory.clear()
+            if self.directory is not None:
+                for _, _, key in self._entries():
+                    for path in self._paths(key):
+                        path.unlink(missing_ok=True)
+            self._memory_hits = 0
+            self._disk_hits = 0
+            self._misses = 0
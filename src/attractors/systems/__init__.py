@@ -12,6 +12,7 @@ from attractors.systems import (
     halvorsen,
     langford,
     lorenz,
+    lorenz96,
     lotka_volterra,
     moore_spiegel,
     newton_leipnik,
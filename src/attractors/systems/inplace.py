@@ -0,0 +1,124 @@
+import ast
+import inspect
+import textwrap
+from typing import Any
+
+from numba import njit
+
+from attractors.type_defs import SystemCallable, SystemInplaceCallable, Vector
+from attractors.utils.logger import setup_logger
+
+logger = setup_logger(name=__name__)
+
+
+def _is_array_literal(node: ast.expr | None) -> bool:
+    """Check whether a node is a call of the form `np.array([...], ...)`."""
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "array"
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id in ("np", "numpy")
+        and len(node.args) == 1
+        and isinstance(node.args[0], ast.List)
+    )
+
+
+def make_inplace(func: SystemCallable) -> SystemInplaceCallable | None:
+    """
+    Generate an in-place variant of a system function by rewriting its source.
+
+    The system function must end with a single `return np.array([dx, dy, ...])` statement,
+    which is replaced by element-wise writes into an `out` argument so that the generated
+    function performs no heap allocation.
+
+    Args:
+        func (SystemCallable): System function taking (state, params)
+
+    Returns:
+        SystemInplaceCallable | None: Function taking (state, params, out), or None if the
+            source is unavailable or does not follow the expected pattern
+    """
+    func = getattr(func, "py_func", func)
+    try:
+        source = textwrap.dedent(inspect.getsource(func))
+    except (OSError, TypeError):
+        return None
+
+    tree = ast.parse(source)
+    if len(tree.body) != 1 or not isinstance(tree.body[0], ast.FunctionDef):
+        return None
+    func_def = tree.body[0]
+    returns = [node for node in ast.walk(func_def) if isinstance(node, ast.Return)]
+    last = func_def.body[-1]
+    if len(returns) != 1 or returns[0] is not last:
+        return None
+    if not _is_array_literal(last.value):
+        return None
+
+    elements = last.value.args[0].elts  # type: ignore[union-attr]
+    writes: list[ast.stmt] = [
+        ast.Assign(
+            targets=[
+                ast.Subscript(
+                    value=ast.Name(id="out", ctx=ast.Load()),
+                    slice=ast.Constant(value=i),
+                    ctx=ast.Store(),
+                )
+            ],
+            value=element,
+        )
+        for i, element in enumerate(elements)
+    ]
+    func_def.body = [*func_def.body[:-1], *writes]
+    func_def.decorator_list = []
+    func_def.returns = None
+    func_def.name = f"{func.__name__}_inplace"
+    func_def.args.args.append(ast.arg(arg="out"))
+    ast.fix_missing_locations(tree)
+    ast.increment_lineno(tree, func.__code__.co_firstlineno - 1)
+
+    namespace: dict[str, Any] = dict(func.__globals__)
+    if func.__closure__ is not None:
+        namespace.update(
+            zip(
+                func.__code__.co_freevars,
+                (cell.cell_contents for cell in func.__closure__),
+                strict=True,
+            )
+        )
+    code = compile(tree, filename=inspect.getsourcefile(func) or "<inplace>", mode="exec")
+    exec(code, namespace)  # noqa: S102
+    generated: SystemInplaceCallable = namespace[func_def.name]
+    return generated
+
+
+def _wrap_inplace(func: SystemCallable) -> SystemInplaceCallable:
+    def inplace(state: Vector, params: Vector, out: Vector) -> None:
+        out[:] = func(state, params)
+
+    return inplace
+
+
+def adapt_inplace(
+    func: SystemCallable, jitted_func: SystemCallable
+) -> tuple[SystemInplaceCallable, SystemInplaceCallable]:
+    """
+    Build original and JIT-compiled in-place variants of a system function.
+
+    Uses `make_inplace` when the source can be rewritten and otherwise falls back to a
+    wrapper that copies the returned vector into the output buffer.
+
+    Args:
+        func (SystemCallable): Original system function
+        jitted_func (SystemCallable): JIT-compiled system function
+
+    Returns:
+        tuple[SystemInplaceCallable, SystemInplaceCallable]: Original and JIT-compiled
+            in-place functions taking (state, params, out)
+    """
+    generated = make_inplace(func)
+    if generated is not None:
+        return generated, njit()(generated)
+    logger.debug("Falling back to copying in-place wrapper for %s", func)
+    return _wrap_inplace(func), njit()(_wrap_inplace(jitted_func))
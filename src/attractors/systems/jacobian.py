@@ -0,0 +1,377 @@
+import ast
+import inspect
+import itertools
+import linecache
+import textwrap
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from numba import njit, prange
+
+from attractors.systems.inplace import _is_array_literal
+from attractors.type_defs import JacobianCallable, SystemCallable, Vector
+from attractors.utils.logger import setup_logger
+
+logger = setup_logger(name=__name__)
+
+Tangent = list[ast.expr | None]
+
+
+class _UnsupportedError(Exception):
+    """Raised when a system function cannot be differentiated by source transformation."""
+
+
+def _add(a: ast.expr | None, b: ast.expr | None) -> ast.expr | None:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return ast.BinOp(left=a, op=ast.Add(), right=b)
+
+
+def _neg(a: ast.expr | None) -> ast.expr | None:
+    return None if a is None else ast.UnaryOp(op=ast.USub(), operand=a)
+
+
+def _sub(a: ast.expr | None, b: ast.expr | None) -> ast.expr | None:
+    if b is None:
+        return a
+    if a is None:
+        return _neg(b)
+    return ast.BinOp(left=a, op=ast.Sub(), right=b)
+
+
+def _mul(a: ast.expr | None, b: ast.expr | None) -> ast.expr | None:
+    if a is None or b is None:
+        return None
+    if isinstance(a, ast.Constant) and a.value == 1:
+        return b
+    if isinstance(b, ast.Constant) and b.value == 1:
+        return a
+    return ast.BinOp(left=a, op=ast.Mult(), right=b)
+
+
+def _div(a: ast.expr | None, b: ast.expr) -> ast.expr | None:
+    return None if a is None else ast.BinOp(left=a, op=ast.Div(), right=b)
+
+
+def _np_call(name: str, arg: ast.expr) -> ast.expr:
+    return ast.Call(
+        func=ast.Attribute(value=ast.Name(id="_np", ctx=ast.Load()), attr=name, ctx=ast.Load()),
+        args=[arg],
+        keywords=[],
+    )
+
+
+def _pow(base: ast.expr, exponent: float) -> ast.expr:
+    return ast.BinOp(left=base, op=ast.Pow(), right=ast.Constant(value=exponent))
+
+
+# d/du f(u) for elementwise functions, as an expression of u
+_DERIVATIVES: dict[str, Callable[[ast.expr], ast.expr]] = {
+    "sin": lambda u: _np_call("cos", u),
+    "cos": lambda u: ast.UnaryOp(op=ast.USub(), operand=_np_call("sin", u)),
+    "tan": lambda u: _pow(_np_call("cos", u), -2),
+    "exp": lambda u: _np_call("exp", u),
+    "log": lambda u: _pow(u, -1),
+    "sqrt": lambda u: _pow(
+        ast.BinOp(left=ast.Constant(value=2), op=ast.Mult(), right=_np_call("sqrt", u)), -1
+    ),
+    "sinh": lambda u: _np_call("cosh", u),
+    "cosh": lambda u: _np_call("sinh", u),
+    "tanh": lambda u: ast.BinOp(
+        left=ast.Constant(value=1), op=ast.Sub(), right=_pow(_np_call("tanh", u), 2)
+    ),
+    "arctan": lambda u: _pow(
+        ast.BinOp(left=ast.Constant(value=1), op=ast.Add(), right=_pow(u, 2)), -1
+    ),
+    "abs": lambda u: _np_call("sign", u),
+    "absolute": lambda u: _np_call("sign", u),
+}
+
+
+class _Differentiator:
+    """Forward-mode differentiation of straight-line expressions.
+
+    Tracks, for every local variable, the expressions of its partial derivatives with
+    respect to each state component. Structurally zero derivatives are represented by None
+    so that the generated code contains only non-trivial terms.
+    """
+
+    def __init__(self, state_name: str, params_name: str, dim: int) -> None:
+        self.state_name = state_name
+        self.params_name = params_name
+        self.dim = dim
+        self.tangents: dict[str, Tangent] = {}
+        self._counter = itertools.count()
+
+    def seed(self, name: str, index: int) -> None:
+        self.tangents[name] = [
+            ast.Constant(value=1.0) if j == index else None for j in range(self.dim)
+        ]
+
+    def assign(self, name: str, value: ast.expr) -> list[ast.stmt]:
+        """Record the tangent of an assignment, returning the statements computing it."""
+        statements: list[ast.stmt] = []
+        tangent: Tangent = []
+        for j in range(self.dim):
+            derivative = self.derive(value, j)
+            if derivative is None or isinstance(derivative, ast.Constant):
+                tangent.append(derivative)
+                continue
+            temp = f"_d{j}_{name}_{next(self._counter)}"
+            statements.append(
+                ast.Assign(targets=[ast.Name(id=temp, ctx=ast.Store())], value=derivative)
+            )
+            tangent.append(ast.Name(id=temp, ctx=ast.Load()))
+        self.tangents[name] = tangent
+        return statements
+
+    def derive(self, node: ast.expr, j: int) -> ast.expr | None:
+        """Build the derivative of an expression with respect to state component j."""
+        if isinstance(node, ast.Constant):
+            return None
+        if isinstance(node, ast.Name):
+            tangent = self.tangents.get(node.id)
+            return None if tangent is None else tangent[j]
+        if isinstance(node, ast.Subscript):
+            return self._derive_subscript(node, j)
+        if isinstance(node, ast.UnaryOp):
+            if isinstance(node.op, ast.USub):
+                return _neg(self.derive(node.operand, j))
+            if isinstance(node.op, ast.UAdd):
+                return self.derive(node.operand, j)
+        if isinstance(node, ast.BinOp):
+            return self._derive_binop(node, j)
+        if isinstance(node, ast.Call):
+            return self._derive_call(node, j)
+        raise _UnsupportedError(ast.dump(node))
+
+    def _derive_subscript(self, node: ast.Subscript, j: int) -> ast.expr | None:
+        if isinstance(node.value, ast.Name) and node.value.id == self.params_name:
+            return None
+        if (
+            isinstance(node.value, ast.Name)
+            and node.value.id == self.state_name
+            and isinstance(node.slice, ast.Constant)
+            and isinstance(node.slice.value, int)
+        ):
+            return ast.Constant(value=1.0) if node.slice.value == j else None
+        raise _UnsupportedError(ast.dump(node))
+
+    def _derive_binop(self, node: ast.BinOp, j: int) -> ast.expr | None:
+        left, right = node.left, node.right
+        d_left, d_right = self.derive(left, j), self.derive(right, j)
+        if isinstance(node.op, ast.Add):
+            return _add(d_left, d_right)
+        if isinstance(node.op, ast.Sub):
+            return _sub(d_left, d_right)
+        if isinstance(node.op, ast.Mult):
+            return _add(_mul(d_left, right), _mul(left, d_right))
+        if isinstance(node.op, ast.Div):
+            quotient = _div(d_left, right)
+            if d_right is None:
+                return quotient
+            return _sub(quotient, _div(_mul(left, d_right), _pow(right, 2)))
+        if isinstance(node.op, ast.Pow):
+            if d_right is None:
+                if isinstance(right, ast.Constant) and isinstance(right.value, int | float):
+                    exponent = right.value
+                    if exponent == 1:
+                        return d_left
+                    factor = (
+                        _mul(ast.Constant(value=2), left)
+                        if exponent == 2
+                        else _mul(ast.Constant(value=exponent), _pow(left, exponent - 1))
+                    )
+                    return _mul(factor, d_left)
+                reduced = ast.BinOp(left=right, op=ast.Sub(), right=ast.Constant(value=1))
+                power = ast.BinOp(left=left, op=ast.Pow(), right=reduced)
+                return _mul(_mul(right, power), d_left)
+            # d(u**v) = u**v * (v' * log(u) + v * u' / u)
+            return _mul(
+                node,
+                _add(_mul(d_right, _np_call("log", left)), _div(_mul(right, d_left), left)),
+            )
+        raise _UnsupportedError(ast.dump(node))
+
+    def _derive_call(self, node: ast.Call, j: int) -> ast.expr | None:
+        if len(node.args) != 1 or node.keywords:
+            raise _UnsupportedError(ast.dump(node))
+        func = node.func
+        if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+            if func.value.id not in ("np", "numpy", "math"):
+                raise _UnsupportedError(ast.dump(node))
+            name = func.attr
+        elif isinstance(func, ast.Name) and func.id == "abs":
+            name = "abs"
+        else:
+            raise _UnsupportedError(ast.dump(node))
+        if name not in _DERIVATIVES:
+            raise _UnsupportedError(name)
+
+        (arg,) = node.args
+        return _mul(_DERIVATIVES[name](arg), self.derive(arg, j))
+
+
+def make_jacobian(func: SystemCallable) -> JacobianCallable | None:
+    """
+    Generate the Jacobian of a system function by forward-mode source transformation.
+
+    The system function must be straight-line code: assignments, an unpacking of the state
+    and parameters, and a final `return np.array([...])`. Every assignment is preceded by
+    statements computing the derivatives of the assigned variable with respect to each state
+    component, using the rules of differentiation for arithmetic, powers and common NumPy
+    functions, so that variables may also be reassigned in terms of themselves. The
+    generated function is exact up to floating-point rounding and compiles with Numba like
+    the system function itself.
+
+    Args:
+        func (SystemCallable): System function taking (state, params)
+
+    Returns:
+        JacobianCallable | None: Function taking (state, params) and returning the
+            Jacobian matrix `J[i, j] = d f_i / d state_j`, or None if the source is
+            unavailable or uses unsupported constructs
+    """
+    func = getattr(func, "py_func", func)
+    try:
+        source = textwrap.dedent(inspect.getsource(func))
+    except (OSError, TypeError):
+        return None
+
+    tree = ast.parse(source)
+    if len(tree.body) != 1 or not isinstance(tree.body[0], ast.FunctionDef):
+        return None
+    func_def = tree.body[0]
+    if len(func_def.args.args) != 2:
+        return None
+    state_name, params_name = (arg.arg for arg in func_def.args.args)
+    last = func_def.body[-1]
+    if not isinstance(last, ast.Return) or not _is_array_literal(last.value):
+        return None
+    elements = last.value.args[0].elts  # type: ignore[union-attr]
+    dim = len(elements)
+
+    diff = _Differentiator(state_name, params_name, dim)
+    body: list[ast.stmt] = []
+    try:
+        for statement in func_def.body[:-1]:
+            if isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Constant):
+                continue
+            if not isinstance(statement, ast.Assign) or len(statement.targets) != 1:
+                raise _UnsupportedError(ast.dump(statement))
+            target, value = statement.targets[0], statement.value
+            if isinstance(target, ast.Name):
+                # derivatives are taken before the assignment, which may overwrite a variable
+                # they depend on, as in `x = x * x`
+                body.extend(diff.assign(target.id, value))
+                body.append(statement)
+            elif (
+                isinstance(target, ast.Tuple)
+                and isinstance(value, ast.Name)
+                and value.id in (state_name, params_name)
+                and all(isinstance(elt, ast.Name) for elt in target.elts)
+            ):
+                body.append(statement)
+                for index, elt in enumerate(target.elts):
+                    assert isinstance(elt, ast.Name)
+                    if value.id == state_name:
+                        diff.seed(elt.id, index)
+                    else:
+                        diff.tangents.pop(elt.id, None)
+            else:
+                raise _UnsupportedError(ast.dump(statement))
+        entries = [[diff.derive(element, j) for j in range(dim)] for element in elements]
+    except _UnsupportedError as e:
+        logger.debug("Cannot differentiate %s: %s", func.__name__, e)
+        return None
+
+    name = f"{func.__name__}_jacobian"
+    lines = [f"def {name}({state_name}, {params_name}):"]
+    lines += [f"    {ast.unparse(ast.fix_missing_locations(statement))}" for statement in body]
+    lines.append(f"    _jac = _np.zeros(({dim}, {dim}), dtype=_np.float64)")
+    for i, row in enumerate(entries):
+        for j, entry in enumerate(row):
+            if entry is not None:
+                lines.append(f"    _jac[{i}, {j}] = {ast.unparse(entry)}")
+    lines.append("    return _jac")
+    generated_source = "\n".join(lines) + "\n"
+
+    # register the source so that inspect and Numba error messages can show it
+    filename = f"<jacobian of {func.__module__}.{func.__qualname__}>"
+    linecache.cache[filename] = (
+        len(generated_source),
+        None,
+        generated_source.splitlines(keepends=True),
+        filename,
+    )
+    namespace: dict[str, Any] = dict(func.__globals__)
+    if func.__closure__ is not None:
+        namespace.update(
+            zip(
+                func.__code__.co_freevars,
+                (cell.cell_contents for cell in func.__closure__),
+                strict=True,
+            )
+        )
+    namespace["_np"] = np
+    exec(compile(generated_source, filename, "exec"), namespace)  # noqa: S102
+    generated: JacobianCallable = namespace[name]
+    return generated
+
+
+def _finite_difference_jacobian(func: SystemCallable) -> JacobianCallable:
+    def jacobian(state: Vector, params: Vector) -> Vector:
+        dim = len(state)
+        jac = np.empty((dim, dim), dtype=np.float64)
+        shifted = state.astype(np.float64)
+        for j in range(dim):
+            h = 6e-6 * max(1.0, abs(state[j]))
+            shifted[j] = state[j] + h
+            forward = func(shifted, params)
+            shifted[j] = state[j] - h
+            backward = func(shifted, params)
+            shifted[j] = state[j]
+            jac[:, j] = (forward - backward) / (2 * h)
+        return jac
+
+    return jacobian
+
+
+def adapt_jacobian(
+    func: SystemCallable, jitted_func: SystemCallable
+) -> tuple[JacobianCallable, JacobianCallable]:
+    """
+    Build original and JIT-compiled Jacobians of a system function.
+
+    Uses `make_jacobian` when the source can be differentiated and otherwise falls back to
+    central finite differences.
+
+    Args:
+        func (SystemCallable): Original system function
+        jitted_func (SystemCallable): JIT-compiled system function
+
+    Returns:
+        tuple[JacobianCallable, JacobianCallable]: Original and JIT-compiled Jacobian
+            functions taking (state, params)
+    """
+    generated = make_jacobian(func)
+    if generated is not None:
+        return generated, njit()(generated)
+    logger.debug("Falling back to finite-difference Jacobian for %s", func)
+    return _finite_difference_jacobian(func), njit()(_finite_difference_jacobian(jitted_func))
+
+
+# non-jitted
+def _jacobian_batch_impl(jacobian_func: JacobianCallable, states: Vector, params: Vector) -> Vector:
+    count, dim = states.shape
+    result = np.empty((count, dim, dim), dtype=np.float64)
+    for i in prange(count):
+        result[i] = jacobian_func(states[i], params)
+    return result
+
+
+# jitted
+_jacobian_batch_jitted = njit(parallel=True)(_jacobian_batch_impl)
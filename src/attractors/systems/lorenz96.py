@@ -0,0 +1,57 @@
+import numpy as np
+
+from attractors.systems.registry import SystemRegistry
+from attractors.type_defs import Vector
+
+DEFAULT_DIM = 40
+
+
+def lorenz96_inplace(state: Vector, params: Vector, out: Vector) -> None:
+    """
+    In-place Lorenz-96 system, a single pass over the state without temporaries.
+    """
+    forcing = params[0]
+    n = len(state)
+    for i in range(n):
+        # negative indices wrap around the ring, i + 1 - n is the successor of i
+        out[i] = (state[i + 1 - n] - state[i - 2]) * state[i - 1] - state[i] + forcing
+
+
+def lorenz96_jacobian(state: Vector, params: Vector) -> Vector:  # noqa: ARG001
+    """
+    Jacobian of the Lorenz-96 system, which has four nonzero entries per row.
+    """
+    n = len(state)
+    jacobian = np.zeros((n, n), dtype=np.float64)
+    for i in range(n):
+        jacobian[i, i + 1 - n] += state[i - 1]
+        jacobian[i, i - 2] -= state[i - 1]
+        jacobian[i, i - 1] += state[i + 1 - n] - state[i - 2]
+        jacobian[i, i] -= 1.0
+    return jacobian
+
+
+@SystemRegistry.register(
+    name="lorenz96",
+    default_params=np.array([8.0]),
+    param_names=["F"],
+    init_coord=np.concatenate(([8.01], np.full(DEFAULT_DIM - 1, 8.0))),
+    reference=(
+        'Lorenz, E. N. "Predictability: A problem partly solved", '
+        "Proceedings of the Seminar on Predictability, ECMWF, 1, 1-18, 1996."
+    ),
+    inplace=lorenz96_inplace,
+    jacobian=lorenz96_jacobian,
+)
+def lorenz96(state: Vector, params: Vector) -> Vector:
+    """
+    Lorenz-96 system of N >= 4 variables on a ring, chaotic for F = 8.
+
+    The dimension is set by the initial state, so larger instances are created with
+    `dataclasses.replace(system, init_coord=...)`.
+    """
+    forcing = params[0]
+    derivative: Vector = (
+        (np.roll(state, -1) - np.roll(state, 2)) * np.roll(state, 1) - state + forcing
+    )
+    return derivative
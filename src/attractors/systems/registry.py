@@ -1,11 +1,20 @@
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, ClassVar, TypeVar
 
+import numpy as np
 from numba import njit
-from numba.core.dispatcher import Dispatcher
 
-from attractors.type_defs import PlotLimits, SystemCallable, Vector
+from attractors.systems.inplace import adapt_inplace
+from attractors.systems.jacobian import _jacobian_batch_impl, _jacobian_batch_jitted, adapt_jacobian
+from attractors.type_defs import (
+    JacobianCallable,
+    PlotLimits,
+    SystemCallable,
+    SystemInplaceCallable,
+    Vector,
+)
+from attractors.utils.jit import is_cacheable, is_jitted
 from attractors.utils.logger import setup_logger
 
 logger = setup_logger(name=__name__)
@@ -24,7 +33,21 @@ class System:
         param_names (list[str]): List of parameter names
         reference (str): Academic reference
         init_coord (Vector): Initial state vector
-        plot_lims (PlotLimits | None): Optional plotting limits
+        plot_lims (PlotLimits | None): Optional plotting limits of the first three state
+            components
+        inplace_func (SystemInplaceCallable | None): In-place system function writing the
+            derivative into an output buffer. Generated from func if None.
+        jitted_inplace_func (SystemInplaceCallable | None): JIT-compiled in-place system
+            function. Generated from func if None.
+        jacobian_func (JacobianCallable | None): Function taking (state, params) and
+            returning the Jacobian matrix of func with respect to the state. Generated from
+            func by automatic differentiation if None.
+        jitted_jacobian_func (JacobianCallable | None): JIT-compiled Jacobian function.
+            Generated from func if None.
+        dim (int): Dimension of the state vector, taken from init_coord
+
+    Raises:
+        ValueError: If init_coord is not a non-empty vector
     """
 
     func: SystemCallable
@@ -35,6 +58,30 @@ class System:
     reference: str
     init_coord: Vector
     plot_lims: PlotLimits | None = None
+    inplace_func: SystemInplaceCallable | None = None
+    jitted_inplace_func: SystemInplaceCallable | None = None
+    jacobian_func: JacobianCallable | None = None
+    jitted_jacobian_func: JacobianCallable | None = None
+    dim: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        if np.ndim(self.init_coord) != 1 or len(self.init_coord) == 0:
+            raise ValueError("Initial state must be a non-empty vector")
+        self.dim = len(self.init_coord)
+        if self.inplace_func is None:
+            self.inplace_func, self.jitted_inplace_func = adapt_inplace(self.func, self.jitted_func)
+        elif self.jitted_inplace_func is None:
+            self.jitted_inplace_func = (
+                self.inplace_func if is_jitted(self.inplace_func) else njit()(self.inplace_func)
+            )
+        if self.jacobian_func is None:
+            self.jacobian_func, self.jitted_jacobian_func = adapt_jacobian(
+                self.func, self.jitted_func
+            )
+        elif self.jitted_jacobian_func is None:
+            self.jitted_jacobian_func = (
+                self.jacobian_func if is_jitted(self.jacobian_func) else njit()(self.jacobian_func)
+            )
 
     def set_params(self, params: Vector) -> None:
         """
@@ -57,13 +104,14 @@ class System:
         Set initial state coordinates.
 
         Args:
-            coord (Vector): Initial state vector (must have length 3)
+            coord (Vector): Initial state vector (must have length dim)
 
         Raises:
-            ValueError: If coordinate vector length is not 3
+            ValueError: If coordinate vector length is not dim
         """
-        if len(coord) != 3:
-            raise ValueError("State vector must have length 3")
+        if len(coord) != self.dim:
+            msg = f"State vector must have length {self.dim}"
+            raise ValueError(msg)
         logger.debug("Setting initial coord: %s for system: %s", coord, self.name)
         self.init_coord = coord
 
@@ -79,6 +127,76 @@ class System:
         """
         return self.jitted_func if jitted else self.func
 
+    def get_inplace_func(self, jitted: bool = True) -> SystemInplaceCallable:
+        """
+        Get in-place system function.
+
+        The in-place function takes (state, params, out) and writes the derivative into out
+        instead of allocating a new vector.
+
+        Args:
+            jitted (bool, optional): Whether to return JIT-compiled version. Defaults to True.
+
+        Returns:
+            SystemInplaceCallable: In-place system function (JIT-compiled or original)
+        """
+        func = self.jitted_inplace_func if jitted else self.inplace_func
+        assert func is not None
+        return func
+
+    def get_jacobian_func(self, jitted: bool = True) -> JacobianCallable:
+        """
+        Get Jacobian function.
+
+        The Jacobian function takes (state, params) and returns the matrix
+        `J[i, j] = d f_i / d state_j`.
+
+        Args:
+            jitted (bool, optional): Whether to return JIT-compiled version. Defaults to True.
+
+        Returns:
+            JacobianCallable: Jacobian function (JIT-compiled or original)
+        """
+        func = self.jitted_jacobian_func if jitted else self.jacobian_func
+        assert func is not None
+        return func
+
+    def jacobian(
+        self, state: Vector, params: Vector | None = None, use_jit: bool | None = None
+    ) -> Vector:
+        """
+        Evaluate the Jacobian at one state or a batch of states.
+
+        Batches are evaluated in parallel when JIT compilation is enabled.
+
+        Args:
+            state (Vector): State vector, or array of states (N x dim)
+            params (Vector | None, optional): Parameters. Defaults to the system parameters.
+            use_jit (bool | None, optional): Whether to use Numba JIT compilation.
+                Defaults to True.
+
+        Returns:
+            Vector: Jacobian matrix (dim x dim), or one matrix per state (N x dim x dim)
+
+        Raises:
+            ValueError: If state is not a vector or a 2D array of states
+        """
+        jit_enabled = True if use_jit is None else use_jit
+        states = np.ascontiguousarray(state, dtype=np.float64)
+        params = np.ascontiguousarray(self.params if params is None else params, np.float64)
+        func = self.get_jacobian_func(jit_enabled)
+        if states.ndim == 1:
+            return func(states, params)
+        if states.ndim != 2:
+            raise ValueError("State must be a vector or Nxdim array")
+        batch_func: Callable[..., Vector] = (
+            _jacobian_batch_jitted if jit_enabled else _jacobian_batch_impl
+        )
+        return batch_func(func, states, params)
+
+    def __repr__(self) -> str:
+        return f"System(name={self.name}, dim={self.dim})"
+
 
 F = TypeVar("F", bound=SystemCallable)
 
@@ -90,7 +208,7 @@ class SystemRegistry:
     Each system must be registered with:
         - Unique name
         - Default parameters and their names
-        - Initial coordinates
+        - Initial coordinates, whose length sets the state dimension
         - Optional plotting limits and academic reference
 
     Systems are automatically JIT-compiled during registration.
@@ -123,21 +241,30 @@ class SystemRegistry:
         reference: str = "",
         init_coord: Vector,
         plot_lims: PlotLimits | None = None,
+        inplace: SystemInplaceCallable | None = None,
+        jacobian: JacobianCallable | None = None,
     ) -> Callable[[F], F]:
         """
         Register a system function in the SystemRegistry.
 
         Decorator that registers a system function and creates a JIT-compiled version.
+        Module-level system functions are compiled with Numba's on-disk cache enabled.
         The registered system must take (state, params) Vector type arguments and
-        return the next state vector.
+        return the derivative vector, which has the same length as the state. States
+        may have any dimension.
 
         Args:
             name (str): Unique identifier for the system
             default_params (Vector): Default parameter values
             param_names (list[str]): Names of parameters
             reference (str, optional): Academic reference. Defaults to "".
-            init_coord (Vector): Initial state vector
+            init_coord (Vector): Initial state vector, which sets the state dimension
             plot_lims (PlotLimits | None, optional): Plotting limits. Defaults to None.
+            inplace (SystemInplaceCallable | None, optional): Hand-written in-place variant
+                taking (state, params, out). Generated from the system function if None.
+            jacobian (JacobianCallable | None, optional): Hand-written analytic Jacobian
+                taking (state, params). Generated from the system function by automatic
+                differentiation if None.
 
         Returns:
             Callable[[F], F]: Decorator function that registers and JIT-compiles the system
@@ -163,7 +290,7 @@ class SystemRegistry:
                 msg = f"System {name} already registered"
                 raise ValueError(msg)
 
-            jitted_f = f if cls.is_jitted(f) else njit(f)
+            jitted_f = f if cls.is_jitted(f) else njit(f, cache=is_cacheable(f))
             cls._systems[name] = System(
                 func=f,
                 jitted_func=jitted_f,
@@ -173,6 +300,8 @@ class SystemRegistry:
                 reference=reference,
                 init_coord=init_coord,
                 plot_lims=plot_lims,
+                inplace_func=inplace,
+                jacobian_func=jacobian,
             )
             return f
 
@@ -220,4 +349,4 @@ class SystemRegistry:
         Returns:
             bool: True if function is JIT-compiled
         """
-        return isinstance(func, Dispatcher)
+        return is_jitted(func)
@@ -7,6 +7,17 @@ from numpy.typing import NDArray
 Vector: TypeAlias = NDArray[np.float64]
 SystemCallable: TypeAlias = Callable[[Vector, Vector], Vector]
 SolverCallable: TypeAlias = Callable[[SystemCallable, Vector, Vector, float], Vector]
+JacobianCallable: TypeAlias = Callable[[Vector, Vector], Vector]
+SystemInplaceCallable: TypeAlias = Callable[[Vector, Vector, Vector], None]
+SolverInplaceCallable: TypeAlias = Callable[
+    [SystemInplaceCallable, Vector, Vector, float, Vector, Vector], None
+]
+MultistepSolverCallable: TypeAlias = Callable[
+    [SystemInplaceCallable, Vector, Vector, float, Vector, Vector, Vector], None
+]
+AdaptiveSolverCallable: TypeAlias = Callable[
+    [SystemCallable, Vector, Vector, Vector, float], tuple[Vector, Vector, Vector]
+]
 
 
 class PlotLimits(TypedDict):
@@ -0,0 +1,28 @@
+import numpy as np
+from numba.extending import register_jitable
+from numpy.typing import NDArray
+
+from attractors.type_defs import Vector
+
+
+@register_jitable
+def accumulate(
+    hist: NDArray[np.int64], point: Vector, axes: NDArray[np.int64], bounds: Vector
+) -> None:
+    """
+    Add a point projected onto two axes to a 2D histogram.
+
+    Bins follow `np.histogram2d`, with the last bin along each axis including its upper
+    edge and points outside the bounds ignored. Usable from jitted and non-jitted code.
+
+    Args:
+        hist (NDArray[np.int64]): Histogram of shape (nx, ny), updated in place
+        point (Vector): State to add
+        axes (NDArray[np.int64]): State components to project onto
+        bounds (Vector): Histogram bounds as (x0, x1, y0, y1)
+    """
+    nx, ny = hist.shape
+    u = (point[axes[0]] - bounds[0]) / (bounds[1] - bounds[0])
+    v = (point[axes[1]] - bounds[2]) / (bounds[3] - bounds[2])
+    if 0.0 <= u <= 1.0 and 0.0 <= v <= 1.0:
+        hist[min(int(u * nx), nx - 1), min(int(v * ny), ny - 1)] += 1
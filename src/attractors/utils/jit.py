@@ -0,0 +1,40 @@
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from numba.core.dispatcher import Dispatcher
+
+
+def is_jitted(func: Callable[..., Any]) -> bool:
+    """
+    Check if a function is JIT-compiled.
+
+    Args:
+        func (Callable[..., Any]): Function to check
+
+    Returns:
+        bool: True if function is a Numba dispatcher
+    """
+    return isinstance(func, Dispatcher)
+
+
+def is_cacheable(func: Callable[..., Any]) -> bool:
+    """
+    Check whether Numba can cache a function on disk across processes.
+
+    Only module-level functions defined in a source file are cached, since nested functions
+    and closures are re-created, and would be re-cached, in every process.
+
+    Args:
+        func (Callable[..., Any]): Function to check
+
+    Returns:
+        bool: True if the function can be compiled with `cache=True`
+    """
+    code = getattr(func, "__code__", None)
+    return (
+        code is not None
+        and getattr(func, "__closure__", None) is None
+        and "<locals>" not in func.__qualname__
+        and Path(code.co_filename).is_file()
+    )
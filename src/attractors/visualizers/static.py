@@ -1,7 +1,12 @@
 from typing import Any
 
+from matplotlib import pyplot as plt
+
+from attractors.solvers.registry import Solver
 from attractors.type_defs import Vector
 from attractors.visualizers.base import BasePlotter
+from attractors.visualizers.utils.density import DensityScaling, render_density
+from attractors.visualizers.utils.projection import flow_density, view_matrix
 
 
 class StaticPlotter(BasePlotter):
@@ -57,3 +62,68 @@ class StaticPlotter(BasePlotter):
                 **line_kwargs,
             )
         return self
+
+    def visualize_density(
+        self,
+        solver: Solver,
+        steps: int,
+        dt: float,
+        bins: int | tuple[int, int] = 1024,
+        bounds: tuple[tuple[float, float], tuple[float, float]] | None = None,
+        view: Vector | None = None,
+        transient_steps: int = 0,
+        scaling: DensityScaling = DensityScaling.LOG,
+        gamma: float = 1.0,
+        use_jit: bool | None = None,
+    ) -> "StaticPlotter":
+        """
+        Integrate the system and plot the density of its projected trajectory.
+
+        Unlike `visualize`, the trajectory is never stored: states are binned into an image
+        inside the integration kernel by `flow_density` and tone mapped by `render_density`,
+        so memory use is fixed by the image size for any number of steps. The rendered
+        image is kept in the `image` attribute.
+
+        Args:
+            solver (Solver): Single-step fixed-step solver to use for integration
+            steps (int): Number of integration steps
+            dt (float): Time step size
+            bins (int | tuple[int, int]): Image width and height in pixels, or both.
+                Defaults to 1024.
+            bounds (tuple[tuple[float, float], tuple[float, float]] | None): Image bounds in
+                projected coordinates. Defaults to bounds estimated by `flow_density`.
+            view (Vector | None): Projection matrix (2 x dim). Defaults to the default
+                matplotlib 3D view for 3D systems and the first two components otherwise.
+            transient_steps (int): Number of initial steps not drawn. Defaults to 0.
+            scaling (DensityScaling): Scaling of the counts. Defaults to DensityScaling.LOG.
+            gamma (float): Exponent applied to the scaled counts. Defaults to 1.0.
+            use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+
+        Returns:
+            StaticPlotter: Self reference for method chaining
+        """
+        if view is None and self.system.dim == 3:
+            view = view_matrix()
+        counts, xedges, yedges = flow_density(
+            self.system,
+            solver,
+            steps,
+            dt,
+            bins=bins,
+            bounds=bounds,
+            view=view,
+            transient_steps=transient_steps,
+            use_jit=use_jit,
+        )
+        self.image = render_density(counts, self.theme, scaling=scaling, gamma=gamma)
+
+        self.fig = plt.figure(facecolor=self.theme.background, **self.fig_kwargs)
+        self.ax = self.fig.add_axes((0.0, 0.0, 1.0, 1.0))
+        self.ax.set_facecolor(self.theme.background)
+        self.ax.set_axis_off()
+        self.ax.imshow(
+            self.image,
+            extent=(xedges[0], xedges[-1], yedges[0], yedges[-1]),
+            interpolation="nearest",
+        )
+        return self
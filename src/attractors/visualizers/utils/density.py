@@ -0,0 +1,77 @@
+from enum import Enum
+
+import matplotlib.colors
+import numpy as np
+from numpy.typing import NDArray
+
+from attractors.themes.theme import Theme
+from attractors.type_defs import Vector
+
+
+class DensityScaling(Enum):
+    """Scalings of point counts before color mapping.
+    linear: Counts relative to the maximum count
+    sqrt: Square root of the relative counts
+    log: Logarithm of the counts, which keeps sparse regions visible next to dense ones
+    """
+
+    LINEAR = "linear"
+    SQRT = "sqrt"
+    LOG = "log"
+
+
+def _scale_counts(counts: NDArray[np.int64], scaling: DensityScaling) -> Vector:
+    """Scale non-negative counts to [0, 1]."""
+    peak = counts.max()
+    if peak <= 0:
+        return np.zeros(counts.shape, dtype=np.float64)
+    scaled: Vector = counts / np.float64(peak)
+    if scaling == DensityScaling.LOG:
+        scaled = np.log1p(counts, dtype=np.float64) / np.log1p(np.float64(peak))
+    elif scaling == DensityScaling.SQRT:
+        scaled = np.sqrt(scaled)
+    return scaled
+
+
+def render_density(
+    counts: NDArray[np.int64],
+    theme: Theme,
+    scaling: DensityScaling = DensityScaling.LOG,
+    gamma: float = 1.0,
+) -> NDArray[np.uint8]:
+    """
+    Render a 2D histogram of point counts as an RGBA image in the colors of a theme.
+
+    Counts are scaled to [0, 1], raised to the power gamma and mapped through the theme
+    colormap, while empty bins take the theme background color. Histograms are indexed as
+    by `np.histogram2d` (first axis horizontal), so the image is transposed and flipped to
+    put the first bin of the second axis at the bottom.
+
+    Args:
+        counts (NDArray[np.int64]): Point counts of shape (bins_x, bins_y), as returned by
+            `map_density` or `poincare_histogram`
+        theme (Theme): Theme providing the colormap and background color
+        scaling (DensityScaling): Scaling of the counts. Defaults to DensityScaling.LOG.
+        gamma (float): Exponent applied to the scaled counts, values below 1 brighten
+            sparse regions. Defaults to 1.0.
+
+    Returns:
+        NDArray[np.uint8]: RGBA image of shape (bins_y, bins_x, 4)
+
+    Raises:
+        ValueError: If counts is not a 2D array of non-negative counts or gamma is not
+            positive
+    """
+    counts = np.asarray(counts)
+    if counts.ndim != 2:
+        raise ValueError("Counts must be a 2D array")
+    if counts.size and counts.min() < 0:
+        raise ValueError("Counts must be non-negative")
+    if gamma <= 0:
+        raise ValueError("Gamma must be positive")
+
+    values = _scale_counts(counts, scaling) ** gamma
+    image = theme.colormap(values.T[::-1], bytes=True)
+    background = matplotlib.colors.to_rgba(theme.background)
+    image[counts.T[::-1] == 0] = np.round(np.multiply(background, 255))
+    return np.ascontiguousarray(image, dtype=np.uint8)
@@ -31,15 +31,15 @@ def _downsample_trajectory(
     Downsample trajectory while preserving important features.
 
     Args:
-        trajectory (Vector): Input trajectory points (N x 3)
+        trajectory (Vector): Input trajectory points (N x dim)
         compression (float): Compression ratio from 0.0 (no compression) to 1.0 (max compression). Defaults to 0.0.
         method (CompressionMethod): Compression method to use. Defaults to CompressionMethod.VELOCITY.
 
     Returns:
         Downsampled trajectory
     """  # noqa: E501
-    if trajectory.ndim != 2 or trajectory.shape[1] != 3:
-        raise ValueError("Trajectory must be Nx3 array")
+    if trajectory.ndim != 2:
+        raise ValueError("Trajectory must be Nxdim array")
 
     if not 0.0 <= compression <= 1.0:
         raise ValueError("Compression must be between 0 and 1")
@@ -71,9 +71,15 @@ def _downsample_trajectory(
         else:  # curvature
             speed = np.linalg.norm(velocity, axis=1)
             speed = np.maximum(speed, 1e-10)
-            curvature = np.linalg.norm(np.cross(velocity[:-1], acceleration), axis=1) / (
-                speed[:-1] ** 3
+            # |v x a| generalized to any dimension by Lagrange's identity
+            cross = np.sqrt(
+                np.maximum(
+                    speed[:-1] ** 2 * np.sum(acceleration**2, axis=1)
+                    - np.sum(velocity[:-1] * acceleration, axis=1) ** 2,
+                    0.0,
+                )
             )
+            curvature = cross / speed[:-1] ** 3
             importance = np.pad(curvature, (1, 1), mode="edge")
             importance = 0.8 * (importance / np.maximum(importance.max(), 1e-10)) + 0.2
 
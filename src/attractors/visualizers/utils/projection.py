@@ -0,0 +1,281 @@
+from collections.abc import Callable
+
+import numpy as np
+from numba import types
+from numba.extending import register_jitable
+from numpy.typing import NDArray
+
+from attractors.solvers.core import integrate_system
+from attractors.solvers.kernels import KernelCache, KernelTarget, _reference_step
+from attractors.solvers.registry import Solver
+from attractors.systems.registry import System
+from attractors.type_defs import SolverInplaceCallable, SystemInplaceCallable, Vector
+from attractors.utils.logger import setup_logger
+
+logger = setup_logger(name=__name__)
+
+PILOT_STEPS = 1_000_000
+PILOT_SAVE_EVERY = 100
+PILOT_MARGIN = 0.05
+
+
+def view_matrix(azimuth: float = -60.0, elevation: float = 30.0, roll: float = 0.0) -> Vector:
+    """Build the orthographic projection of a camera looking at 3D states.
+
+    The camera looks at the origin from the direction given by azimuth and elevation in
+    degrees and is rotated about the viewing axis by roll, with the semantics of
+    `ax.view_init` for matplotlib 3D axes, so that the projected image matches
+    `StaticPlotter` with the same view angles and an orthographic projection.
+
+    Args:
+        azimuth (float): Rotation about the z axis. Defaults to -60.0.
+        elevation (float): Angle above the xy plane. Defaults to 30.0.
+        roll (float): Rotation of the camera about the viewing axis, turning the image
+            counterclockwise. Defaults to 0.0.
+
+    Returns:
+        Vector: Projection matrix (2 x 3) mapping states to horizontal and vertical image
+            coordinates
+    """
+    az, el, rl = np.radians(azimuth), np.radians(elevation), np.radians(roll)
+    camera = np.array(
+        [
+            [-np.sin(az), np.cos(az), 0.0],
+            [-np.sin(el) * np.cos(az), -np.sin(el) * np.sin(az), np.cos(el)],
+        ]
+    )
+    rotation = np.array([[np.cos(rl), -np.sin(rl)], [np.sin(rl), np.cos(rl)]])
+    view: Vector = rotation @ camera
+    return view
+
+
+@register_jitable
+def _bin_state(hist: NDArray[np.int64], state: Vector, transform: Vector) -> None:
+    """Add a state to a histogram through an affine map to bin coordinates.
+
+    The map is the projection onto the image plane composed with the scaling of the bounds
+    to bin indices, so binning takes one multiply-add per matrix entry and no division.
+    """
+    nx, ny = hist.shape
+    dim = len(state)
+    u = transform[0, dim]
+    v = transform[1, dim]
+    for j in range(dim):
+        u += transform[0, j] * state[j]
+        v += transform[1, j] * state[j]
+    if 0.0 <= u <= nx and 0.0 <= v <= ny:
+        hist[min(int(u), nx - 1), min(int(v), ny - 1)] += 1
+
+
+def _bin_transform(view: Vector, bounds: Vector, nx: int, ny: int) -> Vector:
+    """Compose a projection with the scaling of the bounds to bin coordinates."""
+    scale = np.array([nx / (bounds[1] - bounds[0]), ny / (bounds[3] - bounds[2])])
+    offset = -np.array([bounds[0], bounds[2]]) * scale
+    return np.ascontiguousarray(np.column_stack((view * scale[:, None], offset)))
+
+
+# non-jitted
+def _projection_impl(
+    system_func: SystemInplaceCallable,
+    solver_step: SolverInplaceCallable,
+    work: Vector,
+    state: Vector,
+    params: Vector,
+    steps: int,
+    dt: float,
+    skip: int,
+    transform: Vector,
+    hist: NDArray[np.int64],
+) -> None:
+    current, following = state.copy(), np.empty_like(state)
+    for n in range(steps):
+        solver_step(system_func, current, params, dt, work, following)
+        current, following = following, current
+        if n >= skip:
+            _bin_state(hist, current, transform)
+
+
+# jitted
+@KernelCache.register(
+    "projection",
+    signature=(
+        types.float64[::1],
+        types.float64[::1],
+        types.int64,
+        types.float64,
+        types.int64,
+        types.float64[:, ::1],
+        types.int64[:, ::1],
+    ),
+)
+def _build_projection_kernel(target: KernelTarget) -> Callable[..., None]:
+    system_func = target.system_func
+    solver_step = target.solver_step
+    work_size = target.work_size
+
+    def kernel(
+        state: Vector,
+        params: Vector,
+        steps: int,
+        dt: float,
+        skip: int,
+        transform: Vector,
+        hist: NDArray[np.int64],
+    ) -> None:
+        dim = len(state)
+        work = np.empty((work_size, dim), dtype=np.float64)
+        buffers = np.empty((2, dim), dtype=np.float64)
+        current, following = buffers[0], buffers[1]
+        current[:] = state
+        for n in range(steps):
+            solver_step(system_func, current, params, dt, work, following)
+            current, following = following, current
+            if n >= skip:
+                _bin_state(hist, current, transform)
+
+    return kernel
+
+
+def _resolve_view(system: System, view: Vector | None, axes: tuple[int, int]) -> Vector:
+    dim = system.dim
+    if view is None:
+        if not all(0 <= axis < dim for axis in axes):
+            msg = f"Axes must be state components between 0 and {dim - 1}"
+            raise ValueError(msg)
+        view = np.zeros((2, dim), dtype=np.float64)
+        view[0, axes[0]] = view[1, axes[1]] = 1.0
+    view = np.ascontiguousarray(view, dtype=np.float64)
+    if view.shape != (2, dim):
+        msg = f"View matrix must be 2x{dim} array"
+        raise ValueError(msg)
+    return view
+
+
+def _pilot_bounds(
+    system: System,
+    solver: Solver,
+    steps: int,
+    dt: float,
+    transient_steps: int,
+    view: Vector,
+    use_jit: bool | None,
+) -> tuple[tuple[float, float], tuple[float, float]]:
+    """Estimate histogram bounds from the projection of a short run."""
+    pilot_steps = min(steps, transient_steps + PILOT_STEPS)
+    save_every = max(1, min(PILOT_SAVE_EVERY, (pilot_steps - transient_steps) // 1_000))
+    trajectory, _ = integrate_system(
+        system,
+        solver,
+        pilot_steps,
+        dt,
+        use_jit,
+        transient_steps=transient_steps,
+        save_every=save_every,
+    )
+    projected = trajectory @ view.T
+    low, high = projected.min(axis=0), projected.max(axis=0)
+    margin = PILOT_MARGIN * np.maximum(high - low, 1e-12)
+    low, high = low - margin, high + margin
+    logger.debug("Pilot bounds: %s, %s", low, high)
+    return (float(low[0]), float(high[0])), (float(low[1]), float(high[1]))
+
+
+def flow_density(
+    system: System,
+    solver: Solver,
+    steps: int,
+    dt: float,
+    bins: int | tuple[int, int] = 1024,
+    bounds: tuple[tuple[float, float], tuple[float, float]] | None = None,
+    view: Vector | None = None,
+    axes: tuple[int, int] = (0, 1),
+    transient_steps: int = 0,
+    use_jit: bool | None = None,
+) -> tuple[NDArray[np.int64], Vector, Vector]:
+    """Accumulates the projection of a trajectory into a 2D histogram while integrating.
+
+    Every state after the transient is projected onto the image plane, either by a view
+    matrix or onto two state components, and binned inside the integration loop. Memory use
+    is fixed by the number of bins however many steps are integrated, so runs of 1e8 to 1e9
+    steps, whose trajectory could not be stored, can be rendered with `render_density`.
+    Bins follow `np.histogram2d` up to rounding of states on bin edges, with points outside
+    the bounds ignored.
+
+    Args:
+        system (System): System to integrate
+        solver (Solver): Single-step fixed-step solver to use for integration
+        steps (int): Number of integration steps
+        dt (float): Time step size
+        bins (int | tuple[int, int]): Number of bins along both image axes or each axis.
+            Defaults to 1024.
+        bounds (tuple[tuple[float, float], tuple[float, float]] | None): Lower and upper
+            bounds of the histogram along both image axes. Defaults to the range of the
+            projection over up to 1,000,000 steps after the transient, padded by 5%.
+        view (Vector | None): Projection matrix (2 x dim) mapping states to image
+            coordinates, e.g. from `view_matrix`. Defaults to None.
+        axes (tuple[int, int]): State components projected onto if no view matrix is given.
+            Defaults to (0, 1).
+        transient_steps (int): Number of initial steps not binned. Defaults to 0.
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+
+    Raises:
+        ValueError: If steps or dt are not positive, the solver is adaptive or multistep,
+            transient_steps is not in [0, steps), bins are not positive, bounds are empty,
+            axes are not valid state components or the view matrix is not 2 x dim
+
+    Returns:
+        tuple[NDArray[np.int64], Vector, Vector]: A tuple containing:
+            - NDArray[np.int64]: State counts of shape (bins_x, bins_y)
+            - Vector: Bin edges along the horizontal image axis
+            - Vector: Bin edges along the vertical image axis
+
+    Examples:
+        >>> counts, _, _ = flow_density(system, solver, 500_000_000, 0.001, view=view_matrix())
+        >>> image = render_density(counts, theme, gamma=0.5)
+    """
+    if steps <= 0:
+        raise ValueError("Number of steps must be positive")
+    if dt <= 0:
+        raise ValueError("Time step must be positive")
+    if solver.adaptive:
+        msg = f"Solver {solver.name} is adaptive, use a fixed-step solver instead"
+        raise ValueError(msg)
+    if solver.multistep:
+        msg = f"Solver {solver.name} is multistep, use a single-step solver instead"
+        raise ValueError(msg)
+    if not 0 <= transient_steps < steps:
+        raise ValueError("Transient steps must be non-negative and less than the number of steps")
+    nx, ny = (bins, bins) if isinstance(bins, int) else bins
+    if nx <= 0 or ny <= 0:
+        raise ValueError("Number of bins must be positive")
+    view = _resolve_view(system, view, axes)
+    if bounds is None:
+        bounds = _pilot_bounds(system, solver, steps, dt, transient_steps, view, use_jit)
+    (x0, x1), (y0, y1) = bounds
+    if not (x0 < x1 and y0 < y1):
+        raise ValueError("Histogram bounds must be increasing")
+
+    jit_enabled = True if use_jit is None else use_jit
+    logger.debug("JIT enabled: %s", jit_enabled)
+    logger.info("Projecting system: %s with solver: %s", system, solver)
+    logger.info("Steps: %d, dt: %.6g, bins: %dx%d", steps, dt, nx, ny)
+
+    hist = np.zeros((nx, ny), dtype=np.int64)
+    state = np.ascontiguousarray(system.init_coord, dtype=np.float64)
+    params = np.ascontiguousarray(system.params, dtype=np.float64)
+    args = (
+        state,
+        params,
+        steps,
+        float(dt),
+        transient_steps,
+        _bin_transform(view, np.array([x0, x1, y0, y1]), nx, ny),
+        hist,
+    )
+    if jit_enabled:
+        KernelCache.get("projection", system, solver, np.float64)(*args)
+    else:
+        solver_step, work_size = _reference_step(system, solver)
+        work = np.empty((work_size, len(state)), dtype=np.float64)
+        _projection_impl(system.get_inplace_func(jitted=False), solver_step, work, *args)
+    return hist, np.linspace(x0, x1, nx + 1), np.linspace(y0, y1, ny + 1)
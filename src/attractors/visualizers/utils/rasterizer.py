@@ -0,0 +1,282 @@
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from numba import njit, prange
+from numba.extending import register_jitable
+from numpy.typing import NDArray
+
+from attractors.type_defs import Vector
+
+TILE_ROWS = 16
+# distance beyond a band up to which segments are kept when clipping, covering the rounded
+# first column and the second pixel drawn next to the segment
+CLIP_MARGIN = 1.5
+
+
+@register_jitable
+def _clip_segment(
+    x0: float, y0: float, x1: float, y1: float, left: float, right: float, top: float, bottom: float
+) -> tuple[float, float]:
+    """Clip a segment to a rectangle with the Liang-Barsky algorithm.
+
+    Returns the interval of the segment parameter, running from 0 at (x0, y0) to 1 at
+    (x1, y1), that lies inside the rectangle. The interval is empty if the segment misses it.
+    """
+    lo, hi = 0.0, 1.0
+    dx, dy = x1 - x0, y1 - y0
+    for p, q in ((-dx, x0 - left), (dx, right - x0), (-dy, y0 - top), (dy, bottom - y0)):
+        if p == 0.0:
+            if q < 0.0:
+                return 1.0, 0.0
+        elif p < 0.0:
+            lo = max(lo, q / p)
+        else:
+            hi = min(hi, q / p)
+    return lo, hi
+
+
+@register_jitable
+def _segment_tiles(
+    points: Vector, i: int, width: int, height: int, tile_rows: int
+) -> tuple[int, int]:
+    """Get the first and last band of rows a segment may touch, empty if it is not drawn."""
+    x0, y0, x1, y1 = points[i, 0], points[i, 1], points[i + 1, 0], points[i + 1, 1]
+    if not (np.isfinite(x0) and np.isfinite(y0) and np.isfinite(x1) and np.isfinite(y1)):
+        return 1, 0
+    lo, hi = _clip_segment(
+        x0, y0, x1, y1, -CLIP_MARGIN, width + CLIP_MARGIN, -CLIP_MARGIN, height + CLIP_MARGIN
+    )
+    if lo > hi:
+        return 1, 0
+    ya, yb = y0 + lo * (y1 - y0), y0 + hi * (y1 - y0)
+    first = max(int(np.floor(min(ya, yb))) - 1, 0)
+    last = min(int(np.ceil(max(ya, yb))) + 1, height - 1)
+    if first > last:
+        return 1, 0
+    return first // tile_rows, last // tile_rows
+
+
+# non-jitted
+def _bin_segments_impl(
+    points: Vector, width: int, height: int, tile_rows: int
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Sort the segments of a polyline into bands of image rows.
+
+    Returns the segment indices of every band in CSR format, with segments spanning several
+    bands listed in each of them.
+    """
+    n_segments = max(len(points) - 1, 0)
+    spans = np.empty((n_segments, 2), dtype=np.int64)
+    for i in prange(n_segments):
+        spans[i, 0], spans[i, 1] = _segment_tiles(points, i, width, height, tile_rows)
+
+    n_tiles = (height + tile_rows - 1) // tile_rows
+    counts = np.zeros(n_tiles + 1, dtype=np.int64)
+    for i in range(n_segments):
+        for tile in range(spans[i, 0], spans[i, 1] + 1):
+            counts[tile + 1] += 1
+
+    offsets = np.cumsum(counts)
+    fill = offsets[:-1].copy()
+    order = np.empty(offsets[-1], dtype=np.int64)
+    for i in range(n_segments):
+        for tile in range(spans[i, 0], spans[i, 1] + 1):
+            order[fill[tile]] = i
+            fill[tile] += 1
+    return offsets, order
+
+
+# jitted
+_bin_segments_jitted = njit(parallel=True, nogil=True)(_bin_segments_impl)
+
+
+@register_jitable
+def _plot(
+    accum: Vector,
+    row0: int,
+    x: int,
+    y: int,
+    steep: bool,
+    weight: float,
+    color0: NDArray[np.uint8],
+    color1: NDArray[np.uint8],
+    t: float,
+) -> None:
+    """Add a weighted color to a pixel of a band, given in swapped coordinates if steep."""
+    row, col = (x, y) if steep else (y, x)
+    row -= row0
+    if 0 <= row < accum.shape[0] and 0 <= col < accum.shape[1] and weight > 0.0:
+        for k in range(3):
+            accum[row, col, k] += weight * (color0[k] + t * (np.float64(color1[k]) - color0[k]))
+        accum[row, col, 3] += weight
+
+
+@register_jitable
+def _draw_segment(
+    accum: Vector,
+    row0: int,
+    p0: Vector,
+    p1: Vector,
+    color0: NDArray[np.uint8],
+    color1: NDArray[np.uint8],
+) -> None:
+    """Draw an anti-aliased segment with Xiaolin Wu's algorithm into a band of rows.
+
+    Columns along the major axis are covered half-open, from the column of the first to the
+    column before the last endpoint, so consecutive segments of a polyline do not brighten
+    their shared vertex. The columns are limited to the part of the segment within
+    `CLIP_MARGIN` of the band, so that the work is bounded by the band size however far the
+    segment extends beyond it.
+    """
+    ax, ay, bx, by = p0[0], p0[1], p1[0], p1[1]
+    rows, cols = accum.shape[0], accum.shape[1]
+    lo, hi = _clip_segment(
+        ax,
+        ay,
+        bx,
+        by,
+        -CLIP_MARGIN,
+        cols + CLIP_MARGIN,
+        row0 - CLIP_MARGIN,
+        row0 + rows + CLIP_MARGIN,
+    )
+    if lo > hi:
+        return
+
+    x0, y0, x1, y1 = ax, ay, bx, by
+    steep = abs(y1 - y0) > abs(x1 - x0)
+    if steep:
+        x0, y0, x1, y1 = y0, x0, y1, x1
+    reverse = x0 > x1
+    if reverse:
+        x0, y0, x1, y1 = x1, y1, x0, y0
+    dx = x1 - x0
+    gradient = (y1 - y0) / dx if dx > 0.0 else 0.0
+
+    # the major coordinate of the clipped part, which is bounded by the band
+    a, b = (ay, by) if steep else (ax, bx)
+    ca, cb = a + lo * (b - a), a + hi * (b - a)
+    first, last = min(ca, cb), max(ca, cb)
+    start = int(max(np.floor(x0 + 0.5), np.floor(first)))
+    stop = int(min(np.floor(x1 + 0.5), np.floor(last) + 1.0))
+    for x in range(start, stop):
+        y = y0 + gradient * (x - x0)
+        base = np.floor(y)
+        frac = y - base
+        t = min(max((x - x0) / dx, 0.0), 1.0)
+        t = 1.0 - t if reverse else t
+        _plot(accum, row0, x, int(base), steep, 1.0 - frac, color0, color1, t)
+        _plot(accum, row0, x, int(base) + 1, steep, frac, color0, color1, t)
+
+
+# non-jitted
+def _rasterize_impl(
+    points: Vector,
+    colors: NDArray[np.uint8],
+    offsets: NDArray[np.int64],
+    order: NDArray[np.int64],
+    width: int,
+    height: int,
+    tile_rows: int,
+    background: NDArray[np.uint8],
+    intensity: float,
+) -> NDArray[np.uint8]:
+    """Draw the segments of every band of rows and composite it over the background.
+
+    Bands are independent, so each accumulates into a private buffer. Every pixel holds
+    the summed coverage and coverage-weighted color of the segments crossing it, which is
+    composited with opacity 1 - exp(-intensity * coverage) and the mean color.
+    """
+    image = np.empty((height, width, 4), dtype=np.uint8)
+    for tile in prange(len(offsets) - 1):
+        row0 = tile * tile_rows
+        rows = min(tile_rows, height - row0)
+        accum = np.zeros((rows, width, 4), dtype=np.float64)
+        for k in range(offsets[tile], offsets[tile + 1]):
+            i = order[k]
+            _draw_segment(accum, row0, points[i], points[i + 1], colors[i], colors[i + 1])
+
+        for r in range(rows):
+            for c in range(width):
+                coverage = accum[r, c, 3]
+                alpha = 1.0 - np.exp(-intensity * coverage)
+                for k in range(3):
+                    mean = accum[r, c, k] / coverage if coverage > 0.0 else 0.0
+                    value = background[k] + alpha * (mean - background[k])
+                    image[row0 + r, c, k] = np.uint8(min(max(value + 0.5, 0.0), 255.0))
+                image[row0 + r, c, 3] = 255
+    return image
+
+
+# jitted
+_rasterize_jitted = njit(parallel=True, nogil=True)(_rasterize_impl)
+
+
+def rasterize_polyline(
+    points: Vector,
+    colors: NDArray[np.uint8],
+    width: int,
+    height: int,
+    background: NDArray[np.uint8],
+    intensity: float = 1.0,
+    use_jit: bool | None = None,
+) -> NDArray[np.uint8]:
+    """
+    Draw a polyline with per-point colors into an RGBA image.
+
+    Segments are drawn anti-aliased with Xiaolin Wu's algorithm and blended additively, so
+    overlapping segments brighten towards their mean color. With JIT compilation, the image
+    is split into bands of rows drawn and composited in parallel on all available cores,
+    each band only visiting the segments crossing it. Segments are clipped to the image, so
+    endpoints far outside it cost no more than those at its edge, and segments with a
+    non-finite endpoint are skipped.
+
+    Args:
+        points (Vector): Vertices in pixel coordinates (N x 2), with x to the right and y
+            down from the top left corner of the image
+        colors (NDArray[np.uint8]): 8-bit RGB colors of the vertices (N x 3), e.g. from
+            `colormap(values, bytes=True)[:, :3]`, interpolated along each segment
+        width (int): Image width in pixels
+        height (int): Image height in pixels
+        background (NDArray[np.uint8]): 8-bit RGB background color
+        intensity (float): Opacity gained per unit of coverage, higher values saturate
+            with fewer overlapping segments. Defaults to 1.0.
+        use_jit (bool | None): Whether to use Numba JIT compilation. Defaults to True.
+
+    Returns:
+        NDArray[np.uint8]: Opaque RGBA image of shape (height, width, 4)
+
+    Raises:
+        ValueError: If the image size or intensity is not positive, or points and colors
+            do not match
+    """
+    if width <= 0 or height <= 0:
+        raise ValueError("Image size must be positive")
+    if intensity <= 0:
+        raise ValueError("Intensity must be positive")
+    points = np.ascontiguousarray(points, dtype=np.float64)
+    colors = np.ascontiguousarray(colors, dtype=np.uint8)
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError("Points must be Nx2 array")
+    if colors.shape != (len(points), 3):
+        msg = f"Colors must be {len(points)}x3 array"
+        raise ValueError(msg)
+
+    jit_enabled = True if use_jit is None else use_jit
+    bin_segments: Callable[..., Any] = _bin_segments_jitted if jit_enabled else _bin_segments_impl
+    rasterize: Callable[..., NDArray[np.uint8]] = (
+        _rasterize_jitted if jit_enabled else _rasterize_impl
+    )
+    offsets, order = bin_segments(points, width, height, TILE_ROWS)
+    return rasterize(
+        points,
+        colors,
+        offsets,
+        order,
+        width,
+        height,
+        TILE_ROWS,
+        np.ascontiguousarray(background, dtype=np.uint8),
+        float(intensity),
+    )
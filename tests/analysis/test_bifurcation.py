@@ -0,0 +1,181 @@
+import numpy as np
+import pytest
+from numba import njit
+
+from attractors import (
+    BifurcationMethod,
+    SolverRegistry,
+    SystemRegistry,
+    bifurcation_density,
+    bifurcation_diagram,
+    integrate_sweep,
+    param_grid,
+)
+from attractors.systems.registry import System
+from attractors.type_defs import Vector
+
+
+@pytest.fixture()
+def oscillator_system():
+    """Harmonic oscillator with a decaying z component, which has a closed-form solution"""
+
+    def system_func(state: Vector, params: Vector) -> Vector:
+        x, y, z = state
+        omega, gamma = params
+        return np.array([omega * y, -omega * x, -gamma * z], dtype=np.float64)
+
+    return System(
+        func=system_func,
+        jitted_func=njit()(system_func),
+        name="test_bifurcation_oscillator",
+        params=np.array([2.0, 0.5]),
+        param_names=["omega", "gamma"],
+        reference="test",
+        init_coord=np.array([1.0, 0.0, 1.0]),
+    )
+
+
+@pytest.fixture()
+def rossler():
+    return SystemRegistry.get("rossler")
+
+
+def local_maxima(x: Vector) -> Vector:
+    a, b, c = x[:-2], x[1:-1], x[2:]
+    peak = (b > a) & (b >= c)
+    return b[peak] - (c[peak] - a[peak]) ** 2 / (8.0 * (a[peak] - 2.0 * b[peak] + c[peak]))
+
+
+class TestBifurcation:
+    @pytest.mark.parametrize(
+        ("method", "expected"),
+        [
+            (BifurcationMethod.MAXIMA, 1.0),
+            (BifurcationMethod.MINIMA, -1.0),
+            (BifurcationMethod.SECTION, -1.0),
+        ],
+    )
+    def test_oscillator_extrema(self, oscillator_system, method, expected):
+        """Test every frequency yields the closed-form amplitude"""
+        rk4 = SolverRegistry.get("rk4")
+        params, values = bifurcation_diagram(
+            oscillator_system,
+            rk4,
+            "omega",
+            (1.0, 3.0),
+            9,
+            2000,
+            0.01,
+            method=method,
+            normal=[0.0, 1.0, 0.0],
+        )
+
+        np.testing.assert_array_equal(np.unique(params), np.linspace(1.0, 3.0, 9))
+        # crossings are interpolated linearly, extrema by a parabola
+        np.testing.assert_allclose(values, expected, atol=2e-4)
+
+    def test_matches_stored_trajectories(self, rossler):
+        """Test in-kernel maxima match maxima extracted from stored trajectories"""
+        rk4 = SolverRegistry.get("rk4")
+        steps, transient = 4000, 2000
+        params, values = bifurcation_diagram(
+            rossler, rk4, "c", (3.0, 6.0), 4, steps, 0.02, transient, block_size=1
+        )
+        grid = param_grid(rossler, c=np.linspace(3.0, 6.0, 4))
+        trajectories = integrate_sweep(rossler, rk4, grid, steps, 0.02)
+
+        for c, trajectory in zip(grid[:, 2], trajectories, strict=True):
+            # the kernel sees the initial state before the first stored one
+            x = np.concatenate([[rossler.init_coord[0]], trajectory[:, 0]])
+            expected = local_maxima(x[transient - 1 :])
+            np.testing.assert_allclose(values[params == c], expected, rtol=1e-12)
+
+    def test_warm_start_blocks(self, rossler):
+        """Test blocks start from the initial state and continue within the block"""
+        rk4 = SolverRegistry.get("rk4")
+        args = (rossler, rk4, "c", (3.0, 6.0), 8, 3000, 0.02, 1000)
+        cold_params, cold = bifurcation_diagram(*args, block_size=1)
+        warm_params, warm = bifurcation_diagram(*args, block_size=4)
+
+        for c in np.linspace(3.0, 6.0, 8)[[0, 4]]:
+            np.testing.assert_array_equal(warm[warm_params == c], cold[cold_params == c])
+        c = np.linspace(3.0, 6.0, 8)[1]
+        assert not np.array_equal(warm[warm_params == c], cold[cold_params == c])
+
+    @pytest.mark.parametrize("use_jit", [True, False])
+    def test_warm_start_after_divergence(self, rossler, use_jit):
+        """Test values after a diverging one restart from the initial state"""
+        rk4 = SolverRegistry.get("rk4")
+        args = (rossler, rk4, "a", (0.6, 0.2), 8, 20000, 0.01, 10000)
+        with np.errstate(all="ignore"):
+            cold_params, _ = bifurcation_diagram(*args, block_size=1, use_jit=use_jit)
+            warm_params, warm = bifurcation_diagram(*args, block_size=32, use_jit=use_jit)
+
+        assert np.all(np.isfinite(warm))
+        assert np.unique(cold_params).size > 1
+        np.testing.assert_array_equal(np.unique(warm_params), np.unique(cold_params))
+
+    @pytest.mark.parametrize("method", list(BifurcationMethod))
+    def test_jitted_vs_nonjit_consistency(self, rossler, method):
+        """Test the fused kernel matches the reference implementation"""
+        rk4 = SolverRegistry.get("rk4")
+        args = (rossler, rk4, "c", (2.0, 6.0), 10, 3000, 0.02, 1000)
+        kwargs = {"method": method, "normal": [0.0, 1.0, 0.0], "block_size": 3}
+        params1, values1 = bifurcation_diagram(*args, use_jit=False, **kwargs)
+        params2, values2 = bifurcation_diagram(*args, use_jit=True, **kwargs)
+
+        assert len(values1) > 10
+        np.testing.assert_array_equal(params1, params2)
+        np.testing.assert_allclose(values1, values2, rtol=1e-12)
+
+    def test_max_points(self, rossler):
+        """Test at most max_points are recorded per parameter value"""
+        rk4 = SolverRegistry.get("rk4")
+        params, _ = bifurcation_diagram(
+            rossler, rk4, "c", (2.0, 6.0), 5, 5000, 0.02, max_points=3, dtype=np.float32
+        )
+
+        assert len(params) == 15
+        assert np.all(np.unique(params, return_counts=True)[1] == 3)
+
+    def test_density(self, rossler):
+        """Test the density image counts the same points as the diagram"""
+        rk4 = SolverRegistry.get("rk4")
+        args = (rossler, rk4, "c", (2.0, 6.0), 6, 4000, 0.02)
+        params, values = bifurcation_diagram(*args, transient_steps=1000, max_points=1000)
+        counts, columns, edges = bifurcation_density(
+            *args, (0.0, 15.0), bins=30, transient_steps=1000
+        )
+
+        assert counts.shape == (6, 30)
+        np.testing.assert_allclose(columns, np.linspace(2.0, 6.0, 6))
+        for i, c in enumerate(columns):
+            expected, _ = np.histogram(values[params == c], bins=edges)
+            np.testing.assert_array_equal(counts[i], expected)
+
+    def test_error_handling(self, rossler):
+        """Test basic error handling"""
+        rk4 = SolverRegistry.get("rk4")
+        args = (rossler, rk4)
+        with pytest.raises(ValueError, match="Unknown parameter d"):
+            bifurcation_diagram(*args, "d", (0.0, 1.0), 10, 100, 0.01)
+
+        with pytest.raises(ValueError, match="Resolution must be positive"):
+            bifurcation_diagram(*args, "c", (0.0, 1.0), 0, 100, 0.01)
+
+        with pytest.raises(ValueError, match="Component must be between 0 and 2"):
+            bifurcation_diagram(*args, "c", (0.0, 1.0), 10, 100, 0.01, component=3)
+
+        with pytest.raises(ValueError, match="Section method requires a plane normal"):
+            bifurcation_diagram(
+                *args, "c", (0.0, 1.0), 10, 100, 0.01, method=BifurcationMethod.SECTION
+            )
+
+        with pytest.raises(ValueError, match="Block size must be positive"):
+            bifurcation_diagram(*args, "c", (0.0, 1.0), 10, 100, 0.01, block_size=0)
+
+        with pytest.raises(ValueError, match="Solver abm4 is multistep"):
+            bifurcation_diagram(rossler, SolverRegistry.get("abm4"), "c", (0.0, 1.0), 10, 100, 0.1)
+
+        with pytest.raises(ValueError, match="Value range must be increasing"):
+            bifurcation_density(*args, "c", (0.0, 1.0), 10, 100, 0.01, (1.0, 1.0))
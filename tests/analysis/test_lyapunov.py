@@ -0,0 +1,112 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from attractors import (
+    SolverRegistry,
+    SystemRegistry,
+    lyapunov_iter,
+    lyapunov_max,
+    lyapunov_spectrum,
+    lyapunov_sweep,
+    param_grid,
+)
+
+
+@pytest.fixture()
+def lorenz():
+    return SystemRegistry.get("lorenz")
+
+
+@pytest.fixture()
+def rk4():
+    return SolverRegistry.get("rk4")
+
+
+class TestLyapunov:
+    def test_lorenz_spectrum(self, lorenz, rk4):
+        """Test the Lorenz spectrum matches known values and the phase-space contraction"""
+        sigma, _, beta = lorenz.params
+        estimate = lyapunov_spectrum(lorenz, rk4, 50_000, 0.01, transient_steps=2_000)
+
+        assert estimate.exponents.shape == (3,)
+        assert estimate.steps == 50_000
+        assert estimate.exponents[0] == pytest.approx(0.906, abs=0.05)
+        assert estimate.exponents[1] == pytest.approx(0.0, abs=0.02)
+        assert estimate.exponents.sum() == pytest.approx(-(sigma + 1 + beta), abs=1e-3)
+
+    def test_jitted_vs_nonjit_consistency(self, lorenz, rk4):
+        """Test compiled and reference engines agree"""
+        kwargs = {"transient_steps": 100, "renorm_every": 5}
+        jitted = lyapunov_spectrum(lorenz, rk4, 1_000, 0.01, use_jit=True, **kwargs)
+        reference = lyapunov_spectrum(lorenz, rk4, 1_000, 0.01, use_jit=False, **kwargs)
+
+        np.testing.assert_allclose(jitted.exponents, reference.exponents, rtol=1e-8)
+
+    @pytest.mark.parametrize("use_jit", [True, False])
+    def test_tangent_vectors_follow_jacobian(self, lorenz, rk4, use_jit):
+        """Test tangent vectors are propagated with the system Jacobian"""
+
+        def scaled_jacobian(state, params):  # noqa: ARG001
+            return np.diag(np.array([-1.0, -2.0, -3.0]))
+
+        system = replace(lorenz, jacobian_func=scaled_jacobian, jitted_jacobian_func=None)
+        estimate = lyapunov_spectrum(system, rk4, 1_000, 0.01, use_jit=use_jit)
+        np.testing.assert_allclose(estimate.exponents, [-1.0, -2.0, -3.0], rtol=1e-6)
+
+        # solvers without an in-place variant propagate perturbed trajectories instead
+        perturbed = lyapunov_spectrum(
+            lorenz, SolverRegistry.get("bulirsch_stoer"), 2_000, 0.01, transient_steps=200
+        )
+        reference = lyapunov_spectrum(lorenz, rk4, 2_000, 0.01, transient_steps=200)
+        np.testing.assert_allclose(perturbed.exponents, reference.exponents, atol=0.05)
+
+    def test_largest_exponent(self, lorenz, rk4):
+        """Test the largest exponent equals the leading exponent of a one-vector spectrum"""
+        largest = lyapunov_max(lorenz, rk4, 5_000, 0.01)
+        spectrum = lyapunov_spectrum(lorenz, rk4, 5_000, 0.01, n_exponents=1)
+
+        assert largest == spectrum.exponents[0]
+
+    def test_streaming_early_stop(self, lorenz, rk4):
+        """Test streaming yields running estimates and stops once converged"""
+        estimates = list(lyapunov_iter(lorenz, rk4, 0.01, 5_000, 1_000_000, tol=0.05))
+
+        assert [e.steps for e in estimates] == [5_000 * (i + 1) for i in range(len(estimates))]
+        assert estimates[-1].converged
+        assert not any(e.converged for e in estimates[:-1])
+        assert estimates[-1].steps < 1_000_000
+
+    @pytest.mark.parametrize("use_jit", [True, False])
+    def test_sweep(self, lorenz, rk4, use_jit):
+        """Test parameter sweeps match single runs and separate chaotic from stable rows"""
+        grid = param_grid(lorenz, rho=[10.0, lorenz.params[1]])
+        exponents = lyapunov_sweep(
+            lorenz, rk4, grid, 3_000, 0.01, n_exponents=2, transient_steps=500, use_jit=use_jit
+        )
+        single = lyapunov_spectrum(
+            lorenz, rk4, 3_000, 0.01, n_exponents=2, transient_steps=500, use_jit=use_jit
+        )
+
+        assert exponents.shape == (2, 2)
+        assert exponents[0, 0] < 0
+        assert exponents[1, 0] > 0
+        np.testing.assert_allclose(exponents[1], single.exponents, rtol=1e-10)
+
+    def test_error_handling(self, lorenz, rk4):
+        """Test invalid arguments are rejected"""
+        with pytest.raises(ValueError, match="Number of exponents must be between 1 and 3"):
+            lyapunov_spectrum(lorenz, rk4, 100, 0.01, n_exponents=4)
+
+        with pytest.raises(ValueError, match="Solver dopri5 is adaptive"):
+            lyapunov_spectrum(lorenz, SolverRegistry.get("dopri5"), 100, 0.01)
+
+        with pytest.raises(ValueError, match="Renormalization interval must be positive"):
+            lyapunov_iter(lorenz, rk4, 0.01, renorm_every=0)
+
+        with pytest.raises(ValueError, match="Tolerance must be positive"):
+            lyapunov_iter(lorenz, rk4, 0.01, tol=0.0)
+
+        with pytest.raises(ValueError, match="Parameter matrix must be Px3 array"):
+            lyapunov_sweep(lorenz, rk4, np.ones((2, 2)), 100, 0.01)
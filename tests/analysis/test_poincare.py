@@ -0,0 +1,166 @@
+from typing import Any
+
+import numpy as np
+import pytest
+from numba import njit
+
+from attractors import (
+    KernelCache,
+    SolverRegistry,
+    SystemRegistry,
+    poincare_histogram,
+    poincare_section,
+)
+from attractors.systems.registry import System
+from attractors.type_defs import Vector
+
+
+@pytest.fixture()
+def oscillator_system():
+    """Harmonic oscillator with a decaying z component, which has a closed-form solution"""
+
+    def system_func(state: Vector, params: Vector) -> Vector:
+        x, y, z = state
+        omega, gamma = params
+        return np.array([omega * y, -omega * x, -gamma * z], dtype=np.float64)
+
+    return System(
+        func=system_func,
+        jitted_func=njit()(system_func),
+        name="test_section_oscillator",
+        params=np.array([2.0, 0.5]),
+        param_names=["omega", "gamma"],
+        reference="test",
+        init_coord=np.array([1.0, 0.0, 1.0]),
+    )
+
+
+@pytest.fixture()
+def lorenz():
+    return SystemRegistry.get("lorenz")
+
+
+@njit()
+def z_above_27(state: Vector, params: Vector) -> float:  # noqa: ARG001
+    return float(state[2] - 27.0)
+
+
+class TestPoincareSection:
+    def test_crossings_match_closed_form(self, oscillator_system):
+        """Test crossings of y = 0 are located between steps at the exact times"""
+        rk4 = SolverRegistry.get("rk4")
+        points, times = poincare_section(
+            oscillator_system, rk4, 1000, 0.01, normal=[0.0, 1.0, 0.0], direction=1
+        )
+
+        # y = -sin(2t) crosses zero upwards at t = pi / 2 + k pi, where x = -1
+        expected = np.pi / 2 + np.pi * np.arange(3)
+        np.testing.assert_allclose(times, expected, atol=1e-8)
+        np.testing.assert_allclose(points[:, 0], -1.0, atol=1e-8)
+        np.testing.assert_allclose(points[:, 1], 0.0, atol=1e-12)
+        np.testing.assert_allclose(points[:, 2], np.exp(-0.5 * expected), atol=1e-8)
+
+    def test_direction(self, oscillator_system):
+        """Test crossings are filtered by direction"""
+        rk4 = SolverRegistry.get("rk4")
+        kwargs: dict[str, Any] = {"normal": [0.0, 1.0, 0.0]}
+        _, up = poincare_section(oscillator_system, rk4, 1000, 0.01, direction=1, **kwargs)
+        _, down = poincare_section(oscillator_system, rk4, 1000, 0.01, direction=-1, **kwargs)
+        _, both = poincare_section(oscillator_system, rk4, 1000, 0.01, direction=0, **kwargs)
+
+        np.testing.assert_allclose(down, np.pi * np.arange(1, 4), atol=1e-8)
+        np.testing.assert_array_equal(both, np.sort(np.concatenate([up, down])))
+
+    @pytest.mark.parametrize("solver_name", ["rk4", "bulirsch_stoer"])
+    def test_jitted_vs_nonjit_consistency(self, lorenz, solver_name):
+        """Test the fused kernel matches the reference implementation"""
+        solver = SolverRegistry.get(solver_name)
+        kwargs: dict[str, Any] = {"normal": [0.0, 0.0, 1.0], "offset": 27.0, "transient_steps": 500}
+        points1, times1 = poincare_section(lorenz, solver, 5000, 0.01, use_jit=False, **kwargs)
+        points2, times2 = poincare_section(lorenz, solver, 5000, 0.01, use_jit=True, **kwargs)
+
+        assert len(points1) > 10
+        np.testing.assert_allclose(points1, points2, rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(times1, times2, rtol=1e-12)
+        assert times1[0] > 5.0
+
+    def test_event_function(self, lorenz):
+        """Test an event function yields the same section as the equivalent plane"""
+        rk4 = SolverRegistry.get("rk4")
+        points, times = poincare_section(lorenz, rk4, 5000, 0.01, normal=[0, 0, 1], offset=27.0)
+        event_points, event_times = poincare_section(lorenz, rk4, 5000, 0.01, event=z_above_27)
+        reference_points, _ = poincare_section(
+            lorenz, rk4, 5000, 0.01, event=z_above_27, use_jit=False
+        )
+
+        np.testing.assert_allclose(event_points, points, atol=1e-12)
+        np.testing.assert_allclose(event_times, times, atol=1e-12)
+        np.testing.assert_allclose(reference_points, points, atol=1e-12)
+        assert "section:lorenz:rk4:float64:z_above_27" in KernelCache.compile_times()
+
+    def test_max_hits_and_growth(self, oscillator_system):
+        """Test the hit buffer grows beyond its initial size and max_hits stops early"""
+        rk4 = SolverRegistry.get("rk4")
+        points, _ = poincare_section(
+            oscillator_system, rk4, 400_000, 0.01, normal=[0.0, 1.0, 0.0], direction=0
+        )
+        limited, _ = poincare_section(
+            oscillator_system, rk4, 400_000, 0.01, normal=[0.0, 1.0, 0.0], max_hits=5
+        )
+
+        assert len(points) == 2546
+        assert len(limited) == 5
+
+    def test_histogram(self, lorenz):
+        """Test crossings binned in the kernel match a histogram of the section points"""
+        rk4 = SolverRegistry.get("rk4")
+        bounds = ((-15.0, 15.0), (-20.0, 20.0))
+        kwargs: dict[str, Any] = {"normal": [0.0, 0.0, 1.0], "offset": 27.0}
+        points, _ = poincare_section(lorenz, rk4, 20_000, 0.01, **kwargs)
+        expected, xedges, yedges = np.histogram2d(
+            points[:, 0], points[:, 1], bins=(16, 8), range=bounds
+        )
+
+        for use_jit in (True, False):
+            counts, x, y = poincare_histogram(
+                lorenz, rk4, 20_000, 0.01, bounds, bins=(16, 8), use_jit=use_jit, **kwargs
+            )
+            assert counts.dtype == np.int64
+            np.testing.assert_array_equal(counts, expected)
+            np.testing.assert_allclose(x, xedges)
+            np.testing.assert_allclose(y, yedges)
+
+    def test_error_handling(self, lorenz):
+        """Test basic error handling"""
+        rk4 = SolverRegistry.get("rk4")
+        with pytest.raises(ValueError, match="Exactly one of a plane normal and an event"):
+            poincare_section(lorenz, rk4, 100, 0.01)
+
+        with pytest.raises(ValueError, match="Exactly one of a plane normal and an event"):
+            poincare_section(lorenz, rk4, 100, 0.01, normal=[0, 0, 1], event=z_above_27)
+
+        with pytest.raises(ValueError, match="Plane normal must have 3 components"):
+            poincare_section(lorenz, rk4, 100, 0.01, normal=[0, 1])
+
+        with pytest.raises(ValueError, match="Plane normal must be non-zero"):
+            poincare_section(lorenz, rk4, 100, 0.01, normal=[0, 0, 0])
+
+        with pytest.raises(ValueError, match="Crossing direction must be -1, 0 or 1"):
+            poincare_section(lorenz, rk4, 100, 0.01, normal=[0, 0, 1], direction=2)
+
+        with pytest.raises(ValueError, match="Maximum number of hits must be positive"):
+            poincare_section(lorenz, rk4, 100, 0.01, normal=[0, 0, 1], max_hits=0)
+
+        with pytest.raises(ValueError, match="Solver dopri5 is adaptive"):
+            poincare_section(lorenz, SolverRegistry.get("dopri5"), 100, 0.01, normal=[0, 0, 1])
+
+        with pytest.raises(ValueError, match="Transient steps must be non-negative"):
+            poincare_section(lorenz, rk4, 100, 0.01, normal=[0, 0, 1], transient_steps=100)
+
+        with pytest.raises(ValueError, match="Histogram bounds must be increasing"):
+            poincare_histogram(lorenz, rk4, 100, 0.01, ((1, 0), (0, 1)), normal=[0, 0, 1])
+
+        with pytest.raises(ValueError, match="Axes must be state components"):
+            poincare_histogram(
+                lorenz, rk4, 100, 0.01, ((0, 1), (0, 1)), axes=(0, 3), normal=[0, 0, 1]
+            )
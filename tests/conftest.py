@@ -0,0 +1,18 @@
+import pytest
+
+from attractors.solvers.kernels import KernelCache
+
+
+@pytest.fixture(autouse=True, scope="session")
+def kernel_cache_dir(request, tmp_path_factory):
+    """Persist kernels compiled by the test run in the pytest cache, not the user cache.
+
+    Kernels are kept across runs in the pytest cache directory if available, so that test
+    runs do not recompile every kernel, and in a temporary directory otherwise.
+    """
+    cache = getattr(request.config, "cache", None)
+    path = tmp_path_factory.mktemp("kernels") if cache is None else cache.mkdir("kernels")
+    previous = KernelCache.cache_dir()
+    KernelCache.set_cache_dir(path)
+    yield path
+    KernelCache.set_cache_dir(previous)
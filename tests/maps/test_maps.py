@@ -0,0 +1,161 @@
+import numpy as np
+import pytest
+from numba import njit
+
+from attractors import KernelCache, Map, MapRegistry, iterate_map, map_density
+from attractors.type_defs import Vector
+
+
+@pytest.fixture()
+def clifford():
+    return MapRegistry.get("clifford")
+
+
+class TestMapRegistry:
+    @pytest.mark.parametrize("map_name", MapRegistry.list_maps())
+    def test_map_consistency(self, map_name):
+        """Test that JIT, non-JIT and in-place versions of each map give same results"""
+        map = MapRegistry.get(map_name)
+        expected = map.get_func(jitted=False)(map.init_coord, map.params)
+
+        np.testing.assert_allclose(map.get_func()(map.init_coord, map.params), expected, rtol=1e-14)
+        for jitted in (True, False):
+            out = np.empty(map.dim)
+            map.get_inplace_func(jitted)(map.init_coord, map.params, out)
+            np.testing.assert_allclose(out, expected, rtol=1e-14)
+
+    @pytest.mark.parametrize("map_name", MapRegistry.list_maps())
+    def test_orbit_within_extent(self, map_name):
+        """Test that the attractor of each map lies within its extent"""
+        map = MapRegistry.get(map_name)
+        orbit = iterate_map(map, 100_000, transient=100)
+
+        (x0, x1), (y0, y1) = map.extent
+        assert np.all(np.isfinite(orbit))
+        assert x0 <= orbit[:, 0].min()
+        assert orbit[:, 0].max() <= x1
+        assert y0 <= orbit[:, 1].min()
+        assert orbit[:, 1].max() <= y1
+
+    def test_registry_errors(self):
+        """Test lookup of unknown maps and duplicate registration"""
+        with pytest.raises(KeyError, match="Map unknown not found"):
+            MapRegistry.get("unknown")
+
+        with pytest.raises(ValueError, match="Map henon already registered"):
+            MapRegistry.register(
+                "henon",
+                default_params=np.array([1.4, 0.3]),
+                param_names=["a", "b"],
+                init_coord=np.zeros(2),
+            )(lambda state, params: state * params)
+
+    def test_custom_map(self):
+        """Test maps of other dimensions created without the registry"""
+
+        def rotation(state: Vector, params: Vector) -> Vector:
+            x, y, z = state
+            c, s = np.cos(params[0]), np.sin(params[0])
+            return np.array([c * x - s * y, s * x + c * y, z])
+
+        map = Map(
+            func=rotation,
+            jitted_func=njit()(rotation),
+            name="test_rotation",
+            params=np.array([0.5]),
+            param_names=["angle"],
+            reference="test",
+            init_coord=np.array([1.0, 0.0, 2.0]),
+        )
+        orbit = iterate_map(map, 4)
+
+        assert map.dim == 3
+        assert repr(map) == "Map(name=test_rotation, dim=3)"
+        np.testing.assert_allclose(orbit[:, 0], np.cos(0.5 * np.arange(1, 5)))
+        np.testing.assert_allclose(orbit[:, 2], 2.0)
+
+        with pytest.raises(ValueError, match="Expected 1 parameters"):
+            map.set_params(np.array([1.0, 2.0]))
+        with pytest.raises(ValueError, match="Initial state must be a non-empty vector"):
+            Map(rotation, rotation, "test", np.array([0.5]), ["angle"], "", np.array([]))
+
+
+class TestMapDensity:
+    def test_matches_histogram(self, clifford):
+        """Test points binned in the kernel match a histogram of the stored orbit"""
+        orbit = iterate_map(clifford, 50_000, transient=100)
+        bounds = ((-1.0, 1.5), (-1.2, 1.2))
+        expected, xedges, yedges = np.histogram2d(
+            orbit[:, 0], orbit[:, 1], bins=(32, 16), range=bounds
+        )
+
+        for use_jit in (True, False):
+            counts, x, y = map_density(
+                clifford,
+                50_000,
+                bins=(32, 16),
+                bounds=bounds,
+                orbits=1,
+                init_coords=clifford.init_coord[None],
+                use_jit=use_jit,
+            )
+            assert counts.dtype == np.int64
+            np.testing.assert_array_equal(counts, expected)
+            np.testing.assert_allclose(x, xedges)
+            np.testing.assert_allclose(y, yedges)
+
+    def test_parallel_orbits(self, clifford):
+        """Test that independent orbits share the iterations and agree across backends"""
+        counts, _, _ = map_density(clifford, 100_003, bins=64, orbits=7)
+        reference, _, _ = map_density(clifford, 100_003, bins=64, orbits=7, use_jit=False)
+
+        assert counts.sum() == 100_003
+        np.testing.assert_array_equal(counts, reference)
+
+        swapped, _, _ = map_density(
+            clifford, 100_003, bins=64, bounds=((-1.4, 1.6), (-1.5, 2.0)), axes=(1, 0), orbits=7
+        )
+        np.testing.assert_array_equal(swapped, counts.T)
+
+    def test_kernel_cached(self, clifford):
+        """Test the density kernel is kept in the kernel cache and counted in its stats"""
+        KernelCache.clear()
+        map_density(clifford, 1000, bins=8)
+        map_density(clifford, 1000, bins=8)
+
+        stats = KernelCache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert list(KernelCache.compile_times()) == ["map_density:clifford"]
+
+        with pytest.raises(ValueError, match="Kernel trajectory is registered"):
+            KernelCache.get_custom("trajectory", (), "", lambda: len, signature=())
+
+    def test_escaping_orbits(self):
+        """Test that orbits escaping to infinity stop without adding points"""
+        henon = MapRegistry.get("henon")
+        init_coords = np.array([[0.0, 0.0], [5.0, 0.0]])
+
+        for use_jit in (True, False):
+            counts, _, _ = map_density(
+                henon, 10_000, bins=32, orbits=2, init_coords=init_coords, use_jit=use_jit
+            )
+            assert counts.sum() == 5_000
+
+    def test_error_handling(self, clifford):
+        """Test basic error handling"""
+        with pytest.raises(ValueError, match="Number of iterations must be positive"):
+            map_density(clifford, 0)
+        with pytest.raises(ValueError, match="Number of orbits must be positive"):
+            map_density(clifford, 100, orbits=0)
+        with pytest.raises(ValueError, match="Number of bins must be positive"):
+            map_density(clifford, 100, bins=(0, 10))
+        with pytest.raises(ValueError, match="Histogram bounds must be increasing"):
+            map_density(clifford, 100, bounds=((1.0, -1.0), (-1.0, 1.0)))
+        with pytest.raises(ValueError, match="Axes must be state components between 0 and 1"):
+            map_density(clifford, 100, axes=(0, 2))
+        with pytest.raises(ValueError, match="Axes must be a pair of state components"):
+            map_density(clifford, 100, axes=(0, 1, 1))  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="Initial coordinates must be 4x2 array"):
+            map_density(clifford, 100, orbits=4, init_coords=np.zeros((3, 2)))
+        with pytest.raises(ValueError, match="Number of iterations must be positive"):
+            iterate_map(clifford, 0)
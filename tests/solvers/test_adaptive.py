@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+from numba import njit
+
+from attractors import AdaptiveStats, SolverRegistry, integrate_adaptive, integrate_system
+from attractors.systems.registry import System
+from attractors.type_defs import Vector
+
+ADAPTIVE_SOLVERS = ["dopri5", "cash_karp", "bs32"]
+
+
+@pytest.fixture()
+def oscillator_system():
+    """Harmonic oscillator with a decaying z component, which has a closed-form solution"""
+
+    def system_func(state: Vector, params: Vector) -> Vector:
+        x, y, z = state
+        omega, gamma = params
+        return np.array([omega * y, -omega * x, -gamma * z], dtype=np.float64)
+
+    return System(
+        func=system_func,
+        jitted_func=njit()(system_func),
+        name="test_oscillator",
+        params=np.array([2.0, 0.5]),
+        param_names=["omega", "gamma"],
+        reference="test",
+        init_coord=np.array([1.0, 0.0, 1.0]),
+    )
+
+
+def exact_solution(t: Vector) -> Vector:
+    return np.column_stack([np.cos(2.0 * t), -np.sin(2.0 * t), np.exp(-0.5 * t)])
+
+
+class TestAdaptive:
+    @pytest.mark.parametrize("solver_name", ADAPTIVE_SOLVERS)
+    def test_accuracy_improves_with_tolerance(self, oscillator_system, solver_name):
+        """Test global error follows the requested tolerance"""
+        solver = SolverRegistry.get(solver_name)
+        errors = []
+        for tol in (1e-5, 1e-9):
+            trajectory, time, _ = integrate_adaptive(
+                oscillator_system, solver, 5.0, rtol=tol, atol=tol
+            )
+            assert time[0] == 0.0
+            assert time[-1] == pytest.approx(5.0)
+            assert np.all(np.diff(time) > 0)
+            errors.append(np.abs(trajectory - exact_solution(time)).max())
+
+        assert errors[0] < 1e-3
+        assert errors[1] < errors[0] / 100
+
+    @pytest.mark.parametrize("solver_name", ADAPTIVE_SOLVERS)
+    def test_jitted_vs_nonjit_consistency(self, oscillator_system, solver_name):
+        """Test that jitted and non-jitted versions give same results"""
+        solver = SolverRegistry.get(solver_name)
+        traj1, time1, stats1 = integrate_adaptive(oscillator_system, solver, 2.0, use_jit=False)
+        traj2, time2, stats2 = integrate_adaptive(oscillator_system, solver, 2.0, use_jit=True)
+
+        np.testing.assert_allclose(traj1, traj2, rtol=1e-12)
+        np.testing.assert_allclose(time1, time2, rtol=1e-12)
+        assert stats1 == stats2
+
+    @pytest.mark.parametrize("solver_name", ADAPTIVE_SOLVERS)
+    def test_function_evaluation_count(self, oscillator_system, solver_name):
+        """Test nfev accounts for FSAL reuse of the last stage"""
+        solver = SolverRegistry.get(solver_name)
+        _, time, stats = integrate_adaptive(oscillator_system, solver, 2.0)
+
+        assert isinstance(stats, AdaptiveStats)
+        assert stats.accepted == len(time) - 1
+        attempts = stats.accepted + stats.rejected
+        expected = 1 + (solver.stages - 1) * attempts
+        if not solver.fsal:
+            expected += stats.accepted
+        assert stats.nfev == expected
+
+    def test_fewer_evaluations_than_fixed_step(self, oscillator_system):
+        """Test adaptive stepping beats a fixed-step run of comparable accuracy"""
+        _, _, stats = integrate_adaptive(
+            oscillator_system, SolverRegistry.get("dopri5"), 5.0, rtol=1e-8, atol=1e-8
+        )
+        fixed_steps = 5000
+        trajectory, _ = integrate_system(
+            oscillator_system, SolverRegistry.get("rk4"), fixed_steps, 5.0 / fixed_steps
+        )
+        assert stats.nfev < 4 * fixed_steps
+        assert np.abs(trajectory[-1] - exact_solution(np.array([5.0]))[0]).max() < 1e-8
+
+    def test_max_steps_truncates(self, oscillator_system):
+        """Test integration stops when the step budget is exhausted"""
+        _, time, stats = integrate_adaptive(
+            oscillator_system, SolverRegistry.get("bs32"), 100.0, max_steps=10
+        )
+        assert stats.accepted == 10
+        assert len(time) == 11
+        assert time[-1] < 100.0
+
+    @pytest.mark.parametrize("solver_name", ADAPTIVE_SOLVERS)
+    def test_dense_output(self, oscillator_system, solver_name):
+        """Test states at requested output times are interpolated within tolerance"""
+        solver = SolverRegistry.get(solver_name)
+        t_eval = np.linspace(0.0, 2.0, 401)
+        _, _, plain = integrate_adaptive(oscillator_system, solver, 2.0, rtol=1e-8, atol=1e-10)
+        traj1, _, stats1 = integrate_adaptive(
+            oscillator_system, solver, 2.0, rtol=1e-8, atol=1e-10, t_eval=t_eval, use_jit=False
+        )
+        traj2, time2, stats2 = integrate_adaptive(
+            oscillator_system, solver, 2.0, rtol=1e-8, atol=1e-10, t_eval=t_eval, use_jit=True
+        )
+
+        np.testing.assert_array_equal(time2, t_eval)
+        np.testing.assert_allclose(traj1, traj2, rtol=1e-12, atol=1e-12)
+        assert np.abs(traj2 - exact_solution(t_eval)).max() < 1e-5
+        assert stats1 == stats2 == plain
+
+    def test_dense_output_stops_early(self, oscillator_system):
+        """Test output times beyond an early stop are NaN"""
+        t_eval = np.linspace(0.0, 100.0, 11)
+        trajectory, _, _ = integrate_adaptive(
+            oscillator_system, SolverRegistry.get("dopri5"), 100.0, max_steps=10, t_eval=t_eval
+        )
+
+        np.testing.assert_array_equal(trajectory[0], oscillator_system.init_coord)
+        assert np.isnan(trajectory[1:]).all()
+
+    def test_error_handling(self, oscillator_system):
+        """Test basic error handling"""
+        with pytest.raises(ValueError, match="Solver rk4 is not adaptive"):
+            integrate_adaptive(oscillator_system, SolverRegistry.get("rk4"), 1.0)
+
+        with pytest.raises(ValueError, match="End time must be positive"):
+            integrate_adaptive(oscillator_system, SolverRegistry.get("dopri5"), -1.0)
+
+        with pytest.raises(ValueError, match="Tolerances must be positive"):
+            integrate_adaptive(oscillator_system, SolverRegistry.get("dopri5"), 1.0, rtol=0.0)
+
+        with pytest.raises(ValueError, match="must not exceed the end time"):
+            integrate_adaptive(
+                oscillator_system, SolverRegistry.get("dopri5"), 1.0, t_eval=np.array([2.0])
+            )
+
+        with pytest.raises(ValueError, match="Solver dopri5 is adaptive"):
+            integrate_system(oscillator_system, SolverRegistry.get("dopri5"), 100, 0.01)
@@ -0,0 +1,220 @@
+import numpy as np
+import pytest
+from numba import njit
+
+from attractors import (
+    BatchOutput,
+    GuardedBatch,
+    IntegrationGuard,
+    IntegrationStatus,
+    SolverRegistry,
+    SystemRegistry,
+    integrate_ensemble,
+    integrate_sweep,
+    param_grid,
+)
+from attractors.solvers.core import integrate_system
+from attractors.systems.registry import System
+from attractors.type_defs import Vector
+
+
+@pytest.fixture()
+def lorenz():
+    return SystemRegistry.get("lorenz")
+
+
+@pytest.fixture()
+def rk4():
+    return SolverRegistry.get("rk4")
+
+
+@pytest.fixture()
+def init_coords():
+    rng = np.random.default_rng(42)
+    return rng.uniform(-5.0, 5.0, size=(8, 3)) + np.array([0.0, 0.0, 20.0])
+
+
+class TestEnsemble:
+    def test_matches_single_integration(self, lorenz, rk4, init_coords):
+        """Test every ensemble member matches a standalone integrate_system run"""
+        steps, dt = 500, 0.01
+        result = integrate_ensemble(lorenz, rk4, init_coords, steps, dt)
+
+        assert result.shape == (len(init_coords), steps, 3)
+        original = lorenz.init_coord
+        try:
+            for member, coord in zip(result, init_coords, strict=True):
+                lorenz.set_init_coord(coord)
+                trajectory, _ = integrate_system(lorenz, rk4, steps, dt)
+                np.testing.assert_allclose(member, trajectory, rtol=1e-12)
+        finally:
+            lorenz.set_init_coord(original)
+
+    @pytest.mark.parametrize("use_jit", [True, False])
+    def test_reduced_outputs(self, lorenz, rk4, init_coords, use_jit):
+        """Test reduced outputs agree with reductions of the full trajectories"""
+        steps, dt = 200, 0.01
+        full = integrate_ensemble(lorenz, rk4, init_coords, steps, dt, use_jit=use_jit)
+
+        final = integrate_ensemble(
+            lorenz, rk4, init_coords, steps, dt, output=BatchOutput.FINAL, use_jit=use_jit
+        )
+        mean = integrate_ensemble(
+            lorenz, rk4, init_coords, steps, dt, output=BatchOutput.MEAN, use_jit=use_jit
+        )
+        bounds = integrate_ensemble(
+            lorenz, rk4, init_coords, steps, dt, output=BatchOutput.BOUNDS, use_jit=use_jit
+        )
+
+        np.testing.assert_array_equal(final, full[:, -1])
+        np.testing.assert_allclose(mean, full.mean(axis=1), rtol=1e-10)
+        np.testing.assert_array_equal(bounds[:, 0], full.min(axis=1))
+        np.testing.assert_array_equal(bounds[:, 1], full.max(axis=1))
+
+    def test_error_handling(self, lorenz, rk4, init_coords):
+        """Test basic error handling"""
+        with pytest.raises(ValueError, match="Number of steps must be positive"):
+            integrate_ensemble(lorenz, rk4, init_coords, 0, 0.01)
+
+        with pytest.raises(ValueError, match="Time step must be positive"):
+            integrate_ensemble(lorenz, rk4, init_coords, 100, -0.01)
+
+        with pytest.raises(ValueError, match="Initial coordinates must be Mx3 array"):
+            integrate_ensemble(lorenz, rk4, np.ones((4, 2)), 100, 0.01)
+
+
+class TestSweep:
+    def test_param_grid(self, lorenz):
+        """Test Cartesian grid construction from parameter names"""
+        rho = np.linspace(20.0, 30.0, 5)
+        beta = np.array([2.0, 8 / 3])
+        grid = param_grid(lorenz, rho=rho, beta=beta)
+
+        assert grid.shape == (10, 3)
+        np.testing.assert_array_equal(grid[:, 0], lorenz.params[0])
+        np.testing.assert_array_equal(grid[:, 1], np.repeat(rho, 2))
+        np.testing.assert_array_equal(grid[:, 2], np.tile(beta, 5))
+
+        with pytest.raises(ValueError, match="Unknown parameter"):
+            param_grid(lorenz, gamma=[1.0])
+
+    def test_matches_set_params_integration(self, lorenz, rk4):
+        """Test every sweep row matches set_params followed by integrate_system"""
+        steps, dt = 300, 0.01
+        grid = param_grid(lorenz, rho=np.linspace(10.0, 40.0, 4))
+        result = integrate_sweep(lorenz, rk4, grid, steps, dt)
+
+        assert result.shape == (4, steps, 3)
+        original = lorenz.params
+        try:
+            for row, params in zip(result, grid, strict=True):
+                lorenz.set_params(params)
+                trajectory, _ = integrate_system(lorenz, rk4, steps, dt)
+                np.testing.assert_allclose(row, trajectory, rtol=1e-12)
+        finally:
+            lorenz.set_params(original)
+
+    def test_does_not_mutate_system(self, lorenz, rk4):
+        """Test sweeping leaves the shared system instance untouched"""
+        params = lorenz.params.copy()
+        grid = param_grid(lorenz, sigma=[5.0, 15.0])
+        final = integrate_sweep(lorenz, rk4, grid, 100, 0.01, output=BatchOutput.FINAL)
+
+        assert final.shape == (2, 3)
+        np.testing.assert_array_equal(lorenz.params, params)
+
+    def test_error_handling(self, lorenz, rk4):
+        """Test parameter matrix validation"""
+        with pytest.raises(ValueError, match="Parameter matrix must be Px3 array"):
+            integrate_sweep(lorenz, rk4, np.ones((4, 2)), 100, 0.01)
+
+
+@pytest.fixture()
+def oscillator_system():
+    """Harmonic oscillator whose z component grows exponentially for negative gamma"""
+
+    def system_func(state: Vector, params: Vector) -> Vector:
+        x, y, z = state
+        omega, gamma = params
+        return np.array([omega * y, -omega * x, -gamma * z], dtype=np.float64)
+
+    return System(
+        func=system_func,
+        jitted_func=njit()(system_func),
+        name="test_guard_oscillator",
+        params=np.array([2.0, 0.5]),
+        param_names=["omega", "gamma"],
+        reference="test",
+        init_coord=np.array([1.0, 0.0, 1.0]),
+    )
+
+
+class TestGuard:
+    @pytest.mark.parametrize("use_jit", [True, False])
+    def test_status_codes(self, oscillator_system, lorenz, rk4, use_jit):
+        """Test each guard stops at the step its condition first holds"""
+        grid = param_grid(oscillator_system, gamma=[-5.0, 0.0, 0.5])
+        guard = IntegrationGuard(max_norm=1e6, period_tol=0.02)
+        batch = integrate_sweep(
+            oscillator_system, rk4, grid, 1000, 0.01, use_jit=use_jit, guard=guard
+        )
+
+        assert isinstance(batch, GuardedBatch)
+        assert list(batch.status) == [IntegrationStatus.DIVERGED, IntegrationStatus.PERIODIC, 0]
+        # z = exp(5 t) exceeds the bound at t = ln(1e6) / 5
+        assert batch.valid_steps[0] == int(np.log(1e6) / 5 / 0.01)
+        # one period of pi is longer than the gap between anchors 256 and 512, so the
+        # return to the anchor at step 512 is the first one detected
+        assert 512 + 313 <= batch.valid_steps[1] <= 512 + 315
+        assert batch.valid_steps[2] == 1000
+
+        full = integrate_sweep(oscillator_system, rk4, grid, 1000, 0.01, use_jit=use_jit)
+        for row in range(3):
+            valid = batch.valid_steps[row]
+            np.testing.assert_array_equal(batch.result[row, :valid], full[row, :valid])
+            assert np.isnan(batch.result[row, valid:]).all()
+
+        converging = param_grid(lorenz, rho=[0.5])
+        guard = IntegrationGuard(fixed_point_tol=1e-6)
+        batch = integrate_sweep(
+            lorenz, rk4, converging, 100_000, 0.01, output=BatchOutput.FINAL, guard=guard
+        )
+        assert batch.status[0] == IntegrationStatus.FIXED_POINT
+        assert batch.valid_steps[0] < 100_000
+        assert np.abs(batch.result[0]).max() < 1e-5
+
+    def test_non_finite_and_reductions(self, oscillator_system):
+        """Test reduced outputs only cover the valid steps"""
+        euler = SolverRegistry.get("euler")
+        grid = param_grid(oscillator_system, gamma=[-1e200, 0.5])
+        guard = IntegrationGuard(max_norm=np.inf)
+        final = integrate_sweep(
+            oscillator_system, euler, grid, 100, 0.01, output=BatchOutput.FINAL, guard=guard
+        )
+        bounds = integrate_sweep(
+            oscillator_system, euler, grid, 100, 0.01, output=BatchOutput.BOUNDS, guard=guard
+        )
+        mean = integrate_ensemble(
+            oscillator_system,
+            euler,
+            np.array([[1.0, 0.0, np.inf]]),
+            100,
+            0.01,
+            output=BatchOutput.MEAN,
+            guard=guard,
+        )
+
+        assert list(final.status) == [IntegrationStatus.NON_FINITE, 0]
+        assert final.valid_steps[0] == 1
+        assert np.isfinite(final.result).all()
+        np.testing.assert_array_equal(bounds.result[0, 0], bounds.result[0, 1])
+        assert mean.valid_steps[0] == 0
+        assert np.isnan(mean.result).all()
+
+    def test_invalid_guard(self):
+        """Test guard parameters are validated"""
+        with pytest.raises(ValueError, match="Maximum norm must be positive"):
+            IntegrationGuard(max_norm=0.0)
+
+        with pytest.raises(ValueError, match="Tolerances must be non-negative"):
+            IntegrationGuard(period_tol=-1.0)
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from numba import njit
+
+from attractors import SolverRegistry, SystemRegistry, integrate_system
+from attractors.solvers.bulirsch_stoer import make_bulirsch_stoer
+from attractors.type_defs import Vector
+
+
+class CountingOscillator:
+    """Harmonic oscillator with a decaying z component that counts its evaluations"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, state: Vector, params: Vector) -> Vector:  # noqa: ARG002
+        self.calls += 1
+        x, y, z = state
+        return np.array([2.0 * y, -2.0 * x, -0.5 * z], dtype=np.float64)
+
+
+def exact_solution(t: float) -> Vector:
+    return np.array([np.cos(2.0 * t), -np.sin(2.0 * t), np.exp(-0.5 * t)])
+
+
+def run(solver_func, system_func, steps: int, dt: float) -> Vector:
+    state = np.array([1.0, 0.0, 1.0])
+    for _ in range(steps):
+        state = solver_func(system_func, state, np.zeros(1), dt)
+    return state
+
+
+class TestBulirschStoer:
+    def test_large_steps_reach_tolerance(self):
+        """Test output intervals far beyond an explicit step size are resolved to tolerance"""
+        system_func = CountingOscillator()
+        solver_func = SolverRegistry.get("bulirsch_stoer").get_func(jitted=False)
+        state = run(solver_func, system_func, 4, 0.5)
+
+        assert np.abs(state - exact_solution(2.0)).max() < 1e-11
+        reference_func = CountingOscillator()
+        run(SolverRegistry.get("rk4").get_func(jitted=False), reference_func, 600, 2.0 / 600)
+        assert system_func.calls < reference_func.calls / 3
+
+    def test_tolerance(self):
+        """Test looser tolerances trade accuracy for fewer evaluations"""
+        tight, loose = CountingOscillator(), CountingOscillator()
+        tight_state = run(make_bulirsch_stoer(1e-12, 1e-12), tight, 4, 0.5)
+        loose_state = run(make_bulirsch_stoer(1e-6, 1e-6), loose, 4, 0.5)
+
+        assert np.abs(loose_state - exact_solution(2.0)).max() < 1e-5
+        assert np.abs(tight_state - exact_solution(2.0)).max() < 1e-11
+        assert loose.calls < tight.calls
+
+    def test_jitted_vs_nonjit_consistency(self):
+        """Test the fused kernel matches the reference implementation and fine RK steps"""
+        system = SystemRegistry.get("lorenz")
+        solver = SolverRegistry.get("bulirsch_stoer")
+        traj1, time1 = integrate_system(system, solver, 20, 0.1, use_jit=False)
+        traj2, time2 = integrate_system(system, solver, 20, 0.1, use_jit=True)
+        reference, _ = integrate_system(system, SolverRegistry.get("rkf8"), 2000, 0.001)
+
+        np.testing.assert_allclose(traj1, traj2, rtol=1e-12)
+        np.testing.assert_array_equal(time1, time2)
+        np.testing.assert_allclose(traj2, reference[99::100], atol=1e-9)
+
+    @pytest.mark.parametrize("jitted", [True, False])
+    def test_unresolvable_solution(self, jitted):
+        """Test a finite-time blow-up yields NaN instead of stalling"""
+
+        def blowup(state: Vector, params: Vector) -> Vector:  # noqa: ARG001
+            return state * state
+
+        solver_func = SolverRegistry.get("bulirsch_stoer").get_func(jitted)
+        system_func = njit()(blowup) if jitted else blowup
+        with np.errstate(all="ignore"):
+            result = solver_func(system_func, np.ones(3), np.zeros(1), 2.0)
+            nan_input = solver_func(system_func, np.full(3, np.nan), np.zeros(1), 1.0)
+
+        assert np.isnan(result).all()
+        assert np.isnan(nan_input).all()
+
+    def test_error_handling(self):
+        """Test tolerances must be positive"""
+        with pytest.raises(ValueError, match="Tolerances must be positive"):
+            make_bulirsch_stoer(0.0, 1e-9)
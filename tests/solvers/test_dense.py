@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+from numba import njit
+
+from attractors import SolverRegistry, SystemRegistry, integrate_dense, integrate_system
+from attractors.systems.registry import System
+from attractors.type_defs import Vector
+
+
+@pytest.fixture()
+def oscillator_system():
+    """Harmonic oscillator with a decaying z component, which has a closed-form solution"""
+
+    def system_func(state: Vector, params: Vector) -> Vector:
+        x, y, z = state
+        omega, gamma = params
+        return np.array([omega * y, -omega * x, -gamma * z], dtype=np.float64)
+
+    return System(
+        func=system_func,
+        jitted_func=njit()(system_func),
+        name="test_dense_oscillator",
+        params=np.array([2.0, 0.5]),
+        param_names=["omega", "gamma"],
+        reference="test",
+        init_coord=np.array([1.0, 0.0, 1.0]),
+    )
+
+
+def exact_solution(t: Vector) -> Vector:
+    return np.column_stack([np.cos(2.0 * t), -np.sin(2.0 * t), np.exp(-0.5 * t)])
+
+
+class TestDense:
+    def test_interpolation_accuracy(self, oscillator_system):
+        """Test output between steps is accurate to fourth order in the step size"""
+        solver = SolverRegistry.get("rk4")
+        t_eval = np.linspace(0.0, 3.0, 997)
+        errors = []
+        for dt in (0.1, 0.05):
+            trajectory, time = integrate_dense(oscillator_system, solver, t_eval, dt)
+            np.testing.assert_array_equal(time, t_eval)
+            errors.append(np.abs(trajectory - exact_solution(t_eval)).max())
+
+        assert errors[0] < 1e-3
+        assert np.log2(errors[0] / errors[1]) > 3.5
+
+    def test_grid_matches_integrate_system(self):
+        """Test output times on the step grid reproduce the integrated states"""
+        system = SystemRegistry.get("lorenz")
+        solver = SolverRegistry.get("rk4")
+        trajectory, _ = integrate_system(system, solver, 200, 0.01)
+        dense, _ = integrate_dense(system, solver, np.arange(201.0) * 0.01, 0.01)
+
+        np.testing.assert_array_equal(dense[0], system.init_coord)
+        np.testing.assert_allclose(dense[1:], trajectory, rtol=1e-10, atol=1e-10)
+
+    @pytest.mark.parametrize("solver_name", ["rk4", "euler", "rkf8", "sdirk2"])
+    def test_jitted_vs_nonjit_consistency(self, solver_name):
+        """Test the fused kernel matches the reference implementation"""
+        system = SystemRegistry.get("lorenz")
+        solver = SolverRegistry.get(solver_name)
+        t_eval = np.array([0.0, 0.0, 0.013, 0.05, 0.31, 0.31, 1.0])
+        traj1, _ = integrate_dense(system, solver, t_eval, 0.02, use_jit=False)
+        traj2, _ = integrate_dense(system, solver, t_eval, 0.02, use_jit=True)
+
+        np.testing.assert_allclose(traj1, traj2, rtol=1e-12, atol=1e-12)
+
+    def test_dtype(self):
+        """Test output is stored in the requested dtype"""
+        system = SystemRegistry.get("lorenz")
+        solver = SolverRegistry.get("rk4")
+        t_eval = np.linspace(0.0, 1.0, 11)
+        traj64, _ = integrate_dense(system, solver, t_eval, 0.01)
+        traj32, _ = integrate_dense(system, solver, t_eval, 0.01, dtype=np.float32)
+
+        assert traj32.dtype == np.float32
+        np.testing.assert_allclose(traj32, traj64, rtol=1e-6)
+
+    def test_error_handling(self, oscillator_system):
+        """Test basic error handling"""
+        rk4 = SolverRegistry.get("rk4")
+        with pytest.raises(ValueError, match="Time step must be positive"):
+            integrate_dense(oscillator_system, rk4, np.array([1.0]), 0.0)
+
+        with pytest.raises(ValueError, match="use integrate_adaptive with t_eval"):
+            integrate_dense(oscillator_system, SolverRegistry.get("dopri5"), np.array([1.0]), 0.1)
+
+        with pytest.raises(ValueError, match="Solver abm4 is multistep"):
+            integrate_dense(oscillator_system, SolverRegistry.get("abm4"), np.array([1.0]), 0.1)
+
+        with pytest.raises(ValueError, match="non-empty vector"):
+            integrate_dense(oscillator_system, rk4, np.array([]), 0.1)
+
+        with pytest.raises(ValueError, match="must be finite"):
+            integrate_dense(oscillator_system, rk4, np.array([0.0, np.inf]), 0.1)
+
+        with pytest.raises(ValueError, match="non-negative"):
+            integrate_dense(oscillator_system, rk4, np.array([-1.0, 1.0]), 0.1)
+
+        with pytest.raises(ValueError, match="sorted"):
+            integrate_dense(oscillator_system, rk4, np.array([1.0, 0.5]), 0.1)
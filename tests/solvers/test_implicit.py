@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+from numba import njit
+
+from attractors import IntegrationGuard, IntegrationStatus, SolverRegistry, integrate_system
+from attractors.systems.registry import System
+from attractors.type_defs import Vector
+
+IMPLICIT_SOLVERS = ["backward_euler", "implicit_midpoint", "sdirk2", "ros2"]
+
+
+def stiff_system(state: Vector, params: Vector) -> Vector:
+    """Prothero-Robinson style problem relaxing fast onto cos(t), with a slow oscillator"""
+    x, y, z = state
+    lam = params[0]
+    return np.array([lam * (x - np.cos(z)) - np.sin(z), -y * x, 1.0], dtype=np.float64)
+
+
+def saturating_system(state: Vector, params: Vector) -> Vector:
+    """Relaxation whose rate saturates, so the frozen Newton Jacobian is poor far from state"""
+    derivative: Vector = -params[0] * np.tanh(state)
+    return derivative
+
+
+def make_system(lam: float) -> System:
+    return System(
+        func=stiff_system,
+        jitted_func=njit()(stiff_system),
+        name="test_stiff",
+        params=np.array([lam]),
+        param_names=["lambda"],
+        reference="test",
+        init_coord=np.array([1.0, 1.0, 0.0]),
+    )
+
+
+def final_error(solver_name: str, lam: float, dt: float, t_end: float = 1.0) -> float:
+    trajectory, _ = integrate_system(
+        make_system(lam), SolverRegistry.get(solver_name), round(t_end / dt), dt, use_jit=True
+    )
+    # z integrates dz/dt = 1 exactly, so it holds the elapsed time
+    t = trajectory[-1, 2]
+    expected = np.array([np.cos(t), np.exp(-np.sin(t)), t])
+    return float(np.max(np.abs(trajectory[-1] - expected)))
+
+
+class TestImplicitSolvers:
+    @pytest.mark.parametrize("solver_name", IMPLICIT_SOLVERS)
+    def test_registration(self, solver_name):
+        """Test implicit solvers are flagged as such"""
+        solver = SolverRegistry.get(solver_name)
+        assert solver.implicit
+        assert not solver.adaptive
+        assert not SolverRegistry.get("rk4").implicit
+
+    @pytest.mark.parametrize("solver_name", IMPLICIT_SOLVERS)
+    def test_solver_consistency(self, solver_name):
+        """Test that both JIT and non-JIT versions give same results"""
+        solver = SolverRegistry.get(solver_name)
+        state = np.array([1.0, 0.5, 0.2])
+        params = np.array([-1e4])
+
+        jit_result = solver.get_func(jitted=True)(njit()(stiff_system), state, params, 0.1)
+        nojit_result = solver.get_func(jitted=False)(stiff_system, state, params, 0.1)
+
+        np.testing.assert_allclose(jit_result, nojit_result, rtol=1e-12)
+
+    @pytest.mark.parametrize("solver_name", IMPLICIT_SOLVERS)
+    def test_convergence_order(self, solver_name):
+        """Test the observed order matches the declared order on a non-stiff problem"""
+        solver = SolverRegistry.get(solver_name)
+        coarse = final_error(solver_name, -1.0, 0.02)
+        fine = final_error(solver_name, -1.0, 0.01)
+
+        assert np.log2(coarse / fine) == pytest.approx(solver.order, abs=0.25)
+
+    @pytest.mark.parametrize("solver_name", IMPLICIT_SOLVERS)
+    def test_stiff_stability(self, solver_name):
+        """Test steps far beyond the explicit stability limit stay bounded and accurate"""
+        assert final_error(solver_name, -1e6, 0.05) < 2e-2
+
+    def test_explicit_solver_diverges(self):
+        """Test the stiff problem is out of reach of explicit solvers at the same step size"""
+        with np.errstate(all="ignore"):
+            assert not final_error("rk4", -1e6, 0.05) < 2e-2
+
+    @pytest.mark.parametrize("solver_name", ["backward_euler", "implicit_midpoint", "sdirk2"])
+    def test_newton_failure(self, solver_name):
+        """Test steps whose Newton iteration does not converge are reported as non-finite"""
+        solver = SolverRegistry.get(solver_name)
+        state = np.array([2.0])
+        params = np.array([1.0])
+
+        jit_result = solver.get_func(jitted=True)(njit()(saturating_system), state, params, 10.0)
+        nojit_result = solver.get_func(jitted=False)(saturating_system, state, params, 10.0)
+
+        assert np.all(np.isnan(jit_result))
+        assert np.all(np.isnan(nojit_result))
+        assert np.all(np.isfinite(solver.func(saturating_system, state, params, 0.1)))
+
+        system = System(
+            func=saturating_system,
+            jitted_func=njit()(saturating_system),
+            name="test_saturating",
+            params=params,
+            param_names=["rate"],
+            reference="test",
+            init_coord=state,
+        )
+        result = integrate_system(system, solver, 10, 10.0, guard=IntegrationGuard())
+        assert result.status == IntegrationStatus.NON_FINITE
+        assert result.valid_steps == 0
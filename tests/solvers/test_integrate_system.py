@@ -4,8 +4,11 @@ from numba import njit
 
 from attractors.solvers.core import (
     integrate_system,
+    integrate_system_iter,
 )
-from attractors.solvers.registry import Solver
+from attractors.solvers.guards import GuardedTrajectory, IntegrationGuard, IntegrationStatus
+from attractors.solvers.registry import Solver, SolverRegistry
+from attractors.solvers.trajectory_cache import TrajectoryCache
 from attractors.systems.registry import System
 from attractors.type_defs import Vector
 
@@ -43,6 +46,26 @@ def euler_solver():
     return Solver(euler_step, njit(euler_step), "euler")
 
 
+@pytest.fixture()
+def growing_system():
+    """Harmonic oscillator whose z component grows as exp(-gamma t)"""
+
+    def system_func(state: Vector, params: Vector) -> Vector:
+        x, y, z = state
+        omega, gamma = params
+        return np.array([omega * y, -omega * x, -gamma * z], dtype=np.float64)
+
+    return System(
+        func=system_func,
+        jitted_func=njit()(system_func),
+        name="test_growing_oscillator",
+        params=np.array([2.0, -5.0]),
+        param_names=["omega", "gamma"],
+        reference="test",
+        init_coord=np.array([1.0, 0.0, 1.0]),
+    )
+
+
 class TestCore:
     def test_integrate_system_wrapper(self, lorenz_system, euler_solver):
         steps, dt = 1000, 0.01
@@ -88,3 +111,190 @@ class TestCore:
 
         np.testing.assert_allclose(traj1, traj2, rtol=1e-14)
         np.testing.assert_allclose(time1, time2, rtol=1e-14)
+
+    @pytest.mark.parametrize("use_jit", [True, False])
+    def test_iter_matches_full_integration(self, lorenz_system, euler_solver, use_jit):
+        """Test streamed chunks reproduce a single integration exactly"""
+        steps, dt, chunk_size = 1000, 0.01, 300
+        trajectory, time = integrate_system(lorenz_system, euler_solver, steps, dt, use_jit)
+
+        chunks = list(
+            integrate_system_iter(lorenz_system, euler_solver, dt, chunk_size, steps, use_jit)
+        )
+
+        assert [len(chunk) for chunk, _ in chunks] == [300, 300, 300, 100]
+        np.testing.assert_array_equal(np.concatenate([c for c, _ in chunks]), trajectory)
+        np.testing.assert_allclose(np.concatenate([t for _, t in chunks]), time, rtol=1e-14)
+
+    def test_iter_unbounded(self, lorenz_system, euler_solver):
+        """Test streaming without a step limit keeps producing chunks"""
+        stream = integrate_system_iter(lorenz_system, euler_solver, 0.01, 50)
+        for _ in range(5):
+            trajectory, time = next(stream)
+            assert trajectory.shape == (50, 3)
+        assert time[-1] == pytest.approx(249 * 0.01)
+
+    def test_iter_error_handling(self, lorenz_system, euler_solver):
+        """Test streaming validates its arguments eagerly"""
+        with pytest.raises(ValueError, match="Chunk size must be positive"):
+            integrate_system_iter(lorenz_system, euler_solver, 0.01, 0)
+
+        with pytest.raises(ValueError, match="Number of steps must be positive"):
+            integrate_system_iter(lorenz_system, euler_solver, 0.01, 10, steps=0)
+
+    @pytest.mark.parametrize("solver_name", ["euler", "rk4", "rk5"])
+    def test_inplace_matches_allocating_kernel(self, lorenz_system, solver_name):
+        """Test the allocation-free kernel reproduces the allocating kernel exactly"""
+        steps, dt = 1000, 0.01
+        solver = SolverRegistry.get(solver_name)
+        allocating = Solver(solver.func, solver.jitted_func, solver.name)
+        assert solver.has_inplace
+        assert not allocating.has_inplace
+
+        traj1, time1 = integrate_system(lorenz_system, solver, steps, dt)
+        traj2, time2 = integrate_system(lorenz_system, allocating, steps, dt)
+
+        np.testing.assert_array_equal(traj1, traj2)
+        np.testing.assert_array_equal(time1, time2)
+
+    @pytest.mark.parametrize("use_jit", [True, False])
+    @pytest.mark.parametrize(("transient", "save_every"), [(0, 1), (100, 1), (0, 7), (250, 10)])
+    def test_transient_and_decimation(self, lorenz_system, transient, save_every, use_jit):
+        """Test in-loop transient and decimation match slicing a full run"""
+        steps, dt = 1000, 0.01
+        rk4 = SolverRegistry.get("rk4")
+        full_traj, full_time = integrate_system(lorenz_system, rk4, steps, dt, use_jit)
+
+        trajectory, time = integrate_system(
+            lorenz_system,
+            rk4,
+            steps,
+            dt,
+            use_jit,
+            transient_steps=transient,
+            save_every=save_every,
+        )
+
+        np.testing.assert_array_equal(trajectory, full_traj[transient::save_every])
+        np.testing.assert_array_equal(time, full_time[transient::save_every])
+
+    @pytest.mark.parametrize("use_jit", [True, False])
+    def test_iter_transient_and_decimation(self, lorenz_system, euler_solver, use_jit):
+        """Test streamed chunks honour the transient and save interval across chunks"""
+        steps, dt = 1000, 0.01
+        trajectory, time = integrate_system(
+            lorenz_system, euler_solver, steps, dt, use_jit, transient_steps=95, save_every=3
+        )
+
+        chunks = list(
+            integrate_system_iter(
+                lorenz_system,
+                euler_solver,
+                dt,
+                100,
+                steps,
+                use_jit,
+                transient_steps=95,
+                save_every=3,
+            )
+        )
+
+        assert [len(chunk) for chunk, _ in chunks] == [100, 100, 100, 2]
+        np.testing.assert_array_equal(np.concatenate([c for c, _ in chunks]), trajectory)
+        np.testing.assert_array_equal(np.concatenate([t for _, t in chunks]), time)
+
+    def test_sampling_error_handling(self, lorenz_system, euler_solver):
+        """Test invalid transient and save interval values are rejected"""
+        with pytest.raises(ValueError, match="Transient steps must be non-negative"):
+            integrate_system(lorenz_system, euler_solver, 100, 0.01, transient_steps=-1)
+
+        with pytest.raises(ValueError, match="Transient steps must be less than"):
+            integrate_system(lorenz_system, euler_solver, 100, 0.01, transient_steps=100)
+
+        with pytest.raises(ValueError, match="Save interval must be positive"):
+            integrate_system_iter(lorenz_system, euler_solver, 0.01, 10, save_every=0)
+
+    @pytest.mark.parametrize("use_jit", [True, False])
+    @pytest.mark.parametrize("solver_name", ["rk4", "abm2"])
+    def test_guard_stops_diverging_trajectory(self, growing_system, solver_name, use_jit):
+        """Test a guarded run stops where the trajectory leaves the bound"""
+        solver = SolverRegistry.get(solver_name)
+        guard = IntegrationGuard(max_norm=1e6)
+        full, full_time = integrate_system(growing_system, solver, 1000, 0.01, use_jit)
+
+        result = integrate_system(growing_system, solver, 1000, 0.01, use_jit, guard=guard)
+
+        assert isinstance(result, GuardedTrajectory)
+        assert result.status == IntegrationStatus.DIVERGED
+        # z = exp(5 t) exceeds the bound at t = ln(1e6) / 5
+        assert abs(result.valid_steps - np.log(1e6) / 5 / 0.01) <= 1
+        assert np.abs(full[result.valid_steps]).max() > 1e6
+        np.testing.assert_array_equal(result.trajectory, full[: result.valid_steps])
+        np.testing.assert_array_equal(result.time, full_time[: result.valid_steps])
+
+        decimated = integrate_system(
+            growing_system,
+            solver,
+            1000,
+            0.01,
+            use_jit,
+            transient_steps=50,
+            save_every=7,
+            guard=guard,
+        )
+        assert decimated.valid_steps == result.valid_steps
+        np.testing.assert_array_equal(decimated.trajectory, full[50 : result.valid_steps : 7])
+
+    @pytest.mark.parametrize("use_jit", [True, False])
+    def test_guard_completed(self, lorenz_system, use_jit):
+        """Test a guarded run that never trips returns the full trajectory"""
+        rk4 = SolverRegistry.get("rk4")
+        trajectory, _ = integrate_system(lorenz_system, rk4, 1000, 0.01, use_jit, save_every=3)
+
+        result = integrate_system(
+            lorenz_system, rk4, 1000, 0.01, use_jit, save_every=3, guard=IntegrationGuard()
+        )
+
+        assert result.status == IntegrationStatus.COMPLETED
+        assert result.valid_steps == 1000
+        np.testing.assert_array_equal(result.trajectory, trajectory)
+
+    @pytest.mark.parametrize("use_jit", [True, False])
+    def test_iter_guard(self, growing_system, use_jit):
+        """Test guarded streaming ends with the chunk in which the guard tripped"""
+        rk4 = SolverRegistry.get("rk4")
+        guard = IntegrationGuard(max_norm=1e6)
+        expected = integrate_system(growing_system, rk4, 1000, 0.01, use_jit, guard=guard)
+
+        chunks = list(
+            integrate_system_iter(growing_system, rk4, 0.01, 100, None, use_jit, guard=guard)
+        )
+
+        assert [chunk.status for chunk in chunks[:-1]] == [IntegrationStatus.COMPLETED] * 2
+        assert [chunk.valid_steps for chunk in chunks[:-1]] == [100, 200]
+        assert chunks[-1].status == IntegrationStatus.DIVERGED
+        assert chunks[-1].valid_steps == expected.valid_steps
+        np.testing.assert_array_equal(
+            np.concatenate([chunk.trajectory for chunk in chunks]), expected.trajectory
+        )
+
+    def test_iter_guard_periodic(self, growing_system):
+        """Test cycle detection carries over between streamed chunks"""
+        rk4 = SolverRegistry.get("rk4")
+        growing_system.set_params(np.array([2.0, 0.0]))
+        guard = IntegrationGuard(period_tol=0.02)
+        expected = integrate_system(growing_system, rk4, 5000, 0.01, guard=guard)
+
+        chunks = list(integrate_system_iter(growing_system, rk4, 0.01, 64, guard=guard))
+
+        assert expected.status == IntegrationStatus.PERIODIC
+        assert chunks[-1].status == IntegrationStatus.PERIODIC
+        assert chunks[-1].valid_steps == expected.valid_steps
+
+    def test_guard_with_cache(self, lorenz_system, euler_solver, tmp_path):
+        """Test guarded runs are not cached"""
+        cache = TrajectoryCache(tmp_path)
+        with pytest.raises(ValueError, match="Guarded integrations cannot be cached"):
+            integrate_system(  # type: ignore[call-overload]
+                lorenz_system, euler_solver, 100, 0.01, cache=cache, guard=IntegrationGuard()
+            )
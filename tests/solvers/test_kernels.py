@@ -0,0 +1,176 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from attractors import SolverRegistry, SystemRegistry, integrate_ensemble, integrate_system
+from attractors.solvers import ros2
+from attractors.solvers.kernels import KernelCache, KernelCacheStats, _fingerprint
+from attractors.solvers.registry import Solver
+
+
+@pytest.fixture()
+def lorenz():
+    return SystemRegistry.get("lorenz")
+
+
+@pytest.fixture()
+def cache_dir(tmp_path):
+    previous = KernelCache.cache_dir()
+    KernelCache.set_cache_dir(tmp_path)
+    KernelCache.clear()
+    yield tmp_path
+    KernelCache.set_cache_dir(previous)
+    KernelCache.clear()
+
+
+class TestKernelCache:
+    def test_hits_and_misses(self, lorenz):
+        """Test kernels are compiled once per (kind, system, solver, dtype)"""
+        rk4 = SolverRegistry.get("rk4")
+        KernelCache.clear()
+
+        first = KernelCache.get("trajectory", lorenz, rk4)
+        second = KernelCache.get("trajectory", lorenz, rk4)
+        single = KernelCache.get("trajectory", lorenz, rk4, np.float32)
+
+        assert first is second
+        assert single is not first
+        stats = KernelCache.stats()
+        assert isinstance(stats, KernelCacheStats)
+        assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+        assert stats.compile_time > 0
+        assert set(KernelCache.compile_times()) == {
+            "trajectory:lorenz:rk4:float64",
+            "trajectory:lorenz:rk4:float32",
+        }
+
+    def test_compile_times_per_dimension(self):
+        """Test kernels differing only in state dimension are all counted"""
+        lorenz96 = SystemRegistry.get("lorenz96")
+        rk4 = SolverRegistry.get("rk4")
+        KernelCache.clear()
+
+        for dim in (5, 6):
+            system = replace(lorenz96, init_coord=np.resize(lorenz96.init_coord, dim))
+            KernelCache.get("trajectory", system, rk4)
+
+        stats = KernelCache.stats()
+        times = KernelCache.compile_times()
+        assert stats.size == len(KernelCache._compile_times) == 2
+        assert list(times) == ["trajectory:lorenz96:rk4:float64"]
+        assert times["trajectory:lorenz96:rk4:float64"] == pytest.approx(stats.compile_time)
+        assert stats.compile_time > 0
+
+    def test_integrate_system_uses_cache(self, lorenz):
+        """Test repeated integrations reuse the cached kernel"""
+        rk2 = SolverRegistry.get("rk2")
+        integrate_system(lorenz, rk2, 10, 0.01)
+        before = KernelCache.stats()
+        integrate_system(lorenz, rk2, 10, 0.01)
+        after = KernelCache.stats()
+
+        assert after.misses == before.misses
+        assert after.hits == before.hits + 1
+
+    @pytest.mark.parametrize("inplace", [True, False])
+    def test_fused_matches_reference(self, lorenz, inplace):
+        """Test fused kernels reproduce the reference implementation exactly"""
+        rk4 = SolverRegistry.get("rk4")
+        solver = rk4 if inplace else Solver(rk4.func, rk4.jitted_func, "rk4_allocating")
+        steps, dt = 1000, 0.01
+
+        traj1, time1 = integrate_system(lorenz, solver, steps, dt, use_jit=True)
+        traj2, time2 = integrate_system(lorenz, solver, steps, dt, use_jit=False)
+
+        np.testing.assert_array_equal(traj1, traj2)
+        np.testing.assert_array_equal(time1, time2)
+
+    def test_output_dtype(self, lorenz):
+        """Test trajectories can be stored in single precision"""
+        rk4 = SolverRegistry.get("rk4")
+        traj64, _ = integrate_system(lorenz, rk4, 500, 0.01)
+        traj32, _ = integrate_system(lorenz, rk4, 500, 0.01, dtype=np.float32)
+        ensemble = integrate_ensemble(lorenz, rk4, traj64[:2], 100, 0.01, dtype=np.float32)
+
+        assert traj32.dtype == np.float32
+        np.testing.assert_allclose(traj32, traj64, rtol=1e-6)
+        assert ensemble.dtype == np.float32
+
+    def test_error_handling(self, lorenz):
+        """Test unknown and duplicate kernel kinds are rejected"""
+        with pytest.raises(KeyError, match="Kernel nonexistent not found"):
+            KernelCache.get("nonexistent", lorenz, SolverRegistry.get("rk4"))
+
+        with pytest.raises(ValueError, match="Kernel trajectory already registered"):
+            KernelCache.register("trajectory", signature=())(lambda target: target)
+
+
+class TestPersistentCache:
+    def test_kernels_persisted(self, lorenz, cache_dir):
+        """Test compiled kernels are loaded from disk after the in-memory cache is dropped"""
+        euler = SolverRegistry.get("euler")
+        traj1, _ = integrate_system(lorenz, euler, 100, 0.01)
+        assert len(list(cache_dir.glob("trajectory_*.py"))) == 1
+        assert KernelCache.stats().disk_hits == 0
+
+        KernelCache.clear()
+        traj2, _ = integrate_system(lorenz, euler, 100, 0.01)
+
+        assert KernelCache.stats().disk_hits == 1
+        np.testing.assert_array_equal(traj1, traj2)
+
+    def test_changed_solver_uses_new_module(self, lorenz, cache_dir):
+        """Test kernels specialized on different code are stored separately"""
+        rk2 = SolverRegistry.get("rk2")
+        allocating = Solver(rk2.func, rk2.jitted_func, "rk2_allocating")
+        KernelCache.get("trajectory", lorenz, rk2)
+        KernelCache.get("trajectory", lorenz, allocating)
+
+        assert len(list(cache_dir.glob("trajectory_*.py"))) == 2
+
+    def test_disabled(self, lorenz, cache_dir):
+        """Test no files are written with the on-disk cache disabled"""
+        KernelCache.set_cache_dir(None)
+        KernelCache.get("trajectory", lorenz, SolverRegistry.get("euler"))
+
+        assert KernelCache.cache_dir() is None
+        assert not any(cache_dir.iterdir())
+
+    def test_fingerprint(self):
+        """Test functions are fingerprinted by source and unstable references are rejected"""
+
+        def make(value: object) -> object:
+            def func(x):
+                return x + value
+
+            return func
+
+        assert _fingerprint(make(1)) != _fingerprint(make(2))
+        assert _fingerprint(make(1)) == _fingerprint(make(1))
+        assert _fingerprint(make(object())) is None
+
+        # large arrays are elided by repr, so they must be told apart by their contents
+        constants = np.zeros(10_000)
+        changed = constants.copy()
+        changed[5_000] = 1.0
+        assert repr(constants) == repr(changed)
+        assert _fingerprint(make(constants)) != _fingerprint(make(changed))
+        assert _fingerprint(make(constants)) == _fingerprint(make(constants.copy()))
+        assert _fingerprint(make((constants, 1))) != _fingerprint(make((changed, 1)))
+        assert _fingerprint(make(np.array([object()]))) is None
+
+    def test_fingerprint_constants(self, lorenz, monkeypatch):
+        """Test module constants inlined into kernels are part of the fingerprint"""
+        solver = SolverRegistry.get("ros2")
+
+        def fingerprint() -> str | None:
+            target = KernelCache._target(lorenz, solver, np.dtype(np.float64))
+            return _fingerprint(KernelCache._builders["trajectory"][0](target))
+
+        original = fingerprint()
+        assert original is not None
+        monkeypatch.setattr(ros2, "GAMMA", 99.0)
+        assert fingerprint() not in (original, None)
+        monkeypatch.setattr(ros2, "GAMMA", object())
+        assert fingerprint() is None
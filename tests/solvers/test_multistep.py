@@ -0,0 +1,174 @@
+import numpy as np
+import pytest
+from numba import njit
+
+from attractors import (
+    KernelCache,
+    SolverRegistry,
+    SystemRegistry,
+    integrate_ensemble,
+    integrate_system,
+    integrate_system_iter,
+    lyapunov_spectrum,
+)
+from attractors.systems.registry import System
+from attractors.type_defs import Vector
+
+MULTISTEP_SOLVERS = ["abm2", "abm3", "abm4", "abm5"]
+
+
+@pytest.fixture()
+def oscillator_system():
+    """Harmonic oscillator with a decaying z component, which has a closed-form solution"""
+
+    def system_func(state: Vector, params: Vector) -> Vector:
+        x, y, z = state
+        omega, gamma = params
+        return np.array([omega * y, -omega * x, -gamma * z], dtype=np.float64)
+
+    return System(
+        func=system_func,
+        jitted_func=njit()(system_func),
+        name="test_oscillator",
+        params=np.array([2.0, 0.5]),
+        param_names=["omega", "gamma"],
+        reference="test",
+        init_coord=np.array([1.0, 0.0, 1.0]),
+    )
+
+
+def final_error(system: System, solver_name: str, steps: int, t_end: float = 2.0) -> float:
+    trajectory, _ = integrate_system(system, SolverRegistry.get(solver_name), steps, t_end / steps)
+    expected = np.array([np.cos(2.0 * t_end), -np.sin(2.0 * t_end), np.exp(-0.5 * t_end)])
+    return float(np.abs(trajectory[-1] - expected).max())
+
+
+class TestMultistep:
+    @pytest.mark.parametrize("solver_name", MULTISTEP_SOLVERS)
+    def test_registration(self, solver_name):
+        """Test multistep solvers declare their history and start-up solver"""
+        solver = SolverRegistry.get(solver_name)
+        assert solver.multistep
+        assert solver.history == solver.order
+        assert solver.startup == "rk4"
+        assert not SolverRegistry.get("rk4").multistep
+
+    @pytest.mark.parametrize("solver_name", MULTISTEP_SOLVERS)
+    def test_convergence_order(self, oscillator_system, solver_name):
+        """Test the observed order matches the declared order"""
+        solver = SolverRegistry.get(solver_name)
+        coarse = final_error(oscillator_system, solver_name, 200)
+        fine = final_error(oscillator_system, solver_name, 400)
+
+        assert np.log2(coarse / fine) == pytest.approx(solver.order, abs=0.3)
+
+    @pytest.mark.parametrize("solver_name", MULTISTEP_SOLVERS)
+    def test_jitted_vs_nonjit_consistency(self, solver_name):
+        """Test that jitted and non-jitted versions give same results"""
+        system = SystemRegistry.get("lorenz")
+        solver = SolverRegistry.get(solver_name)
+        traj1, time1 = integrate_system(system, solver, 1000, 0.001, use_jit=False)
+        traj2, time2 = integrate_system(system, solver, 1000, 0.001, use_jit=True)
+
+        np.testing.assert_allclose(traj1, traj2, rtol=1e-12)
+        np.testing.assert_array_equal(time1, time2)
+
+    @pytest.mark.parametrize("use_jit", [True, False])
+    @pytest.mark.parametrize("chunk_size", [2, 7])
+    def test_iter_carries_history(self, use_jit, chunk_size):
+        """Test chunks continue the history, including chunks shorter than the start-up"""
+        system = SystemRegistry.get("lorenz")
+        solver = SolverRegistry.get("abm5")
+        expected, expected_time = integrate_system(
+            system, solver, 100, 0.01, use_jit=use_jit, transient_steps=3, save_every=2
+        )
+        chunks = list(
+            integrate_system_iter(
+                system,
+                solver,
+                0.01,
+                chunk_size,
+                steps=100,
+                use_jit=use_jit,
+                transient_steps=3,
+                save_every=2,
+            )
+        )
+
+        np.testing.assert_array_equal(np.concatenate([c[0] for c in chunks]), expected)
+        np.testing.assert_array_equal(np.concatenate([c[1] for c in chunks]), expected_time)
+
+    def test_sampling(self):
+        """Test transient and decimation select the same states as a full run"""
+        system = SystemRegistry.get("rossler")
+        solver = SolverRegistry.get("abm4")
+        full, full_time = integrate_system(system, solver, 500, 0.01)
+        trajectory, time = integrate_system(
+            system, solver, 500, 0.01, transient_steps=50, save_every=7
+        )
+
+        np.testing.assert_array_equal(trajectory, full[50::7])
+        np.testing.assert_array_equal(time, full_time[50::7])
+
+    @pytest.mark.parametrize("solver_name", MULTISTEP_SOLVERS)
+    def test_function_evaluation_count(self, oscillator_system, solver_name):
+        """Test steps after the start-up cost two system evaluations"""
+        calls = []
+        system_func = oscillator_system.func
+
+        def counting_inplace(state, params, out):
+            calls.append(1)
+            out[:] = system_func(state, params)
+
+        system = System(
+            func=system_func,
+            jitted_func=oscillator_system.jitted_func,
+            name="counting_oscillator",
+            params=oscillator_system.params,
+            param_names=oscillator_system.param_names,
+            reference="test",
+            init_coord=oscillator_system.init_coord,
+            inplace_func=counting_inplace,
+            jitted_inplace_func=oscillator_system.jitted_inplace_func,
+        )
+        solver = SolverRegistry.get(solver_name)
+        steps = 100
+        integrate_system(system, solver, steps, 0.01, use_jit=False)
+
+        startup = solver.history - 1
+        assert len(calls) == 1 + 5 * startup + 2 * (steps - startup)
+
+    def test_unsupported_uses(self):
+        """Test multistep solvers are rejected where no history can be kept"""
+        system = SystemRegistry.get("lorenz")
+        solver = SolverRegistry.get("abm4")
+
+        assert KernelCache.supports("multistep", solver)
+        assert not KernelCache.supports("trajectory", solver)
+        assert not KernelCache.supports("multistep", SolverRegistry.get("rk4"))
+        with pytest.raises(ValueError, match="Kernel trajectory does not support solver abm4"):
+            KernelCache.get("trajectory", system, solver)
+        with pytest.raises(ValueError, match="Solver abm4 is multistep"):
+            integrate_ensemble(system, solver, np.zeros((2, 3)), 10, 0.01)
+        with pytest.raises(ValueError, match="Solver abm4 is multistep"):
+            lyapunov_spectrum(system, solver, 10, 0.01)
+
+    def test_registration_errors(self):
+        """Test multistep registration validates its metadata"""
+
+        def step(system_func, state, params, dt, history, work, out):  # noqa: ARG001
+            out[:] = state
+
+        with pytest.raises(ValueError, match="must declare a positive order and history"):
+            SolverRegistry.register_multistep("bad_multistep", order=2, history=0, work_size=0)(
+                step
+            )
+        with pytest.raises(KeyError, match="Solver nonexistent not found"):
+            SolverRegistry.register_multistep(
+                "bad_multistep", order=2, history=2, work_size=0, startup="nonexistent"
+            )(step)
+        with pytest.raises(ValueError, match="Start-up solver dopri5 has no in-place variant"):
+            SolverRegistry.register_multistep(
+                "bad_multistep", order=2, history=2, work_size=0, startup="dopri5"
+            )(step)
+        assert "bad_multistep" not in SolverRegistry.list_solvers()
@@ -0,0 +1,113 @@
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import pytest
+
+from attractors import (
+    BatchOutput,
+    KernelCache,
+    NetworkResult,
+    SolverRegistry,
+    SystemRegistry,
+    integrate_ensemble,
+    integrate_network,
+    ring_coupling,
+)
+
+
+@pytest.fixture()
+def rossler():
+    return SystemRegistry.get("rossler")
+
+
+@pytest.fixture()
+def rk4():
+    return SolverRegistry.get("rk4")
+
+
+@pytest.fixture()
+def init_coords(rossler):
+    return rossler.init_coord + np.random.default_rng(0).normal(size=(12, 3))
+
+
+class TestNetwork:
+    def test_ring_coupling(self):
+        """Test ring lattices couple every node to its nearest neighbors"""
+        indptr, indices, weights = ring_coupling(6, neighbors=2)
+
+        np.testing.assert_array_equal(indptr, np.arange(7) * 4)
+        np.testing.assert_array_equal(indices[:4], [4, 5, 1, 2])
+        np.testing.assert_array_equal(weights, np.ones(24))
+
+        with pytest.raises(ValueError, match="Number of neighbors must be positive"):
+            ring_coupling(6, neighbors=0)
+        with pytest.raises(ValueError, match="Ring must have more than twice"):
+            ring_coupling(4, neighbors=2)
+
+    def test_reference(self, rossler, rk4, init_coords):
+        """Test the kernel matches the reference implementation"""
+        kwargs: dict[str, Any] = {"strength": 0.3, "record_every": 10, "snapshot_every": 100}
+        coupling = ring_coupling(len(init_coords))
+        result = integrate_network(rossler, rk4, init_coords, coupling, 300, 0.01, **kwargs)
+        reference = integrate_network(
+            rossler, rk4, init_coords, coupling, 300, 0.01, use_jit=False, **kwargs
+        )
+
+        assert isinstance(result, NetworkResult)
+        assert result.snapshots.shape == (3, 12, 3)
+        np.testing.assert_allclose(result.time, np.arange(1, 31) * 0.1)
+        np.testing.assert_allclose(result.snapshot_time, [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(result.snapshots[-1], result.final)
+        for field in ("final", "order_parameter", "sync_error", "snapshots"):
+            np.testing.assert_allclose(
+                getattr(result, field), getattr(reference, field), rtol=1e-12, atol=1e-14
+            )
+
+    def test_uncoupled(self, rossler, rk4, init_coords):
+        """Test uncoupled nodes evolve like independent ensemble members"""
+        result = integrate_network(
+            rossler, rk4, init_coords, ring_coupling(12), 500, 0.01, strength=0.0
+        )
+        expected = integrate_ensemble(rossler, rk4, init_coords, 500, 0.01, BatchOutput.FINAL)
+
+        np.testing.assert_allclose(result.final, expected, rtol=1e-12)
+
+    def test_synchronization(self, rossler, rk4, init_coords):
+        """Test strong diffusive coupling synchronizes the nodes"""
+        indptr = np.arange(13) * 11
+        indices = np.array([j for i in range(12) for j in range(12) if j != i])
+        complete = SimpleNamespace(indptr=indptr, indices=indices, data=np.ones(len(indices)))
+
+        result = integrate_network(
+            rossler, rk4, init_coords, complete, 5000, 0.01, strength=0.5, record_every=10
+        )
+
+        assert result.sync_error[0] > 0.1
+        assert result.sync_error[-1] < 1e-8
+        assert result.order_parameter[-1] == pytest.approx(1.0)
+
+    def test_error_handling(self, rossler, rk4, init_coords):
+        """Test invalid solvers, states and couplings are rejected"""
+        coupling = ring_coupling(12)
+        with pytest.raises(ValueError, match="has no in-place single-step variant"):
+            integrate_network(
+                rossler, SolverRegistry.get("dopri5"), init_coords, coupling, 10, 0.01
+            )
+        with pytest.raises(ValueError, match="Initial coordinates must be Nx3 array"):
+            integrate_network(rossler, rk4, init_coords[:, :2], coupling, 10, 0.01)
+        with pytest.raises(ValueError, match="Coupling must be a 10x10 CSR matrix"):
+            integrate_network(rossler, rk4, init_coords[:10], coupling, 10, 0.01)
+        with pytest.raises(ValueError, match="Coupling column indices must refer to nodes"):
+            integrate_network(
+                rossler, rk4, init_coords, (coupling[0], coupling[1] + 12, coupling[2]), 10, 0.01
+            )
+        with pytest.raises(ValueError, match="Inner coupling matrix must be 3x3"):
+            integrate_network(rossler, rk4, init_coords, coupling, 10, 0.01, inner=np.eye(2))
+        with pytest.raises(ValueError, match="Phase axes must be two state components"):
+            integrate_network(rossler, rk4, init_coords, coupling, 10, 0.01, phase_axes=(0, 3))
+        with pytest.raises(ValueError, match="Record interval must be positive"):
+            integrate_network(rossler, rk4, init_coords, coupling, 10, 0.01, record_every=0)
+
+        assert KernelCache.supports("network", rk4)
+        assert not KernelCache.supports("network", SolverRegistry.get("backward_euler"))
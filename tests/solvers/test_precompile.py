@@ -0,0 +1,93 @@
+from concurrent.futures import Future
+
+import pytest
+
+from attractors import KernelCache, SolverRegistry, SystemRegistry, precompile
+from attractors.cli import main
+
+
+@pytest.fixture()
+def cache_dir(tmp_path):
+    previous = KernelCache.cache_dir()
+    KernelCache.set_cache_dir(tmp_path)
+    yield tmp_path
+    KernelCache.set_cache_dir(previous)
+
+
+class TestPrecompile:
+    @pytest.mark.usefixtures("cache_dir")
+    def test_report(self):
+        """Test precompile reports the compile time of each requested kernel"""
+        report = precompile(["lorenz"], ["euler", SolverRegistry.get("rk2")], ["trajectory"])
+
+        assert set(report) == {"trajectory:lorenz:euler:float64", "trajectory:lorenz:rk2:float64"}
+        assert all(seconds >= 0 for seconds in report.values())
+        assert report.items() <= KernelCache.compile_times().items()
+
+    @pytest.mark.usefixtures("cache_dir")
+    def test_multistep_kinds(self):
+        """Test solvers are only compiled for the kernel kinds that support them"""
+        report = precompile(["lorenz"], ["euler", "abm2"], ["trajectory", "multistep"])
+
+        assert set(report) == {
+            "trajectory:lorenz:euler:float64",
+            "multistep:lorenz:abm2:float64",
+        }
+
+    @pytest.mark.usefixtures("cache_dir")
+    def test_maps(self):
+        """Test precompile compiles the density kernels of the given maps"""
+        report = precompile(["lorenz"], ["euler"], ["trajectory"], maps=["henon"])
+
+        assert set(report) == {"trajectory:lorenz:euler:float64", "map_density:henon"}
+
+        with pytest.raises(KeyError, match="Map nonexistent not found"):
+            precompile(["lorenz"], ["euler"], ["trajectory"], maps=["nonexistent"])
+
+    @pytest.mark.usefixtures("cache_dir")
+    def test_background(self):
+        """Test precompile can run in a background thread"""
+        future = precompile(
+            [SystemRegistry.get("rossler")], ["euler"], ["trajectory"], background=True
+        )
+
+        assert isinstance(future, Future)
+        assert list(future.result(timeout=120)) == ["trajectory:rossler:euler:float64"]
+
+    def test_error_handling(self):
+        """Test unknown names and adaptive solvers are rejected before compiling"""
+        with pytest.raises(KeyError, match="Kernel nonexistent not found"):
+            precompile(["lorenz"], ["euler"], ["nonexistent"])
+        with pytest.raises(KeyError):
+            precompile(["nonexistent"], ["euler"], ["trajectory"])
+        with pytest.raises(ValueError, match="Solver dopri5 is adaptive"):
+            precompile(["lorenz"], ["dopri5"], ["trajectory"])
+
+    def test_cli(self, cache_dir, capsys):
+        """Test the precompile command compiles into the given cache directory"""
+        status = main(
+            [
+                "precompile",
+                "-s",
+                "lorenz",
+                "-S",
+                "euler",
+                "-k",
+                "trajectory",
+                "-m",
+                "henon",
+                "--cache-dir",
+                str(cache_dir),
+            ]
+        )
+
+        assert status == 0
+        out = capsys.readouterr().out
+        assert "trajectory:lorenz:euler:float64" in out
+        assert "map_density:henon" in out
+
+    def test_cli_error(self, capsys):
+        """Test the precompile command reports unknown systems"""
+        with pytest.raises(SystemExit):
+            main(["precompile", "-s", "nonexistent"])
+        assert "nonexistent" in capsys.readouterr().err
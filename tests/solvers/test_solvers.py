@@ -51,7 +51,46 @@ class TestSolverRegistry:
 
         np.testing.assert_array_equal(result1, result2)
 
+    @pytest.mark.parametrize("solver_name", ["euler", "rk2", "rk3", "rk4", "rk5"])
+    @pytest.mark.parametrize("jitted", [True, False])
+    def test_solver_inplace_consistency(self, solver_name, jitted, test_state, test_params):
+        """Test that allocation-free variants match the allocating solvers"""
+        solver = SolverRegistry.get(solver_name)
+        assert solver.has_inplace
+
+        system_func = njit()(nonlinear_system) if jitted else nonlinear_system
+
+        def nonlinear_system_inplace(state, params, out):
+            out[:] = system_func(state, params)
+
+        inplace_func = njit()(nonlinear_system_inplace) if jitted else nonlinear_system_inplace
+        expected = solver.get_func(jitted)(system_func, test_state, test_params, 0.01)
+
+        work = np.empty((solver.work_size, 3))
+        out = np.empty(3)
+        solver.get_inplace_func(jitted)(inplace_func, test_state, test_params, 0.01, work, out)
+
+        np.testing.assert_array_equal(out, expected)
+
+    def test_inplace_registration(self):
+        """Test in-place variants can only be attached once to registered solvers"""
+        with pytest.raises(KeyError, match="Solver nonexistent_solver not found"):
+            SolverRegistry.register_inplace("nonexistent_solver", work_size=1)(lambda *_: None)
+
+        with pytest.raises(ValueError, match="Solver rk4 already has an in-place variant"):
+            SolverRegistry.register_inplace("rk4", work_size=5)(lambda *_: None)
+
     def test_invalid_solver_access(self):
         """Test error handling for invalid solver access"""
         with pytest.raises(KeyError, match="Solver nonexistent_solver not found"):
             SolverRegistry.get("nonexistent_solver")
+
+    def test_adaptive_registration_requires_metadata(self):
+        """Test adaptive solvers must declare their order and stage count"""
+
+        def step(system_func, state, k1, params, dt):  # noqa: ARG001
+            return state, state, k1
+
+        with pytest.raises(ValueError, match="must declare a positive order and stage count"):
+            SolverRegistry.register("incomplete_adaptive", adaptive=True)(step)
+        assert "incomplete_adaptive" not in SolverRegistry.list_solvers()
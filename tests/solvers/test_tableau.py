@@ -0,0 +1,166 @@
+import inspect
+from fractions import Fraction
+from typing import cast
+
+import numpy as np
+import pytest
+from numba import njit
+
+from attractors import (
+    ButcherTableau,
+    SolverRegistry,
+    SystemRegistry,
+    integrate_adaptive,
+    integrate_system,
+    register_tableau,
+)
+from attractors.solvers.rk6 import BUTCHER6
+from attractors.solvers.rkf78 import FEHLBERG78
+from attractors.systems.registry import System
+from attractors.type_defs import AdaptiveSolverCallable, Vector
+
+CLASSICAL_RK4 = ButcherTableau(
+    a=[[], [0.5], [0, 0.5], [0, 0, 1]],
+    b=[Fraction(1, 6), Fraction(1, 3), Fraction(1, 3), Fraction(1, 6)],
+    c=[0, 0.5, 0.5, 1],
+    order=4,
+)
+
+
+@pytest.fixture()
+def oscillator_system():
+    """Harmonic oscillator with a decaying z component, which has a closed-form solution"""
+
+    def system_func(state: Vector, params: Vector) -> Vector:
+        x, y, z = state
+        omega, gamma = params
+        return np.array([omega * y, -omega * x, -gamma * z], dtype=np.float64)
+
+    return System(
+        func=system_func,
+        jitted_func=njit()(system_func),
+        name="test_oscillator",
+        params=np.array([2.0, 0.5]),
+        param_names=["omega", "gamma"],
+        reference="test",
+        init_coord=np.array([1.0, 0.0, 1.0]),
+    )
+
+
+def exact_solution(t: float) -> Vector:
+    return np.array([np.cos(2.0 * t), -np.sin(2.0 * t), np.exp(-0.5 * t)])
+
+
+@pytest.fixture(scope="module")
+def tableau_rk4():
+    return register_tableau("test_tableau_rk4", CLASSICAL_RK4)
+
+
+class TestTableau:
+    def test_matches_handwritten_rk4(self, tableau_rk4):
+        """Test the generated steps reproduce the hand-coded RK4 scheme"""
+        system = SystemRegistry.get("lorenz")
+        state, params = system.init_coord + 1.0, system.params
+        expected = SolverRegistry.get("rk4").get_func(jitted=False)(
+            system.func, state, params, 0.01
+        )
+        allocating = tableau_rk4.get_func(jitted=True)(system.jitted_func, state, params, 0.01)
+
+        out = np.empty(3)
+        work = np.empty((tableau_rk4.work_size, 3))
+        tableau_rk4.get_inplace_func(jitted=True)(
+            system.jitted_inplace_func, state, params, 0.01, work, out
+        )
+
+        np.testing.assert_allclose(allocating, expected, rtol=1e-14)
+        np.testing.assert_array_equal(out, allocating)
+        assert tableau_rk4.order == 4
+
+    def test_jitted_vs_nonjit_consistency(self, tableau_rk4):
+        """Test the fused kernel matches the reference implementation"""
+        system = SystemRegistry.get("rossler")
+        for solver in (tableau_rk4, SolverRegistry.get("rkf8")):
+            traj1, _ = integrate_system(system, solver, 500, 0.01, use_jit=False)
+            traj2, _ = integrate_system(system, solver, 500, 0.01, use_jit=True)
+            np.testing.assert_allclose(traj1, traj2, rtol=1e-12)
+
+    @pytest.mark.parametrize(("solver_name", "order"), [("rk6", 6), ("rkf8", 8)])
+    def test_convergence_order(self, oscillator_system, solver_name, order):
+        """Test the shipped fixed-step tableaus reach their order"""
+        solver = SolverRegistry.get(solver_name)
+        errors = [
+            np.abs(
+                integrate_system(oscillator_system, solver, n, 2.0 / n)[0][-1] - exact_solution(2.0)
+            ).max()
+            for n in (10, 20)
+        ]
+
+        assert solver.order == order
+        assert np.log2(errors[0] / errors[1]) == pytest.approx(order, abs=0.3)
+
+    def test_adaptive_pair(self, oscillator_system):
+        """Test the embedded Fehlberg pair needs fewer evaluations than dopri5 at tight tolerance"""
+        solver = SolverRegistry.get("rkf78")
+        trajectory, time, stats = integrate_adaptive(
+            oscillator_system, solver, 2.0, rtol=1e-11, atol=1e-11
+        )
+        _, _, reference = integrate_adaptive(
+            oscillator_system, SolverRegistry.get("dopri5"), 2.0, rtol=1e-11, atol=1e-11
+        )
+
+        assert solver.adaptive
+        assert (solver.order, solver.stages, solver.fsal) == (8, 13, False)
+        assert time[-1] == pytest.approx(2.0)
+        assert np.abs(trajectory[-1] - exact_solution(2.0)).max() < 1e-9
+        assert stats.nfev < reference.nfev / 2
+
+    def test_fsal_detection(self):
+        """Test tableaus whose last stage is evaluated at the solution are marked FSAL"""
+        bs32 = ButcherTableau(
+            a=[[], [0.5], [0, 0.75], [Fraction(2, 9), Fraction(1, 3), Fraction(4, 9)]],
+            b=[Fraction(2, 9), Fraction(1, 3), Fraction(4, 9), 0],
+            c=[0, 0.5, 0.75, 1],
+            order=3,
+            b_embedded=[Fraction(7, 24), 0.25, Fraction(1, 3), 0.125],
+        )
+        assert bs32.fsal
+        assert not FEHLBERG78.fsal
+
+        solver = register_tableau("test_tableau_bs32", bs32, adaptive=True)
+        system = SystemRegistry.get("lorenz")
+        state = system.init_coord + 1.0
+        k1 = system.func(state, system.params)
+        reference_step = cast(
+            AdaptiveSolverCallable, SolverRegistry.get("bs32").get_func(jitted=False)
+        )
+        step = cast(AdaptiveSolverCallable, solver.get_func(jitted=False))
+        expected = reference_step(system.func, state, k1, system.params, 0.01)
+        result = step(system.func, state, k1, system.params, 0.01)
+
+        assert solver.fsal
+        for actual, reference in zip(result, expected, strict=True):
+            np.testing.assert_allclose(actual, reference, rtol=1e-13, atol=1e-16)
+
+    def test_generated_source_is_inspectable(self):
+        """Test generated steps expose their source, which kernel caching relies on"""
+        source = inspect.getsource(SolverRegistry.get("rkf8").get_func(jitted=False))
+
+        assert source.startswith("def rkf8(system_func, state, params, dt):")
+        assert source.count("system_func(") == 13
+
+    def test_validation(self):
+        """Test inconsistent tableaus are rejected"""
+        with pytest.raises(ValueError, match="must have one entry per stage"):
+            ButcherTableau(a=[[], [1]], b=[1], c=[0, 1], order=1)
+        with pytest.raises(ValueError, match="must be explicit"):
+            ButcherTableau(a=[[0], [1]], b=[0.5, 0.5], c=[0, 1], order=1)
+        with pytest.raises(ValueError, match="Row sums of a must equal c"):
+            ButcherTableau(a=[[], [1]], b=[0.5, 0.5], c=[0, 0.5], order=1)
+        with pytest.raises(ValueError, match="Weights must sum to one"):
+            ButcherTableau(a=[[], [1]], b=[0.5, 0.25], c=[0, 1], order=1)
+        with pytest.raises(ValueError, match="Order must be positive"):
+            ButcherTableau(a=[[], [1]], b=[0.5, 0.5], c=[0, 1], order=0)
+        with pytest.raises(ValueError, match="has no embedded weights"):
+            register_tableau("test_tableau_invalid", CLASSICAL_RK4, adaptive=True)
+        with pytest.raises(ValueError, match="Solver rk6 already registered"):
+            register_tableau("rk6", BUTCHER6)
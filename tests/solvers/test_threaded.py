@@ -0,0 +1,88 @@
+import asyncio
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from attractors import (
+    KernelCache,
+    SolverRegistry,
+    SystemRegistry,
+    integrate_many,
+    integrate_system,
+    integrate_system_async,
+)
+from attractors.type_defs import Vector
+
+
+@pytest.fixture()
+def lorenz():
+    return SystemRegistry.get("lorenz")
+
+
+@pytest.fixture()
+def rk4():
+    return SolverRegistry.get("rk4")
+
+
+@pytest.fixture()
+def systems(lorenz):
+    return [replace(lorenz, params=np.array([10.0, rho, 8 / 3])) for rho in (14.0, 28.0, 99.0)]
+
+
+class TestThreaded:
+    def test_kernels_release_gil(self, lorenz, rk4):
+        """Test kernels are compiled without holding the GIL"""
+        kernel = KernelCache.get("trajectory", lorenz, rk4)
+
+        assert kernel.targetoptions["nogil"]
+
+    @pytest.mark.parametrize("use_jit", [True, False])
+    def test_integrate_many(self, systems, rk4, use_jit):
+        """Test concurrent integrations match sequential ones in order"""
+        results = integrate_many(
+            systems, rk4, 2000, 0.01, use_jit=use_jit, save_every=10, max_workers=2
+        )
+
+        assert len(results) == len(systems)
+        for system, (trajectory, time) in zip(systems, results, strict=True):
+            expected, expected_time = integrate_system(
+                system, rk4, 2000, 0.01, use_jit=use_jit, save_every=10
+            )
+            np.testing.assert_array_equal(trajectory, expected)
+            np.testing.assert_array_equal(time, expected_time)
+
+    def test_integrate_async(self, systems, rk4):
+        """Test awaited integrations match sequential ones"""
+
+        async def run() -> list[tuple[Vector, Vector]]:
+            return await asyncio.gather(
+                *(integrate_system_async(system, rk4, 1000, 0.01) for system in systems)
+            )
+
+        results = asyncio.run(run())
+
+        for system, (trajectory, _) in zip(systems, results, strict=True):
+            np.testing.assert_array_equal(trajectory, integrate_system(system, rk4, 1000, 0.01)[0])
+
+    def test_async_snapshot(self, lorenz, rk4):
+        """Test the system may be modified while an integration is pending"""
+        system = replace(lorenz, params=lorenz.params.copy())
+
+        async def run() -> tuple[Vector, Vector]:
+            pending = asyncio.ensure_future(integrate_system_async(system, rk4, 1000, 0.01))
+            await asyncio.sleep(0)
+            system.set_params(np.array([10.0, 99.0, 8 / 3]))
+            return await pending
+
+        trajectory, _ = asyncio.run(run())
+
+        np.testing.assert_array_equal(trajectory, integrate_system(lorenz, rk4, 1000, 0.01)[0])
+
+    def test_error_handling(self, systems, rk4):
+        """Test invalid worker counts and arguments are rejected"""
+        assert integrate_many([], rk4, 1000, 0.01) == []
+        with pytest.raises(ValueError, match="Number of workers must be positive"):
+            integrate_many(systems, rk4, 1000, 0.01, max_workers=0)
+        with pytest.raises(ValueError, match="Number of steps must be positive"):
+            integrate_many(systems, rk4, 0, 0.01)
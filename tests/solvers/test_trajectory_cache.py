@@ -0,0 +1,156 @@
+from functools import partial
+
+import numpy as np
+import pytest
+
+from attractors import SolverRegistry, SystemRegistry, TrajectoryCache, integrate_system
+from attractors.solvers.registry import Solver
+from attractors.systems.registry import System
+from attractors.type_defs import Vector
+
+
+@pytest.fixture()
+def lorenz():
+    return SystemRegistry.get("lorenz")
+
+
+@pytest.fixture()
+def rk4():
+    return SolverRegistry.get("rk4")
+
+
+def decay(state: Vector, params: Vector, rate: float) -> Vector:  # noqa: ARG001
+    return -rate * state
+
+
+def cache_key(system: System, solver: Solver, steps: int, dt: float) -> str:
+    key = TrajectoryCache.key(system, solver, steps, dt)
+    assert key is not None
+    return key
+
+
+class TestTrajectoryCache:
+    def test_memory_hit(self, lorenz, rk4):
+        """Test repeated integrations are served from the in-process tier"""
+        cache = TrajectoryCache()
+        traj1, time1 = integrate_system(lorenz, rk4, 500, 0.01, cache=cache)
+        traj2, time2 = integrate_system(lorenz, rk4, 500, 0.01, cache=cache)
+
+        assert traj2 is traj1
+        assert time2 is time1
+        assert not traj1.flags.writeable
+        stats = cache.stats()
+        assert (stats.memory_hits, stats.disk_hits, stats.misses) == (1, 0, 1)
+
+    def test_disk_hit_is_memory_mapped(self, lorenz, rk4, tmp_path):
+        """Test entries are read back from disk as memory-mapped arrays"""
+        expected, expected_time = integrate_system(lorenz, rk4, 500, 0.01)
+        integrate_system(lorenz, rk4, 500, 0.01, cache=TrajectoryCache(tmp_path))
+
+        cache = TrajectoryCache(tmp_path)
+        trajectory, time = integrate_system(lorenz, rk4, 500, 0.01, cache=cache)
+
+        assert isinstance(trajectory, np.memmap)
+        np.testing.assert_array_equal(trajectory, expected)
+        np.testing.assert_array_equal(time, expected_time)
+        assert cache.stats().disk_hits == 1
+        assert cache.stats().disk_bytes > 0
+
+    def test_key_covers_inputs(self, lorenz, rk4):
+        """Test every input that determines a trajectory changes the key"""
+        base = TrajectoryCache.key(lorenz, rk4, 500, 0.01)
+        variants = [
+            TrajectoryCache.key(lorenz, SolverRegistry.get("rk2"), 500, 0.01),
+            TrajectoryCache.key(SystemRegistry.get("rossler"), rk4, 500, 0.01),
+            TrajectoryCache.key(lorenz, rk4, 501, 0.01),
+            TrajectoryCache.key(lorenz, rk4, 500, 0.02),
+            TrajectoryCache.key(lorenz, rk4, 500, 0.01, transient_steps=10),
+            TrajectoryCache.key(lorenz, rk4, 500, 0.01, save_every=2),
+            TrajectoryCache.key(lorenz, rk4, 500, 0.01, dtype=np.float32),
+        ]
+
+        assert base == TrajectoryCache.key(lorenz, rk4, 500, 0.01)
+        assert len({base, *variants}) == len(variants) + 1
+
+    def test_key_covers_state(self, rk4):
+        """Test parameters and initial state are part of the key"""
+        system = SystemRegistry.get("rossler")
+        base = TrajectoryCache.key(system, rk4, 500, 0.01)
+        original_params, original_init = system.params.copy(), system.init_coord.copy()
+        try:
+            system.params = original_params + 1.0
+            changed_params = TrajectoryCache.key(system, rk4, 500, 0.01)
+            system.params = original_params
+            system.init_coord = original_init + 1.0
+            changed_init = TrajectoryCache.key(system, rk4, 500, 0.01)
+        finally:
+            system.params, system.init_coord = original_params, original_init
+
+        assert len({base, changed_params, changed_init}) == 3
+
+    def test_unfingerprinted_bypass(self, rk4, tmp_path):
+        """Test functions without a stable description are never cached"""
+
+        def make(rate: float) -> System:
+            # partial objects have no source and cannot be fingerprinted
+            func = partial(decay, rate=rate)
+            return System(
+                func=func,
+                jitted_func=func,
+                name="test_unfingerprinted",
+                params=np.array([]),
+                param_names=[],
+                reference="test",
+                init_coord=np.array([1.0]),
+            )
+
+        cache = TrajectoryCache(tmp_path)
+        slow, _ = integrate_system(make(1.0), rk4, 100, 0.01, use_jit=False, cache=cache)
+        fast, _ = integrate_system(make(2.0), rk4, 100, 0.01, use_jit=False, cache=cache)
+
+        assert TrajectoryCache.key(make(1.0), rk4, 100, 0.01) is None
+        assert fast[-1, 0] < slow[-1, 0]
+        stats = cache.stats()
+        assert (stats.memory_hits, stats.disk_hits, stats.misses, stats.disk_bytes) == (0, 0, 0, 0)
+
+    def test_lru_eviction(self, lorenz, rk4, tmp_path):
+        """Test least recently used entries are evicted beyond the size limit"""
+        entry_size = 100 * 4 * 8
+        cache = TrajectoryCache(tmp_path, max_bytes=int(entry_size * 2.5), memory_items=0)
+        keys = [cache_key(lorenz, rk4, 100, dt) for dt in (0.01, 0.02, 0.03)]
+
+        integrate_system(lorenz, rk4, 100, 0.01, cache=cache)
+        integrate_system(lorenz, rk4, 100, 0.02, cache=cache)
+        assert cache.get(keys[0]) is not None
+        integrate_system(lorenz, rk4, 100, 0.03, cache=cache)
+
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) is not None
+        assert cache.stats().disk_bytes <= cache.max_bytes
+
+    def test_memory_tier_bounded(self, lorenz, rk4):
+        """Test the in-process tier keeps only the most recent entries"""
+        cache = TrajectoryCache(memory_items=1)
+        integrate_system(lorenz, rk4, 100, 0.01, cache=cache)
+        integrate_system(lorenz, rk4, 100, 0.02, cache=cache)
+
+        assert cache.get(cache_key(lorenz, rk4, 100, 0.01)) is None
+        assert cache.get(cache_key(lorenz, rk4, 100, 0.02)) is not None
+
+    def test_clear(self, lorenz, rk4, tmp_path):
+        """Test clearing removes entries from both tiers"""
+        cache = TrajectoryCache(tmp_path)
+        integrate_system(lorenz, rk4, 100, 0.01, cache=cache)
+        cache.clear()
+
+        assert cache.get(cache_key(lorenz, rk4, 100, 0.01)) is None
+        assert not list(tmp_path.iterdir())
+
+    def test_error_handling(self):
+        """Test invalid cache limits are rejected"""
+        with pytest.raises(ValueError, match="Maximum cache size must be non-negative"):
+            TrajectoryCache(max_bytes=-1)
+
+        with pytest.raises(ValueError, match="Number of in-memory entries must be non-negative"):
+            TrajectoryCache(memory_items=-1)
@@ -1,7 +1,23 @@
+from dataclasses import replace
+
 import numpy as np
 import pytest
+from numba import njit
 
-from attractors import SolverRegistry, SystemRegistry
+from attractors import (
+    BatchOutput,
+    SolverRegistry,
+    System,
+    SystemRegistry,
+    integrate_ensemble,
+    integrate_system,
+)
+from attractors.systems.inplace import adapt_inplace, make_inplace
+from attractors.systems.jacobian import (
+    _finite_difference_jacobian,
+    adapt_jacobian,
+    make_jacobian,
+)
 
 
 class TestSystemRegistry:
@@ -45,11 +61,145 @@ class TestSystemRegistry:
         result = system_func(test_state, test_params)
 
         assert isinstance(result, np.ndarray)
-        assert result.shape == (3,)
+        assert result.shape == (system.dim,)
         assert result.dtype == np.float64
         assert not np.any(np.isnan(result))
         assert not np.any(np.isinf(result))
 
+    @pytest.mark.parametrize("system_name", SystemRegistry.list_systems())
+    @pytest.mark.parametrize("jitted", [True, False])
+    def test_system_inplace_consistency(self, system_name, jitted):
+        """Test that the generated in-place variant matches the allocating system"""
+        system = SystemRegistry.get(system_name)
+        if system.dim == 3:
+            assert make_inplace(system.func) is not None
+
+        expected = system.get_func(jitted)(system.init_coord, system.params)
+        out = np.full(system.dim, np.nan)
+        assert system.get_inplace_func(jitted)(system.init_coord, system.params, out) is None
+
+        np.testing.assert_array_equal(out, expected)
+
+    def test_system_inplace_fallback(self):
+        """Test systems that cannot be rewritten fall back to a copying wrapper"""
+
+        def scaled(state, params):
+            return params[0] * state
+
+        assert make_inplace(scaled) is None
+        for inplace in adapt_inplace(scaled, njit(scaled)):
+            out = np.empty(3)
+            inplace(np.array([1.0, 2.0, 3.0]), np.array([2.0]), out)
+            np.testing.assert_array_equal(out, [2.0, 4.0, 6.0])
+
+    @pytest.mark.parametrize("system_name", SystemRegistry.list_systems())
+    @pytest.mark.parametrize("jitted", [True, False])
+    def test_system_jacobian_consistency(self, system_name, jitted):
+        """Test that the generated Jacobian matches finite differences"""
+        system = SystemRegistry.get(system_name)
+        if system.dim == 3:
+            assert make_jacobian(system.func) is not None
+
+        state = system.init_coord + np.resize([0.3, -0.2, 0.1], system.dim)
+        expected = _finite_difference_jacobian(system.func)(state, system.params)
+        jacobian = system.get_jacobian_func(jitted)(state, system.params)
+
+        assert jacobian.shape == (system.dim, system.dim)
+        np.testing.assert_allclose(jacobian, expected, rtol=1e-6, atol=1e-6)
+
+    def test_jacobian_differentiation_rules(self):
+        """Test differentiation of powers, quotients and elementwise functions"""
+
+        def system(state, params):
+            x, y, z = state
+            a = params[0]
+            u = np.sin(x * y) / (1 + z**2)
+            dx = u * np.exp(-a * z) + np.sqrt(1 + x * x)
+            dy = np.tanh(y) ** 3 - np.log(2 + np.cos(z)) + abs(x - y)
+            dz = x**y + state[2] / a
+            return np.array([dx, dy, dz])
+
+        jacobian = make_jacobian(system)
+        assert jacobian is not None
+        state, params = np.array([0.4, 1.3, -0.7]), np.array([0.5])
+
+        np.testing.assert_allclose(
+            jacobian(state, params),
+            _finite_difference_jacobian(system)(state, params),
+            rtol=1e-7,
+        )
+        np.testing.assert_array_equal(njit()(jacobian)(state, params), jacobian(state, params))
+
+    def test_jacobian_reassigned_variables(self):
+        """Test variables reassigned in terms of themselves are differentiated correctly"""
+
+        def system(state, params):
+            x, y = state
+            (a,) = params
+            x = x * x + a * y
+            return np.array([x * y, y])
+
+        jacobian = make_jacobian(system)
+        assert jacobian is not None
+        state, params = np.array([1.5, 2.0]), np.array([0.5])
+
+        result = jacobian(state, params)
+        np.testing.assert_allclose(result[0], [6.0, 4.25])
+        np.testing.assert_allclose(
+            result, _finite_difference_jacobian(system)(state, params), rtol=1e-7
+        )
+
+    @pytest.mark.parametrize("use_jit", [True, False])
+    def test_system_jacobian_batch(self, use_jit):
+        """Test batched evaluation matches evaluation state by state"""
+        system = SystemRegistry.get("lorenz")
+        states = np.random.default_rng(0).normal(size=(16, 3)) * 10
+
+        batch = system.jacobian(states, use_jit=use_jit)
+
+        assert batch.shape == (16, 3, 3)
+        for state, jacobian in zip(states, batch, strict=True):
+            np.testing.assert_array_equal(jacobian, system.jacobian(state, use_jit=use_jit))
+
+        with pytest.raises(ValueError, match="State must be a vector or Nxdim array"):
+            system.jacobian(states[None], use_jit=use_jit)
+
+    def test_system_jacobian_fallback(self):
+        """Test systems that cannot be differentiated fall back to finite differences"""
+
+        def scaled(state, params):
+            return params[0] * state
+
+        assert make_jacobian(scaled) is None
+        for jacobian in adapt_jacobian(scaled, njit(scaled)):
+            result = jacobian(np.array([1.0, 2.0, 3.0]), np.array([2.0]))
+            np.testing.assert_allclose(result, 2 * np.eye(3), atol=1e-8)
+
+    def test_system_handwritten_jacobian(self):
+        """Test a hand-written Jacobian takes precedence over the generated one"""
+        lorenz = SystemRegistry.get("lorenz")
+
+        def analytic(state, params):
+            x, y, z = state
+            sigma, rho, beta = params
+            return np.array([[-sigma, sigma, 0.0], [rho - z, -1.0, -x], [y, x, -beta]])
+
+        system = System(
+            func=lorenz.func,
+            jitted_func=lorenz.jitted_func,
+            name="lorenz_analytic",
+            params=lorenz.params,
+            param_names=lorenz.param_names,
+            reference="",
+            init_coord=lorenz.init_coord,
+            jacobian_func=analytic,
+        )
+
+        assert system.get_jacobian_func(jitted=False) is analytic
+        np.testing.assert_array_equal(
+            system.jacobian(lorenz.init_coord), lorenz.jacobian(lorenz.init_coord)
+        )
+
     def test_system_parameter_validation(self):
         """Test parameter validation for systems"""
         system_name = "lorenz"
@@ -68,6 +218,22 @@ class TestSystemRegistry:
         with pytest.raises(ValueError, match="State vector must have length 3"):
             system.set_init_coord(invalid_state)
 
+    def test_system_dimension(self):
+        """Test the state dimension is taken from the initial state"""
+        lorenz = SystemRegistry.get("lorenz")
+        assert lorenz.dim == 3
+
+        with pytest.raises(ValueError, match="Initial state must be a non-empty vector"):
+            System(
+                func=lorenz.func,
+                jitted_func=lorenz.jitted_func,
+                name="lorenz_empty",
+                params=lorenz.params,
+                param_names=lorenz.param_names,
+                reference="",
+                init_coord=np.empty(0),
+            )
+
     def test_invalid_system_access(self):
         """Test error handling for invalid system access"""
         with pytest.raises(KeyError, match="System nonexistent_system not found"):
@@ -144,3 +310,46 @@ class TestSystemRegistry:
 
         except AssertionError:
             pytest.fail(f"System {system_name} showed numerical instability")
+
+
+class TestHighDimensional:
+    @pytest.fixture()
+    def lorenz96(self):
+        return SystemRegistry.get("lorenz96")
+
+    @pytest.mark.parametrize("dim", [4, 40, 1000])
+    def test_lorenz96_variants(self, lorenz96, dim):
+        """Test the hand-written in-place and Jacobian functions at any dimension"""
+        state = np.random.default_rng(dim).normal(size=dim) + 8.0
+        system = replace(lorenz96, init_coord=state)
+        expected = system.get_func(jitted=False)(state, system.params)
+
+        assert system.dim == dim
+        for jitted in (True, False):
+            out = np.full(dim, np.nan)
+            system.get_inplace_func(jitted)(state, system.params, out)
+            np.testing.assert_allclose(out, expected, rtol=1e-14)
+        if dim <= 40:
+            np.testing.assert_allclose(
+                system.jacobian(state),
+                _finite_difference_jacobian(system.func)(state, system.params),
+                rtol=1e-6,
+                atol=1e-6,
+            )
+
+    def test_integration(self, lorenz96):
+        """Test kernels and reference implementations agree beyond three dimensions"""
+        system = replace(lorenz96, init_coord=np.resize(lorenz96.init_coord, 100))
+        solver = SolverRegistry.get("rk4")
+
+        trajectory, _ = integrate_system(system, solver, 200, 0.01)
+        reference, _ = integrate_system(system, solver, 200, 0.01, use_jit=False)
+
+        assert trajectory.shape == (200, 100)
+        np.testing.assert_allclose(trajectory, reference, rtol=1e-12)
+
+        init_coords = system.init_coord + np.random.default_rng(0).normal(size=(4, 100))
+        final = integrate_ensemble(system, solver, init_coords, 200, 0.01, BatchOutput.FINAL)
+        assert final.shape == (4, 100)
+        with pytest.raises(ValueError, match="Initial coordinates must be Mx100 array"):
+            integrate_ensemble(system, solver, init_coords[:, :3], 200, 0.01)
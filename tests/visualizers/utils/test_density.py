@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from attractors import DensityScaling, Theme, render_density
+
+
+@pytest.fixture()
+def theme():
+    return Theme(name="test", background="#000000", foreground="#ffffff", colors="viridis")
+
+
+class TestRenderDensity:
+    def test_orientation_and_background(self, theme):
+        """Test that the image puts the first axis horizontally with y pointing up"""
+        counts = np.zeros((4, 3), dtype=np.int64)
+        counts[0, 2] = 5
+        counts[3, 0] = 1
+
+        image = render_density(counts, theme)
+
+        assert image.shape == (3, 4, 4)
+        assert image.dtype == np.uint8
+        np.testing.assert_array_equal(image[0, 0], theme.colormap(1.0, bytes=True))
+        np.testing.assert_array_equal(
+            image[2, 3], theme.colormap(np.log(2) / np.log(6), bytes=True)
+        )
+        assert (image[1] == [0, 0, 0, 255]).all()
+
+    @pytest.mark.parametrize("scaling", list(DensityScaling))
+    def test_scaling_monotonic(self, scaling):
+        """Test that larger counts map further along the colormap"""
+        gray = Theme(name="gray", background="#ff0000", foreground="#ffffff", colors="gray")
+        counts = np.arange(1, 9, dtype=np.int64).reshape(8, 1)
+
+        image = render_density(counts, gray, scaling=scaling, gamma=0.5)
+
+        assert np.all(np.diff(image[0, :, 0].astype(int)) >= 0)
+        assert image[0, -1, 0] == 255
+
+    def test_empty_and_errors(self, theme):
+        """Test rendering of empty histograms and invalid inputs"""
+        image = render_density(np.zeros((2, 2), dtype=np.int64), theme)
+        assert (image == [0, 0, 0, 255]).all()
+
+        with pytest.raises(ValueError, match="Counts must be a 2D array"):
+            render_density(np.zeros(4, dtype=np.int64), theme)
+        with pytest.raises(ValueError, match="Counts must be non-negative"):
+            render_density(-np.ones((2, 2), dtype=np.int64), theme)
+        with pytest.raises(ValueError, match="Gamma must be positive"):
+            render_density(np.ones((2, 2), dtype=np.int64), theme, gamma=0.0)
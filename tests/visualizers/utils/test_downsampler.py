@@ -20,8 +20,8 @@ class TestDownsampler:
         with pytest.raises(ValueError, match="Compression must be between 0 and 1"):
             _downsample_trajectory(sample_trajectory, compression=1.5)
 
-        with pytest.raises(ValueError, match="Trajectory must be Nx3 array"):
-            _downsample_trajectory(np.array([[1, 2]]))
+        with pytest.raises(ValueError, match="Trajectory must be Nxdim array"):
+            _downsample_trajectory(np.array([1, 2, 3]))
 
     def test_no_compression(self, sample_trajectory):
         """Test with no compression"""
@@ -112,3 +112,14 @@ class TestDownsampler:
 
         assert len(result) < len(trajectory)
         assert result.shape[1] == 3
+
+    @pytest.mark.parametrize("method", list(CompressionMethod))
+    def test_higher_dimensional(self, method):
+        """Test trajectories of any dimension are downsampled along time"""
+        t = np.linspace(0, 10, 1000)
+        trajectory = np.column_stack([np.sin(k * t) * t for k in range(1, 6)])
+
+        result = _downsample_trajectory(trajectory, compression=0.5, method=method)
+
+        assert result.shape[1] == 5
+        assert len(result) <= len(trajectory)
@@ -0,0 +1,106 @@
+import matplotlib as mpl
+import numpy as np
+import pytest
+from matplotlib import pyplot as plt
+
+from attractors import (
+    SolverRegistry,
+    StaticPlotter,
+    SystemRegistry,
+    Theme,
+    flow_density,
+    integrate_system,
+    view_matrix,
+)
+
+mpl.use("Agg")
+
+
+@pytest.fixture()
+def lorenz():
+    return SystemRegistry.get("lorenz")
+
+
+class TestFlowDensity:
+    def test_matches_histogram(self, lorenz):
+        """Test states binned in the kernel match a histogram of the projected trajectory"""
+        rk4 = SolverRegistry.get("rk4")
+        view = view_matrix(azimuth=30.0, elevation=20.0)
+        bounds = ((-25.0, 25.0), (-20.0, 40.0))
+        trajectory, _ = integrate_system(lorenz, rk4, 20_001, 0.01, transient_steps=101)
+        projected = trajectory @ view.T
+        expected, xedges, yedges = np.histogram2d(
+            projected[:, 0], projected[:, 1], bins=(40, 30), range=bounds
+        )
+
+        for use_jit in (True, False):
+            counts, x, y = flow_density(
+                lorenz,
+                rk4,
+                20_000,
+                0.01,
+                bins=(40, 30),
+                bounds=bounds,
+                view=view,
+                transient_steps=100,
+                use_jit=use_jit,
+            )
+            assert counts.dtype == np.int64
+            assert counts.sum() == expected.sum()
+            # states on a bin edge may fall into either bin due to rounding
+            assert np.abs(counts - expected).sum() <= 4
+            np.testing.assert_allclose(x, xedges)
+            np.testing.assert_allclose(y, yedges)
+
+    def test_axis_aligned(self, lorenz):
+        """Test projection onto state components with bounds estimated from a pilot run"""
+        rk4 = SolverRegistry.get("rk4")
+        counts, x, y = flow_density(lorenz, rk4, 20_000, 0.01, bins=64, axes=(0, 2))
+        view = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+        bounds = ((x[0], x[-1]), (y[0], y[-1]))
+        expected, _, _ = flow_density(lorenz, rk4, 20_000, 0.01, bins=64, bounds=bounds, view=view)
+
+        assert counts.sum() > 0.95 * 20_000
+        np.testing.assert_array_equal(counts, expected)
+
+    def test_view_matrix(self):
+        """Test that view matrices are orthonormal projections"""
+        view = view_matrix(azimuth=-60.0, elevation=30.0)
+        np.testing.assert_allclose(view @ view.T, np.eye(2), atol=1e-15)
+        np.testing.assert_allclose(view_matrix(0.0, 0.0), [[0, 1, 0], [0, 0, 1]], atol=1e-15)
+        np.testing.assert_allclose(view_matrix(0.0, 90.0), [[0, 1, 0], [-1, 0, 0]], atol=1e-15)
+        rolled = view_matrix(0.0, 0.0, roll=90.0)
+        np.testing.assert_allclose(rolled, [[0, 0, -1], [0, 1, 0]], atol=1e-15)
+
+    def test_error_handling(self, lorenz):
+        """Test basic error handling"""
+        rk4 = SolverRegistry.get("rk4")
+        bounds = ((-1.0, 1.0), (-1.0, 1.0))
+        with pytest.raises(ValueError, match="Number of steps must be positive"):
+            flow_density(lorenz, rk4, 0, 0.01, bounds=bounds)
+        with pytest.raises(ValueError, match="is multistep"):
+            flow_density(lorenz, SolverRegistry.get("abm4"), 100, 0.01, bounds=bounds)
+        with pytest.raises(ValueError, match="Number of bins must be positive"):
+            flow_density(lorenz, rk4, 100, 0.01, bins=0, bounds=bounds)
+        with pytest.raises(ValueError, match="Histogram bounds must be increasing"):
+            flow_density(lorenz, rk4, 100, 0.01, bounds=((1.0, -1.0), (-1.0, 1.0)))
+        with pytest.raises(ValueError, match="Axes must be state components between 0 and 2"):
+            flow_density(lorenz, rk4, 100, 0.01, bounds=bounds, axes=(0, 3))
+        with pytest.raises(ValueError, match="View matrix must be 2x3 array"):
+            flow_density(lorenz, rk4, 100, 0.01, bounds=bounds, view=np.eye(3))
+
+
+def test_static_plotter_density(lorenz):
+    """Test that the density mode of StaticPlotter draws the rendered image"""
+    theme = Theme(name="test", background="#101010", foreground="#ffffff", colors="magma")
+    plotter = StaticPlotter(lorenz, theme)
+
+    result = plotter.visualize_density(
+        SolverRegistry.get("rk4"), 20_000, 0.01, bins=(48, 32), transient_steps=1_000, gamma=0.5
+    )
+
+    assert result is plotter
+    assert plotter.image.shape == (32, 48, 4)
+    assert len(plotter.ax.images) == 1
+    assert (plotter.image[..., 3] == 255).all()
+    plt.close(plotter.fig)
@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from attractors import RasterPlotter, SolverRegistry, SystemRegistry, Theme, integrate_system
+from attractors.visualizers.utils.rasterizer import rasterize_polyline
+
+BLACK = np.zeros(3, dtype=np.uint8)
+
+
+@pytest.fixture()
+def theme():
+    return Theme(name="test", background="#000000", foreground="#ffffff", colors="viridis")
+
+
+class TestRasterizePolyline:
+    def test_jit_matches_python(self):
+        """Test that the compiled rasterizer draws the same image as the Python version"""
+        rng = np.random.default_rng(0)
+        points = np.cumsum(rng.normal(scale=8.0, size=(2_000, 2)), axis=0) + np.array([80.0, 60.0])
+        points[500] = np.nan
+        colors = rng.integers(0, 256, size=(2_000, 3), dtype=np.uint8)
+
+        jitted = rasterize_polyline(points, colors, 160, 120, BLACK, use_jit=True)
+        python = rasterize_polyline(points, colors, 160, 120, BLACK, use_jit=False)
+
+        assert jitted.shape == (120, 160, 4)
+        assert jitted.dtype == np.uint8
+        np.testing.assert_array_equal(jitted, python)
+
+    def test_horizontal_segment(self):
+        """Test coverage, color interpolation and background of a pixel-aligned segment"""
+        points = np.array([[2.0, 5.0], [12.0, 5.0]])
+        colors = np.array([[255, 0, 0], [0, 0, 255]], dtype=np.uint8)
+        background = np.array([10, 20, 30], dtype=np.uint8)
+
+        image = rasterize_polyline(points, colors, 16, 10, background, intensity=50.0)
+
+        drawn = image[5, 2:12]
+        assert (image[..., 3] == 255).all()
+        np.testing.assert_array_equal(drawn[0, :3], [255, 0, 0])
+        assert (np.diff(drawn[:, 0].astype(int)) < 0).all()
+        assert (np.diff(drawn[:, 2].astype(int)) > 0).all()
+        mask = np.ones((10, 16), dtype=bool)
+        mask[5, 2:12] = False
+        assert (image[mask][:, :3] == background).all()
+
+    def test_overlap_brightens(self):
+        """Test that overlapping segments accumulate opacity"""
+        colors = np.full((3, 3), 255, dtype=np.uint8)
+        single = rasterize_polyline(
+            np.array([[0.0, 4.0], [8.0, 4.0], [8.0, 4.0]]), colors, 8, 8, BLACK
+        )
+        double = rasterize_polyline(
+            np.array([[0.0, 4.0], [8.0, 4.0], [0.0, 4.0]]), colors, 8, 8, BLACK
+        )
+        assert (double[4, 1:7, 0] > single[4, 1:7, 0]).all()
+
+    def test_skips_non_finite_and_outside(self):
+        """Test that segments with a non-finite endpoint or outside the image are skipped"""
+        points = np.array([[1.0, 1.0], [np.nan, 5.0], [-6.0, 6.0], [-50.0, -50.0], [-60.0, -5.0]])
+        colors = np.full((5, 3), 255, dtype=np.uint8)
+        image = rasterize_polyline(points, colors, 8, 8, BLACK, use_jit=True)
+        assert (image[..., :3] == 0).all()
+
+    @pytest.mark.parametrize("use_jit", [True, False])
+    def test_far_endpoints(self, use_jit):
+        """Test that segments reaching far outside the image are clipped to it"""
+        points = np.array(
+            [[-1e8, 5.0], [1e8, 6.0], [1e9, -1e9], [-1e20, -1e20], [3e18, 50.0], [5e18, 50.0]]
+        )
+        colors = np.full((6, 3), 255, dtype=np.uint8)
+
+        image = rasterize_polyline(points, colors, 100, 100, BLACK, use_jit=use_jit)
+
+        # the first segment crosses the image between rows 5 and 6 at x = 0
+        drawn = image[..., 0] > 0
+        assert drawn[5:7].all()
+        assert not drawn[:5].any()
+        assert not drawn[7:].any()
+
+        # the visible part is drawn as by a segment ending just outside the image
+        clipped = np.array([[-2.0, 5.5 - 1e-8], [102.0, 5.5 + 5.1e-7]])
+        expected = rasterize_polyline(clipped, colors[:2], 100, 100, BLACK, use_jit=use_jit)
+        np.testing.assert_allclose(image[..., 0], expected[..., 0], atol=1)
+
+    def test_error_handling(self):
+        """Test basic error handling"""
+        points = np.zeros((4, 2))
+        colors = np.zeros((4, 3), dtype=np.uint8)
+        with pytest.raises(ValueError, match="Image size must be positive"):
+            rasterize_polyline(points, colors, 0, 8, BLACK)
+        with pytest.raises(ValueError, match="Intensity must be positive"):
+            rasterize_polyline(points, colors, 8, 8, BLACK, intensity=0.0)
+        with pytest.raises(ValueError, match="Points must be Nx2 array"):
+            rasterize_polyline(np.zeros((4, 3)), colors, 8, 8, BLACK)
+        with pytest.raises(ValueError, match="Colors must be 4x3 array"):
+            rasterize_polyline(points, colors[:3], 8, 8, BLACK)
+
+
+def test_raster_plotter(theme, tmp_path):
+    """Test rendering a trajectory and saving it as PNG"""
+    lorenz = SystemRegistry.get("lorenz")
+    trajectory, _ = integrate_system(lorenz, SolverRegistry.get("rk4"), 20_000, 0.01)
+    plotter = RasterPlotter(lorenz, theme)
+
+    with pytest.raises(ValueError, match="Nothing rendered yet"):
+        plotter.save(tmp_path / "empty.png")
+    with pytest.raises(ValueError, match="dim >= 3"):
+        plotter.visualize(trajectory[:, :2])
+    with pytest.raises(ValueError, match="Margin must be in"):
+        plotter.visualize(trajectory, margin=0.5)
+
+    result = plotter.visualize(trajectory, width=320, height=180, azimuth=30.0, roll=10.0)
+    assert result is plotter
+    assert plotter.image.shape == (180, 320, 4)
+    drawn = plotter.image[..., :3].max(axis=-1) > 0
+    assert drawn.mean() > 0.01
+    # the margin is left empty
+    assert not drawn[:, :16].any()
+    assert not drawn[:, -16:].any()
+
+    path = tmp_path / "lorenz.png"
+    plotter.save(path)
+    with Image.open(path) as saved:
+        np.testing.assert_array_equal(np.asarray(saved), plotter.image)